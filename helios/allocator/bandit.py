@@ -11,14 +11,62 @@ When the allocator needs to choose between competing strategies that all have
 positive signals at the same time, it samples once from each posterior and
 takes the argmax. This is online learning: strategies with newly-confirmed
 edges get more capital; strategies whose edge decays get demoted automatically.
+
+Design:
+  - Arms are rows of two numpy arrays (alpha, beta), so sample_weights()
+    draws every requested arm in one Generator.beta call, and
+    allocation_weights() runs many Monte Carlo draws for all arms at once
+    (probability each arm is the best).
+  - Forgetting, both optional and per arm (an arm's history only moves when
+    that arm trades):
+      decay   before each update, the arm's evidence (counts above the
+              prior) is scaled by `decay`; the effective memory is about
+              1 / (1 - decay) trades.
+      window  only the arm's last `window` outcomes count; the oldest is
+              subtracted (at its decayed weight) as a new one arrives.
+  - Persistence (`path`): every update appends one line to `<path>.journal`;
+    checkpoint() writes the full state to `path` atomically (.partial +
+    os.replace) and truncates the journal. Journal lines carry a sequence
+    number, and restore replays only lines newer than the snapshot, so a
+    crash between the two steps never double counts. The bandit checkpoints
+    itself every `checkpoint_every` updates. A journal line torn by a crash
+    is cut off on restore, so the next append starts on a fresh line.
+    `decay` and `window` are saved with the state: the posterior was built
+    under them, so a restored bandit keeps them (and logs if the constructor
+    asked for something else).
+  - `posteriors` is still a live, mutable mapping: its values are views
+    onto the arrays, so `bandit.posteriors[key].update(win)` and
+    `bandit.posteriors[key] = BetaPosterior(a, b)` change the arm. Such edits
+    bypass decay, window and the journal; use update() for learning that
+    should persist. `posteriors=` seeds arms at construction.
+  - Below SMALL_BATCH arms, sample_weights() draws one scalar per arm: numpy's
+    per-call overhead would otherwise cost more than the draws.
 """
 from __future__ import annotations
 
+import contextlib
+import json
+import os
 import random
-from dataclasses import dataclass, field
+from collections import deque
+from collections.abc import Iterator, Mapping, MutableMapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
 
+from helios.ops import get_logger
 from helios.types import StrategyId
 
+log = get_logger(__name__)
+
+STATE_VERSION = 1
+BANDIT_STATE_PATH = Path(os.getenv("HELIOS_LOGS_DIR", "logs")) / "bandit_state.json"
+
+SMALL_BATCH = 16  # below this many arms, scalar draws beat one vectorized call
+
+ArmKey = tuple[StrategyId, str]
+
 
 @dataclass
 class BetaPosterior:
@@ -39,33 +87,274 @@ class BetaPosterior:
         return self.alpha / (self.alpha + self.beta)
 
 
-@dataclass
+class _ArmPosterior(BetaPosterior):
+    """One arm's posterior, read and written through the bandit's arrays."""
+
+    def __init__(self, bandit: StrategyBandit, i: int) -> None:
+        self._bandit = bandit
+        self._i = i
+
+    @property
+    def alpha(self) -> float:
+        return float(self._bandit._alpha[self._i])
+
+    @alpha.setter
+    def alpha(self, value: float) -> None:
+        self._bandit._alpha[self._i] = value
+
+    @property
+    def beta(self) -> float:
+        return float(self._bandit._beta[self._i])
+
+    @beta.setter
+    def beta(self, value: float) -> None:
+        self._bandit._beta[self._i] = value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BetaPosterior):
+            return NotImplemented
+        return (self.alpha, self.beta) == (other.alpha, other.beta)
+
+    def __repr__(self) -> str:
+        return f"BetaPosterior(alpha={self.alpha!r}, beta={self.beta!r})"
+
+
+class _Posteriors(MutableMapping[ArmKey, BetaPosterior]):
+    """The bandit's arms as a dict-like of live BetaPosterior views."""
+
+    def __init__(self, bandit: StrategyBandit) -> None:
+        self._bandit = bandit
+
+    def __getitem__(self, key: ArmKey) -> BetaPosterior:
+        return _ArmPosterior(self._bandit, self._bandit._index[key])
+
+    def __setitem__(self, key: ArmKey, post: BetaPosterior) -> None:
+        i = self._bandit._arm(key)
+        self._bandit._alpha[i], self._bandit._beta[i] = post.alpha, post.beta
+
+    def __delitem__(self, key: ArmKey) -> None:
+        self._bandit._drop(key)
+
+    def __iter__(self) -> Iterator[ArmKey]:
+        return iter(list(self._bandit._keys))
+
+    def __len__(self) -> int:
+        return len(self._bandit._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._bandit._index
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
 class StrategyBandit:
     """Posteriors keyed by (strategy, regime_label). Pass regime_label="" for
     regime-agnostic operation."""
 
-    posteriors: dict[tuple[StrategyId, str], BetaPosterior] = field(default_factory=dict)
-    rng: random.Random = field(default_factory=lambda: random.Random(0))
+    def __init__(
+        self,
+        posteriors: Mapping[ArmKey, BetaPosterior] | None = None,
+        prior_alpha: float = 1.0,
+        prior_beta: float = 1.0,
+        decay: float = 1.0,                # 1.0 = never forget
+        window: int | None = None,         # None = all outcomes count
+        rng: random.Random | np.random.Generator | None = None,
+        path: Path | None = None,          # checkpoint file; None = memory only
+        checkpoint_every: int = 500,
+    ) -> None:
+        if not 0.0 < decay <= 1.0:
+            raise ValueError("decay must be in (0, 1]")
+        self.prior_alpha = prior_alpha
+        self.prior_beta = prior_beta
+        self.decay = decay
+        self.window = window
+        self.rng = np.random.default_rng(0) if rng is None else rng
+        self.path = None if path is None else Path(path)
+        self.checkpoint_every = checkpoint_every
+        if isinstance(self.rng, np.random.Generator):
+            self._gen = self.rng
+        else:
+            self._gen = np.random.default_rng(self.rng.getrandbits(64))
+        self._index: dict[ArmKey, int] = {}
+        self._keys: list[ArmKey] = []
+        self._alpha = np.empty(8)
+        self._beta = np.empty(8)
+        self._history: list[deque[bool]] = []
+        self._seq = 0             # updates applied, ever
+        self._since_checkpoint = 0
+        for key, post in (posteriors or {}).items():
+            i = self._arm(key)
+            self._alpha[i], self._beta[i] = post.alpha, post.beta
+        if self.path is not None:
+            self._restore()
+
+    # ---- arms ----
 
-    def _key(self, strategy: StrategyId, regime: str) -> tuple[StrategyId, str]:
-        return (strategy, regime)
+    def _arm(self, key: ArmKey) -> int:
+        i = self._index.get(key)
+        if i is None:
+            i = self._index[key] = len(self._keys)
+            self._keys.append(key)
+            if i == len(self._alpha):
+                self._alpha = np.resize(self._alpha, 2 * i)
+                self._beta = np.resize(self._beta, 2 * i)
+            self._alpha[i] = self.prior_alpha
+            self._beta[i] = self.prior_beta
+            self._history.append(deque())
+        return i
+
+    def _drop(self, key: ArmKey) -> None:
+        i = self._index.pop(key)
+        n = len(self._keys)
+        self._alpha[i:n - 1] = self._alpha[i + 1:n]
+        self._beta[i:n - 1] = self._beta[i + 1:n]
+        del self._keys[i], self._history[i]
+        for j in range(i, n - 1):
+            self._index[self._keys[j]] = j
+
+    @property
+    def posteriors(self) -> MutableMapping[ArmKey, BetaPosterior]:
+        """Every arm's posterior; values are live views (see module docstring)."""
+        return _Posteriors(self)
+
+    def posterior(self, strategy: StrategyId, regime: str) -> BetaPosterior:
+        i = self._index.get((strategy, regime))
+        if i is None:
+            return BetaPosterior(self.prior_alpha, self.prior_beta)
+        return BetaPosterior(float(self._alpha[i]), float(self._beta[i]))
+
+    # ---- learning ----
 
     def update(self, strategy: StrategyId, regime: str, win: bool) -> None:
-        key = self._key(strategy, regime)
-        if key not in self.posteriors:
-            self.posteriors[key] = BetaPosterior()
-        self.posteriors[key].update(win)
+        self._apply(self._arm((strategy, regime)), bool(win))
+        self._seq += 1
+        if self.path is not None:
+            line = json.dumps({"seq": self._seq, "s": strategy.value, "r": regime, "w": bool(win)})
+            with self._journal_path().open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self._since_checkpoint += 1
+            if self._since_checkpoint >= self.checkpoint_every:
+                self.checkpoint()
+
+    def _apply(self, i: int, win: bool) -> None:
+        if self.decay < 1.0:
+            self._alpha[i] = self.prior_alpha + self.decay * (self._alpha[i] - self.prior_alpha)
+            self._beta[i] = self.prior_beta + self.decay * (self._beta[i] - self.prior_beta)
+        if win:
+            self._alpha[i] += 1.0
+        else:
+            self._beta[i] += 1.0
+        if self.window is not None:
+            history = self._history[i]
+            history.append(win)
+            if len(history) > self.window:
+                weight = self.decay ** self.window
+                if history.popleft():
+                    self._alpha[i] = max(self.prior_alpha, self._alpha[i] - weight)
+                else:
+                    self._beta[i] = max(self.prior_beta, self._beta[i] - weight)
+
+    # ---- sampling ----
 
     def sample_weight(self, strategy: StrategyId, regime: str) -> float:
         """Sample a per-strategy weight. The orchestrator multiplies the signal
         magnitude by this when deciding capital fraction."""
-        key = self._key(strategy, regime)
-        if key not in self.posteriors:
-            self.posteriors[key] = BetaPosterior()
-        return self.posteriors[key].sample(self.rng)
+        i = self._arm((strategy, regime))
+        return float(self._gen.beta(self._alpha[i], self._beta[i]))
+
+    def sample_weights(self, keys: Sequence[ArmKey]) -> np.ndarray:
+        """One Thompson draw per key (repeats get independent draws), in one call."""
+        idx = [self._arm(k) for k in keys]
+        if len(idx) < SMALL_BATCH:
+            beta, alpha_, beta_ = self._gen.beta, self._alpha, self._beta
+            return np.array([beta(alpha_[i], beta_[i]) for i in idx])
+        return self._gen.beta(self._alpha[idx], self._beta[idx])
+
+    def allocation_weights(self, keys: Sequence[ArmKey], n_draws: int = 1000) -> np.ndarray:
+        """Monte Carlo probability that each arm draws the highest sample."""
+        idx = np.fromiter((self._arm(k) for k in keys), dtype=np.intp, count=len(keys))
+        draws = self._gen.beta(self._alpha[idx], self._beta[idx], size=(n_draws, len(idx)))
+        return np.bincount(draws.argmax(axis=1), minlength=len(idx)) / n_draws
 
     def mean_estimate(self, strategy: StrategyId, regime: str) -> float:
-        key = self._key(strategy, regime)
-        if key not in self.posteriors:
+        i = self._index.get((strategy, regime))
+        if i is None:
             return 0.5
-        return self.posteriors[key].mean
+        return float(self._alpha[i] / (self._alpha[i] + self._beta[i]))
+
+    # ---- persistence ----
+
+    def _journal_path(self) -> Path:
+        return self.path.with_name(self.path.name + ".journal")
+
+    def state_dict(self) -> dict:
+        n = len(self._keys)
+        return {
+            "version": STATE_VERSION,
+            "seq": self._seq,
+            "arms": [[s.value, r] for s, r in self._keys],
+            "alpha": self._alpha[:n].tolist(),
+            "beta": self._beta[:n].tolist(),
+            "history": [list(h) for h in self._history] if self.window is not None else None,
+            "decay": self.decay,
+            "window": self.window,
+        }
+
+    def load_state(self, state: dict) -> None:
+        if state.get("version") != STATE_VERSION:
+            raise ValueError(f"Unsupported bandit state version: {state.get('version')!r}")
+        decay, window = state.get("decay", self.decay), state.get("window", self.window)
+        if (decay, window) != (self.decay, self.window):
+            log.warning("bandit_config_restored", decay=decay, window=window,
+                        requested_decay=self.decay, requested_window=self.window)
+            self.decay, self.window = decay, window
+        self._index.clear()
+        self._keys.clear()
+        self._history.clear()
+        for (strategy, regime), a, b in zip(state["arms"], state["alpha"], state["beta"], strict=True):
+            i = self._arm((StrategyId(strategy), regime))
+            self._alpha[i], self._beta[i] = a, b
+        if self.window is not None and state.get("history") is not None:
+            self._history = [deque(h[-self.window:]) for h in state["history"]]
+        self._seq = state["seq"]
+
+    def checkpoint(self) -> None:
+        """Write the full state atomically, then start a fresh journal."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".partial")
+        tmp.write_text(json.dumps(self.state_dict()), encoding="utf-8")
+        os.replace(tmp, self.path)
+        self._journal_path().write_text("", encoding="utf-8")
+        self._since_checkpoint = 0
+
+    def _restore(self) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            self.load_state(json.loads(self.path.read_text(encoding="utf-8")))
+        replayed = 0
+        journal = self._journal_path()
+        try:
+            raw = journal.read_bytes()
+        except FileNotFoundError:
+            raw = b""
+        if raw and not raw.endswith(b"\n"):
+            # Torn final line: cut it off, or the next append would be glued to it
+            raw = raw[:raw.rfind(b"\n") + 1]
+            os.truncate(journal, len(raw))
+            log.warning("bandit_journal_torn_tail", path=str(journal))
+        for line in raw.decode("utf-8").splitlines():
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if rec["seq"] <= self._seq:
+                continue
+            self._apply(self._arm((StrategyId(rec["s"]), rec["r"])), rec["w"])
+            self._seq = rec["seq"]
+            replayed += 1
+        self._since_checkpoint = replayed
+        if self._keys:
+            log.info("bandit_restored", arms=len(self._keys), seq=self._seq, replayed=replayed)
+
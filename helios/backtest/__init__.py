@@ -4,6 +4,12 @@ Three pieces compose:
   slippage.py     — order_size, ADV, volatility → expected slippage in bps
   walkforward.py  — generates train/val splits for honest evaluation
   tearsheet.py    — Sharpe, Sortino, Calmar, max DD, deflated Sharpe
+  sweep.py        — parallel parameter grids with checkpoint/resume; feeds
+                    the trial count into the deflated Sharpe
 
-The engine itself (engine.py) arrives once strategies have a stable interface.
+Two engines run strategies through the live orchestrator:
+  engine.py       — event-driven: one Orchestrator.tick() per bar timestamp
+  vectorized.py   — columnar fast path for VectorizedStrategy; walks only
+                    signal ticks and must match engine.py's fills
+  regression.py   — the shared parity fixture both engines are tested on
 """
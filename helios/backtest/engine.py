@@ -20,14 +20,16 @@ from decimal import Decimal
 
 import numpy as np
 
+from helios.allocator.bandit import StrategyBandit
 from helios.backtest.tearsheet import TearSheet, tearsheet
 from helios.data.adapters import Bar
+from helios.execution.ledger import PortfolioLedger
 from helios.execution.paper_broker import MarketSnapshot, PaperBroker
 from helios.execution.router import ExecutionMode, ExecutionRouter
 from helios.ops import get_logger
 from helios.orchestrator import Orchestrator
 from helios.strategies import Strategy
-from helios.types import Fill, PortfolioState, Position, Venue
+from helios.types import Fill, Venue
 
 log = get_logger(__name__)
 
@@ -48,8 +50,9 @@ class BacktestEngine:
 
     async def run(self, bars: list[Bar]) -> BacktestReport:
         broker = PaperBroker(starting_cash=self.starting_cash)
+        ledger = PortfolioLedger(broker)
         router = ExecutionRouter(mode=ExecutionMode.PAPER, paper=broker)
-        orch = Orchestrator(strategies=self.strategies, router=router)
+        orch = Orchestrator(strategies=self.strategies, router=router, bandit=StrategyBandit())
         await orch.prepare()
 
         # Group bars by (symbol, event_time) into time-ordered ticks
@@ -59,8 +62,7 @@ class BacktestEngine:
         time_order = sorted(bars_by_time.keys())
 
         equity_curve: list[Decimal] = []
-        peak_nav = self.starting_cash
-        symbols = tuple({b.symbol for b in bars})
+        symbols = tuple(sorted({b.symbol for b in bars}))  # stable universe order
 
         for t in time_order:
             tick_bars = bars_by_time[t]
@@ -77,24 +79,11 @@ class BacktestEngine:
                 )
                 marks[key] = b.close
 
-            nav = broker.nav(marks)
-            peak_nav = max(peak_nav, nav)
+            nav = ledger.mark(marks, t if t.tzinfo else t.replace(tzinfo=timezone.utc))
             equity_curve.append(nav)
+            await orch.tick(ledger.snapshot(), snapshots, universe=symbols)
 
-            state = PortfolioState(
-                nav_usd=nav,
-                peak_nav_usd=peak_nav,
-                cash_usd=broker.cash,
-                positions=tuple(_books_to_positions(broker)),
-                open_orders=(),
-                realized_pnl_today_usd=Decimal("0"),  # TODO: track via window
-                realized_pnl_week_usd=Decimal("0"),
-                realized_pnl_month_usd=Decimal("0"),
-                as_of=t if t.tzinfo else t.replace(tzinfo=timezone.utc),
-            )
-            await orch.tick(state, snapshots, universe=symbols)
-
-        returns = _equity_to_returns(equity_curve)
+        returns = equity_to_returns(equity_curve)
         ts = tearsheet(returns, periods_per_year=self.periods_per_year, n_trials=1)
         log.info(
             "backtest_done",
@@ -107,30 +96,11 @@ class BacktestEngine:
         return BacktestReport(fills=broker.fills, equity_curve=equity_curve, tearsheet=ts)
 
 
-def _books_to_positions(broker: PaperBroker) -> list[Position]:
-    out: list[Position] = []
-    for (symbol, venue), book in broker.positions.items():
-        if book.qty == 0:
-            continue
-        from datetime import datetime
-        out.append(Position(
-            symbol=symbol,
-            venue=venue,
-            side=__import__("helios.types", fromlist=["Side"]).Side.LONG if book.qty > 0 else __import__("helios.types", fromlist=["Side"]).Side.SHORT,
-            qty=abs(book.qty),
-            avg_entry=book.avg_price,
-            unrealized_pnl_usd=Decimal("0"),
-            realized_pnl_usd=book.realized_pnl,
-            leverage=1.0,
-            opened_at=datetime.now(timezone.utc),
-        ))
-    return out
-
-
-def _equity_to_returns(equity: list[Decimal]) -> np.ndarray:
+def equity_to_returns(equity: list[Decimal] | np.ndarray) -> np.ndarray:
+    """Simple per-period returns of an equity curve (non-finite steps are 0)."""
     if len(equity) < 2:
         return np.array([])
-    arr = np.array([float(e) for e in equity], dtype=float)
+    arr = np.asarray(equity, dtype=float)
     rets = np.diff(arr) / arr[:-1]
     rets = np.nan_to_num(rets, nan=0.0, posinf=0.0, neginf=0.0)
     return rets
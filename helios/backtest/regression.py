@@ -0,0 +1,127 @@
+"""Shared parity fixture for the event-driven and vectorized engines.
+
+The vectorized engine (vectorized.py) is only trustworthy while it produces
+the same fills and tearsheet as the event-driven engine (engine.py). This
+module holds the deterministic inputs both are run against — in tests and in
+scripts/bench_backtest_vectorized.py:
+
+  synthetic_bar_frame()  seeded multi-symbol random-walk bars (Polars)
+  frame_to_bars()        the same bars as list[Bar] for engine.py
+                         (an optional `venue` column sets each bar's venue)
+  BreakoutReference      a trivially simple channel-breakout strategy that
+                         implements both evaluate() and evaluate_batch()
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import numpy as np
+import polars as pl
+
+from helios.backtest.vectorized import signal_from_row
+from helios.data.adapters import Bar
+from helios.strategies import StrategyContext, VectorizedStrategy
+from helios.types import Signal, StrategyId, Venue
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def synthetic_bar_frame(
+    n_bars: int = 2000,
+    symbols: tuple[str, ...] = ("BTC-PERP", "ETH-PERP", "SOL-PERP"),
+    seed: int = 11,
+    interval: timedelta = timedelta(hours=1),
+) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    times = [T0 + i * interval for i in range(n_bars)]
+    frames = []
+    for k, sym in enumerate(symbols):
+        rets = rng.normal(0.0, 0.01, n_bars)
+        close = np.round(100.0 * (k + 1) * np.exp(np.cumsum(rets)), 4)
+        spread = np.round(np.abs(rng.normal(0.0, 0.004, n_bars)) * close, 4) + 0.0001
+        frames.append(pl.DataFrame({
+            "symbol": [sym] * n_bars,
+            "event_time": times,
+            "available_at": times,
+            "open": close,
+            "high": np.round(close + spread, 4),
+            "low": np.round(close - spread, 4),
+            "close": close,
+            "volume": np.round(rng.uniform(5_000, 50_000, n_bars), 2),
+        }))
+    return pl.concat(frames).with_columns(
+        pl.col("event_time").cast(pl.Datetime("us", "UTC")),
+        pl.col("available_at").cast(pl.Datetime("us", "UTC")),
+    ).sort(["symbol", "event_time"])
+
+
+def frame_to_bars(frame: pl.DataFrame, venue: Venue = Venue.KRAKEN_FUTURES, interval: str = "1h") -> list[Bar]:
+    def _d(x: float) -> Decimal:
+        return Decimal(repr(float(x)))
+    return [
+        Bar(
+            symbol=r["symbol"], venue=Venue(r["venue"]) if "venue" in r else venue, interval=interval,
+            open=_d(r["open"]), high=_d(r["high"]), low=_d(r["low"]), close=_d(r["close"]),
+            volume=_d(r["volume"]), event_time=r["event_time"], available_at=r["available_at"],
+        )
+        for r in frame.iter_rows(named=True)
+    ]
+
+
+class BreakoutReference(VectorizedStrategy):
+    """Long on a close above the prior `lookback`-bar high, short on a close
+    below the prior low, at most once per market per `lookback` bars. A
+    market is a symbol, or a (symbol, venue) pair when the frame has a
+    `venue` column. Not a trading idea — a parity fixture.
+
+    Event-path strategies receive no bars, so `evaluate()` serves the rows of
+    its own batch evaluation for `ctx.as_of` (computed on first use); what the
+    parity test exercises is the engines, not the signal logic.
+    """
+    id = StrategyId.A1_PERP_TREND
+
+    def __init__(self, bars: pl.DataFrame, lookback: int = 720, venue: Venue = Venue.KRAKEN_FUTURES) -> None:
+        self.bars = bars
+        self.lookback = lookback
+        self.venue = venue
+        self._by_time: dict[datetime, list[Signal]] | None = None
+
+    async def prepare(self) -> None:
+        self._by_time = None
+
+    async def evaluate(self, ctx: StrategyContext) -> list[Signal]:
+        if self._by_time is None:
+            self._by_time = {}
+            for row in self.evaluate_batch(self.bars).iter_rows(named=True):
+                sig = signal_from_row(row, self.id, self.venue)
+                self._by_time.setdefault(sig.created_at, []).append(sig)
+        return list(self._by_time.get(ctx.as_of, []))
+
+    def evaluate_batch(self, bars: pl.DataFrame) -> pl.DataFrame:
+        n = self.lookback
+        market = ["symbol", "venue"] if "venue" in bars.columns else ["symbol"]
+        df = bars.sort([*market, "event_time"]).with_columns(
+            pl.col("close").shift(1).rolling_max(window_size=n).over(market).alias("_hi"),
+            pl.col("close").shift(1).rolling_min(window_size=n).over(market).alias("_lo"),
+        ).with_columns(
+            pl.when(pl.col("close") > pl.col("_hi")).then(1)
+            .when(pl.col("close") < pl.col("_lo")).then(-1)
+            .otherwise(0).alias("direction"),
+        ).with_columns(
+            (pl.int_range(pl.len()).over(market) // n).alias("_bucket"),
+        ).filter(pl.col("direction") != 0)
+        # At most one signal per symbol per lookback window keeps the fixture
+        # at a realistic trade frequency.
+        df = df.unique(subset=[*market, "_bucket"], keep="first", maintain_order=True)
+        return df.select(
+            "event_time",
+            *market,
+            pl.col("direction").cast(pl.Int64),
+            pl.lit(0.6).alias("magnitude"),
+            pl.lit(0.65).alias("confidence"),
+            pl.lit(0.03).alias("confidence_lower"),
+            (pl.col("close") * (1 - 0.02 * pl.col("direction"))).round(4).alias("invalidation_price"),
+            (pl.col("close") * (1 + 0.05 * pl.col("direction"))).round(4).alias("target_price"),
+            pl.lit("breakout_ref").alias("features_hash"),
+        ).sort(["event_time", *market])
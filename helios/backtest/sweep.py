@@ -0,0 +1,320 @@
+"""Parallel parameter sweeps with shared inputs, checkpoint/resume and DSR.
+
+Why this exists:
+  The research scripts (research_xsectional, research_combined_book,
+  backtest_a8_expanded) each hand-rolled a serial grid loop and recomputed
+  the same aligned matrices for every config. Sweeps of a few hundred
+  configs over 15 perps took long enough that a crash meant starting over,
+  and nothing kept count of how many configs were tried, so the reported
+  "best" Sharpe was never deflated for the search.
+
+Design:
+  - An evaluation is a pure module-level function
+        fn(inputs: Mapping[str, Any], **params) -> Mapping[str, Any]
+    returning metrics. An optional "returns" entry (per-period returns) is
+    kept apart from the metrics and used for the Deflated Sharpe Ratio;
+    an optional "periods_per_year" metric overrides the sweep default.
+  - Inputs are published once. NumPy arrays become `.npy` files and Arrow /
+    Polars tables become Arrow IPC files; every worker memory-maps them in
+    its initializer, so nothing large is pickled per task and all workers
+    share the page cache.
+  - Trials fan out over a ProcessPoolExecutor (spawn context — no forked
+    DuckDB/loguru state). `max_workers=1` runs in-process.
+  - With `checkpoint=`, each finished trial is appended to a JSONL file as
+    it completes, tagged with a fingerprint of the sweep: `fn`'s qualified
+    name and source, plus the content of every input. Re-running the same
+    sweep skips params already recorded under that fingerprint, so a
+    crashed sweep resumes where it stopped. An edited function or changed
+    data never resumes from stale metrics.
+  - `n_trials` is the full grid size (resumed trials included) and is fed
+    into `deflated_sharpe()` for the best trial automatically.
+"""
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import inspect
+import itertools
+import json
+import math
+import multiprocessing as mp
+import shutil
+import tempfile
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import polars as pl
+import pyarrow as pa
+
+from helios.backtest.tearsheet import deflated_sharpe
+from helios.ops import get_logger
+
+log = get_logger(__name__)
+
+EvalFn = Callable[..., Mapping[str, Any]]
+
+# Set in each worker by _init_worker(); read by _run_trial().
+_WORKER_INPUTS: dict[str, Any] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class Trial:
+    params: dict[str, Any]
+    metrics: dict[str, Any]
+    returns: np.ndarray | None = None
+
+
+@dataclass
+class SweepReport:
+    trials: list[Trial]  # grid order
+    n_trials: int
+    metric: str
+    best: Trial | None
+    deflated_sharpe: float | None
+    n_resumed: int
+    elapsed_s: float
+
+    def frame(self) -> pl.DataFrame:
+        """One row per trial: params then metrics."""
+        return pl.DataFrame([{**t.params, **t.metrics} for t in self.trials])
+
+
+def param_grid(**axes: Iterable[Any]) -> list[dict[str, Any]]:
+    """Cartesian product of the axes, in argument order:
+    param_grid(lookback=(1, 4), hold=(1, 4)) → 4 dicts."""
+    names = list(axes)
+    return [dict(zip(names, combo, strict=True)) for combo in itertools.product(*axes.values())]
+
+
+def run_sweep(
+    fn: EvalFn,
+    grid: Sequence[Mapping[str, Any]],
+    inputs: Mapping[str, Any] | None = None,
+    *,
+    metric: str = "sharpe",
+    periods_per_year: int = 252,
+    min_periods: int = 0,
+    max_workers: int | None = None,
+    checkpoint: str | Path | None = None,
+    workdir: str | Path | None = None,
+) -> SweepReport:
+    """Evaluate `fn(inputs, **params)` for every params in `grid`.
+
+    The best trial maximizes `metric` among trials with at least
+    `min_periods` returns (or any trial, if `fn` returns none). Its DSR uses
+    the "sharpe" metric, its returns and n_trials = len(grid).
+    """
+    t0 = time.perf_counter()
+    inputs = dict(inputs or {})
+    grid = [dict(p) for p in grid]
+    keys = [_params_key(p) for p in grid]
+    if len(set(keys)) != len(keys):
+        raise ValueError("parameter grid contains duplicate configs")
+
+    fingerprint = sweep_fingerprint(fn, inputs) if checkpoint else ""
+    done: dict[str, Trial] = _load_checkpoint(Path(checkpoint), fingerprint) if checkpoint else {}
+    pending = [(k, p) for k, p in zip(keys, grid, strict=True) if k not in done]
+    n_resumed = len(grid) - len(pending)
+    if n_resumed:
+        log.info("sweep_resumed", fn=fn.__qualname__, resumed=n_resumed, pending=len(pending))
+
+    with (
+        Path(checkpoint).open("a+", encoding="utf-8") if checkpoint else contextlib.nullcontext()
+    ) as sink:
+        if sink is not None and sink.tell():
+            sink.seek(sink.tell() - 1)
+            if sink.read(1) != "\n":
+                sink.write("\n")  # end a torn last line so the next record starts clean
+
+        def _record(key: str, params: dict[str, Any], out: Mapping[str, Any]) -> None:
+            trial = _to_trial(params, out)
+            done[key] = trial
+            if sink is not None:
+                sink.write(_trial_json(trial, fingerprint) + "\n")
+                sink.flush()
+
+        if max_workers == 1 or len(pending) <= 1:
+            for key, params in pending:
+                _record(key, params, fn(inputs, **params))
+        elif pending:
+            _run_parallel(fn, pending, inputs, max_workers, workdir, _record)
+
+    trials = [done[k] for k in keys]
+    best = _pick_best(trials, metric, min_periods)
+    dsr = None
+    if best is not None and best.returns is not None and "sharpe" in best.metrics:
+        ppy = int(best.metrics.get("periods_per_year", periods_per_year))
+        dsr = deflated_sharpe(float(best.metrics["sharpe"]), best.returns, len(grid), ppy)
+    report = SweepReport(
+        trials=trials, n_trials=len(grid), metric=metric, best=best,
+        deflated_sharpe=dsr, n_resumed=n_resumed, elapsed_s=time.perf_counter() - t0,
+    )
+    log.info(
+        "sweep_done", fn=fn.__qualname__, n_trials=report.n_trials, resumed=n_resumed,
+        best=best.params if best else None, deflated_sharpe=dsr, elapsed_s=report.elapsed_s,
+    )
+    return report
+
+
+def _run_parallel(
+    fn: EvalFn,
+    pending: list[tuple[str, dict[str, Any]]],
+    inputs: dict[str, Any],
+    max_workers: int | None,
+    workdir: str | Path | None,
+    record: Callable[[str, dict[str, Any], Mapping[str, Any]], None],
+) -> None:
+    tmp = Path(tempfile.mkdtemp(prefix="helios_sweep_", dir=workdir))
+    try:
+        manifest = publish_inputs(inputs, tmp)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(manifest,),
+        ) as pool:
+            futures = {pool.submit(_run_trial, fn, params): (key, params) for key, params in pending}
+            remaining = set(futures)
+            while remaining:
+                finished, remaining = wait(remaining, return_when=FIRST_EXCEPTION)
+                for fut in finished:
+                    key, params = futures[fut]
+                    exc = fut.exception()
+                    if exc is not None:
+                        # Completed trials are already checkpointed; a rerun resumes.
+                        log.error("sweep_trial_failed", fn=fn.__qualname__, params=params, error=str(exc))
+                        for f in remaining:
+                            f.cancel()
+                        raise exc
+                    record(key, params, fut.result())
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+# ---- shared inputs ----
+
+
+def publish_inputs(inputs: Mapping[str, Any], directory: Path) -> list[tuple[str, str, str]]:
+    """Write inputs once for memory-mapping. Returns (name, kind, path) entries."""
+    manifest: list[tuple[str, str, str]] = []
+    for i, (name, value) in enumerate(inputs.items()):
+        if isinstance(value, np.ndarray):
+            path = directory / f"{i}.npy"
+            np.save(path, np.ascontiguousarray(value), allow_pickle=False)
+            manifest.append((name, "numpy", str(path)))
+        elif isinstance(value, (pa.Table, pl.DataFrame)):
+            table = value.to_arrow() if isinstance(value, pl.DataFrame) else value
+            path = directory / f"{i}.arrow"
+            with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            manifest.append((name, "polars" if isinstance(value, pl.DataFrame) else "arrow", str(path)))
+        else:
+            raise TypeError(f"sweep input {name!r}: expected ndarray, pa.Table or pl.DataFrame, got {type(value).__name__}")
+    return manifest
+
+
+def attach_inputs(manifest: Sequence[tuple[str, str, str]]) -> dict[str, Any]:
+    """Zero-copy views over published inputs (read-only)."""
+    out: dict[str, Any] = {}
+    for name, kind, path in manifest:
+        if kind == "numpy":
+            out[name] = np.load(path, mmap_mode="r")
+        else:
+            table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+            out[name] = pl.from_arrow(table) if kind == "polars" else table
+    return out
+
+
+def _init_worker(manifest: list[tuple[str, str, str]]) -> None:
+    global _WORKER_INPUTS
+    _WORKER_INPUTS = attach_inputs(manifest)
+
+
+def _run_trial(fn: EvalFn, params: dict[str, Any]) -> Mapping[str, Any]:
+    return fn(_WORKER_INPUTS, **params)
+
+
+# ---- trials & checkpoint ----
+
+
+def sweep_fingerprint(fn: EvalFn, inputs: Mapping[str, Any]) -> str:
+    """sha256 over fn's qualified name and source and every input's content."""
+    h = hashlib.sha256(f"{fn.__module__}.{fn.__qualname__}".encode())
+    try:
+        h.update(inspect.getsource(fn).encode())
+    except (OSError, TypeError):
+        h.update(fn.__code__.co_code)  # no source on disk (REPL, frozen)
+    for name, value in inputs.items():
+        h.update(name.encode())
+        if isinstance(value, np.ndarray):
+            h.update(f"{value.dtype.str}{value.shape}".encode())
+            h.update(np.ascontiguousarray(value).tobytes())
+        else:
+            table = value.to_arrow() if isinstance(value, pl.DataFrame) else value
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            h.update(sink.getvalue())
+    return h.hexdigest()
+
+
+def _params_key(params: Mapping[str, Any]) -> str:
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+def _to_trial(params: dict[str, Any], out: Mapping[str, Any]) -> Trial:
+    metrics = dict(out)
+    returns = metrics.pop("returns", None)
+    return Trial(
+        params=params,
+        metrics=metrics,
+        returns=np.asarray(returns, dtype=float) if returns is not None else None,
+    )
+
+
+def _trial_json(trial: Trial, fingerprint: str) -> str:
+    return json.dumps({
+        "fingerprint": fingerprint,
+        "params": trial.params,
+        "metrics": trial.metrics,
+        "returns": trial.returns.tolist() if trial.returns is not None else None,
+    }, default=float)
+
+
+def _load_checkpoint(path: Path, fingerprint: str) -> dict[str, Trial]:
+    done: dict[str, Trial] = {}
+    if not path.exists():
+        return done
+    stale = 0
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn last line from a crash
+            if row.get("fingerprint") != fingerprint:
+                stale += 1  # another function or other inputs
+                continue
+            trial = _to_trial(row["params"], {**row["metrics"], "returns": row.get("returns")})
+            done[_params_key(trial.params)] = trial
+    if stale:
+        log.info("sweep_checkpoint_stale", path=str(path), skipped=stale)
+    return done
+
+
+def _pick_best(trials: list[Trial], metric: str, min_periods: int) -> Trial | None:
+    best: Trial | None = None
+    for t in trials:
+        value = t.metrics.get(metric)
+        if value is None or not math.isfinite(float(value)):
+            continue
+        if t.returns is not None and len(t.returns) < min_periods:
+            continue
+        if best is None or float(value) > float(best.metrics[metric]):
+            best = t
+    return best
@@ -0,0 +1,286 @@
+"""Columnar backtest engine — the fast path for VectorizedStrategy.
+
+The event-driven engine (engine.py) builds a MarketSnapshot per bar, a full
+PortfolioState per timestamp and awaits Orchestrator.tick() for every bar.
+A year of 1m bars across 15 perps therefore takes hours, even though almost
+every tick produces no signal.
+
+This engine:
+  1. Pivots a Polars/Arrow bar frame into (T, S) NumPy matrices, one column
+     per (symbol, venue) market, as the event path keys its snapshots.
+  2. Calls `evaluate_batch()` once per strategy over the whole frame.
+  3. Walks only the ticks that carry signals. Between them, positions and
+     cash are constant, so the equity curve for the gap is one
+     matrix-vector product over the mark matrix.
+  4. At a signal tick, marks the same PortfolioLedger the event path keeps
+     (held and signalled markets only, plus the gap's NAV peak) and hands
+     its snapshot and the signals to Orchestrator.process_signals() — the
+     same allocator, bandit, risk overlay and PaperBroker. Fill objects
+     exist only for real trades.
+
+Sizing and risk see the broker's exact books, so fills match the
+event-driven path. Marks are sticky (last close seen), as in the ledger.
+A signal for a market with no bars gets no snapshot, so it is sized and
+risk-checked but never fills, also as in the event path. The equity curve
+is float64 rather than Decimal; the tearsheet agrees to floating-point
+precision.
+
+Speed (scripts/bench_backtest_vectorized.py): 30-40x the event path at 3
+symbols and about 15x at 15. That does NOT meet the 50x the request asked for.
+What remains is mostly per signal tick, not per bar:
+Orchestrator.process_signals() (allocator, bandit, risk, broker) and the
+ledger marks, whose cost grows with the number of held markets, plus the
+strategy's own evaluate_batch(), which the event path pays too. Closing
+the gap means batching the shared allocation/risk/broker path itself.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+import polars as pl
+import pyarrow as pa
+
+from helios.allocator.bandit import StrategyBandit
+from helios.backtest.engine import equity_to_returns
+from helios.backtest.tearsheet import TearSheet, tearsheet
+from helios.execution.ledger import PortfolioLedger
+from helios.execution.paper_broker import MarketSnapshot, PaperBroker
+from helios.execution.router import ExecutionMode, ExecutionRouter
+from helios.ops import get_logger
+from helios.orchestrator import Orchestrator
+from helios.strategies import VectorizedStrategy
+from helios.types import Fill, Signal, StrategyId, Venue
+
+log = get_logger(__name__)
+
+
+@dataclass
+class VectorizedBacktestReport:
+    fills: list[Fill]
+    equity_curve: np.ndarray  # float64 NAV per tick
+    tearsheet: TearSheet
+    n_signal_ticks: int
+
+
+@dataclass
+class _BarMatrix:
+    times_us: np.ndarray  # (T,) sorted unique event_time, epoch microseconds
+    markets: list[tuple[str, Venue]]  # column j's (symbol, venue), sorted
+    high: np.ndarray    # (T, S), NaN where a market has no bar
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    last_close: np.ndarray  # close forward-filled along time: the sticky mark
+    col: dict[tuple[str, Venue], int]
+
+
+@dataclass
+class VectorizedBacktestEngine:
+    strategies: list[VectorizedStrategy]
+    starting_cash: Decimal = Decimal("1000")
+    bar_spread_bps: float = 5.0
+    periods_per_year: int = 365 * 24
+    default_venue: Venue = Venue.KRAKEN_FUTURES  # when the frame has no `venue` column
+    orchestrator_kwargs: dict[str, Any] = field(default_factory=dict)
+
+    async def run(self, bars: pl.DataFrame | pa.Table) -> VectorizedBacktestReport:
+        frame = pl.from_arrow(bars) if isinstance(bars, pa.Table) else bars
+        broker = PaperBroker(starting_cash=self.starting_cash)
+        ledger = PortfolioLedger(broker)
+        router = ExecutionRouter(mode=ExecutionMode.PAPER, paper=broker)
+        kwargs = {"bandit": StrategyBandit(), **self.orchestrator_kwargs}  # never the live checkpoint
+        orch = Orchestrator(strategies=list(self.strategies), router=router, **kwargs)
+        await orch.prepare()
+
+        m = self._pivot(frame)
+        n_t, n_s = m.close.shape
+        signals_by_tick = self._batch_signals(frame, m)
+        # Markets not yet seen are NaN here but never held, so they value at 0
+        marks_f = np.nan_to_num(m.last_close, nan=0.0)
+
+        equity = np.empty(n_t, dtype=float)
+        qty = np.zeros(n_s, dtype=float)
+        cash = float(self.starting_cash)
+        peak = cash
+        start = 0
+
+        for t in sorted(signals_by_tick):
+            # Positions are constant over [start, t]: one matvec for the gap.
+            equity[start:t + 1] = cash + marks_f[start:t + 1] @ qty
+            # Books are unchanged across the gap, so marking the ledger at the
+            # gap's float argmax gives the exact peak the event path tracks.
+            # A gap that stays clearly below the peak cannot move it, and the
+            # mark at t overwrites every mark made at k, so that mark is skipped.
+            k = start + int(np.argmax(equity[start:t + 1]))
+            if k != t and equity[k] >= peak - _PEAK_TOL * abs(peak):
+                ledger.mark(self._exact_marks(m, k, broker), _tick_time(m, k))
+            signals = signals_by_tick[t]
+            traded = {(s.symbol, s.venue) for s in signals} & m.col.keys()
+            ledger.mark(self._exact_marks(m, t, broker, traded), _tick_time(m, t))
+            snapshots = {key: self._snapshot(m, t, m.col[key]) for key in traded}
+            state = ledger.snapshot()
+            peak = float(state.peak_nav_usd)
+            await orch.process_signals(signals, state, snapshots)
+
+            # Sync the float mirror from the broker's exact books. Only
+            # markets with a snapshot ever fill, so every book has a column.
+            cash = float(broker.cash)
+            for key, book in broker.positions.items():
+                qty[m.col[key]] = float(book.qty)
+            start = t + 1
+
+        if start < n_t:
+            equity[start:] = cash + marks_f[start:] @ qty
+
+        returns = equity_to_returns(equity)
+        ts = tearsheet(returns, periods_per_year=self.periods_per_year, n_trials=1)
+        log.info(
+            "vectorized_backtest_done",
+            n_ticks=n_t,
+            n_markets=n_s,
+            n_signal_ticks=len(signals_by_tick),
+            n_fills=len(broker.fills),
+            final_nav=float(equity[-1]) if n_t else float(self.starting_cash),
+            sharpe=ts.sharpe,
+            max_dd=ts.max_drawdown,
+        )
+        return VectorizedBacktestReport(
+            fills=broker.fills, equity_curve=equity, tearsheet=ts,
+            n_signal_ticks=len(signals_by_tick),
+        )
+
+    # ---- frame → matrices ----
+
+    def _pivot(self, frame: pl.DataFrame) -> _BarMatrix:
+        # Dense ranks are the grid coordinates: one parallel Polars pass
+        # instead of sort + searchsorted + an Enum cast. A market is a
+        # (symbol, venue) pair; "\x00" sorts below any character, so ranking
+        # the joined string orders columns as the sorted pairs do.
+        has_venue = "venue" in frame.columns
+        market = (
+            pl.concat_str([pl.col("symbol"), pl.col("venue").cast(pl.Utf8)], separator="\x00")
+            if has_venue else pl.col("symbol")
+        )
+        pos = frame.select(
+            pl.col("event_time").dt.epoch("us").alias("us"),
+            (pl.col("event_time").rank("dense") - 1).alias("t"),
+            (market.rank("dense") - 1).alias("s"),
+        )
+        t_pos = pos.get_column("t").to_numpy().astype(np.int64)
+        s_pos = pos.get_column("s").to_numpy().astype(np.int64)
+        if has_venue:
+            pairs = frame.select("symbol", pl.col("venue").cast(pl.Utf8)).unique().sort(["symbol", "venue"])
+            markets = [(sym, Venue(v)) for sym, v in pairs.iter_rows()]
+        else:
+            markets = [(sym, self.default_venue) for sym in frame.get_column("symbol").unique().sort()]
+        col = {key: j for j, key in enumerate(markets)}
+        n_t, n_s = (int(t_pos.max()) + 1 if len(t_pos) else 0), len(markets)
+        times_us = np.empty(n_t, dtype=np.int64)
+        times_us[t_pos] = pos.get_column("us").to_numpy()
+        flat = t_pos * n_s + s_pos
+
+        def _mat(name: str) -> np.ndarray:
+            out = np.full(n_t * n_s, np.nan)
+            out[flat] = frame.get_column(name).cast(pl.Float64).to_numpy()
+            return out.reshape(n_t, n_s)
+
+        close = _mat("close")
+        gaps = np.isnan(close)
+        if gaps.any():
+            idx = np.where(gaps, 0, np.arange(n_t)[:, None])
+            last_close = close[np.maximum.accumulate(idx, axis=0), np.arange(n_s)]
+        else:
+            last_close = close  # every market has a bar at every tick
+
+        return _BarMatrix(
+            times_us=times_us, markets=markets,
+            high=_mat("high"), low=_mat("low"), close=close, volume=_mat("volume"),
+            last_close=last_close, col=col,
+        )
+
+    def _batch_signals(self, frame: pl.DataFrame, m: _BarMatrix) -> dict[int, list[Signal]]:
+        out: dict[int, list[Signal]] = {}
+        # A signal row without a venue trades the symbol's only market, if it has one.
+        venues: dict[str, set[Venue]] = {}
+        for symbol, venue in m.markets:
+            venues.setdefault(symbol, set()).add(venue)
+        venue_of = {sym: vs.pop() if len(vs) == 1 else self.default_venue for sym, vs in venues.items()}
+        for strat in self.strategies:  # strategy order == tick() evaluation order
+            sig_frame = strat.evaluate_batch(frame)
+            if sig_frame.height == 0:
+                continue
+            sig_us = _epoch_us(sig_frame.get_column("event_time"))
+            t_pos = np.minimum(np.searchsorted(m.times_us, sig_us), len(m.times_us) - 1)
+            on_grid = m.times_us[t_pos] == sig_us
+            for t, ok, row in zip(t_pos.tolist(), on_grid.tolist(), sig_frame.iter_rows(named=True), strict=True):
+                if not ok:
+                    continue
+                venue = venue_of.get(row["symbol"], self.default_venue)
+                out.setdefault(t, []).append(signal_from_row(row, strat.id, venue))
+        return out
+
+    # ---- exact per-tick values (match engine.py's Decimal arithmetic) ----
+
+    def _exact_marks(
+        self, m: _BarMatrix, t: int, broker: PaperBroker, extra: Iterable[tuple[str, Venue]] = (),
+    ) -> dict[tuple[str, Venue], Decimal]:
+        # Only held markets (plus any about to trade) move NAV; skip the rest of the row.
+        out: dict[tuple[str, Venue], Decimal] = {}
+        for key, book in broker.positions.items():
+            if book.qty_units:
+                out[key] = Decimal(repr(float(m.last_close[t, m.col[key]])))
+        for key in extra:
+            out[key] = Decimal(repr(float(m.last_close[t, m.col[key]])))
+        return out
+
+    def _snapshot(self, m: _BarMatrix, t: int, j: int) -> MarketSnapshot:
+        high = Decimal(repr(float(m.high[t, j])))
+        low = Decimal(repr(float(m.low[t, j])))
+        mid = (high + low) / Decimal("2")
+        return MarketSnapshot(
+            mid_price=mid,
+            spread_bps=self.bar_spread_bps,
+            bar_volume=float(m.volume[t, j]),
+            bar_volatility=float((high - low) / mid) if mid > 0 else 0.0,
+        )
+
+
+def _tick_time(m: _BarMatrix, t: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=int(m.times_us[t]))
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# Float equity vs the ledger's exact NAV: far wider than their ~1e-12 disagreement
+_PEAK_TOL = 1e-9
+
+
+def _epoch_us(col: pl.Series) -> np.ndarray:
+    return col.dt.epoch("us").to_numpy()
+
+
+def signal_from_row(row: dict[str, Any], strategy: StrategyId, venue: Venue) -> Signal:
+    """Materialize one evaluate_batch() row as a Signal.
+
+    Prices go through `Decimal(repr(float))`, the same conversion a Bar built
+    from float data uses, so event and vectorized paths see identical Decimals.
+    """
+    target = row.get("target_price")
+    created_at = row["event_time"]
+    return Signal(
+        strategy=strategy,
+        symbol=row["symbol"],
+        venue=Venue(row["venue"]) if row.get("venue") else venue,
+        direction=int(row["direction"]),
+        magnitude=float(row["magnitude"]),
+        confidence=float(row["confidence"]),
+        confidence_lower=float(row["confidence_lower"]),
+        invalidation_price=Decimal(repr(float(row["invalidation_price"]))),
+        target_price=Decimal(repr(float(target))) if target is not None else None,
+        features_hash=str(row.get("features_hash") or ""),
+        created_at=created_at if created_at.tzinfo else created_at.replace(tzinfo=timezone.utc),
+    )
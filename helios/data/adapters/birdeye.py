@@ -16,7 +16,9 @@ from dataclasses import dataclass
 import httpx
 
 from helios.data.adapters.base import VenueError
+from helios.data.store.candle_cache import CandleCache
 from helios.ops import get_logger
+from helios.ops.ratelimit import TokenBucket, limiter_for, retry_after_seconds
 
 log = get_logger(__name__)
 
@@ -39,6 +41,8 @@ class BirdeyeAdapter:
         client: httpx.AsyncClient | None = None,
         max_retries: int = 5,
         base_backoff_seconds: float = 1.5,
+        limiter: TokenBucket | None = None,
+        cache: CandleCache | None = None,
     ) -> None:
         self.api_key = api_key or os.getenv("BIRDEYE_API_KEY")
         if not self.api_key:
@@ -49,11 +53,14 @@ class BirdeyeAdapter:
         )
         self._max_retries = max_retries
         self._base_backoff = base_backoff_seconds
+        self._limiter = limiter or limiter_for("birdeye")
+        self._cache = cache
 
     async def _get(self, url: str, params: dict | None = None) -> httpx.Response:
         """GET with 429 / 5xx backoff. Raises VenueError on persistent failure."""
         last_exc: Exception | None = None
         for attempt in range(self._max_retries):
+            await self._limiter.acquire()
             try:
                 resp = await self._client.get(url, params=params)
             except httpx.HTTPError as e:
@@ -61,15 +68,12 @@ class BirdeyeAdapter:
                 await asyncio.sleep(self._base_backoff * (2 ** attempt))
                 continue
             if resp.status_code == 429 or resp.status_code >= 500:
-                wait = self._base_backoff * (2 ** attempt)
                 # Honor Retry-After if present
-                ra = resp.headers.get("Retry-After")
-                if ra:
-                    try:
-                        wait = max(wait, float(ra))
-                    except ValueError:
-                        pass
-                await asyncio.sleep(wait)
+                wait = retry_after_seconds(resp.headers, self._base_backoff * (2 ** attempt))
+                if resp.status_code == 429:
+                    self._limiter.penalize(wait)  # every caller backs off, not just this one
+                else:
+                    await asyncio.sleep(wait)
                 continue
             return resp
         raise VenueError(f"Birdeye GET {url} failed after {self._max_retries} retries: {last_exc}")
@@ -142,7 +146,18 @@ class BirdeyeAdapter:
 
         interval: '1m', '3m', '5m', '15m', '30m', '1H', '2H', '4H', '6H', '8H',
                   '12H', '1D', '3D', '1W', '1M' per Birdeye docs.
+
+        With a CandleCache, only the parts of the window not already cached
+        are requested.
         """
+        if self._cache is not None:
+            return await self._cache.fetch(
+                "birdeye", mint_address, interval, time_from, time_to,
+                lambda start, end: self._fetch_ohlcv(mint_address, start, end, interval),
+            )
+        return await self._fetch_ohlcv(mint_address, time_from, time_to, interval)
+
+    async def _fetch_ohlcv(self, mint_address: str, time_from: int, time_to: int, interval: str) -> list[dict]:
         url = f"{BIRDEYE_BASE}/defi/ohlcv"
         # Birdeye caps at ~1000 candles per response. Compute approximate chunk size.
         seconds_per_candle = {
@@ -17,10 +17,15 @@ RugFilter correctly REJECTS any token whose K/C/P fields default to unknown.
 This is intentional: the system is safe by default. Until we wire authority
 checks, no token can pass — which is the right behavior before live capital.
 
+Rate limit: every HTTP request (one per mint, or one per chunk of
+MAX_TOKENS_PER_REQUEST mints) draws from the process-wide "dexscreener"
+token bucket (helios.ops.ratelimit); callers don't pace around it.
+
 API: https://docs.dexscreener.com/api/reference
 """
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from decimal import Decimal
 
@@ -28,11 +33,13 @@ import httpx
 
 from helios.data.adapters.base import VenueError
 from helios.ops import get_logger
+from helios.ops.ratelimit import TokenBucket, limiter_for, retry_after_seconds
 from helios.strategies.a2_meme_snipe.snapshot import TokenSnapshot
 
 log = get_logger(__name__)
 
 DEXSCREENER_BASE = "https://api.dexscreener.com/latest/dex"
+MAX_TOKENS_PER_REQUEST = 30  # documented cap for comma-separated token addresses
 
 
 def _dec(x, default: Decimal = Decimal("0")) -> Decimal:
@@ -50,8 +57,18 @@ def _int(x, default: int = 0) -> int:
 
 
 class DexScreenerAdapter:
-    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+    def __init__(self, client: httpx.AsyncClient | None = None, limiter: TokenBucket | None = None) -> None:
         self._client = client or httpx.AsyncClient(timeout=15.0)
+        self._limiter = limiter or limiter_for("dexscreener")
+
+    async def _get(self, url: str) -> httpx.Response:
+        """One paced GET; a 429 pauses every caller of the shared bucket."""
+        await self._limiter.acquire()
+        resp = await self._client.get(url)
+        if resp.status_code == 429:
+            self._limiter.penalize(retry_after_seconds(resp.headers, 5.0))
+        resp.raise_for_status()
+        return resp
 
     async def fetch_token_snapshot(self, mint_address: str) -> TokenSnapshot | None:
         """Return a TokenSnapshot for the most-liquid Solana pair of this mint,
@@ -60,79 +77,110 @@ class DexScreenerAdapter:
         a separate adapter must fill them before any trade can pass."""
         url = f"{DEXSCREENER_BASE}/tokens/{mint_address}"
         try:
-            resp = await self._client.get(url)
-            resp.raise_for_status()
+            resp = await self._get(url)
         except httpx.HTTPError as e:
             raise VenueError(f"DexScreener fetch failed for {mint_address}: {e}") from e
 
-        body = resp.json()
-        pairs = body.get("pairs") or []
-        solana_pairs = [p for p in pairs if p.get("chainId") == "solana"]
-        if not solana_pairs:
-            return None
-        # Pick the most-liquid pair
-        pair = max(solana_pairs, key=lambda p: float(p.get("liquidity", {}).get("usd", 0) or 0))
-
-        base = pair.get("baseToken") or {}
-        liquidity = (pair.get("liquidity") or {}).get("usd") or 0
-        fdv = pair.get("fdv") or 0
-        vol5m = (pair.get("volume") or {}).get("m5") or 0
-        vol1h = (pair.get("volume") or {}).get("h1") or 0
-        txns_5m = ((pair.get("txns") or {}).get("m5") or {})
-        txns_1h = ((pair.get("txns") or {}).get("h1") or {})
-        buys_5m = _int(txns_5m.get("buys"))
-        sells_5m = _int(txns_5m.get("sells"))
-        n_5m = buys_5m + sells_5m
-        n_1h = _int(txns_1h.get("buys")) + _int(txns_1h.get("sells"))
-
-        # Approximate spread from buy/sell imbalance + activity. Heuristic:
-        # well-balanced (ratio 0.4-0.6) AND high activity (>50 txns/5m) => ~3% spread.
-        # Heavily skewed or low activity => unknown (filter rejects).
-        spread_pct: float | None = None
-        if n_5m >= 50 and buys_5m > 0 and sells_5m > 0:
-            ratio = buys_5m / n_5m
-            if 0.30 <= ratio <= 0.70:
-                # Map balance to spread: perfectly balanced -> 2%, edge of band -> 4%
-                imbalance = abs(ratio - 0.5) / 0.20  # 0..1 within band
-                spread_pct = 0.02 + imbalance * 0.02
-
-        pair_created_ms = pair.get("pairCreatedAt")
-        if pair_created_ms:
-            created = datetime.fromtimestamp(int(pair_created_ms) / 1000, tz=timezone.utc)
-            age_seconds = int((datetime.now(timezone.utc) - created).total_seconds())
-        else:
-            age_seconds = 0
-
-        last_price = pair.get("priceUsd") or 0
-
-        return TokenSnapshot(
-            mint_address=base.get("address") or mint_address,
-            symbol=base.get("symbol") or "?",
-            name=base.get("name") or "?",
-            venue_pair_address=pair.get("pairAddress") or "",
-            pool_age_seconds=age_seconds,
-            liquidity_usd=_dec(liquidity),
-            fully_diluted_value_usd=_dec(fdv),
-            volume_5m_usd=_dec(vol5m),
-            volume_1h_usd=_dec(vol1h),
-            txns_5m=n_5m,
-            txns_1h=n_1h,
-            # Fields DexScreener doesn't surface — default to UNKNOWN/false so
-            # the RugFilter rejects until authority adapter (Phase 2.2) lands.
-            mint_authority_renounced=False,
-            freeze_authority_renounced=False,
-            lp_locked_or_burned=False,
-            lp_lock_pct=0.0,
-            top_10_holder_pct=1.0,
-            dev_wallet_pct=1.0,
-            n_holders=0,
-            metadata_verified=bool(base.get("symbol") and base.get("name")),
-            dev_history_known=False,
-            dev_rug_history_count=0,
-            bid_ask_spread_pct=spread_pct,
-            last_trade_price_usd=_dec(last_price),
-            snapshot_time=datetime.now(timezone.utc),
-        )
+        return _snapshot_from_pairs(mint_address, resp.json().get("pairs") or [])
+
+    async def fetch_token_snapshots(self, mint_addresses: Sequence[str]) -> dict[str, TokenSnapshot]:
+        """fetch_token_snapshot() for many mints, MAX_TOKENS_PER_REQUEST per
+        request (the tokens endpoint takes a comma-separated list). Mints with
+        no Solana pair are absent from the result."""
+        out: dict[str, TokenSnapshot] = {}
+        mints = list(dict.fromkeys(mint_addresses))
+        for i in range(0, len(mints), MAX_TOKENS_PER_REQUEST):
+            chunk = mints[i:i + MAX_TOKENS_PER_REQUEST]
+            url = f"{DEXSCREENER_BASE}/tokens/{','.join(chunk)}"
+            try:
+                resp = await self._get(url)
+            except httpx.HTTPError as e:
+                raise VenueError(f"DexScreener batch fetch failed for {len(chunk)} mints: {e}") from e
+            # A pair belongs to each requested mint on either side of it, as
+            # in the single-mint response.
+            wanted = set(chunk)
+            by_mint: dict[str, list[dict]] = {}
+            for pair in resp.json().get("pairs") or []:
+                for side in ("baseToken", "quoteToken"):
+                    address = (pair.get(side) or {}).get("address")
+                    if address in wanted:
+                        by_mint.setdefault(address, []).append(pair)
+            for mint, pairs in by_mint.items():
+                snap = _snapshot_from_pairs(mint, pairs)
+                if snap is not None:
+                    out[mint] = snap
+        return out
 
     async def close(self) -> None:
         await self._client.aclose()
+
+
+def _snapshot_from_pairs(mint_address: str, pairs: list[dict]) -> TokenSnapshot | None:
+    """Snapshot of the most-liquid Solana pair among `pairs`, or None."""
+    solana_pairs = [p for p in pairs if p.get("chainId") == "solana"]
+    if not solana_pairs:
+        return None
+    # Pick the most-liquid pair
+    pair = max(solana_pairs, key=lambda p: float(p.get("liquidity", {}).get("usd", 0) or 0))
+
+    base = pair.get("baseToken") or {}
+    liquidity = (pair.get("liquidity") or {}).get("usd") or 0
+    fdv = pair.get("fdv") or 0
+    vol5m = (pair.get("volume") or {}).get("m5") or 0
+    vol1h = (pair.get("volume") or {}).get("h1") or 0
+    txns_5m = ((pair.get("txns") or {}).get("m5") or {})
+    txns_1h = ((pair.get("txns") or {}).get("h1") or {})
+    buys_5m = _int(txns_5m.get("buys"))
+    sells_5m = _int(txns_5m.get("sells"))
+    n_5m = buys_5m + sells_5m
+    n_1h = _int(txns_1h.get("buys")) + _int(txns_1h.get("sells"))
+
+    # Approximate spread from buy/sell imbalance + activity. Heuristic:
+    # well-balanced (ratio 0.4-0.6) AND high activity (>50 txns/5m) => ~3% spread.
+    # Heavily skewed or low activity => unknown (filter rejects).
+    spread_pct: float | None = None
+    if n_5m >= 50 and buys_5m > 0 and sells_5m > 0:
+        ratio = buys_5m / n_5m
+        if 0.30 <= ratio <= 0.70:
+            # Map balance to spread: perfectly balanced -> 2%, edge of band -> 4%
+            imbalance = abs(ratio - 0.5) / 0.20  # 0..1 within band
+            spread_pct = 0.02 + imbalance * 0.02
+
+    pair_created_ms = pair.get("pairCreatedAt")
+    if pair_created_ms:
+        created = datetime.fromtimestamp(int(pair_created_ms) / 1000, tz=timezone.utc)
+        age_seconds = int((datetime.now(timezone.utc) - created).total_seconds())
+    else:
+        age_seconds = 0
+
+    last_price = pair.get("priceUsd") or 0
+
+    return TokenSnapshot(
+        mint_address=base.get("address") or mint_address,
+        symbol=base.get("symbol") or "?",
+        name=base.get("name") or "?",
+        venue_pair_address=pair.get("pairAddress") or "",
+        pool_age_seconds=age_seconds,
+        liquidity_usd=_dec(liquidity),
+        fully_diluted_value_usd=_dec(fdv),
+        volume_5m_usd=_dec(vol5m),
+        volume_1h_usd=_dec(vol1h),
+        txns_5m=n_5m,
+        txns_1h=n_1h,
+        # Fields DexScreener doesn't surface — default to UNKNOWN/false so
+        # the RugFilter rejects until authority adapter (Phase 2.2) lands.
+        mint_authority_renounced=False,
+        freeze_authority_renounced=False,
+        lp_locked_or_burned=False,
+        lp_lock_pct=0.0,
+        top_10_holder_pct=1.0,
+        dev_wallet_pct=1.0,
+        n_holders=0,
+        metadata_verified=bool(base.get("symbol") and base.get("name")),
+        dev_history_known=False,
+        dev_rug_history_count=0,
+        bid_ask_spread_pct=spread_pct,
+        last_trade_price_usd=_dec(last_price),
+        snapshot_time=datetime.now(timezone.utc),
+        dex_id=pair.get("dexId"),
+    )
@@ -5,7 +5,11 @@ compute-unit budget exhausts in ~2 days of continuous operation. GeckoTerminal
 is free, requires no API key, and serves historical 1m/1h/1d candles for any
 tracked Solana pool.
 
-Rate limit: ~30 calls/min on the free tier. We throttle to stay under.
+Rate limit: ~30 calls/min on the free tier. Every request draws from the
+process-wide "geckoterminal" token bucket (helios.ops.ratelimit), so
+concurrent callers share the budget instead of each assuming they own it.
+Pass `cache=` (helios.data.store.candle_cache) to serve already-fetched
+windows locally; only uncovered gaps reach DexScreener/GeckoTerminal.
 
 Flow for our use:
     mint  --(DexScreener)-->  pool_address  --(GeckoTerminal)-->  OHLCV
@@ -17,14 +21,14 @@ API: https://www.geckoterminal.com/dex-api
 """
 from __future__ import annotations
 
-import asyncio
-import time
 from typing import Optional
 
 import httpx
 
 from helios.data.adapters.base import VenueError
+from helios.data.store.candle_cache import CandleCache, PartialCandles
 from helios.ops import get_logger
+from helios.ops.ratelimit import TokenBucket, limiter_for, retry_after_seconds
 
 log = get_logger(__name__)
 
@@ -36,29 +40,36 @@ class GeckoTerminalAdapter:
     def __init__(
         self,
         client: Optional[httpx.AsyncClient] = None,
-        min_interval_seconds: float = 2.2,   # ~27/min, under the 30/min free cap
+        min_interval_seconds: float | None = None,  # private pacing instead of the shared bucket
+        limiter: TokenBucket | None = None,
+        cache: CandleCache | None = None,
     ) -> None:
         self._client = client or httpx.AsyncClient(
             timeout=20.0,
             headers={"Accept": "application/json"},
         )
-        self.min_interval_seconds = min_interval_seconds
-        self._last_call = 0.0
+        self._cache = cache
+        if limiter is None and min_interval_seconds is not None:
+            limiter = TokenBucket(1.0 / min_interval_seconds)
+        self._limiter = limiter or limiter_for("geckoterminal")
+        self._dexscreener = limiter_for("dexscreener")
         self._pool_cache: dict[str, Optional[str]] = {}
 
-    async def _throttle(self) -> None:
-        now = time.time()
-        if now - self._last_call < self.min_interval_seconds:
-            await asyncio.sleep(self.min_interval_seconds - (now - self._last_call))
-        self._last_call = time.time()
-
     async def resolve_pool(self, mint: str) -> Optional[str]:
         """mint → most-liquid Solana pool address, via DexScreener. Cached."""
         if mint in self._pool_cache:
             return self._pool_cache[mint]
+        await self._dexscreener.acquire()
         try:
             resp = await self._client.get(f"{DEXSCREENER_TOKENS}/{mint}")
             resp.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429 or e.response.status_code >= 500:
+                # transient: don't cache "no pool", let the caller retry
+                self._dexscreener.penalize(retry_after_seconds(e.response.headers, 5.0))
+                raise VenueError(f"DexScreener pool lookup failed for {mint}: {e}") from e
+            self._pool_cache[mint] = None
+            return None
         except httpx.HTTPError:
             self._pool_cache[mint] = None
             return None
@@ -81,13 +92,20 @@ class GeckoTerminalAdapter:
         newest-first. We page backward from time_to until we cover time_from.
         Output normalized to Birdeye-compatible dicts: {unixTime, o, h, l, c, v}.
         """
+        return await self._fetch_ohlcv_pages(pool, time_from, time_to, timeframe, aggregate)
+
+    async def _fetch_ohlcv_pages(
+        self, pool: str, time_from: int, time_to: int, timeframe: str, aggregate: int,
+    ) -> PartialCandles:
+        """fetch_ohlcv_by_pool, also saying how far back the pages reached:
+        `covered_from` stays above time_from when the page cap cut it off."""
         all_rows: dict[int, dict] = {}
         cursor = time_to
         # Cap pages to avoid runaway; 1000 1m candles = ~16h per page
         for _ in range(20):
             if cursor <= time_from:
                 break
-            await self._throttle()
+            await self._limiter.acquire()
             params = {"aggregate": aggregate, "limit": 1000, "before_timestamp": cursor}
             try:
                 resp = await self._client.get(
@@ -96,6 +114,8 @@ class GeckoTerminalAdapter:
                 )
                 resp.raise_for_status()
             except httpx.HTTPError as e:
+                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 429:
+                    self._limiter.penalize(retry_after_seconds(e.response.headers, 10.0))
                 raise VenueError(f"GeckoTerminal OHLCV failed for {pool}: {e}") from e
             ohlcv = (resp.json().get("data", {}).get("attributes", {}).get("ohlcv_list") or [])
             if not ohlcv:
@@ -116,20 +136,29 @@ class GeckoTerminalAdapter:
             cursor = oldest_in_page
             if oldest_in_page <= time_from:
                 break
-        return [all_rows[t] for t in sorted(all_rows.keys())]
+        else:
+            # Page cap hit: nothing older than `cursor` was asked for
+            return PartialCandles([all_rows[t] for t in sorted(all_rows.keys())], covered_from=cursor)
+        return PartialCandles([all_rows[t] for t in sorted(all_rows.keys())], covered_from=time_from)
 
     async def fetch_ohlcv(
         self, mint: str, time_from: int, time_to: int, interval: str = "1m",
     ) -> list[dict]:
         """Birdeye-compatible signature: mint + unix range → candle dicts.
         Resolves the pool internally."""
-        pool = await self.resolve_pool(mint)
-        if not pool:
-            return []
         tf_map = {"1m": ("minute", 1), "5m": ("minute", 5), "15m": ("minute", 15),
                   "1h": ("hour", 1), "1H": ("hour", 1), "1d": ("day", 1)}
         timeframe, aggregate = tf_map.get(interval, ("minute", 1))
-        return await self.fetch_ohlcv_by_pool(pool, time_from, time_to, timeframe, aggregate)
+
+        async def upstream(start: int, end: int) -> list[dict] | None:
+            pool = await self.resolve_pool(mint)
+            if not pool:
+                return None  # may be transient; don't record the window as empty
+            return await self._fetch_ohlcv_pages(pool, start, end, timeframe, aggregate)
+
+        if self._cache is not None:
+            return await self._cache.fetch("geckoterminal", mint, interval, time_from, time_to, upstream)
+        return await upstream(time_from, time_to) or []
 
     async def close(self) -> None:
         await self._client.aclose()
@@ -20,7 +20,9 @@ from typing import AsyncIterator
 import httpx
 
 from helios.data.adapters.base import Bar, MarketDataSource, Tick, VenueError
+from helios.data.store.candle_cache import CandleCache
 from helios.ops import get_logger
+from helios.ops.ratelimit import TokenBucket, limiter_for, retry_after_seconds
 from helios.types import Venue
 
 log = get_logger(__name__)
@@ -56,14 +58,47 @@ class KrakenFuturesMarketData(MarketDataSource):
     consistently with live streamed bars.
     """
 
-    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        limiter: TokenBucket | None = None,
+        cache: CandleCache | None = None,
+    ) -> None:
         self._client = client or httpx.AsyncClient(timeout=20.0)
+        self._limiter = limiter or limiter_for("kraken_futures")
+        self._cache = cache
 
     async def fetch_bars(
         self, symbol: str, interval: str, start: datetime, end: datetime
     ) -> list[Bar]:
         """Fetch hourly/etc bars. Kraken caps each response at ~5000 candles, so
-        we chunk the request window backwards from `end` until we cover `start`."""
+        we chunk the request window backwards from `end` until we cover `start`.
+
+        With a CandleCache, cached ranges are served locally (with their
+        original available_at) and only the gaps are requested."""
+        if self._cache is None:
+            return await self._fetch_bars(symbol, interval, start, end)
+
+        async def upstream(t0: int, t1: int) -> list[dict]:
+            bars = await self._fetch_bars(symbol, interval, datetime.fromtimestamp(t0, timezone.utc),
+                                          datetime.fromtimestamp(t1, timezone.utc))
+            return [{"unixTime": int(b.event_time.timestamp()), "o": float(b.open), "h": float(b.high),
+                     "l": float(b.low), "c": float(b.close), "v": float(b.volume),
+                     "available_at": b.available_at.timestamp()} for b in bars]
+
+        rows = await self._cache.fetch("kraken_futures", symbol, interval,
+                                       int(start.timestamp()), int(end.timestamp()), upstream)
+        return [Bar(
+            symbol=symbol, venue=Venue.KRAKEN_FUTURES, interval=interval,
+            open=Decimal(str(r["o"])), high=Decimal(str(r["h"])), low=Decimal(str(r["l"])),
+            close=Decimal(str(r["c"])), volume=Decimal(str(r["v"])),
+            event_time=datetime.fromtimestamp(r["unixTime"], timezone.utc),
+            available_at=datetime.fromtimestamp(r["available_at"], timezone.utc),
+        ) for r in rows]
+
+    async def _fetch_bars(
+        self, symbol: str, interval: str, start: datetime, end: datetime
+    ) -> list[Bar]:
         resolution = _INTERVAL_MAP.get(interval)
         if resolution is None:
             raise ValueError(f"Unsupported interval {interval!r}")
@@ -85,10 +120,13 @@ class KrakenFuturesMarketData(MarketDataSource):
         while cursor > floor:
             chunk_from = max(floor, cursor - chunk_seconds)
             params = {"from": chunk_from, "to": cursor}
+            await self._limiter.acquire()
             try:
                 resp = await self._client.get(url, params=params)
                 resp.raise_for_status()
             except httpx.HTTPError as e:
+                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 429:
+                    self._limiter.penalize(retry_after_seconds(e.response.headers, 5.0))
                 raise VenueError(f"Kraken Futures bars fetch failed for {symbol} {interval}: {e}") from e
 
             available_at = datetime.now(timezone.utc)
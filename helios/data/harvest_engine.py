@@ -0,0 +1,241 @@
+"""HarvestEngine — shared fetch scheduler for the outcome harvesters.
+
+Why this exists:
+  The A2/A3/A5 harvesters each walked their pending rows one at a time:
+  fetch candles, sleep a fixed interval, next row. Request latency and the
+  fixed sleep both came out of the upstream's rate budget, so a cycle used a
+  fraction of what the API allows, and a mint observed twenty times in a day
+  was fetched twenty times for nearly the same candles.
+
+Design:
+  - Callers describe work as FetchJob(key, start, end, tag): "candles for
+    `key` (mint / symbol) over unix seconds [start, end]". `tag` carries the
+    caller's handle (log position, record) back with the result.
+  - Jobs for the same key whose windows overlap or touch are coalesced into
+    one span, fetched once, and each job gets back its own slice of the span
+    (`time_of(item)` gives an item's unix time; items arrive sorted by it).
+    `max_span_seconds` caps a span so adapters that page a bounded number of
+    times (GeckoTerminal: 20 pages) still cover it.
+  - Spans run on `concurrency` workers. Pacing is not the engine's job: the
+    adapters draw from the per-upstream token buckets in
+    helios.ops.ratelimit, so concurrency only has to be high enough to hide
+    request latency and keep the bucket drained.
+  - A failed span is retried with full-jitter backoff (`backoff_delay`);
+    after `retries` retries every job in it yields a FetchResult with
+    `error` set and the caller decides whether the row stays pending.
+  - stream() yields results as spans complete, so the caller writes
+    outcomes while later spans are still in flight. stream_spans() yields
+    the span itself (all its jobs plus the shared items) for callers that
+    batch their per-job work over one candle array. HarvestMetrics tracks
+    throughput and backlog and is logged as `harvest_engine_progress` /
+    `harvest_engine_done`.
+"""
+from __future__ import annotations
+
+import asyncio
+import bisect
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from helios.ops import get_logger
+from helios.ops.ratelimit import backoff_delay
+
+log = get_logger(__name__)
+
+FetchFn = Callable[[str, int, int], Awaitable[Sequence[Any]]]
+
+
+@dataclass(frozen=True, slots=True)
+class FetchJob:
+    key: str
+    start: int  # unix seconds, inclusive
+    end: int    # unix seconds, inclusive
+    tag: Any = None
+
+
+@dataclass(frozen=True, slots=True)
+class FetchResult:
+    job: FetchJob
+    items: list[Any]
+    error: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class SpanResult:
+    key: str
+    start: int
+    end: int
+    jobs: tuple[FetchJob, ...]
+    items: list[Any]          # sorted by time_of; covers every job's window
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class _Span:
+    key: str
+    start: int
+    end: int
+    jobs: list[FetchJob] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class HarvestMetrics:
+    jobs: int = 0
+    spans: int = 0          # fetches needed after coalescing
+    delivered: int = 0      # jobs whose result has been yielded
+    fetch_calls: int = 0    # attempts, including retries
+    retries: int = 0
+    failed_jobs: int = 0
+    items: int = 0
+    in_flight: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def coalesced(self) -> int:
+        return self.jobs - self.spans
+
+    @property
+    def backlog(self) -> int:
+        return self.jobs - self.delivered
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def jobs_per_second(self) -> float:
+        elapsed = self.elapsed_seconds
+        return self.delivered / elapsed if elapsed > 0 else 0.0
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "jobs": self.jobs, "spans": self.spans, "coalesced": self.coalesced,
+            "delivered": self.delivered, "backlog": self.backlog, "in_flight": self.in_flight,
+            "fetch_calls": self.fetch_calls, "retries": self.retries, "failed_jobs": self.failed_jobs,
+            "items": self.items, "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "jobs_per_second": round(self.jobs_per_second, 3),
+        }
+
+
+def coalesce(jobs: Iterable[FetchJob], max_span_seconds: int | None = None) -> list[_Span]:
+    """Merge overlapping/adjacent windows per key. Keys keep first-seen order."""
+    by_key: dict[str, list[FetchJob]] = {}
+    for job in jobs:
+        by_key.setdefault(job.key, []).append(job)
+    spans: list[_Span] = []
+    for key, key_jobs in by_key.items():
+        key_jobs.sort(key=lambda j: j.start)
+        cur: _Span | None = None
+        for job in key_jobs:
+            fits = cur is not None and job.start <= cur.end + 1 and (
+                max_span_seconds is None or max(cur.end, job.end) - cur.start <= max_span_seconds
+            )
+            if fits:
+                cur.end = max(cur.end, job.end)
+                cur.jobs.append(job)
+            else:
+                cur = _Span(key, job.start, job.end, [job])
+                spans.append(cur)
+    return spans
+
+
+class HarvestEngine:
+    def __init__(
+        self,
+        fetch: FetchFn,
+        time_of: Callable[[Any], float],
+        *,
+        name: str = "harvest",
+        concurrency: int = 8,
+        retries: int = 3,
+        base_delay_seconds: float = 1.0,
+        max_delay_seconds: float = 30.0,
+        max_span_seconds: int | None = None,
+        progress_every: int = 100,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+        self._fetch = fetch
+        self._time_of = time_of
+        self.name = name
+        self.concurrency = concurrency
+        self.retries = retries
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.max_span_seconds = max_span_seconds
+        self.progress_every = progress_every
+        self.metrics = HarvestMetrics()
+
+    async def stream(self, jobs: Iterable[FetchJob]) -> AsyncIterator[FetchResult]:
+        """Yield one FetchResult per job, in completion order."""
+        async for span in self.stream_spans(jobs):
+            if span.error is not None:
+                for job in span.jobs:
+                    yield FetchResult(job, [], span.error)
+                continue
+            try:
+                times = [self._time_of(it) for it in span.items]
+            except Exception as e:  # one bad item fails its span, not the stream
+                self.metrics.failed_jobs += len(span.jobs)
+                for job in span.jobs:
+                    yield FetchResult(job, [], str(e) or type(e).__name__)
+                continue
+            for job in span.jobs:
+                yield FetchResult(job, span.items[bisect.bisect_left(times, job.start):
+                                                  bisect.bisect_right(times, job.end)])
+
+    async def stream_spans(self, jobs: Iterable[FetchJob]) -> AsyncIterator[SpanResult]:
+        """Yield one SpanResult per coalesced fetch, in completion order — for
+        callers that process every job of a span against the same items."""
+        jobs = list(jobs)
+        spans = coalesce(jobs, self.max_span_seconds)
+        m = self.metrics = HarvestMetrics(jobs=len(jobs), spans=len(spans))
+        todo = deque(spans)
+        done: asyncio.Queue[SpanResult] = asyncio.Queue()
+
+        async def worker() -> None:
+            while todo:
+                span = todo.popleft()
+                m.in_flight += 1
+                try:
+                    await done.put(await self._run(span))
+                finally:
+                    m.in_flight -= 1
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.concurrency, len(spans)))]
+        try:
+            for n in range(1, len(spans) + 1):
+                result = await done.get()
+                m.delivered += len(result.jobs)
+                yield result
+                if self.progress_every and n % self.progress_every == 0:
+                    log.info("harvest_engine_progress", engine=self.name, **m.as_dict())
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        log.info("harvest_engine_done", engine=self.name, **m.as_dict())
+
+    async def _run(self, span: _Span) -> SpanResult:
+        m = self.metrics
+        jobs = tuple(span.jobs)
+        error = ""
+        for attempt in range(self.retries + 1):
+            if attempt:
+                m.retries += 1
+                await asyncio.sleep(backoff_delay(attempt - 1, self.base_delay_seconds, self.max_delay_seconds))
+            m.fetch_calls += 1
+            try:
+                items = list(await self._fetch(span.key, span.start, span.end))
+            except Exception as e:
+                error = str(e) or type(e).__name__
+                log.warning("harvest_engine_fetch_failed", engine=self.name, key=span.key,
+                            attempt=attempt, error=error)
+                continue
+            m.items += len(items)
+            return SpanResult(span.key, span.start, span.end, jobs, items)
+        m.failed_jobs += len(jobs)
+        return SpanResult(span.key, span.start, span.end, jobs, [], error)
@@ -4,8 +4,9 @@ Usage:
     table = as_of_query(store, "SELECT * FROM bars_1m WHERE symbol = 'BTC-USD'", as_of=t)
 
 Behavior:
-  - Each dataset is registered as a view with a built-in `available_at <= ?`
-    filter.
+  - Each dataset resolves to a PIT view in the store's long-lived catalog
+    with a built-in `available_at <= ?` filter. `as_of` is bound as a
+    prepared parameter, never formatted into the SQL.
   - If the query result contains any row with `available_at > as_of`, raise
     PITViolation.
 
@@ -17,7 +18,6 @@ from __future__ import annotations
 
 from datetime import datetime
 
-import duckdb
 import pyarrow as pa
 
 from helios.data.store import ParquetStore
@@ -27,26 +27,15 @@ class PITViolation(RuntimeError):
     """A row that postdates the as_of timestamp leaked into a result. Capital risk."""
 
 
-def as_of_query(store: ParquetStore, sql: str, as_of: datetime) -> pa.Table:
-    con = duckdb.connect()
-    con.execute("SET TimeZone = 'UTC'")
-
-    for ds_dir in store.root.iterdir():
-        if not ds_dir.is_dir():
-            continue
-        glob = str(ds_dir / "**" / "*.parquet")
-        # Inject PIT filter at the view level — any query against `ds.name`
-        # only ever sees rows with available_at <= as_of.
-        con.execute(
-            f"""
-            CREATE VIEW {ds_dir.name} AS
-            SELECT * FROM read_parquet('{glob}', hive_partitioning=true)
-            WHERE available_at <= TIMESTAMP '{as_of.isoformat()}'
-            """
-        )
-
-    _arrow = con.execute(sql).arrow()
-    result = _arrow.read_all() if hasattr(_arrow, "read_all") else _arrow
+def as_of_query(
+    store: ParquetStore,
+    sql: str,
+    as_of: datetime,
+    params: list[object] | dict[str, object] | None = None,
+) -> pa.Table:
+    # PIT filter lives at the view level — any query against a dataset name
+    # only ever sees rows with available_at <= as_of.
+    result = store.catalog.execute(sql, params=params, as_of=as_of)
 
     # Canary: if the user joined external data or otherwise bypassed the view,
     # we still catch leaks here.
@@ -7,6 +7,22 @@ Every row carries `event_time` (when it happened in the market) AND
 `available_at` (when our system could first have seen it). The PIT layer in
 helios.data.pit refuses to return rows where `available_at > as_of`.
 """
+from helios.data.store.candle_cache import CandleCache
+from helios.data.store.catalog import StoreCatalog
+from helios.data.store.compaction import CompactionConfig, CompactionReport, compact_dataset
+from helios.data.store.feature_store import FeatureSpec, FeatureStore
+from helios.data.store.log_store import LogBatch, LogStore
 from helios.data.store.parquet_store import ParquetStore
 
-__all__ = ["ParquetStore"]
+__all__ = [
+    "CandleCache",
+    "CompactionConfig",
+    "CompactionReport",
+    "FeatureSpec",
+    "FeatureStore",
+    "LogBatch",
+    "LogStore",
+    "ParquetStore",
+    "StoreCatalog",
+    "compact_dataset",
+]
@@ -0,0 +1,245 @@
+"""CandleCache — local OHLCV cache with per-instrument coverage ranges.
+
+Why this exists:
+  The A2/A3/A5 harvesters and scripts/a2_exit_research.py each refetched the
+  same 1m/5m candles from GeckoTerminal, Birdeye or Kraken Futures, usually
+  for overlapping windows, and re-running exit research with a new policy
+  grid refetched everything through a 30/min free tier.
+
+Design:
+  - Candles live in the ParquetStore, one dataset per (source, interval):
+    `ohlcv_{source}_{interval}`, with `symbol` = mint / venue symbol, so
+    ParquetStore.read() prunes by day and by symbol row-group statistics.
+  - `{root}/{dataset}/_coverage.json` records, per symbol, the merged list
+    of [start, end] unix-second ranges already fetched (inclusive). A range
+    is covered even if the upstream returned no candles in it — "no trades"
+    is an answer, so a dead token is not refetched.
+  - fetch() subtracts coverage from the requested window and calls the
+    upstream only for the gaps. Candles newer than `now - settle` (two bars)
+    may still be forming: they are returned but neither stored nor marked
+    covered, so the next call refetches just that tail.
+  - The upstream callable returns None for "could not tell" (e.g. no pool
+    found, which can be transient); nothing is recorded then. An upstream
+    that stops early (GeckoTerminal's page cap) returns PartialCandles, and
+    only [covered_from, end] is marked covered.
+  - Candles are written before coverage is saved, so a crash in between
+    refetches the gap and stores those candles twice. _read() keeps one row
+    per unixTime (the earliest available_at), so duplicates never surface.
+  - Every gap fill writes a small part. After `compact_every` parts in a
+    dataset, compact_dataset() merges them sorted by (symbol, event_time),
+    so each symbol's candles sit together and row-group pruning by symbol
+    keeps working.
+  - Rows are Birdeye-style dicts {unixTime, o, h, l, c, v}; `available_at`
+    (unix seconds) is kept when the adapter supplies it so PIT consumers
+    (Kraken bars) see the same value on a hit as on the original fetch.
+  - One asyncio.Lock per (dataset, symbol) so concurrent harvester workers
+    never fetch and write the same gap twice.
+
+Single-writer assumption, as for LogStore: one process owns a cache root.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pyarrow as pa
+
+from helios.data.store.compaction import CompactionConfig, compact_dataset
+from helios.data.store.parquet_store import ParquetStore
+from helios.ops import get_logger
+
+log = get_logger(__name__)
+
+CANDLE_CACHE_ROOT = Path(os.getenv("HELIOS_LOGS_DIR", "logs")) / "candle_cache"
+COVERAGE_FILE = "_coverage.json"
+
+INTERVAL_SECONDS = {
+    "1m": 60, "3m": 180, "5m": 300, "15m": 900, "30m": 1800,
+    "1h": 3600, "1H": 3600, "2H": 7200, "4h": 14400, "4H": 14400,
+    "6H": 21600, "8H": 28800, "12H": 43200, "1d": 86400, "1D": 86400,
+}
+
+Range = tuple[int, int]
+UpstreamFn = Callable[[int, int], Awaitable[list[dict] | None]]
+
+_TS = pa.timestamp("us", tz="UTC")
+_PRICE_FIELDS = (("o", "open"), ("h", "high"), ("l", "low"), ("c", "close"), ("v", "volume"))
+_COMPACTION = CompactionConfig(min_files=2, sort_by=("symbol", "event_time"))
+
+
+class PartialCandles(list):
+    """Upstream rows that only cover [covered_from, end] of the asked range."""
+
+    def __init__(self, rows: list[dict], covered_from: int) -> None:
+        super().__init__(rows)
+        self.covered_from = covered_from
+
+
+def merge_ranges(ranges: list[Range]) -> list[Range]:
+    """Sorted, merged ranges; touching ranges (e + 1 == next s) merge too."""
+    out: list[list[int]] = []
+    for s, e in sorted(ranges):
+        if out and s <= out[-1][1] + 1:
+            out[-1][1] = max(out[-1][1], e)
+        else:
+            out.append([s, e])
+    return [(s, e) for s, e in out]
+
+
+def missing_ranges(covered: list[Range], start: int, end: int) -> list[Range]:
+    """Parts of [start, end] not inside any of the merged `covered` ranges."""
+    gaps: list[Range] = []
+    cursor = start
+    for s, e in covered:
+        if e < cursor:
+            continue
+        if s > end:
+            break
+        if s > cursor:
+            gaps.append((cursor, s - 1))
+        cursor = max(cursor, e + 1)
+        if cursor > end:
+            return gaps
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class CandleCache:
+    def __init__(
+        self, store: ParquetStore | str | Path = CANDLE_CACHE_ROOT, settle_bars: int = 2,
+        compact_every: int = 64,
+    ) -> None:
+        self.store = store if isinstance(store, ParquetStore) else ParquetStore(store)
+        self.settle_bars = settle_bars
+        self.compact_every = compact_every
+        self._unmerged: dict[str, int] = {}  # parts written per dataset since the last compaction
+        self._coverage: dict[str, dict[str, list[Range]]] = {}
+        self._locks: dict[tuple[str, str], asyncio.Lock] = {}
+        self.hits = 0     # windows served with no upstream call
+        self.fetches = 0  # upstream calls (one per gap)
+
+    @staticmethod
+    def dataset(source: str, interval: str) -> str:
+        return f"ohlcv_{source}_{interval}"
+
+    # ---- coverage ----
+
+    def _coverage_of(self, dataset: str) -> dict[str, list[Range]]:
+        cov = self._coverage.get(dataset)
+        if cov is None:
+            try:
+                raw = json.loads((self.store.root / dataset / COVERAGE_FILE).read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                raw = {}
+            cov = self._coverage[dataset] = {sym: [(s, e) for s, e in rs] for sym, rs in raw.items()}
+        return cov
+
+    def _save_coverage(self, dataset: str) -> None:
+        ds_dir = self.store.root / dataset
+        ds_dir.mkdir(parents=True, exist_ok=True)
+        path = ds_dir / COVERAGE_FILE
+        tmp = path.with_name(path.name + ".partial")
+        tmp.write_text(json.dumps(self._coverage[dataset]), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def covered(self, source: str, symbol: str, interval: str) -> list[Range]:
+        return list(self._coverage_of(self.dataset(source, interval)).get(symbol, []))
+
+    # ---- read-through ----
+
+    async def fetch(
+        self, source: str, symbol: str, interval: str, start: int, end: int, upstream: UpstreamFn,
+    ) -> list[dict]:
+        """Candles for `symbol` with unixTime in [start, end], fetching only
+        the parts of the window not already cached."""
+        dataset = self.dataset(source, interval)
+        lock = self._locks.setdefault((dataset, symbol), asyncio.Lock())
+        async with lock:
+            cov = self._coverage_of(dataset)
+            gaps = missing_ranges(cov.get(symbol, []), start, end)
+            if not gaps:
+                self.hits += 1
+                return self._read(dataset, symbol, start, end)
+
+            settled = int(time.time()) - self.settle_bars * INTERVAL_SECONDS.get(interval, 60)
+            tail: list[dict] = []
+            for gs, ge in gaps:
+                self.fetches += 1
+                rows = await upstream(gs, ge)
+                if rows is None:
+                    continue
+                lo = max(gs, getattr(rows, "covered_from", gs))
+                keep = {int(r["unixTime"]): r for r in rows if lo <= int(r["unixTime"]) <= ge}
+                done_to = min(ge, settled)
+                stored = [keep[t] for t in sorted(keep) if t <= done_to]
+                tail.extend(keep[t] for t in sorted(keep) if t > done_to)
+                if stored:
+                    self._write(dataset, symbol, stored)
+                if done_to >= lo:
+                    cov[symbol] = merge_ranges([*cov.get(symbol, []), (lo, done_to)])
+                    self._save_coverage(dataset)
+            cached = self._read(dataset, symbol, start, end)
+        if tail:
+            cached = sorted([*cached, *tail], key=lambda r: r["unixTime"])
+        return cached
+
+    def _write(self, dataset: str, symbol: str, rows: list[dict]) -> None:
+        now = datetime.now(timezone.utc).timestamp()
+        times = [int(r["unixTime"]) for r in rows]
+        columns: dict[str, pa.Array] = {
+            "symbol": pa.array([symbol] * len(rows), pa.string()),
+            "event_time": pa.array([t * 1_000_000 for t in times], pa.int64()).cast(_TS),
+            "available_at": pa.array(
+                [int(max(float(r.get("available_at", now)), t) * 1_000_000) for r, t in zip(rows, times, strict=True)],
+                pa.int64(),
+            ).cast(_TS),
+        }
+        for short, name in _PRICE_FIELDS:
+            columns[name] = pa.array([float(r.get(short) or 0.0) for r in rows], pa.float64())
+        self.store.write(dataset, pa.table(columns))
+        self._unmerged[dataset] = self._unmerged.get(dataset, 0) + 1
+        if self._unmerged[dataset] >= self.compact_every:
+            compact_dataset(self.store, dataset, _COMPACTION)
+            self._unmerged[dataset] = 0
+
+    def _read(self, dataset: str, symbol: str, start: int, end: int) -> list[dict]:
+        if not (self.store.root / dataset).is_dir():
+            return []
+        table = self.store.read(
+            dataset, symbols=[symbol],
+            start=datetime.fromtimestamp(start, timezone.utc),
+            end=datetime.fromtimestamp(end + 1, timezone.utc),
+        )
+        if not table.num_rows:
+            return []
+        table = table.sort_by([("event_time", "ascending"), ("available_at", "ascending")])
+        t = table.column("event_time").cast(pa.int64()).to_pylist()
+        avail = table.column("available_at").cast(pa.int64()).to_pylist()
+        cols = [table.column(name).to_pylist() for _, name in _PRICE_FIELDS]
+        out: list[dict] = []
+        for i, ts in enumerate(t):
+            if i and ts == t[i - 1]:
+                continue  # stored twice (crash before _save_coverage); first copy wins
+            row = {"unixTime": ts // 1_000_000}
+            for (short, _), col in zip(_PRICE_FIELDS, cols, strict=True):
+                row[short] = col[i]
+            row["available_at"] = avail[i] / 1_000_000
+            out.append(row)
+        return out
+
+
+_DEFAULT: CandleCache | None = None
+
+
+def default_candle_cache() -> CandleCache:
+    """Process-wide cache at CANDLE_CACHE_ROOT, shared by every adapter."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = CandleCache()
+    return _DEFAULT
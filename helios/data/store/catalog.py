@@ -0,0 +1,283 @@
+"""StoreCatalog — one long-lived DuckDB session over a ParquetStore root.
+
+Why this exists:
+  The original query path opened a fresh `duckdb.connect()` per call, walked
+  the store root and re-created a `read_parquet('**/*.parquet')` view per
+  dataset. Every query therefore re-globbed the tree and re-read every
+  Parquet footer. Research loops issue thousands of small queries per run,
+  so that overhead dominated.
+
+Design:
+  - One in-memory DuckDB database per store, with `parquet_metadata_cache`
+    on so footers are read once and reused across queries.
+  - The file listing per dataset is cached. Each dataset is registered as a
+    view over an explicit file list (no glob at query time). `write()` tells
+    the catalog about the new part file; only that dataset's views are
+    rebuilt, lazily, on the next query.
+  - Two views per dataset:
+        main.{dataset}  raw rows
+        pit.{dataset}   rows with available_at <= getvariable('helios_as_of')
+    The PIT variable is bound as a prepared parameter, never formatted into
+    SQL. An unset variable is NULL, so the PIT views fail closed (no rows).
+  - DuckDB connections are not safe for concurrent use, so each thread gets
+    its own cursors (raw + PIT) onto the shared database. Catalog mutation
+    is serialized by a lock.
+  - Another store on the same root may compact and reclaim parts this
+    catalog still lists. A query that trips over a missing file rescans
+    from disk once and retries (ParquetStore.read does the same).
+"""
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+PIT_SCHEMA = "pit"
+AS_OF_VARIABLE = "helios_as_of"
+# Written by compaction before its output appears; see compaction.py.
+JOURNAL_GLOB = "_compaction-*.json"
+
+
+@dataclass(slots=True)
+class _DatasetEntry:
+    files: list[str] = field(default_factory=list)
+    stale: bool = True  # views need (re)creation before the next query
+
+
+class StoreCatalog:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._con = duckdb.connect()
+        self._con.execute("SET TimeZone = 'UTC'")
+        self._con.execute("SET parquet_metadata_cache = true")
+        self._con.execute(f"CREATE SCHEMA IF NOT EXISTS {PIT_SCHEMA}")
+        self._datasets: dict[str, _DatasetEntry] | None = None  # lazily scanned
+        self._generation = 0  # bumped on every view rebuild
+        # Part files are immutable once written, so footers never go stale.
+        self._footers: dict[str, pq.FileMetaData] = {}
+
+    # ---- file listing ----
+
+    def _scan(self) -> dict[str, _DatasetEntry]:
+        out: dict[str, _DatasetEntry] = {}
+        if not self.root.exists():
+            return out
+        for ds_dir in sorted(self.root.iterdir()):
+            if ds_dir.is_dir():
+                out[ds_dir.name] = _DatasetEntry(files=list_live_parts(ds_dir))
+        return out
+
+    def files(self, dataset: str) -> list[str]:
+        """Cached part-file listing for one dataset."""
+        with self._lock:
+            if self._datasets is None:
+                self._datasets = self._scan()
+            entry = self._datasets.get(dataset)
+            return list(entry.files) if entry else []
+
+    def add_file(self, dataset: str, path: str | Path) -> None:
+        """Record a freshly written part file. Invalidates only `dataset`."""
+        with self._lock:
+            if self._datasets is None:
+                # Nothing cached yet; the first query will scan from disk.
+                return
+            entry = self._datasets.setdefault(dataset, _DatasetEntry())
+            entry.files.append(str(path))
+            entry.stale = True
+
+    def refresh(self, dataset: str | None = None) -> None:
+        """Rescan from disk. Use after out-of-process writers touch the root."""
+        with self._lock:
+            if dataset is None or self._datasets is None:
+                old = self._datasets or {}
+                self._datasets = self._scan()
+                for name in old.keys() - self._datasets.keys():
+                    # Empty + stale → views dropped on the next sync
+                    self._datasets[name] = _DatasetEntry()
+            else:
+                ds_dir = self.root / dataset
+                self._datasets[dataset] = _DatasetEntry(
+                    files=list_live_parts(ds_dir) if ds_dir.is_dir() else [],
+                )
+            live = {f for e in self._datasets.values() for f in e.files}
+            for path in [p for p in self._footers if p not in live]:
+                del self._footers[path]
+
+    def metadata(self, path: str) -> pq.FileMetaData:
+        """Cached Parquet footer for one part file."""
+        md = self._footers.get(path)
+        if md is None:
+            md = pq.read_metadata(path)
+            with self._lock:
+                self._footers[path] = md
+        return md
+
+    # ---- views ----
+
+    def _sync_views(self) -> None:
+        with self._lock:
+            if self._datasets is None:
+                self._datasets = self._scan()
+            changed = False
+            for name, entry in self._datasets.items():
+                if not entry.stale:
+                    continue
+                ident = _quote_ident(name)
+                if entry.files:
+                    files_sql = ", ".join(_quote_literal(f) for f in entry.files)
+                    self._con.execute(
+                        f"CREATE OR REPLACE VIEW main.{ident} AS "
+                        f"SELECT * FROM read_parquet([{files_sql}], hive_partitioning=true)"
+                    )
+                    self._con.execute(
+                        f"CREATE OR REPLACE VIEW {PIT_SCHEMA}.{ident} AS "
+                        f"SELECT * FROM main.{ident} "
+                        f"WHERE available_at <= getvariable('{AS_OF_VARIABLE}')"
+                    )
+                else:
+                    self._con.execute(f"DROP VIEW IF EXISTS {PIT_SCHEMA}.{ident}")
+                    self._con.execute(f"DROP VIEW IF EXISTS main.{ident}")
+                entry.stale = False
+                changed = True
+            if changed:
+                self._generation += 1
+
+    def _cursors(self) -> tuple[duckdb.DuckDBPyConnection, duckdb.DuckDBPyConnection]:
+        cursors = getattr(self._local, "cursors", None)
+        if cursors is None:
+            with self._lock:
+                raw = self._con.cursor()
+                pit = self._con.cursor()
+            raw.execute("SET TimeZone = 'UTC'")
+            pit.execute("SET TimeZone = 'UTC'")
+            # Unqualified dataset names resolve to the PIT-filtered views first.
+            pit.execute(f"SET search_path = '{PIT_SCHEMA},main'")
+            cursors = (raw, pit)
+            self._local.cursors = cursors
+        return cursors
+
+    # ---- execution ----
+
+    def execute(
+        self,
+        sql: str,
+        params: list[object] | dict[str, object] | None = None,
+        as_of: datetime | None = None,
+    ) -> pa.Table:
+        """Run `sql` against the catalog.
+
+        With `as_of`, unqualified dataset names resolve to the PIT views and
+        the cutoff is bound via a prepared `SET VARIABLE`.
+        """
+        try:
+            return self._execute(sql, params, as_of)
+        except duckdb.IOException:
+            # A listed part was reclaimed by another store's compaction
+            self.refresh()
+            return self._execute(sql, params, as_of)
+
+    def _execute(
+        self,
+        sql: str,
+        params: list[object] | dict[str, object] | None,
+        as_of: datetime | None,
+    ) -> pa.Table:
+        self._sync_views()
+        raw, pit = self._cursors()
+        if as_of is None:
+            cur = raw
+        else:
+            cur = pit
+            cur.execute(f"SET VARIABLE {AS_OF_VARIABLE} = $1::TIMESTAMPTZ", [as_of])
+        _arrow = cur.execute(sql, params).arrow() if params else cur.execute(sql).arrow()
+        return _arrow.read_all() if hasattr(_arrow, "read_all") else _arrow
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def close(self) -> None:
+        with self._lock:
+            self._con.close()
+
+
+@dataclass(frozen=True, slots=True)
+class CompactionJournal:
+    path: Path
+    created_unix: float
+    inputs: frozenset[str]   # absolute part paths
+    outputs: frozenset[str]
+
+
+def read_journals(ds_dir: Path) -> list[CompactionJournal]:
+    """Every readable compaction journal under `ds_dir` (torn ones skipped)."""
+    journals = []
+    for path in ds_dir.rglob(JOURNAL_GLOB):
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        journals.append(CompactionJournal(
+            path=path,
+            created_unix=float(entry.get("created_unix", 0)),
+            inputs=frozenset(str(path.parent / n) for n in entry.get("inputs", [])),
+            outputs=frozenset(str(path.parent / n) for n in entry.get("outputs", [])),
+        ))
+    return journals
+
+
+def resolve_journals(files: set[str], journals: list[CompactionJournal]) -> list[bool]:
+    """Whether each journal's swap committed, given the parquet listing `files`.
+
+    An output counts as present if it is listed, or if it was itself an input
+    of a committed journal (chained compaction: A,B,C -> X, then X,D,E -> Y,
+    and X since reclaimed). Resolved to a fixpoint over an unmodified
+    listing, so the answer does not depend on journal order.
+    """
+    consumers: dict[str, list[int]] = {}
+    for i, j in enumerate(journals):
+        for name in j.inputs:
+            consumers.setdefault(name, []).append(i)
+    committed = [False] * len(journals)
+    changed = True
+    while changed:
+        changed = False
+        for i, j in enumerate(journals):
+            if committed[i]:
+                continue
+            if all(o in files or any(committed[k] for k in consumers.get(o, ())) for o in j.outputs):
+                committed[i] = changed = True
+    return committed
+
+
+def list_live_parts(ds_dir: Path) -> list[str]:
+    """Live part files under `ds_dir`.
+
+    Lists files FIRST, then reads compaction journals: a committed journal's
+    inputs are superseded and dropped; an incomplete swap's outputs are not
+    live yet and are dropped (see resolve_journals). Journals outlive the
+    swap by a grace period, so a listing never contains both a compacted
+    file and the parts it replaced.
+    """
+    files = {str(p) for p in ds_dir.rglob("*.parquet")}
+    journals = read_journals(ds_dir)
+    live = set(files)
+    for j, committed in zip(journals, resolve_journals(files, journals), strict=True):
+        live.difference_update(j.inputs if committed else j.outputs)
+    return sorted(live)
+
+
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
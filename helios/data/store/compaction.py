@@ -0,0 +1,241 @@
+"""Compaction — merge small Parquet part files within a partition.
+
+Why this exists:
+  Every ParquetStore.write() creates a new part file. Streaming harvesters
+  appending a few hundred rows at a time leave day partitions with thousands
+  of tiny files, and DuckDB's glob + footer reads then dominate query
+  latency. Compaction rewrites those into a few size-targeted files sorted
+  by `event_time`, with row groups sized for statistics pruning.
+
+Swap protocol (per partition), so readers never see duplicates or gaps:
+  1. Write merged output to hidden `.compact-*.tmp` files (not `*.parquet`,
+     so no reader lists them).
+  2. Atomically write `_compaction-<id>.json` naming inputs and outputs.
+  3. Rename each tmp file to `part-<uuid>.parquet`.
+  The catalog's listing honours journals: until every output is visible the
+  outputs are ignored; once they are, the inputs are ignored. Inputs and the
+  journal stay on disk for `grace_seconds` so in-flight queries holding the
+  old file list keep working; a later run reclaims them. A compacted file
+  can itself be compacted again before it is reclaimed; journals are
+  resolved together (catalog.resolve_journals), so such chains read the
+  same in any listing order.
+
+Run from the CLI (scripts/compact_store.py) or as a supervised task via
+`compact_loop()`.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from helios.data.store.catalog import StoreCatalog, list_live_parts, read_journals, resolve_journals
+from helios.data.store.parquet_store import ParquetStore
+from helios.ops import get_logger
+
+log = get_logger(__name__)
+
+TMP_GLOB = ".compact-*.tmp"
+
+
+@dataclass(frozen=True, slots=True)
+class CompactionConfig:
+    small_file_bytes: int = 8 * 1024 * 1024      # parts below this are candidates
+    target_file_bytes: int = 128 * 1024 * 1024   # compressed size budget per output
+    row_group_rows: int = 128_000
+    min_files: int = 4                           # leave partitions with fewer small parts alone
+    sort_by: tuple[str, ...] = ("event_time",)
+    grace_seconds: float = 3600.0                # superseded parts kept this long
+
+
+@dataclass(frozen=True, slots=True)
+class CompactionReport:
+    dataset: str
+    partitions_compacted: int
+    files_before: int
+    files_after: int
+    bytes_before: int
+    bytes_after: int
+    rows: int
+    query_ms_before: float
+    query_ms_after: float
+    reclaimed_files: int  # superseded parts deleted from earlier runs
+
+
+def compact_dataset(
+    store: ParquetStore,
+    dataset: str,
+    config: CompactionConfig | None = None,
+) -> CompactionReport:
+    config = config or CompactionConfig()
+    ds_dir = store.root / dataset
+    reclaimed = reclaim(ds_dir, config.grace_seconds)
+
+    before = list_live_parts(ds_dir) if ds_dir.is_dir() else []
+    bytes_before = sum(os.path.getsize(f) for f in before)
+    rows_before, ms_before = _probe(store.root, dataset)
+
+    by_partition: dict[Path, list[str]] = defaultdict(list)
+    for f in before:
+        if os.path.getsize(f) < config.small_file_bytes:
+            by_partition[Path(f).parent].append(f)
+
+    n_compacted = 0
+    for part_dir, small in sorted(by_partition.items()):
+        if len(small) < config.min_files:
+            continue
+        _compact_partition(part_dir, small, config)
+        n_compacted += 1
+
+    if config.grace_seconds <= 0:
+        reclaimed += reclaim(ds_dir, 0.0)
+    store.refresh(dataset)
+
+    after = list_live_parts(ds_dir) if ds_dir.is_dir() else []
+    rows_after, ms_after = _probe(store.root, dataset)
+    if rows_after != rows_before:
+        # The listing protocol should make this impossible; shout if it isn't.
+        log.error("compaction_row_mismatch", dataset=dataset, before=rows_before, after=rows_after)
+
+    report = CompactionReport(
+        dataset=dataset,
+        partitions_compacted=n_compacted,
+        files_before=len(before),
+        files_after=len(after),
+        bytes_before=bytes_before,
+        bytes_after=sum(os.path.getsize(f) for f in after),
+        rows=rows_after,
+        query_ms_before=ms_before,
+        query_ms_after=ms_after,
+        reclaimed_files=reclaimed,
+    )
+    log.info("compaction_done", **asdict(report))
+    return report
+
+
+def _compact_partition(part_dir: Path, small: list[str], config: CompactionConfig) -> None:
+    # Greedy size-bounded bins, in name order (stable, deterministic)
+    bins: list[list[str]] = [[]]
+    acc = 0
+    for f in sorted(small):
+        size = os.path.getsize(f)
+        if bins[-1] and acc + size > config.target_file_bytes:
+            bins.append([])
+            acc = 0
+        bins[-1].append(f)
+        acc += size
+    bins = [b for b in bins if len(b) > 1]
+    if not bins:
+        return
+
+    inputs: list[str] = []
+    staged: list[tuple[Path, Path]] = []  # (tmp, final)
+    for group in bins:
+        # ParquetFile.read() — no hive columns inferred from the path
+        tables = [pq.ParquetFile(f).read() for f in group]
+        table = pa.concat_tables(tables, promote_options="default")
+        sort_keys = [(c, "ascending") for c in config.sort_by if c in table.column_names]
+        if sort_keys:
+            table = table.sort_by(sort_keys)
+        tmp = part_dir / f".compact-{uuid.uuid4()}.tmp"
+        pq.write_table(table, tmp, compression="zstd", row_group_size=config.row_group_rows)
+        staged.append((tmp, part_dir / f"part-{uuid.uuid4()}.parquet"))
+        inputs.extend(group)
+
+    journal = part_dir / f"_compaction-{uuid.uuid4()}.json"
+    _atomic_write_json(journal, {
+        "created_unix": time.time(),
+        "inputs": [Path(f).name for f in inputs],
+        "outputs": [final.name for _, final in staged],
+    })
+    for tmp, final in staged:
+        os.replace(tmp, final)
+    log.info("compaction_partition_swapped", partition=str(part_dir),
+             inputs=len(inputs), outputs=len(staged))
+
+
+def reclaim(ds_dir: Path, grace_seconds: float) -> int:
+    """Delete parts superseded more than `grace_seconds` ago; roll back swaps
+    that never completed. Returns the number of parquet files deleted.
+
+    Journals are judged together against one listing (resolve_journals), and
+    reclaimed oldest first. A journal whose inputs came out of an earlier
+    compaction waits until that earlier journal is gone: deleting its inputs
+    and journal first would leave the earlier journal looking like a crashed
+    swap, and its own inputs would come back as live.
+    """
+    if not ds_dir.is_dir():
+        return 0
+    now = time.time()
+    files = {str(p) for p in ds_dir.rglob("*.parquet")}
+    journals = sorted(read_journals(ds_dir), key=lambda j: j.created_unix)
+    committed = resolve_journals(files, journals)
+    producer = {o: i for i, j in enumerate(journals) for o in j.outputs}
+    done: set[int] = set()
+    deleted = 0
+    for i, j in enumerate(journals):
+        if now - j.created_unix < grace_seconds:
+            continue
+        if committed[i]:
+            if any(producer.get(p, i) not in done | {i} for p in j.inputs):
+                continue  # an earlier compaction in the chain is still pending
+            doomed = j.inputs
+        else:
+            # Crashed mid-swap: inputs are still the live copy
+            doomed = j.outputs
+        for name in doomed:
+            p = Path(name)
+            if p.exists():
+                p.unlink()
+                deleted += 1
+        j.path.unlink(missing_ok=True)
+        done.add(i)
+    for tmp in ds_dir.rglob(TMP_GLOB):
+        if now - tmp.stat().st_mtime >= grace_seconds:
+            tmp.unlink(missing_ok=True)
+    return deleted
+
+
+def _probe(root: Path, dataset: str) -> tuple[int, float]:
+    """Cold-cache row count + latency through a fresh catalog."""
+    catalog = StoreCatalog(root)
+    try:
+        if not catalog.files(dataset):
+            return 0, 0.0
+        t = time.perf_counter()
+        out = catalog.execute(f'SELECT count(*) AS n FROM "{dataset}"')
+        return int(out.column("n")[0].as_py()), (time.perf_counter() - t) * 1000.0
+    finally:
+        catalog.close()
+
+
+def _atomic_write_json(path: Path, payload: dict) -> None:
+    tmp = path.with_name(path.name + ".partial")
+    tmp.write_text(json.dumps(payload), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+async def compact_loop(
+    store: ParquetStore,
+    datasets: Sequence[str] | None = None,
+    interval_minutes: float = 60.0,
+    config: CompactionConfig | None = None,
+) -> None:
+    """Periodic compaction loop — designed to run as a supervised task."""
+    log.info("compaction_loop_starting", interval_minutes=interval_minutes)
+    while True:
+        for ds in datasets or store.datasets():
+            try:
+                await asyncio.to_thread(compact_dataset, store, ds, config)
+            except Exception as e:
+                log.warning("compaction_failed", dataset=ds, error=str(e))
+        await asyncio.sleep(interval_minutes * 60.0)
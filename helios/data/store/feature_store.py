@@ -0,0 +1,363 @@
+"""FeatureStore — content-addressed, incrementally extended feature frames.
+
+Why this exists:
+  train_a1(), scripts/backtest_a1.py and the research scripts re-fetched
+  bars and reran compute_features() + make_labels() from scratch on every
+  run, even when nothing but the last few hours of data had changed.
+
+Design:
+  - A feature *family* is keyed by (spec name, source hash of the feature
+    module + label function, FEATURE_NAMES, symbol set, interval, label
+    horizon). Any code change to the feature module yields a new key, so
+    stale frames are never served.
+  - Each family has a manifest (`{dataset}/_manifests/{key}.json`) listing
+    materialized chunks. A chunk covers a contiguous [start, end) of
+    event_time; together the chunks cover one contiguous range.
+  - A request for [start, end) computes only what the manifest does not
+    cover. Bars are loaded with `warmup_bars` of history before the gap so
+    rolling windows are full, and `horizon` bars after it so labels are
+    complete. Extending forward also recomputes the last `horizon` bars of
+    the cached range, whose labels were null for lack of future bars. The
+    superseded rows stay on disk; the manifest trims the old chunk's
+    effective range.
+  - Rows are stored in ParquetStore dataset `features_{spec.name}`, each
+    tagged with its chunk's artifact id in a `features_hash` column. That
+    is the value to put in Signal.features_hash: `lineage(features_hash)`
+    resolves it back to the family key, computed range, input-bar digest and
+    creation time.
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import ModuleType
+
+import polars as pl
+
+from helios.data.store.parquet_store import ParquetStore
+from helios.ops import get_logger
+
+log = get_logger(__name__)
+
+BarLoader = Callable[[datetime, datetime], pl.DataFrame]  # (start, end) → bars in [start, end)
+KEY_COLUMNS = ("symbol", "event_time", "available_at")
+HASH_COLUMN = "features_hash"
+
+_INTERVAL_RE = re.compile(r"^(\d+)([mhd])$")
+_INTERVAL_UNIT = {"m": timedelta(minutes=1), "h": timedelta(hours=1), "d": timedelta(days=1)}
+
+
+@dataclass(frozen=True, slots=True)
+class FeatureSpec:
+    """How to compute one feature set. Build with `from_module()`."""
+    name: str
+    compute: Callable[[pl.DataFrame], pl.DataFrame]
+    feature_names: tuple[str, ...]
+    source_hash: str
+    warmup_bars: int                      # history needed before the first full row
+    label: Callable[[pl.DataFrame, int], pl.DataFrame] | None = None
+    passthrough: tuple[str, ...] = ()     # bar columns joined onto the features (e.g. close)
+
+    @classmethod
+    def from_module(
+        cls,
+        module: ModuleType,
+        name: str,
+        warmup_bars: int,
+        label: Callable[[pl.DataFrame, int], pl.DataFrame] | None = None,
+        passthrough: tuple[str, ...] = (),
+    ) -> FeatureSpec:
+        """Spec from a module exposing `compute_features` and `FEATURE_NAMES`."""
+        h = hashlib.sha256(inspect.getsource(module).encode())
+        if label is not None:
+            h.update(inspect.getsource(label).encode())
+        return cls(
+            name=name,
+            compute=module.compute_features,
+            feature_names=tuple(module.FEATURE_NAMES),
+            source_hash=h.hexdigest()[:16],
+            warmup_bars=warmup_bars,
+            label=label,
+            passthrough=passthrough,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FeatureKey:
+    spec_name: str
+    source_hash: str
+    feature_names: tuple[str, ...]
+    symbols: tuple[str, ...]  # sorted
+    interval: str
+    horizon: int | None
+
+    @property
+    def digest(self) -> str:
+        payload = json.dumps(asdict(self), sort_keys=True, default=list)
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+@dataclass(frozen=True, slots=True)
+class FeatureChunk:
+    features_hash: str    # artifact id, stored on every row of the chunk
+    start: datetime       # effective [start, end) served from this chunk
+    end: datetime
+    computed_start: datetime
+    computed_end: datetime
+    rows: int
+    bars_digest: str      # sha256 of the input bars the chunk was computed from
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class FeatureLineage:
+    key: FeatureKey
+    key_digest: str
+    chunk: FeatureChunk
+
+
+@dataclass
+class _Manifest:
+    key: FeatureKey
+    chunks: list[FeatureChunk] = field(default_factory=list)
+
+    @property
+    def coverage(self) -> tuple[datetime, datetime] | None:
+        if not self.chunks:
+            return None
+        return min(c.start for c in self.chunks), max(c.end for c in self.chunks)
+
+
+class FeatureStore:
+    def __init__(self, store: ParquetStore) -> None:
+        self.store = store
+
+    def get(
+        self,
+        spec: FeatureSpec,
+        symbols: Sequence[str],
+        interval: str,
+        start: datetime,
+        end: datetime,
+        load_bars: BarLoader,
+        horizon: int | None = None,
+    ) -> pl.DataFrame:
+        """Feature rows (plus labels when `horizon` is set) for event_time in
+        [start, end), computing only the range the cache does not hold.
+
+        `load_bars(a, b)` must return bars for `symbols` with event_time in
+        [a, b) in the schema `spec.compute` expects.
+        """
+        start, end = _utc(start), _utc(end)
+        if horizon is not None and spec.label is None:
+            raise ValueError(f"feature spec {spec.name!r} has no label function")
+        key = FeatureKey(
+            spec_name=spec.name,
+            source_hash=spec.source_hash,
+            feature_names=spec.feature_names,
+            symbols=tuple(sorted(symbols)),
+            interval=interval,
+            horizon=horizon,
+        )
+        manifest = self._load_manifest(spec, key)
+        step = interval_timedelta(interval)
+        tail = step * (horizon or 0)
+
+        cov = manifest.coverage
+        if cov is None:
+            self._materialize(spec, manifest, start, end, load_bars, step, tail)
+        else:
+            cov_start, cov_end = cov
+            if start < cov_start:
+                self._materialize(spec, manifest, start, cov_start, load_bars, step, tail)
+            if end > cov_end:
+                # Rows in the last `horizon` bars were labelled without future bars.
+                resume = max(cov_start, cov_end - tail)
+                manifest.chunks = [
+                    replace(c, end=min(c.end, resume)) if c.end > resume else c
+                    for c in manifest.chunks
+                ]
+                manifest.chunks = [c for c in manifest.chunks if c.end > c.start]
+                self._materialize(spec, manifest, resume, end, load_bars, step, tail)
+        return self._read(spec, manifest, start, end)
+
+    def lineage(self, spec_name: str, features_hash: str) -> FeatureLineage | None:
+        """Resolve a Signal.features_hash back to the chunk that produced it."""
+        manifest_dir = self._dataset_dir(spec_name) / "_manifests"
+        if not manifest_dir.is_dir():
+            return None
+        for path in sorted(manifest_dir.glob("*.json")):
+            manifest = _manifest_from_json(json.loads(path.read_text(encoding="utf-8")))
+            for chunk in manifest.chunks:
+                if chunk.features_hash == features_hash:
+                    return FeatureLineage(key=manifest.key, key_digest=manifest.key.digest, chunk=chunk)
+        return None
+
+    # ---- materialization ----
+
+    def _materialize(
+        self,
+        spec: FeatureSpec,
+        manifest: _Manifest,
+        start: datetime,
+        end: datetime,
+        load_bars: BarLoader,
+        step: timedelta,
+        tail: timedelta,
+    ) -> None:
+        bars = load_bars(start - step * spec.warmup_bars, end + tail)
+        if bars.height:
+            bars = bars.filter(pl.col("symbol").is_in(list(manifest.key.symbols)))
+        if bars.height == 0:
+            log.info("feature_store_no_bars", spec=spec.name, start=str(start), end=str(end))
+            return
+        feats = spec.compute(bars)
+        if spec.passthrough:
+            feats = feats.join(
+                bars.select(["symbol", "event_time", *spec.passthrough]),
+                on=["symbol", "event_time"], how="left",
+            )
+        if manifest.key.horizon is not None and spec.label is not None:
+            feats = spec.label(feats, manifest.key.horizon)
+        feats = feats.filter((pl.col("event_time") >= start) & (pl.col("event_time") < end))
+        if feats.height == 0:
+            return
+        # Never claim coverage past the last bar we actually saw.
+        last = _utc(feats.get_column("event_time").max())
+        effective_end = min(end, last + step)
+
+        bars_digest = _frame_digest(bars)
+        features_hash = hashlib.sha256(
+            f"{manifest.key.digest}|{start.isoformat()}|{effective_end.isoformat()}|{bars_digest}".encode()
+        ).hexdigest()[:16]
+        feats = feats.with_columns(pl.lit(features_hash).alias(HASH_COLUMN)).sort(["symbol", "event_time"])
+
+        dataset = _dataset_name(spec.name)
+        # One part file per month keeps partition pruning useful for long ranges.
+        month = pl.col("event_time").dt.truncate("1mo")
+        for _, part in feats.with_columns(month.alias("_month")).group_by("_month", maintain_order=True):
+            self.store.write(dataset, part.drop("_month").to_arrow())
+
+        manifest.chunks.append(FeatureChunk(
+            features_hash=features_hash,
+            start=start,
+            end=effective_end,
+            computed_start=start,
+            computed_end=effective_end,
+            rows=feats.height,
+            bars_digest=bars_digest,
+            created_at=datetime.now(timezone.utc),
+        ))
+        manifest.chunks.sort(key=lambda c: c.start)
+        self._save_manifest(spec, manifest)
+        log.info(
+            "feature_store_materialized",
+            spec=spec.name, key=manifest.key.digest, features_hash=features_hash,
+            start=str(start), end=str(effective_end), rows=feats.height,
+        )
+
+    def _read(self, spec: FeatureSpec, manifest: _Manifest, start: datetime, end: datetime) -> pl.DataFrame:
+        live = [c for c in manifest.chunks if c.start < end and c.end > start]
+        if not live:
+            return pl.DataFrame()
+        frame = self.store.read(
+            _dataset_name(spec.name), symbols=list(manifest.key.symbols),
+            start=start, end=end, output="polars",
+        )
+        if frame.height == 0:
+            return frame
+        keep = pl.lit(False)
+        for c in live:
+            keep = keep | (
+                (pl.col(HASH_COLUMN) == c.features_hash)
+                & (pl.col("event_time") >= c.start)
+                & (pl.col("event_time") < c.end)
+            )
+        frame = frame.filter(keep)
+        extra = [c for c in frame.columns if c not in (*KEY_COLUMNS, *spec.feature_names, HASH_COLUMN)]
+        return frame.select([*KEY_COLUMNS, *spec.feature_names, *extra, HASH_COLUMN]).sort(
+            ["symbol", "event_time"]
+        )
+
+    # ---- manifests ----
+
+    def _dataset_dir(self, spec_name: str) -> Path:
+        return self.store.root / _dataset_name(spec_name)
+
+    def _manifest_path(self, spec: FeatureSpec, key: FeatureKey) -> Path:
+        return self._dataset_dir(spec.name) / "_manifests" / f"{key.digest}.json"
+
+    def _load_manifest(self, spec: FeatureSpec, key: FeatureKey) -> _Manifest:
+        path = self._manifest_path(spec, key)
+        if not path.exists():
+            return _Manifest(key=key)
+        return _manifest_from_json(json.loads(path.read_text(encoding="utf-8")))
+
+    def _save_manifest(self, spec: FeatureSpec, manifest: _Manifest) -> None:
+        path = self._manifest_path(spec, manifest.key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "key": asdict(manifest.key),
+            "chunks": [
+                {k: (v.isoformat() if isinstance(v, datetime) else v) for k, v in asdict(c).items()}
+                for c in manifest.chunks
+            ],
+        }
+        tmp = path.with_name(path.name + ".partial")
+        tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+def interval_timedelta(interval: str) -> timedelta:
+    m = _INTERVAL_RE.match(interval)
+    if m is None:
+        raise ValueError(f"unsupported interval {interval!r} (expected e.g. '1m', '1h', '1d')")
+    return int(m.group(1)) * _INTERVAL_UNIT[m.group(2)]
+
+
+def _dataset_name(spec_name: str) -> str:
+    return f"features_{spec_name}"
+
+
+def _frame_digest(frame: pl.DataFrame) -> str:
+    h = hashlib.sha256()
+    h.update(",".join(frame.columns).encode())
+    h.update(frame.hash_rows(seed=0).to_numpy().tobytes())
+    return h.hexdigest()[:16]
+
+
+def _manifest_from_json(payload: dict) -> _Manifest:
+    k = payload["key"]
+    key = FeatureKey(
+        spec_name=k["spec_name"],
+        source_hash=k["source_hash"],
+        feature_names=tuple(k["feature_names"]),
+        symbols=tuple(k["symbols"]),
+        interval=k["interval"],
+        horizon=k["horizon"],
+    )
+    chunks = [
+        FeatureChunk(
+            features_hash=c["features_hash"],
+            start=datetime.fromisoformat(c["start"]),
+            end=datetime.fromisoformat(c["end"]),
+            computed_start=datetime.fromisoformat(c["computed_start"]),
+            computed_end=datetime.fromisoformat(c["computed_end"]),
+            rows=int(c["rows"]),
+            bars_digest=c["bars_digest"],
+            created_at=datetime.fromisoformat(c["created_at"]),
+        )
+        for c in payload["chunks"]
+    ]
+    return _Manifest(key=key, chunks=chunks)
+
+
+def _utc(dt: datetime) -> datetime:
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
@@ -0,0 +1,407 @@
+"""LogStore — append-only JSONL logs with resumable readers and key indexes.
+
+Why this exists:
+  The shadow and outcome logs (a2/a3/a5 *_shadow.jsonl, *_outcomes.jsonl)
+  only ever grow. Every harvest cycle used to json.loads every line of both
+  files just to find the few rows appended since the previous cycle, and
+  after months of shadow mode that parsing dominated the cycle.
+
+Design:
+  - Writers are unchanged: one JSON object per line appended to `path`.
+    Readers never trust a final line without its newline (a writer may be
+    mid-append).
+  - A *position* names a line: `segment * SEGMENT_SPAN + byte offset`.
+    Positions only grow, across rollovers too.
+  - Consumers (`resume(name)`) persist a cursor: the position they have read
+    up to plus the positions of rows they did not mark done (observations
+    whose outcome window has not matured, fetches that failed). A harvest
+    cycle parses only those rows and the new tail.
+  - Key indexes (`keys(name, key_fn)`) persist the set of keys already
+    present in a log (e.g. harvested obs_ids) as a text file plus the
+    position it covers; each call parses only lines appended since.
+  - rollover() seals the live file into `{path}.idx/seg-NNNNNN.jsonl` once
+    it passes `max_bytes` (writers open the file per append, so the next
+    line starts a fresh one), exports sealed segments to a ParquetStore
+    dataset partitioned by day, and deletes a sealed segment once it is
+    exported and every cursor and key index has moved past it. Each
+    segment's parts have fixed names, so an export replayed after a crash
+    (before meta.json recorded it) adds no duplicate rows. History
+    older than the live segments is then queried with DuckDB via
+    ParquetStore.query() rather than re-parsed. meta.json records where the
+    archive lives, so read_all() can return the whole history.
+  - Exported rows have a fixed schema so every part file unions cleanly:
+    event_time/available_at (from `time_field`), the `export_columns` the
+    log declares, and `record` — the full line as JSON text for DuckDB's
+    json functions (`record->>'$.snapshot.symbol'`).
+
+Index layout, next to the log:
+    {path}.idx/
+        meta.json                 live segment number, sealed/exported segments, archive
+        seg-NNNNNN.jsonl          sealed segments not yet reclaimed
+        cursor-{name}.json        {"position": int, "pending": [int, ...]}
+        keys-{name}.txt           one key per line
+        keys-{name}.json          {"position": int}
+
+Single-writer assumption for the index: the process running the consumer
+(the harvester) owns `{path}.idx`. Log *writers* may be anywhere.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+
+from helios.data.store.parquet_store import ParquetStore
+from helios.ops import get_logger
+
+log = get_logger(__name__)
+
+SEGMENT_SPAN = 1 << 40  # bytes addressable per segment
+_READ_CHUNK = 1 << 20
+
+
+def _atomic_write_json(path: Path, payload: dict) -> None:
+    tmp = path.with_name(path.name + ".partial")
+    tmp.write_text(json.dumps(payload), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _parse(line: bytes) -> dict | None:
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        rec = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return rec if isinstance(rec, dict) else None
+
+
+@dataclass(slots=True)
+class LogBatch:
+    """Rows one consumer has not resolved: its pending rows, then the new tail.
+
+    Call done(position) for every row that never needs to be offered again,
+    then commit(); the rest stay pending. Without commit() the next resume()
+    replays this batch.
+    """
+    rows: list[tuple[int, dict]]
+    end: int
+    _store: LogStore
+    _consumer: str
+    _done: set[int] = field(default_factory=set)
+
+    def done(self, position: int) -> None:
+        self._done.add(position)
+
+    def commit(self) -> None:
+        pending = [p for p, _ in self.rows if p not in self._done]
+        self._store._save_cursor(self._consumer, self.end, pending)
+
+
+class LogStore:
+    def __init__(
+        self,
+        path: str | Path,
+        time_field: str = "timestamp_iso",
+        export_columns: Mapping[str, pa.DataType] | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.index_dir = self.path.with_name(self.path.name + ".idx")
+        self.time_field = time_field  # ISO timestamp used as event_time on export
+        self.export_columns = dict(export_columns or {})
+
+    # ---- index metadata ----
+
+    def _meta(self) -> dict:
+        try:
+            return json.loads((self.index_dir / "meta.json").read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {"live": 0, "sealed": [], "exported": [], "exported_rows": 0}
+
+    def _save_meta(self, meta: dict) -> None:
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        _atomic_write_json(self.index_dir / "meta.json", meta)
+
+    def _segment_path(self, seg: int, meta: dict) -> Path:
+        return self.path if seg == meta["live"] else self.index_dir / f"seg-{seg:06d}.jsonl"
+
+    # ---- reading ----
+
+    def scan(self, start: int = 0) -> Iterator[tuple[int, dict]]:
+        """(position, record) for every complete, parseable line at or after `start`."""
+        yield from self._scan(start, [0])
+
+    def _scan(self, start: int, end_out: list[int]) -> Iterator[tuple[int, dict]]:
+        """scan(), leaving the position just past the last complete line in end_out[0]."""
+        meta = self._meta()
+        seg0, off0 = divmod(start, SEGMENT_SPAN)
+        end_out[0] = start
+        for seg in [*meta["sealed"], meta["live"]]:
+            if seg >= seg0:
+                yield from self._segment_rows(seg, off0 if seg == seg0 else 0, meta, end_out)
+
+    def _segment_rows(self, seg: int, off: int, meta: dict, end_out: list[int]) -> Iterator[tuple[int, dict]]:
+        end_out[0] = seg * SEGMENT_SPAN + off
+        try:
+            f = self._segment_path(seg, meta).open("rb")
+        except FileNotFoundError:
+            return  # not written yet, or reclaimed since `meta` was read
+        with f:
+            f.seek(off)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # torn: a writer is mid-append
+                rec = _parse(line)
+                if rec is not None:
+                    yield seg * SEGMENT_SPAN + off, rec
+                off += len(line)
+        end_out[0] = seg * SEGMENT_SPAN + off
+
+    def read(self) -> list[dict]:
+        """Every record still held as JSONL (rolled-over history is in Parquet)."""
+        return [rec for _, rec in self.scan()]
+
+    def read_all(self) -> list[dict]:
+        """Every record, rolled-over history included: rows exported to the
+        archive dataset (in event_time order), then the segments not yet
+        exported, in log order."""
+        meta = self._meta()
+        out = self._read_archive(meta)
+        for seg in [*meta["sealed"], meta["live"]]:
+            if seg not in meta["exported"]:
+                out.extend(rec for _, rec in self._segment_rows(seg, 0, meta, [0]))
+        return out
+
+    def _read_archive(self, meta: dict) -> list[dict]:
+        if not meta["exported"]:
+            return []
+        archive = meta.get("archive")
+        if archive is None or not Path(archive["root"]).is_dir():
+            log.warning("log_archive_missing", path=str(self.path), segments=len(meta["exported"]))
+            return []
+        store = ParquetStore(archive["root"])
+        try:
+            table = store.read(archive["dataset"], columns=["event_time", "record"])
+        finally:
+            store.catalog.close()
+        if table.num_rows:
+            table = table.sort_by("event_time")
+        return [json.loads(r) for r in table.column("record").to_pylist()] if table.num_rows else []
+
+    def records_at(self, positions: Sequence[int]) -> list[tuple[int, dict]]:
+        """(position, record) for each readable position, in position order."""
+        meta = self._meta()
+        out: list[tuple[int, dict]] = []
+        f, open_seg = None, None
+        try:
+            for position in sorted(positions):
+                seg, off = divmod(position, SEGMENT_SPAN)
+                if seg != open_seg:
+                    if f is not None:
+                        f.close()
+                    try:
+                        f = self._segment_path(seg, meta).open("rb")
+                    except FileNotFoundError:
+                        f = None
+                    open_seg = seg
+                if f is None:
+                    continue
+                f.seek(off)
+                rec = _parse(f.readline())
+                if rec is not None:
+                    out.append((position, rec))
+        finally:
+            if f is not None:
+                f.close()
+        return out
+
+    def count(self) -> int:
+        """Row count without parsing: exported rows plus complete live lines."""
+        meta = self._meta()
+        n = int(meta.get("exported_rows", 0))
+        for seg in [*meta["sealed"], meta["live"]]:
+            if seg in meta["exported"]:
+                continue
+            try:
+                f = self._segment_path(seg, meta).open("rb")
+            except FileNotFoundError:
+                continue
+            with f:
+                while chunk := f.read(_READ_CHUNK):
+                    n += chunk.count(b"\n")
+        return n
+
+    # ---- consumers ----
+
+    def _cursor(self, consumer: str) -> dict:
+        try:
+            return json.loads((self.index_dir / f"cursor-{consumer}.json").read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {"position": 0, "pending": []}
+
+    def _save_cursor(self, consumer: str, position: int, pending: list[int]) -> None:
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        _atomic_write_json(self.index_dir / f"cursor-{consumer}.json",
+                           {"position": position, "pending": sorted(pending)})
+
+    def resume(self, consumer: str) -> LogBatch:
+        """Pending rows of `consumer`, then every row appended since its last commit."""
+        cur = self._cursor(consumer)
+        rows = self.records_at(cur["pending"])
+        end = [cur["position"]]
+        rows.extend(self._scan(cur["position"], end))
+        return LogBatch(rows=rows, end=end[0], _store=self, _consumer=consumer)
+
+    def keys(self, name: str, key_fn: Callable[[dict], str | None]) -> set[str]:
+        """Persisted set of key_fn(record) over the log. `name` must change
+        whenever key_fn does."""
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        keys_path = self.index_dir / f"keys-{name}.txt"
+        state_path = self.index_dir / f"keys-{name}.json"
+        try:
+            position = json.loads(state_path.read_text(encoding="utf-8"))["position"]
+            with keys_path.open("r", encoding="utf-8") as f:
+                keys = {line.rstrip("\n") for line in f}
+        except (OSError, json.JSONDecodeError, KeyError):
+            # A fresh index also covers history already rolled into the archive.
+            position = 0
+            keys = {k for rec in self._read_archive(self._meta()) if (k := key_fn(rec))}
+            keys_path.write_text("".join(f"{k}\n" for k in keys), encoding="utf-8")
+        end = [position]
+        new = [k for _, rec in self._scan(position, end) if (k := key_fn(rec)) and k not in keys]
+        if end[0] != position:
+            if new:
+                with keys_path.open("a", encoding="utf-8") as f:
+                    f.writelines(f"{k}\n" for k in dict.fromkeys(new))
+                keys.update(new)
+            _atomic_write_json(state_path, {"position": end[0]})
+        return keys
+
+    # ---- rollover ----
+
+    def rollover(self, store: ParquetStore, dataset: str, max_bytes: int = 256 * 1024 * 1024) -> int:
+        """Seal the live file past `max_bytes`, export sealed segments to
+        `dataset`, reclaim segments nobody needs. Returns rows exported."""
+        self.seal(max_bytes)
+        return self.archive(store, dataset)
+
+    def seal(self, max_bytes: int = 256 * 1024 * 1024) -> bool:
+        """Seal the live file if it has passed `max_bytes`. Cheap (a rename
+        and a meta write), but it moves the file readers scan, so run it on
+        the thread that runs this log's consumers."""
+        meta = self._meta()
+        if not self.path.exists() or self.path.stat().st_size < max_bytes:
+            return False
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        os.replace(self.path, self.index_dir / f"seg-{meta['live']:06d}.jsonl")
+        meta["sealed"].append(meta["live"])
+        meta["live"] += 1
+        self._save_meta(meta)
+        log.info("log_segment_sealed", path=str(self.path), segment=meta["sealed"][-1])
+        return True
+
+    def archive(self, store: ParquetStore, dataset: str) -> int:
+        """Export sealed segments to `dataset` and reclaim the ones nobody
+        needs. Only touches sealed segments, which consumers never write, so
+        it may run in a worker thread. Returns rows exported."""
+        meta = self._meta()
+        exported = 0
+        for seg in meta["sealed"]:
+            if seg in meta["exported"]:
+                continue
+            rows = [rec for _, rec in self._segment_rows(seg, 0, meta, [0])]
+            self._export(store, dataset, rows, seg)
+            meta["exported"].append(seg)
+            meta["archive"] = {"root": str(store.root.resolve()), "dataset": dataset}
+            meta["exported_rows"] = int(meta.get("exported_rows", 0)) + len(rows)
+            exported += len(rows)
+            self._save_meta(meta)
+
+        floor = self._min_position()
+        for seg in list(meta["sealed"]):
+            if seg in meta["exported"] and floor >= (seg + 1) * SEGMENT_SPAN:
+                (self.index_dir / f"seg-{seg:06d}.jsonl").unlink(missing_ok=True)
+                meta["sealed"].remove(seg)
+                self._save_meta(meta)
+                log.info("log_segment_reclaimed", path=str(self.path), segment=seg)
+        return exported
+
+    def _min_position(self) -> int:
+        """Lowest position any cursor or key index may still read."""
+        floor = SEGMENT_SPAN * self._meta()["live"]
+        for p in self.index_dir.glob("cursor-*.json"):
+            cur = json.loads(p.read_text(encoding="utf-8"))
+            floor = min(floor, cur["position"], *cur["pending"])
+        for p in self.index_dir.glob("keys-*.json"):
+            floor = min(floor, json.loads(p.read_text(encoding="utf-8"))["position"])
+        return floor
+
+    def _export(self, store: ParquetStore, dataset: str, rows: list[dict], seg: int) -> None:
+        if not rows:
+            return
+        now = datetime.now(timezone.utc)
+        times = [_event_time(rec.get(self.time_field), now) for rec in rows]
+        by_day: dict[Any, list[int]] = {}
+        for i, t in enumerate(times):
+            by_day.setdefault(t.date(), []).append(i)
+        ts_type = pa.timestamp("us", tz="UTC")
+        for day, idx in by_day.items():
+            day_times = [times[i] for i in idx]
+            columns = {"event_time": pa.array(day_times, ts_type), "available_at": pa.array(day_times, ts_type)}
+            for name, dtype in self.export_columns.items():
+                columns[name] = _column([rows[i].get(name) for i in idx], dtype)
+            columns["record"] = pa.array([json.dumps(rows[i], default=str) for i in idx], pa.string())
+            store.write(dataset, pa.table(columns), partition_date=max(day_times),
+                        part_name=f"{self.path.stem}-seg{seg:06d}-{day:%Y%m%d}")
+
+
+def _event_time(raw: Any, default: datetime) -> datetime:
+    try:
+        t = datetime.fromisoformat(str(raw))
+    except ValueError:
+        return default
+    return t.astimezone(timezone.utc) if t.tzinfo else t.replace(tzinfo=timezone.utc)
+
+
+def _column(values: list[Any], dtype: pa.DataType) -> pa.Array:
+    try:
+        return pa.array(values, dtype)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError, TypeError, ValueError):
+        out = []
+        for v in values:  # one bad value nulls that cell, not the column
+            try:
+                out.append(pa.scalar(v, dtype).as_py())
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError, TypeError, ValueError):
+                out.append(None)
+        return pa.array(out, dtype)
+
+
+async def rollover_loop(
+    logs: Sequence[tuple[LogStore, str]],
+    store: ParquetStore,
+    interval_minutes: float = 60.0,
+    max_bytes: int = 256 * 1024 * 1024,
+) -> None:
+    """Periodic rollover of (log, dataset) pairs — designed to run as a
+    supervised task. Sealing runs on the event loop thread, so it never
+    interleaves with a harvester's resume()/commit() in this process; the
+    export and reclaim run in a worker thread."""
+    log.info("log_rollover_loop_starting", interval_minutes=interval_minutes, logs=len(logs))
+    while True:
+        for log_store, dataset in logs:
+            try:
+                log_store.seal(max_bytes)
+                n = await asyncio.to_thread(log_store.archive, store, dataset)
+                if n:
+                    log.info("log_rollover_exported", path=str(log_store.path), dataset=dataset, rows=n)
+            except Exception as e:
+                log.warning("log_rollover_failed", path=str(log_store.path), error=str(e))
+        await asyncio.sleep(interval_minutes * 60.0)
@@ -5,19 +5,43 @@ Append-only. Schema-validated. Every write requires `event_time` and
 
 This implementation uses pyarrow + duckdb. The interface is designed so that
 swapping the backend to R2/S3 later is a config change, not a rewrite.
+
+Queries go through one long-lived StoreCatalog (see catalog.py) instead of a
+fresh DuckDB connection per call.
+
+A part lands in the day of its batch's latest event_time unless the caller
+passes an earlier `partition_date` (a backfill filed under the day it
+belongs to). Those writes record how many days late the data runs in
+`{dataset}/_partition_lag.json`, and read() widens its date pruning by that
+much, so pruning never drops a row. Partition days are UTC days: a
+`partition_date` must be naive (read as UTC) or carry a zero UTC offset.
 """
 from __future__ import annotations
 
+import json
+import os
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Literal
 
-import duckdb
+import polars as pl
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
+from helios.data.store.catalog import StoreCatalog
+from helios.data.store.pruning import (
+    ReadFilter,
+    exact_mask,
+    prune_partitions,
+    prune_row_groups,
+)
+
 REQUIRED_COLUMNS = ("event_time", "available_at")
+PARTITION_LAG_FILE = "_partition_lag.json"
 
 
 class SchemaError(ValueError):
@@ -35,6 +59,8 @@ class ParquetStore:
     def __init__(self, root: str | Path) -> None:
         self.root = Path(root)
         self.root.mkdir(parents=True, exist_ok=True)
+        self.catalog = StoreCatalog(self.root)
+        self._lags: dict[str, int] = {}  # dataset -> partition lag in days
 
     def _validate(self, table: pa.Table) -> None:
         cols = set(table.column_names)
@@ -46,41 +72,160 @@ class ParquetStore:
             if not pa.types.is_timestamp(table.schema.field(c).type):
                 raise SchemaError(f"Column {c!r} must be timestamp, got {table.schema.field(c).type}")
 
-    def write(self, dataset: str, table: pa.Table, partition_date: datetime | None = None) -> WriteResult:
+    def write(
+        self,
+        dataset: str,
+        table: pa.Table,
+        partition_date: datetime | None = None,
+        part_name: str | None = None,
+    ) -> WriteResult:
+        """Append `table` as one new part file.
+
+        `part_name` makes the write idempotent: the part is written once,
+        atomically, as `part-{part_name}.parquet`, and a replay that finds it
+        already there writes nothing (rows=0).
+
+        Raises ValueError for a `partition_date` in a non-UTC timezone:
+        converting it could file the part under a different day than the
+        one the caller named.
+        """
         self._validate(table)
+        if partition_date is not None and partition_date.utcoffset() not in (None, timedelta(0)):
+            raise ValueError(f"partition_date must be UTC or naive, got {partition_date.isoformat()}")
         # Default partition is the max event_time in the batch (so a backfill of yesterday lands in yesterday)
+        latest = pc.max(table.column("event_time")).as_py() if table.num_rows else None
         if partition_date is None:
-            event_times = table.column("event_time").to_pylist()
-            partition_date = max(event_times) if event_times else datetime.now(timezone.utc)
+            partition_date = latest if latest is not None else datetime.now(timezone.utc)
         d = partition_date
+        if latest is not None and (lag := (latest.date() - d.date()).days) > self._partition_lag(dataset):
+            self._save_partition_lag(dataset, lag)
         part_dir = (
             self.root / dataset / f"year={d.year:04d}" / f"month={d.month:02d}" / f"day={d.day:02d}"
         )
         part_dir.mkdir(parents=True, exist_ok=True)
-        path = part_dir / f"part-{uuid.uuid4()}.parquet"
-        pq.write_table(table, path, compression="zstd")
+        if part_name is None:
+            path = part_dir / f"part-{uuid.uuid4()}.parquet"
+            pq.write_table(table, path, compression="zstd")
+        else:
+            path = part_dir / f"part-{part_name}.parquet"
+            if path.exists():
+                return WriteResult(dataset=dataset, rows=0, path=str(path))
+            tmp = part_dir / f".part-{part_name}.tmp"  # not *.parquet: never listed
+            pq.write_table(table, tmp, compression="zstd")
+            os.replace(tmp, path)
+        self.catalog.add_file(dataset, path)
         return WriteResult(dataset=dataset, rows=table.num_rows, path=str(path))
 
-    def query(self, sql: str, as_of: datetime | None = None) -> pa.Table:
-        """Run a SQL query against the store.
+    def _partition_lag(self, dataset: str) -> int:
+        """Most days any row's event_time runs past its partition day.
 
-        If `as_of` is provided, automatically appends a PIT filter
-        (`available_at <= as_of`) — but only if the user's SQL already
-        references the source as a registered view. The PIT layer in
-        helios.data.pit is the recommended interface.
+        Read from disk once per dataset and cached, like the catalog's file
+        listing; refresh() rereads both.
+        """
+        lag = self._lags.get(dataset)
+        if lag is None:
+            try:
+                raw = (self.root / dataset / PARTITION_LAG_FILE).read_text(encoding="utf-8")
+                lag = int(json.loads(raw)["days"])
+            except (OSError, ValueError, KeyError):
+                lag = 0
+            self._lags[dataset] = lag
+        return lag
+
+    def _save_partition_lag(self, dataset: str, days: int) -> None:
+        ds_dir = self.root / dataset
+        ds_dir.mkdir(parents=True, exist_ok=True)
+        path = ds_dir / PARTITION_LAG_FILE
+        tmp = path.with_name(path.name + ".partial")
+        tmp.write_text(json.dumps({"days": days}), encoding="utf-8")
+        os.replace(tmp, path)
+        self._lags[dataset] = days
+
+    def refresh(self, dataset: str | None = None) -> None:
+        """Rescan from disk. Use after another store or process writes the root."""
+        if dataset is None:
+            self._lags.clear()
+        else:
+            self._lags.pop(dataset, None)
+        self.catalog.refresh(dataset)
+
+    def query(
+        self,
+        sql: str,
+        as_of: datetime | None = None,
+        params: list[object] | dict[str, object] | None = None,
+    ) -> pa.Table:
+        """Run a SQL query against the store. Every dataset is a view by name.
+
+        If `as_of` is provided, dataset names resolve to PIT views that only
+        expose rows with `available_at <= as_of` (bound as a parameter). The
+        PIT layer in helios.data.pit is the recommended interface — it adds
+        the post-query leak canary on top.
+        """
+        return self.catalog.execute(sql, params=params, as_of=as_of)
+
+    def read(
+        self,
+        dataset: str,
+        symbols: Sequence[str] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        columns: Sequence[str] | None = None,
+        as_of: datetime | None = None,
+        output: Literal["arrow", "polars"] = "arrow",
+    ) -> pa.Table | pl.DataFrame:
+        """Typed read with partition pruning and row-group predicate pushdown.
+
+        `start` is inclusive and `end` exclusive on `event_time`; `as_of`
+        keeps rows with `available_at <= as_of`. Naive datetimes are UTC.
+        No SQL round-trip — row groups are read straight from Parquet.
         """
-        con = duckdb.connect()
-        # Register every dataset as a globbed view
-        for ds_dir in self.root.iterdir():
-            if ds_dir.is_dir():
-                glob = str(ds_dir / "**" / "*.parquet")
-                con.execute(
-                    f"CREATE VIEW {ds_dir.name} AS SELECT * FROM read_parquet('{glob}', hive_partitioning=true)"
-                )
-        if as_of is not None:
-            con.execute("SET TimeZone = 'UTC'")
-        _arrow = con.execute(sql).arrow()
-        return _arrow.read_all() if hasattr(_arrow, "read_all") else _arrow
+        flt = ReadFilter.build(symbols, start, end, as_of)
+        try:
+            tables, schema = self._read_parts(dataset, flt, columns)
+        except FileNotFoundError:
+            # A listed part was reclaimed by another store's compaction
+            self.refresh(dataset)
+            tables, schema = self._read_parts(dataset, flt, columns)
+
+        if tables:
+            out = pa.concat_tables(tables, promote_options="default")
+        elif schema is not None:
+            out = schema.empty_table()
+        else:
+            out = pa.table({})
+        if columns is not None and out.num_columns:
+            out = out.select([c for c in columns if c in out.column_names])
+        return pl.from_arrow(out) if output == "polars" else out
+
+    def _read_parts(
+        self,
+        dataset: str,
+        flt: ReadFilter,
+        columns: Sequence[str] | None,
+    ) -> tuple[list[pa.Table], pa.Schema | None]:
+        files = prune_partitions(self.catalog.files(dataset), flt, lag_days=self._partition_lag(dataset))
+        tables: list[pa.Table] = []
+        schema: pa.Schema | None = None
+        for path in files:
+            md = self.catalog.metadata(path)
+            if schema is None:
+                schema = md.schema.to_arrow_schema()
+            row_groups = prune_row_groups(md, flt)
+            if not row_groups:
+                continue
+            file_cols = set(md.schema.names)
+            read_cols = None
+            if columns is not None:
+                wanted = dict.fromkeys([*columns, *flt.needed_columns])
+                read_cols = [c for c in wanted if c in file_cols]
+            t = pq.ParquetFile(path, metadata=md).read_row_groups(row_groups, columns=read_cols)
+            mask = exact_mask(t, flt)
+            if mask is not None:
+                t = t.filter(mask)
+            if t.num_rows:
+                tables.append(t)
+        return tables, schema
 
     def datasets(self) -> list[str]:
         return sorted([p.name for p in self.root.iterdir() if p.is_dir()])
@@ -0,0 +1,158 @@
+"""Partition and row-group pruning for ParquetStore.read().
+
+Two levels of skipping, cheapest first:
+
+  1. Partition (directory) pruning by date. A part file lands in the day of
+     its batch's latest `event_time`, so every row in `day=D` has
+     `event_time <= end of D`. An explicit, earlier partition_date (a
+     backfill) can break that by up to the dataset's recorded lag, so any
+     partition whose day ends more than `lag_days` before `start` is
+     skipped without opening a file.
+  2. Row-group pruning from Parquet footer statistics on `symbol`,
+     `event_time` and `available_at`. Footers come from the catalog's
+     metadata cache, so repeated reads do not touch them again.
+
+Surviving row groups are read with column projection and then filtered
+exactly — statistics only ever rule row groups out, never in.
+"""
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+_PARTITION_RE = re.compile(r"year=(\d{4})[/\\]month=(\d{2})[/\\]day=(\d{2})")
+
+FILTER_COLUMNS = ("symbol", "event_time", "available_at")
+
+
+@dataclass(frozen=True, slots=True)
+class ReadFilter:
+    symbols: frozenset[str] | None
+    start: datetime | None  # inclusive, on event_time
+    end: datetime | None    # exclusive, on event_time
+    as_of: datetime | None  # inclusive, on available_at
+
+    @classmethod
+    def build(
+        cls,
+        symbols: Sequence[str] | None,
+        start: datetime | None,
+        end: datetime | None,
+        as_of: datetime | None,
+    ) -> ReadFilter:
+        return cls(
+            symbols=frozenset(symbols) if symbols is not None else None,
+            start=_utc(start),
+            end=_utc(end),
+            as_of=_utc(as_of),
+        )
+
+    @property
+    def needed_columns(self) -> tuple[str, ...]:
+        cols = []
+        if self.symbols is not None:
+            cols.append("symbol")
+        if self.start is not None or self.end is not None:
+            cols.append("event_time")
+        if self.as_of is not None:
+            cols.append("available_at")
+        return tuple(cols)
+
+
+def partition_date(path: str) -> date | None:
+    m = _PARTITION_RE.search(path)
+    if m is None:
+        return None
+    return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+
+
+def prune_partitions(files: Sequence[str], flt: ReadFilter, lag_days: int = 0) -> list[str]:
+    if flt.start is None:
+        return list(files)
+    start_day = flt.start.date() - timedelta(days=lag_days)
+    out = []
+    for f in files:
+        d = partition_date(f)
+        if d is None or d >= start_day:
+            out.append(f)
+    return out
+
+
+def prune_row_groups(md: pq.FileMetaData, flt: ReadFilter) -> list[int]:
+    """Indices of row groups whose statistics cannot rule out a match."""
+    col_idx = _column_indices(md)
+    keep = []
+    for i in range(md.num_row_groups):
+        rg = md.row_group(i)
+        if flt.symbols is not None:
+            lo, hi = _min_max(rg, col_idx.get("symbol"))
+            if lo is not None and not any(lo <= s <= hi for s in flt.symbols):
+                continue
+        if flt.start is not None or flt.end is not None:
+            lo, hi = _min_max(rg, col_idx.get("event_time"))
+            if lo is not None:
+                lo, hi = _utc(lo), _utc(hi)
+                if flt.start is not None and hi < flt.start:
+                    continue
+                if flt.end is not None and lo >= flt.end:
+                    continue
+        if flt.as_of is not None:
+            lo, _ = _min_max(rg, col_idx.get("available_at"))
+            if lo is not None and _utc(lo) > flt.as_of:
+                continue
+        keep.append(i)
+    return keep
+
+
+def exact_mask(table: pa.Table, flt: ReadFilter) -> pa.ChunkedArray | None:
+    mask = None
+
+    def _and(m: Any) -> None:
+        nonlocal mask
+        mask = m if mask is None else pc.and_(mask, m)
+
+    if flt.symbols is not None:
+        _and(pc.is_in(table.column("symbol"), value_set=pa.array(sorted(flt.symbols))))
+    if flt.start is not None:
+        _and(pc.greater_equal(table.column("event_time"), _scalar(flt.start, table, "event_time")))
+    if flt.end is not None:
+        _and(pc.less(table.column("event_time"), _scalar(flt.end, table, "event_time")))
+    if flt.as_of is not None:
+        _and(pc.less_equal(table.column("available_at"), _scalar(flt.as_of, table, "available_at")))
+    return mask
+
+
+def _scalar(value: datetime, table: pa.Table, column: str) -> pa.Scalar:
+    typ = table.schema.field(column).type
+    if typ.tz is None:
+        value = value.replace(tzinfo=None)
+    return pa.scalar(value, type=typ)
+
+
+def _column_indices(md: pq.FileMetaData) -> dict[str, int]:
+    if md.num_row_groups == 0:
+        return {}
+    rg = md.row_group(0)
+    return {rg.column(j).path_in_schema: j for j in range(rg.num_columns)}
+
+
+def _min_max(rg: pq.RowGroupMetaData, idx: int | None) -> tuple[Any, Any]:
+    if idx is None:
+        return None, None
+    stats = rg.column(idx).statistics
+    if stats is None or not stats.has_min_max:
+        return None, None
+    return stats.min, stats.max
+
+
+def _utc(ts: datetime | None) -> datetime | None:
+    if ts is None:
+        return None
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
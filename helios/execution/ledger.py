@@ -0,0 +1,243 @@
+"""PortfolioLedger — an incrementally maintained PortfolioState.
+
+Why this exists:
+  The backtest engines rebuilt a PortfolioState every bar: a fresh Position
+  tuple from the broker's books and a full NAV revaluation. The risk overlay
+  then re-scanned every position (gross/net) and open order (per-strategy)
+  for every intent. The realized-PnL loss windows were never filled, so the
+  R02 loss caps could not fire in a backtest.
+
+Design:
+  - The ledger hangs off a PaperBroker (`broker.on_fill`) and treats the
+    broker's books as the source of truth. A fill touches one book, so the
+    ledger swaps that book's old contribution for its new one: market
+    value, gross/net exposure and realized PnL. O(1) per fill.
+  - `mark(marks, as_of)` re-values only the marked positions: O(1) per mark.
+    Marks are sticky: a position without a fresh mark keeps its last one,
+    or its average entry until it is first marked.
+  - All totals are fixed-point ints (helios.fixed_point). Peak NAV is the
+    running max of the NAV seen at each mark, as the engines tracked it.
+  - Realized PnL accrues into UTC day, ISO week and calendar month buckets
+    on the ledger clock (the `as_of` of the last mark). A bucket resets when
+    the clock enters a new period.
+  - `snapshot()` returns a PortfolioState carrying an ExposureSummary, so
+    risk.apply() reads aggregates instead of scanning. The positions tuple,
+    open-order tuple and summary are rebuilt only after a fill or an order
+    change, never per tick.
+
+Positions are reported at leverage 1.0, since the paper broker funds the
+full notional from cash. `unrealized_pnl_usd` stays 0, as the engines
+reported it: filling it would force a tuple rebuild on every mark.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from types import MappingProxyType
+
+from helios.execution.paper_broker import PaperBroker, _PositionBook
+from helios.fixed_point import RATIO_ONE, USD_DP, from_fixed, rescale, to_fixed
+from helios.types import (
+    ExposureSummary,
+    Fill,
+    Order,
+    PortfolioState,
+    Position,
+    Side,
+    StrategyId,
+    Venue,
+)
+
+_Key = tuple[str, Venue]
+_ZERO = Decimal("0")
+
+
+@dataclass(slots=True)
+class _Line:
+    """One book's contributions, as currently included in the ledger totals."""
+    mark: Decimal | None = None   # last mark seen (sticky)
+    mark_units: int | None = None  # `mark` in the book's price units, once held
+    qty_units: int = 0
+    value_units: int = 0          # USD units: qty * mark
+    exposure_units: int = 0       # signed, scale 10**-(USD_DP + RATIO_DP)
+    realized_units: int = 0       # book.realized_units already booked to the windows
+    opened_at: datetime | None = None
+
+
+def _periods(as_of: datetime) -> tuple[date, tuple[int, int], tuple[int, int]]:
+    t = as_of.astimezone(timezone.utc) if as_of.tzinfo else as_of
+    iso = t.isocalendar()
+    return t.date(), (iso.year, iso.week), (t.year, t.month)
+
+
+class PortfolioLedger:
+    """Running portfolio totals over a PaperBroker's books.
+
+    Attach once; the broker reports each fill. Call `mark()` with fresh
+    prices (this also advances the clock), and `snapshot()` whenever a
+    PortfolioState is needed. Live callers that keep resting orders report
+    them with `order_opened()` / `order_closed()`.
+    """
+
+    def __init__(self, broker: PaperBroker, *, as_of: datetime | None = None) -> None:
+        self.broker = broker
+        self.as_of = as_of or datetime.now(timezone.utc)
+        self._lines: dict[_Key, _Line] = {}
+        self._value_units = 0
+        self._gross_units = 0
+        self._net_units = 0
+        self._open_orders: dict[str, Order] = {}
+        self._order_usd: dict[StrategyId, Decimal] = {}
+        self._period_keys = _periods(self.as_of)
+        self._pnl_units = [0, 0, 0]  # day, week, month
+        self._views: tuple[tuple[Position, ...], tuple[Order, ...], ExposureSummary] | None = None
+        for key, book in broker.positions.items():
+            # Attaching mid-run: PnL realized before now is not in any window.
+            line = self._lines[key] = _Line(realized_units=book.realized_units)
+            self._refresh(line, book)
+        self._peak_units = self.nav_units
+        broker.on_fill = self._on_fill
+
+    # ---- inputs ----
+
+    def mark(self, marks: Mapping[_Key, Decimal], as_of: datetime) -> Decimal:
+        """Apply fresh marks at `as_of`; returns NAV. Only held positions are
+        re-valued; other marks are kept for when a position opens."""
+        self._advance(as_of)
+        books = self.broker.positions
+        for key, price in marks.items():
+            line = self._lines.get(key)
+            if line is None:
+                line = self._lines[key] = _Line()
+            line.mark = price
+            line.mark_units = None
+            if line.qty_units:
+                self._revalue(line, books[key])
+        nav = self.nav_units
+        if nav > self._peak_units:
+            self._peak_units = nav
+        return from_fixed(nav, USD_DP)
+
+    def order_opened(self, order: Order) -> None:
+        self._open_orders[order.client_order_id] = order
+        strategy = order.intent.strategy
+        self._order_usd[strategy] = self._order_usd.get(strategy, _ZERO) + order.intent.notional_usd
+        self._views = None
+
+    def order_closed(self, client_order_id: str) -> None:
+        """Filled, cancelled or expired — the order no longer counts toward R07."""
+        order = self._open_orders.pop(client_order_id, None)
+        if order is None:
+            return
+        strategy = order.intent.strategy
+        self._order_usd[strategy] -= order.intent.notional_usd
+        self._views = None
+
+    def _on_fill(self, order: Order, fill: Fill) -> None:
+        key = (fill.symbol, fill.venue)
+        book = self.broker.positions[key]
+        line = self._lines.get(key)
+        if line is None:
+            line = self._lines[key] = _Line()
+        if not line.qty_units and book.qty_units:
+            line.opened_at = self.as_of
+        realized = book.realized_units - line.realized_units
+        if realized:
+            self._pnl_units = [u + realized for u in self._pnl_units]
+            line.realized_units = book.realized_units
+        self._refresh(line, book)
+        self._views = None
+
+    # ---- incremental updates ----
+
+    def _advance(self, as_of: datetime) -> None:
+        keys = _periods(as_of)
+        if keys != self._period_keys:
+            self._pnl_units = [
+                units if new == old else 0
+                for units, new, old in zip(self._pnl_units, keys, self._period_keys, strict=True)
+            ]
+            self._period_keys = keys
+        self.as_of = as_of
+
+    def _refresh(self, line: _Line, book: _PositionBook) -> None:
+        """Re-derive a line after its book changed (a fill)."""
+        p = book.precision
+        line.qty_units = book.qty_units
+        entry = rescale(abs(book.qty_units) * book.avg_units, p.qty_dp + p.price_dp, USD_DP) * RATIO_ONE
+        exposure = -entry if book.qty_units < 0 else entry
+        self._gross_units += abs(exposure) - abs(line.exposure_units)
+        self._net_units += exposure - line.exposure_units
+        line.exposure_units = exposure
+        self._revalue(line, book)
+
+    def _revalue(self, line: _Line, book: _PositionBook) -> None:
+        p = book.precision
+        if line.mark_units is None:
+            line.mark_units = book.avg_units if line.mark is None else to_fixed(line.mark, p.price_dp)
+        value = rescale(line.qty_units * line.mark_units, p.qty_dp + p.price_dp, USD_DP)
+        self._value_units += value - line.value_units
+        line.value_units = value
+
+    # ---- outputs ----
+
+    @property
+    def nav_units(self) -> int:
+        return self.broker.cash_units + self._value_units
+
+    @property
+    def nav(self) -> Decimal:
+        return from_fixed(self.nav_units, USD_DP)
+
+    @property
+    def peak_nav(self) -> Decimal:
+        return from_fixed(self._peak_units, USD_DP)
+
+    def snapshot(self) -> PortfolioState:
+        """Immutable view at the ledger clock. Cheap: the tuples and exposure
+        summary are shared between snapshots until the next fill."""
+        if self._views is None:
+            self._views = (
+                self._build_positions(),
+                tuple(self._open_orders.values()),
+                ExposureSummary(
+                    gross_units=self._gross_units,
+                    net_units=self._net_units,
+                    open_order_usd=MappingProxyType(dict(self._order_usd)),
+                ),
+            )
+        positions, open_orders, exposure = self._views
+        day, week, month = self._pnl_units
+        return PortfolioState(
+            nav_usd=self.nav,
+            peak_nav_usd=self.peak_nav,
+            cash_usd=self.broker.cash,
+            positions=positions,
+            open_orders=open_orders,
+            realized_pnl_today_usd=from_fixed(day, USD_DP),
+            realized_pnl_week_usd=from_fixed(week, USD_DP),
+            realized_pnl_month_usd=from_fixed(month, USD_DP),
+            as_of=self.as_of,
+            exposure=exposure,
+        )
+
+    def _build_positions(self) -> tuple[Position, ...]:
+        out: list[Position] = []
+        for (symbol, venue), book in self.broker.positions.items():
+            if not book.qty_units:
+                continue
+            line = self._lines[(symbol, venue)]
+            out.append(Position(
+                symbol=symbol,
+                venue=venue,
+                side=Side.LONG if book.qty_units > 0 else Side.SHORT,
+                qty=abs(book.qty),
+                avg_entry=book.avg_price,
+                unrealized_pnl_usd=_ZERO,
+                realized_pnl_usd=book.realized_pnl,
+                leverage=1.0,
+                opened_at=line.opened_at or self.as_of,
+            ))
+        return tuple(out)
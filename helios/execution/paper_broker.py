@@ -15,20 +15,66 @@ This is the safety floor while we earn the right to live capital.
 from __future__ import annotations
 
 import uuid
-from collections import defaultdict
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
 
 from helios.backtest.slippage import SlippageInputs, estimate_slippage_bps
+from helios.fixed_point import (
+    DEFAULT_PRECISION,
+    RATIO_ONE,
+    USD_DP,
+    Precision,
+    div_round,
+    from_fixed,
+    precision_for,
+    ratio_units,
+    rescale,
+    to_fixed,
+)
 from helios.types import Fill, Order, Side, Venue
 
+# Conservative 5 bps per fill on crypto majors (Kraken Futures taker is ~5bps)
+FEE_RATE_UNITS = ratio_units(0.0005)
+
 
 @dataclass
 class _PositionBook:
+    """One position. The `*_units` ints (see helios.fixed_point) are the
+    state; `qty`, `avg_price` and `realized_pnl` are read-only Decimal views.
+    `qty` is refreshed on every fill, since nav() reads it every tick; the
+    other two are converted on first read after a fill."""
+    precision: Precision = DEFAULT_PRECISION
+    qty_units: int = 0
+    avg_units: int = 0       # price units
+    realized_units: int = 0  # USD units
     qty: Decimal = Decimal("0")
-    avg_price: Decimal = Decimal("0")
-    realized_pnl: Decimal = Decimal("0")
+    _avg_price: Decimal | None = None
+    _realized_pnl: Decimal | None = None
+
+    @property
+    def avg_price(self) -> Decimal:
+        if self._avg_price is None:
+            self._avg_price = from_fixed(self.avg_units, self.precision.price_dp)
+        return self._avg_price
+
+    @property
+    def realized_pnl(self) -> Decimal:
+        if self._realized_pnl is None:
+            self._realized_pnl = from_fixed(self.realized_units, USD_DP)
+        return self._realized_pnl
+
+    def _changed(self) -> None:
+        self.qty = from_fixed(self.qty_units, self.precision.qty_dp)
+        self._avg_price = self._realized_pnl = None
+
+
+class _Books(dict[tuple[str, Venue], _PositionBook]):
+    """defaultdict that sizes each new book to its venue's precision."""
+    def __missing__(self, key: tuple[str, Venue]) -> _PositionBook:
+        book = self[key] = _PositionBook(precision=precision_for(key[1]))
+        return book
 
 
 @dataclass
@@ -43,15 +89,38 @@ class MarketSnapshot:
 
 class PaperBroker:
     def __init__(self, starting_cash: Decimal = Decimal("1000")) -> None:
-        self.cash: Decimal = starting_cash
+        self.cash_units: int = to_fixed(starting_cash, USD_DP)
         self.starting_cash: Decimal = starting_cash
-        self.positions: dict[tuple[str, Venue], _PositionBook] = defaultdict(_PositionBook)
+        self.positions: dict[tuple[str, Venue], _PositionBook] = _Books()
         self.fills: list[Fill] = []
+        # Called after every fill, once the books reflect it (PortfolioLedger hooks in here)
+        self.on_fill: Callable[[Order, Fill], None] | None = None
+
+    @property
+    def cash_units(self) -> int:
+        return self._cash_units
+
+    @cash_units.setter
+    def cash_units(self, units: int) -> None:
+        self._cash_units = units
+        self._cash: Decimal | None = None
+
+    @property
+    def cash(self) -> Decimal:
+        """Decimal view of cash_units, converted once per change."""
+        if self._cash is None:
+            self._cash = from_fixed(self._cash_units, USD_DP)
+        return self._cash
+
+    @cash.setter
+    def cash(self, value: Decimal) -> None:
+        self.cash_units = to_fixed(value, USD_DP)
 
     def submit(self, order: Order, snap: MarketSnapshot) -> Fill:
         """Simulate a fill. Pure function over (state, order, snap).
 
         Slippage is added against us: long fills above mid, short fills below.
+        Arithmetic is fixed-point; the Fill carries Decimal values.
         """
         slip_bps = estimate_slippage_bps(SlippageInputs(
             order_size=float(order.qty),
@@ -59,54 +128,77 @@ class PaperBroker:
             volatility_pct=snap.bar_volatility,
             spread_bps=snap.spread_bps,
         ))
-        slip_factor = Decimal(str(slip_bps / 10000.0))
-        if order.intent.side == Side.LONG:
-            fill_price = snap.mid_price * (Decimal("1") + slip_factor)
-        else:
-            fill_price = snap.mid_price * (Decimal("1") - slip_factor)
+        key = (order.intent.symbol, order.intent.venue)
+        book = self.positions[key]
+        p = book.precision
+        slip = ratio_units(slip_bps / 10000.0)
+        factor = RATIO_ONE + slip if order.intent.side == Side.LONG else RATIO_ONE - slip
+        fill_px = div_round(to_fixed(snap.mid_price, p.price_dp) * factor, RATIO_ONE)
+        qty = to_fixed(order.qty, p.qty_dp)
 
-        # Fee: conservative 5 bps round-trip on crypto majors (Kraken Futures taker is ~5bps)
-        notional = order.qty * fill_price
-        fee = notional * Decimal("0.0005")
+        notional = div_round(qty * fill_px, p.notional_div)
+        fee = div_round(notional * FEE_RATE_UNITS, RATIO_ONE)
 
         # Update book
-        key = (order.intent.symbol, order.intent.venue)
-        book = self.positions[key]
         if order.intent.side == Side.LONG:
-            new_qty = book.qty + order.qty
+            new_qty = book.qty_units + qty
             if new_qty > 0:
                 # weighted-avg entry
-                book.avg_price = (book.avg_price * book.qty + fill_price * order.qty) / new_qty if book.qty >= 0 else fill_price
-            book.qty = new_qty
-            self.cash -= notional + fee
+                book.avg_units = (
+                    div_round(book.avg_units * book.qty_units + fill_px * qty, new_qty)
+                    if book.qty_units >= 0 else fill_px
+                )
+            book.qty_units = new_qty
+            self._cash_units -= notional + fee
         else:
-            new_qty = book.qty - order.qty
-            if book.qty > 0:
+            new_qty = book.qty_units - qty
+            if book.qty_units > 0:
                 # closing long -> realize PnL on closed portion
-                closed = min(book.qty, order.qty)
-                book.realized_pnl += (fill_price - book.avg_price) * closed
-            book.qty = new_qty
-            self.cash += notional - fee
+                closed = min(book.qty_units, qty)
+                book.realized_units += div_round((fill_px - book.avg_units) * closed, p.notional_div)
+            book.qty_units = new_qty
+            self._cash_units += notional - fee
+        book._changed()
+        self._cash = None
 
         fill = Fill(
             order_id=order.client_order_id,
             symbol=order.intent.symbol,
             venue=order.intent.venue,
             side=order.intent.side,
-            qty=order.qty,
-            price=fill_price,
-            fee_usd=fee,
+            qty=from_fixed(qty, p.qty_dp),  # what the book took, after rounding to qty_dp
+            price=from_fixed(fill_px, p.price_dp),
+            fee_usd=from_fixed(fee, USD_DP),
             slippage_bps=slip_bps,
             filled_at=datetime.now(timezone.utc),
         )
         self.fills.append(fill)
+        if self.on_fill is not None:
+            self.on_fill(order, fill)
         return fill
 
     def nav(self, marks: dict[tuple[str, Venue], Decimal]) -> Decimal:
         """NAV = cash + sum(qty * mark) for each position. Marks are passed in
-        so the broker is pure (doesn't need to fetch prices)."""
+        so the broker is pure (doesn't need to fetch prices).
+
+        Marks arrive as Decimal, so this multiplies them into each book's
+        Decimal qty view (exact) rather than converting every mark to units;
+        nav_units() is the all-integer variant.
+        """
         equity = self.cash
         for key, book in self.positions.items():
-            mark = marks.get(key, book.avg_price)
-            equity += book.qty * mark
+            if book.qty_units:
+                mark = marks.get(key)
+                equity += book.qty * (book.avg_price if mark is None else mark)
+        return equity
+
+    def nav_units(self, marks: dict[tuple[str, Venue], int]) -> int:
+        """nav() in USD units, for callers that already hold marks in each
+        book's price units. Unmarked positions are valued at average entry."""
+        equity = self.cash_units
+        for key, book in self.positions.items():
+            if book.qty_units:
+                p = book.precision
+                mark = marks.get(key, book.avg_units)
+                equity += rescale(book.qty_units * mark, p.qty_dp + p.price_dp, USD_DP)
         return equity
@@ -0,0 +1,112 @@
+"""Fixed-point integer arithmetic for the broker and risk hot paths.
+
+Why this exists:
+  PaperBroker.submit()/nav() and the risk overlay's exposure rules ran every
+  operation in Decimal, including a `Decimal(str(float))` round-trip for
+  slippage and leverage on every fill and every rule evaluation. Those paths
+  run once per tick per position in backtests.
+
+Representation:
+  Every amount is a plain int counting fixed units:
+    USD amounts (cash, fees, PnL, notional)  10**-USD_DP   (pico-dollars)
+    dimensionless rates (leverage, fee rate,
+      slippage factor)                       10**-RATIO_DP (parts per trillion)
+    prices and quantities                    per-venue `Precision`
+  USD_DP is deliberately fine: a float64 equity curve mirrored from the
+  books (backtest/vectorized.py) must agree with nav() to ~1e-12 relative,
+  so the rounding of each fill has to sit far below that. Python ints do
+  not overflow, and products of two scaled values stay exact. Rounding
+  when digits are dropped is half-even, the same as Decimal's default
+  context.
+
+Scope, against what was asked for (int64 micro-units throughout, faster
+submit()/nav()/apply()/BacktestEngine.run()):
+  - Not int64 micro-units. A CPython int has no fixed width, so an int64
+    bound buys no speed outside NumPy, and at USD_DP = 6 the vectorized
+    mirror drifts ~1e-9 from nav() and the broker no longer tracks exact
+    Decimal accounting (tests/helios/test_fixed_point.py).
+  - risk.apply() is the one hot path that got faster: the exposure rules
+    read integer aggregates instead of re-summing Decimals.
+  - submit() and nav() take and return Decimal, so each call pays
+    conversions that cost about what the Decimal arithmetic did. nav() is
+    unchanged; submit() is slower (about 8 -> 10 us). The books are ints
+    anyway, because the ledger keeps exact O(1) totals over them.
+  - BacktestEngine.run() is unchanged: its per-bar arithmetic builds the
+    MarketSnapshot, which is Decimal at the API boundary.
+
+Decimal remains the type at the API boundary (Order, Fill, Position,
+PortfolioState) and in audit messages: convert with `to_fixed()` on the way
+in and `from_fixed()` on the way out.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from decimal import ROUND_HALF_EVEN, Decimal
+
+from helios.types import Venue
+
+USD_DP = 12
+RATIO_DP = 12
+USD_ONE = 10**USD_DP
+RATIO_ONE = 10**RATIO_DP
+
+_POW10 = [Decimal(10) ** k for k in range(25)]
+
+
+@dataclass(frozen=True, slots=True)
+class Precision:
+    price_dp: int
+    qty_dp: int
+    # qty units * price units → USD units: divide by this (qty_dp + price_dp >= USD_DP)
+    notional_div: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "notional_div", 10 ** (self.qty_dp + self.price_dp - USD_DP))
+
+
+DEFAULT_PRECISION = Precision(price_dp=12, qty_dp=9)
+VENUE_PRECISION: dict[Venue, Precision] = {
+    # Meme tokens trade at 1e-9 USD and below; token amounts rarely need more than 6 dp.
+    Venue.SOLANA_DEX: Precision(price_dp=18, qty_dp=6),
+}
+
+
+def precision_for(venue: Venue) -> Precision:
+    return VENUE_PRECISION.get(venue, DEFAULT_PRECISION)
+
+
+def to_fixed(value: Decimal | int | str, dp: int) -> int:
+    """Decimal → fixed units at `dp` decimal places (half-even)."""
+    d = value if isinstance(value, Decimal) else Decimal(value)
+    return int((d * _POW10[dp]).to_integral_value(ROUND_HALF_EVEN))
+
+
+def from_fixed(units: int, dp: int) -> Decimal:
+    """Fixed units → Decimal (exact)."""
+    return Decimal(units).scaleb(-dp)
+
+
+def ratio_units(value: float) -> int:
+    """Float rate (leverage, fee, slippage fraction) → parts per 10**RATIO_DP."""
+    return round(value * RATIO_ONE)
+
+
+def rescale(units: int, from_dp: int, to_dp: int) -> int:
+    """Change scale; dropped digits round half-even."""
+    if to_dp >= from_dp:
+        return units * 10 ** (to_dp - from_dp)
+    d = 10 ** (from_dp - to_dp)
+    q, r = divmod(units, d)  # div_round(), inlined: this is on every fill
+    twice = 2 * r
+    if twice > d or (twice == d and q & 1):
+        q += 1
+    return q
+
+
+def div_round(n: int, d: int) -> int:
+    """n / d rounded half-even (d > 0)."""
+    q, r = divmod(n, d)
+    twice = 2 * r
+    if twice > d or (twice == d and q & 1):
+        q += 1
+    return q
@@ -10,9 +10,10 @@ self-learning loop has nothing to learn from. With it, every closed trade
 adds to the bot's empirical experience and improves future decisions.
 """
 from helios.memory.vector_store import (
+    PatternFilter,
     PatternQuery,
     PatternRecord,
     VectorMemory,
 )
 
-__all__ = ["PatternQuery", "PatternRecord", "VectorMemory"]
+__all__ = ["PatternFilter", "PatternQuery", "PatternRecord", "VectorMemory"]
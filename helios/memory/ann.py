@@ -0,0 +1,149 @@
+"""Inverted-file (IVF) approximate nearest-neighbour index for VectorMemory.
+
+Why this exists:
+  Exact cosine search is one (n, d) @ (d,) product per query, linear in n.
+  That is fine at 100k records; at millions it dominates the entry decision.
+  No ANN library is a dependency, so this is the classic IVF-Flat in NumPy.
+
+Design:
+  - Coarse quantizer: `n_lists` unit-norm centroids from spherical k-means
+    over a sample of the (already normalized) vectors.
+  - Every row is assigned to its most similar centroid. Lists are growable
+    id arrays, so adding a row is amortized O(d * n_lists).
+  - search(): score the centroids, take the `nprobe` best lists, score the
+    rows in them exactly and return the top k. nprobe trades recall for
+    latency (scripts/bench_vector_memory.py measures both). If those lists
+    hold fewer than k rows (after the caller's filter mask), further lists
+    are probed, nearest first, until k rows turn up or none are left.
+  - The state is the centroids plus one list id per row. VectorMemory
+    persists both in its sidecar, so a reload rebuilds the lists with one
+    argsort instead of re-training.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+_CHUNK = 65_536  # rows per assignment matmul, bounds the (rows, n_lists) temp
+
+
+def default_n_lists(n: int) -> int:
+    return int(min(max(math.isqrt(max(n, 1)), 16), 4096))
+
+
+class IVFIndex:
+    """IVF-Flat over unit-norm float32 rows stored elsewhere (rows are ids)."""
+
+    def __init__(self, centroids: np.ndarray, nprobe: int | None = None) -> None:
+        self.centroids = np.ascontiguousarray(centroids, dtype=np.float32)
+        self.nprobe = nprobe or max(1, len(self.centroids) // 16)
+        n_lists = len(self.centroids)
+        self._ids: list[np.ndarray] = [np.empty(0, dtype=np.int64) for _ in range(n_lists)]
+        self._sizes = np.zeros(n_lists, dtype=np.int64)
+
+    @property
+    def n_lists(self) -> int:
+        return len(self.centroids)
+
+    def __len__(self) -> int:
+        return int(self._sizes.sum())
+
+    @classmethod
+    def train(
+        cls,
+        vectors: np.ndarray,
+        n_lists: int | None = None,
+        *,
+        sample_per_list: int = 64,
+        iters: int = 10,
+        seed: int = 0,
+    ) -> IVFIndex:
+        """Spherical k-means over a sample of `vectors` (unit-norm rows)."""
+        n = len(vectors)
+        n_lists = min(n_lists or default_n_lists(n), n)
+        rng = np.random.default_rng(seed)
+        sample_n = min(n, n_lists * sample_per_list)
+        sample = np.asarray(vectors[np.sort(rng.choice(n, sample_n, replace=False))], dtype=np.float32)
+        centroids = sample[rng.choice(sample_n, n_lists, replace=False)].copy()
+        for _ in range(iters):
+            assign = _nearest(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, sample)
+            counts = np.bincount(assign, minlength=n_lists)
+            empty = counts == 0
+            if empty.any():  # re-seed dead lists from random sample rows
+                sums[empty] = sample[rng.choice(sample_n, int(empty.sum()), replace=False)]
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            centroids = sums / np.maximum(norms, 1e-9)
+        return cls(centroids)
+
+    def assign(self, vectors: np.ndarray) -> np.ndarray:
+        """List id (int32) of each row."""
+        return _nearest(vectors, self.centroids).astype(np.int32)
+
+    def build(self, assignment: np.ndarray) -> None:
+        """Reset the lists from a full per-row assignment (row i → list assignment[i])."""
+        order = np.argsort(assignment, kind="stable")
+        counts = np.bincount(assignment, minlength=self.n_lists)
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        self._ids = [order[bounds[j]:bounds[j + 1]].astype(np.int64) for j in range(self.n_lists)]
+        self._sizes = counts.astype(np.int64)
+
+    def add(self, row: int, list_id: int) -> None:
+        ids, size = self._ids[list_id], self._sizes[list_id]
+        if size == len(ids):
+            grown = np.empty(max(8, 2 * len(ids)), dtype=np.int64)
+            grown[:size] = ids[:size]
+            ids = self._ids[list_id] = grown
+        ids[size] = row
+        self._sizes[list_id] = size + 1
+
+    def candidates(
+        self, query: np.ndarray, nprobe: int | None = None, *, k: int = 0, mask: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Row ids in the `nprobe` lists nearest to `query` (unit norm, shape (d,))
+        that pass `mask`, probing further lists until there are at least `k`."""
+        nprobe = min(nprobe or self.nprobe, self.n_lists)
+        scores = self.centroids @ query
+        probe = np.argpartition(-scores, nprobe - 1)[:nprobe]
+        parts = [self._list(j, mask) for j in probe]
+        found = sum(len(p) for p in parts)
+        if found < k and nprobe < self.n_lists:
+            rest = np.argsort(-scores)
+            rest = rest[~np.isin(rest, probe)]
+            taken = 0
+            while found < k and taken < len(rest):
+                step = max(nprobe, taken)  # double the lists probed each round
+                for j in rest[taken:taken + step]:
+                    parts.append(self._list(j, mask))
+                    found += len(parts[-1])
+                taken += step
+        return np.concatenate(parts)
+
+    def _list(self, j: int, mask: np.ndarray | None) -> np.ndarray:
+        ids = self._ids[j][:self._sizes[j]]
+        return ids if mask is None else ids[mask[ids]]
+
+    def search(
+        self, vectors: np.ndarray, query: np.ndarray, k: int, nprobe: int | None = None,
+        mask: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(row ids, similarities) of the approximate top k, best first.
+        `mask` (bool per row) drops rows before scoring."""
+        ids = self.candidates(query, nprobe, k=k, mask=mask)
+        if len(ids) == 0:
+            return ids, np.empty(0, dtype=np.float32)
+        sims = vectors[ids] @ query
+        k = min(k, len(ids))
+        top = np.argpartition(-sims, k - 1)[:k]
+        top = top[np.argsort(-sims[top], kind="stable")]
+        return ids[top], sims[top]
+
+
+def _nearest(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    out = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), _CHUNK):
+        block = np.asarray(vectors[start:start + _CHUNK], dtype=np.float32)
+        out[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return out
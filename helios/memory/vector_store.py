@@ -1,9 +1,41 @@
 """Vector memory — JSONL-backed numpy-based pattern search.
 
-Why not Qdrant/pgvector/Weaviate: at our scale (10k-100k observations), a
-flat numpy cosine search is ~10ms per query and zero infra. We can swap to
-a real vector DB once we have >1M observations or need sub-millisecond
-latency — neither applies yet.
+Why not Qdrant/pgvector/Weaviate: a flat numpy cosine search over
+pre-normalized float32 rows is ~1ms per 100k observations and zero infra.
+Past ~1M observations the optional IVF index (helios.memory.ann) keeps
+queries in the low milliseconds; see scripts/bench_vector_memory.py.
+
+Storage:
+    {name}.jsonl      append-only PatternRecord log — the source of truth
+    {name}.vecidx/    binary sidecar, derived from the log:
+        meta.json         dim, row count, how many log bytes it covers and
+                          how many rows the IVF index was trained on
+        vectors.f32       (n, d) unit-norm float32 rows
+        outcome_r.f64     outcome_r per row
+        offsets.i64       byte offset of each row's log line
+        strategy.i32      strategy code per row (names listed in meta.json)
+        timestamp.i64     timestamp_unix per row
+        ivf_centroids.f32 / ivf_lists.i32   IVF state, once built
+  Startup memory-maps the sidecar instead of parsing JSON. Log lines past
+  what meta.json covers (a crash between the two appends, or an older
+  writer) are parsed and appended; a missing or inconsistent sidecar is
+  rebuilt from the log. Column bytes past the rows meta.json counts (a crash
+  before its update) are ignored when mapping and trimmed before the next
+  append; only writes touch the files. Records are parsed from the log
+  lazily, only when a query returns them.
+
+In memory, rows live in amortized-growth buffers (capacity doubles), so
+add() never copies the whole matrix; the mmap is used as-is until the
+first add.
+
+Filters (PatternFilter) become boolean masks over those columns before the
+search, so "the nearest 200 A2 setups from the last 30 days" is a top 200
+of the matching rows rather than a post-filtered top k: exact without the
+IVF index; with it, lists are probed past `nprobe` until k matching rows
+turn up, and a filter that few rows pass is searched exactly instead.
+Metadata keys have no sidecar column: the first filter on a key parses the
+log once and dictionary-encodes the values (int32 code per row, like the
+strategy column), which add() then extends; filters compare codes.
 
 Schema:
     PatternRecord:
@@ -18,23 +50,31 @@ Schema:
 Lookup:
     query(target_vec, k=20) → (similarity, record) pairs sorted desc
     similar_outcomes(target_vec, k=200) → summary stats over the nearest k
+    query_batch(targets, k=200, where=...) → one PatternQuery per target,
+        from one matrix multiply per block of targets
 """
 from __future__ import annotations
 
+import contextlib
 import json
 import os
+from collections.abc import Collection, Mapping
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from statistics import mean, median
-from typing import Optional
+from typing import Any
 
 import numpy as np
 
+from helios.memory.ann import IVFIndex, default_n_lists
 from helios.ops import get_logger
 
 log = get_logger(__name__)
 
 DEFAULT_VECTORS_PATH = Path(os.getenv("HELIOS_LOGS_DIR", "logs")) / "pattern_memory.jsonl"
+SIDECAR_VERSION = 2
+ANN_MIN_RECORDS = 200_000  # below this, exact search is already fast enough
+ANN_RETRAIN_GROWTH = 4     # retrain the IVF once the memory is this many times its training size
+_BLOCK_CELLS = 1 << 24     # similarity cells per batch block (64 MiB of float32)
 
 
 @dataclass(frozen=True, slots=True)
@@ -59,102 +99,549 @@ class PatternQuery:
     examples: list[PatternRecord]
 
 
+@dataclass(frozen=True, slots=True)
+class PatternFilter:
+    """Pre-filter for query_batch()/query(). Unset fields match everything.
+
+    `strategy` is one name or a collection of names; `since` <= timestamp_unix
+    < `until`; `metadata` entries must compare equal (missing keys are None).
+    """
+    strategy: str | Collection[str] | None = None
+    since: int | None = None
+    until: int | None = None
+    metadata: Mapping[str, Any] = field(default_factory=dict)
+
+
+_EMPTY_QUERY = PatternQuery(0, 0.0, 0.0, 0.0, [])
+
+
+class _Rows:
+    """Column buffers with amortized growth. Starts as (read-only) mmap views."""
+
+    _COLUMNS = ("vectors", "outcome_r", "offsets", "strategy", "timestamp")
+
+    def __init__(
+        self, vectors: np.ndarray, outcome_r: np.ndarray, offsets: np.ndarray,
+        strategy: np.ndarray, timestamp: np.ndarray,
+    ) -> None:
+        self.n = len(vectors)
+        self.vectors = vectors
+        self.outcome_r = outcome_r
+        self.offsets = offsets
+        self.strategy = strategy
+        self.timestamp = timestamp
+        self.metadata: dict[str, _Codes] = {}  # encoded metadata columns, built on demand
+
+    @classmethod
+    def empty(cls, dim: int) -> _Rows:
+        return cls(
+            np.empty((0, dim), np.float32), np.empty(0, np.float64), np.empty(0, np.int64),
+            np.empty(0, np.int32), np.empty(0, np.int64),
+        )
+
+    def append(
+        self, vec: np.ndarray, outcome_r: float, offset: int, strategy: int, timestamp: int,
+        metadata: Mapping[str, Any],
+    ) -> None:
+        if self.n == len(self.vectors) or not self.vectors.flags.writeable:
+            cap = max(64, 2 * self.n)
+            for name in self._COLUMNS:
+                arr = getattr(self, name)
+                setattr(self, name, _grow(arr, self.n, (cap, *arr.shape[1:])))
+            for col in self.metadata.values():
+                col.codes = _grow(col.codes, self.n, (cap,))
+        self.vectors[self.n] = vec
+        self.outcome_r[self.n] = outcome_r
+        self.offsets[self.n] = offset
+        self.strategy[self.n] = strategy
+        self.timestamp[self.n] = timestamp
+        for key, col in self.metadata.items():
+            col.codes[self.n] = col.code(metadata.get(key))
+        self.n += 1
+
+
+class _Codes:
+    """Dictionary-encoded column: an int32 code per row, each distinct value once."""
+
+    def __init__(self, capacity: int) -> None:
+        self.codes = np.empty(capacity, dtype=np.int32)
+        self.values: list[Any] = []
+        self._lookup: dict[Any, int] = {}
+
+    def code(self, value: Any) -> int:
+        try:
+            found = self._lookup.get(value)
+        except TypeError:  # unhashable (list, dict): compare against the distinct values
+            found = next((c for c, v in enumerate(self.values) if _equal(v, value)), None)
+        if found is None:
+            found = len(self.values)
+            self.values.append(value)
+            with contextlib.suppress(TypeError):
+                self._lookup[value] = found
+        return found
+
+    def matching(self, value: Any) -> list[int]:
+        """Codes whose value compares equal to `value`."""
+        return [c for c, v in enumerate(self.values) if _equal(v, value)]
+
+
+def _equal(a: Any, b: Any) -> bool:
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError):  # e.g. ambiguous array truth values
+        return False
+
+
+def _grow(arr: np.ndarray, n: int, shape: tuple[int, ...]) -> np.ndarray:
+    out = np.empty(shape, dtype=arr.dtype)
+    out[:n] = arr[:n]
+    return out
+
+
+def _normalize(vec: np.ndarray) -> np.ndarray:
+    return vec / np.maximum(np.linalg.norm(vec, axis=-1, keepdims=True), 1e-9)
+
+
 class VectorMemory:
     """Append-only JSONL of pattern records + in-memory numpy index.
 
     Designed for the orchestrator to call `add()` after every closed trade
     and `query()` before every entry decision.
+
+    `ann=True` opts in to the (approximate) IVF index; the default is exact
+    search, and a memory past ANN_MIN_RECORDS rows logs once that the index
+    is available. Even with `ann=True` the index is only used past
+    ANN_MIN_RECORDS rows, and it is retrained once the memory grows
+    ANN_RETRAIN_GROWTH-fold past its training size, so its list count
+    keeps up with the data. `nprobe` overrides the index's
+    lists-probed-per-query default.
     """
 
-    def __init__(self, path: Path | str = DEFAULT_VECTORS_PATH) -> None:
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_VECTORS_PATH,
+        *,
+        ann: bool = False,
+        nprobe: int | None = None,
+    ) -> None:
         self.path = Path(path)
-        self._records: list[PatternRecord] = []
-        self._vectors: Optional[np.ndarray] = None  # (n, d)
+        self.sidecar = self.path.with_suffix(".vecidx")
+        self.ann = ann
+        self.nprobe = nprobe
+        self._rows: _Rows | None = None
+        self._dim: int | None = None
+        self._covered = 0  # log bytes reflected in the sidecar
+        self._strategies: list[str] = []  # strategy code → name
+        self._cache: dict[int, PatternRecord] = {}
+        self._ivf: IVFIndex | None = None
+        self._ivf_trained_n = 0  # rows the persisted IVF was trained on
+        self._trimmed = False  # sidecar tails checked against meta.json since load
+        self._ann_hinted = False
         self._load()
 
+    # ---- load / persist ----
+
     def _load(self) -> None:
         if not self.path.exists():
             return
-        with self.path.open("r", encoding="utf-8") as f:
+        if not self._open_sidecar():
+            self._rebuild_sidecar()
+        self._catch_up()
+        if self._rows is not None:
+            log.info("vector_memory_loaded", n=self._rows.n)
+
+    def _open_sidecar(self) -> bool:
+        try:
+            meta = json.loads((self.sidecar / "meta.json").read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return False
+        n, dim, covered = int(meta["n"]), int(meta["dim"]), int(meta["jsonl_bytes"])
+        if meta.get("version") != SIDECAR_VERSION or covered > self.path.stat().st_size:
+            return False
+        try:
+            vectors = self._map("vectors.f32", np.float32, n * dim).reshape(n, dim)
+            outcome_r = self._map("outcome_r.f64", np.float64, n)
+            offsets = self._map("offsets.i64", np.int64, n)
+            strategy = self._map("strategy.i32", np.int32, n)
+            timestamp = self._map("timestamp.i64", np.int64, n)
+        except ValueError:
+            return False
+        self._dim = dim if n else None
+        self._rows = _Rows(vectors, outcome_r, offsets, strategy, timestamp) if n else None
+        self._covered = covered
+        self._strategies = list(meta.get("strategies", []))
+        self._ivf_trained_n = int(meta.get("ivf_trained_n", 0))
+        return True
+
+    def _map(self, name: str, dtype: type, count: int) -> np.ndarray:
+        path = self.sidecar / name
+        itemsize = np.dtype(dtype).itemsize
+        size = path.stat().st_size if path.exists() else 0
+        if size < count * itemsize:
+            raise ValueError(f"{name}: sidecar shorter than meta.json claims")
+        # A longer file holds rows appended before a crash kept meta.json from
+        # counting them; they are not mapped, and _trim_sidecar() drops them
+        # before the next append.
+        if count == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", shape=(count,))
+
+    def _rebuild_sidecar(self) -> None:
+        self.sidecar.mkdir(parents=True, exist_ok=True)
+        for name in _SIDECAR_FILES:
+            (self.sidecar / name).unlink(missing_ok=True)
+        self._rows, self._dim, self._covered, self._strategies = None, None, 0, []
+        self._ivf, self._ivf_trained_n = None, 0
+        self._trimmed = True
+        self._write_meta()
+        log.info("vector_memory_sidecar_rebuild", path=str(self.path))
+
+    def _catch_up(self) -> None:
+        """Index log lines the sidecar does not cover yet."""
+        size = self.path.stat().st_size if self.path.exists() else 0
+        if size <= self._covered:
+            return
+        added = 0
+        with self.path.open("rb") as f:
+            f.seek(self._covered)
+            offset = self._covered
             for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    raw = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                self._records.append(PatternRecord(
-                    record_id=raw["record_id"],
-                    strategy=raw["strategy"],
-                    feature_vector=tuple(raw["feature_vector"]),
-                    feature_names=tuple(raw["feature_names"]),
-                    outcome_r=float(raw["outcome_r"]),
-                    outcome_label=raw["outcome_label"],
-                    timestamp_unix=int(raw["timestamp_unix"]),
-                    metadata=raw.get("metadata", {}),
-                ))
-        self._rebuild_index()
-        log.info("vector_memory_loaded", n=len(self._records))
-
-    def _rebuild_index(self) -> None:
-        if not self._records:
-            self._vectors = None
+                if not line.endswith(b"\n"):
+                    break  # torn last line; the next writer appends after it
+                raw = _parse(line)
+                if raw is not None:
+                    self._index(
+                        np.asarray(raw["feature_vector"], dtype=np.float32), float(raw["outcome_r"]), offset,
+                        raw["strategy"], int(raw["timestamp_unix"]), raw.get("metadata", {}),
+                    )
+                    added += 1
+                offset += len(line)
+        self._covered = offset
+        self._write_meta()
+        if added:
+            log.info("vector_memory_caught_up", added=added)
+
+    def _index(
+        self, vec: np.ndarray, outcome_r: float, offset: int, strategy: str, timestamp: int,
+        metadata: Mapping[str, Any],
+    ) -> None:
+        """Append one row to the buffers and the sidecar (meta.json not updated)."""
+        self._trim_sidecar()
+        if self._dim is None:
+            self._dim = len(vec)
+        elif len(vec) != self._dim:
+            raise ValueError(f"feature_vector has dim {len(vec)}, memory holds dim {self._dim}")
+        unit = _normalize(vec).astype(np.float32)
+        if strategy not in self._strategies:
+            self._strategies.append(strategy)
+        code = self._strategies.index(strategy)
+        if self._rows is None:
+            self._rows = _Rows.empty(self._dim)
+        self._rows.append(unit, outcome_r, offset, code, timestamp, metadata)
+        for name, value in (
+            ("vectors.f32", unit), ("outcome_r.f64", np.float64(outcome_r)), ("offsets.i64", np.int64(offset)),
+            ("strategy.i32", np.int32(code)), ("timestamp.i64", np.int64(timestamp)),
+        ):
+            with (self.sidecar / name).open("ab") as f:
+                f.write(value.tobytes())
+        if self._ivf is not None:
+            row = self._rows.n - 1
+            list_id = int(self._ivf.assign(unit[None, :])[0])
+            self._ivf.add(row, list_id)
+            lpath = self.sidecar / "ivf_lists.i32"
+            have = lpath.stat().st_size // 4 if lpath.exists() else 0
+            with lpath.open("ab") as f:
+                if have < row:  # rows a writer without the index loaded never assigned
+                    f.write(self._ivf.assign(self._rows.vectors[have:row]).tobytes())
+                f.write(np.int32(list_id).tobytes())
+
+    def _trim_sidecar(self) -> None:
+        """Cut column files back to the rows meta.json counts, once per load,
+        so appends land on the right row."""
+        if self._trimmed:
             return
-        self._vectors = np.array([r.feature_vector for r in self._records], dtype=np.float32)
+        n = self._rows.n if self._rows is not None else 0
+        widths = {"vectors.f32": 4 * (self._dim or 0), "outcome_r.f64": 8, "offsets.i64": 8,
+                  "strategy.i32": 4, "timestamp.i64": 8, "ivf_lists.i32": 4}
+        for name, width in widths.items():
+            path = self.sidecar / name
+            if path.exists() and path.stat().st_size > n * width:
+                os.truncate(path, n * width)
+                log.info("vector_memory_sidecar_trimmed", file=name, rows=n)
+        self._trimmed = True
+
+    def _write_meta(self) -> None:
+        self.sidecar.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "version": SIDECAR_VERSION,
+            "dim": self._dim or 0,
+            "n": self._rows.n if self._rows is not None else 0,
+            "jsonl_bytes": self._covered,
+            "strategies": self._strategies,
+            "ivf_trained_n": self._ivf_trained_n,
+        }
+        tmp = self.sidecar / "meta.json.partial"
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp, self.sidecar / "meta.json")
+
+    # ---- records ----
 
     def add(self, record: PatternRecord) -> None:
         # Append to JSONL
         parent = self.path.parent
         target = parent.resolve() if parent.is_symlink() else parent
-        try:
+        with contextlib.suppress(FileExistsError):
             target.mkdir(parents=True, exist_ok=True)
-        except FileExistsError:
-            pass
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(asdict(record), default=str) + "\n")
-        self._records.append(record)
-        # Cheap incremental: append to in-memory array
-        vec = np.array(record.feature_vector, dtype=np.float32).reshape(1, -1)
-        self._vectors = vec if self._vectors is None else np.vstack([self._vectors, vec])
-
-    def query(self, target_vec: np.ndarray | list[float], k: int = 20) -> list[tuple[float, PatternRecord]]:
-        """Return the k nearest records by cosine similarity, sorted desc."""
-        if self._vectors is None or len(self._records) == 0:
-            return []
-        target = np.array(target_vec, dtype=np.float32).reshape(1, -1)
-        if target.shape[1] != self._vectors.shape[1]:
-            log.warning("vector_dim_mismatch", got=target.shape[1], expected=self._vectors.shape[1])
+        if not self.sidecar.exists():
+            self._rebuild_sidecar()
+        self._catch_up()  # another writer may have appended since we loaded
+        vec = np.asarray(record.feature_vector, dtype=np.float32)
+        if self._dim is not None and len(vec) != self._dim:
+            raise ValueError(f"feature_vector has dim {len(vec)}, memory holds dim {self._dim}")
+        line = (json.dumps(asdict(record), default=str) + "\n").encode("utf-8")
+        with self.path.open("ab") as f:
+            offset = f.tell()
+            f.write(line)
+        self._index(vec, record.outcome_r, offset, record.strategy, record.timestamp_unix, record.metadata)
+        self._covered = offset + len(line)
+        self._write_meta()
+        self._cache[self._rows.n - 1] = record
+
+    def record(self, row: int) -> PatternRecord:
+        """The PatternRecord at `row`, parsed from the log on first access."""
+        rec = self._cache.get(row)
+        if rec is None:
+            with self.path.open("rb") as f:
+                f.seek(int(self._rows.offsets[row]))
+                raw = _parse(f.readline())
+            rec = self._cache[row] = _to_record(raw)
+        return rec
+
+    # ---- search ----
+
+    def _ann_index(self) -> IVFIndex | None:
+        n = self._rows.n if self._rows is not None else 0
+        if not self.ann:
+            if n >= ANN_MIN_RECORDS and not self._ann_hinted:
+                log.info("vector_memory_ann_available", n=n, hint="VectorMemory(ann=True)")
+                self._ann_hinted = True
+            return None
+        if n < ANN_MIN_RECORDS:
+            return None
+        if self._ivf is None:
+            self._ivf = self._load_ivf()
+        if (
+            self._ivf is None
+            or n >= ANN_RETRAIN_GROWTH * self._ivf_trained_n
+            or self._ivf.n_lists < default_n_lists(n) // 2
+        ):
+            self._ivf = self._train_ivf()
+        return self._ivf
+
+    def _load_ivf(self) -> IVFIndex | None:
+        cpath, lpath = self.sidecar / "ivf_centroids.f32", self.sidecar / "ivf_lists.i32"
+        if not cpath.exists() or not lpath.exists():
+            return None
+        centroids = np.fromfile(cpath, dtype=np.float32)
+        if len(centroids) == 0 or len(centroids) % self._dim:
+            return None
+        ivf = IVFIndex(centroids.reshape(-1, self._dim), nprobe=self.nprobe)
+        n = self._rows.n
+        assignment = np.fromfile(lpath, dtype=np.int32)[:n]
+        if len(assignment) < n:  # rows added by a writer that had no index loaded
+            # Assigned in memory only; the next add() persists them.
+            tail = ivf.assign(self._rows.vectors[len(assignment):n])
+            assignment = np.concatenate([assignment, tail])
+        ivf.build(assignment)
+        return ivf
+
+    def _train_ivf(self) -> IVFIndex:
+        vectors = self._rows.vectors[:self._rows.n]
+        ivf = IVFIndex.train(vectors)
+        ivf.nprobe = self.nprobe or ivf.nprobe
+        assignment = ivf.assign(vectors)
+        ivf.build(assignment)
+        (self.sidecar / "ivf_centroids.f32").write_bytes(ivf.centroids.tobytes())
+        (self.sidecar / "ivf_lists.i32").write_bytes(assignment.tobytes())
+        self._ivf_trained_n = len(vectors)
+        self._write_meta()
+        log.info("vector_memory_ivf_trained", n=len(vectors), n_lists=ivf.n_lists)
+        return ivf
+
+    def query(
+        self, target_vec: np.ndarray | list[float], k: int = 20, *,
+        where: PatternFilter | None = None, exact: bool = False,
+    ) -> list[tuple[float, PatternRecord]]:
+        """Return the k nearest records by cosine similarity, sorted desc.
+        `exact=True` bypasses the ANN index."""
+        found = self._search(np.asarray(target_vec, dtype=np.float32).reshape(1, -1), k, where, exact)
+        if found is None:
             return []
-        # Cosine similarity
-        a_norm = self._vectors / np.maximum(np.linalg.norm(self._vectors, axis=1, keepdims=True), 1e-9)
-        t_norm = target / np.maximum(np.linalg.norm(target, axis=1, keepdims=True), 1e-9)
-        sims = (a_norm @ t_norm.T).flatten()
-        # Top-k
-        k = min(k, len(sims))
-        idx = np.argpartition(-sims, k - 1)[:k]
-        idx_sorted = idx[np.argsort(-sims[idx])]
-        return [(float(sims[i]), self._records[i]) for i in idx_sorted]
-
-    def similar_outcomes(self, target_vec: np.ndarray | list[float], k: int = 200) -> PatternQuery:
+        rows, sims = found
+        return [(float(sim), self.record(int(row))) for row, sim in zip(rows[0], sims[0], strict=True) if row >= 0]
+
+    def similar_outcomes(
+        self, target_vec: np.ndarray | list[float], k: int = 200, *, where: PatternFilter | None = None,
+    ) -> PatternQuery:
         """Aggregate stats over the k nearest historical records.
 
         Use this RIGHT before making an entry decision: "I'm about to take a
         setup that looks like X — what happened the last 200 times this shape
         appeared?"
         """
-        neighbors = self.query(target_vec, k)
-        if not neighbors:
-            return PatternQuery(0, 0.0, 0.0, 0.0, [])
-        outcomes = [n[1].outcome_r for n in neighbors]
-        wins = sum(1 for r in outcomes if r > 0)
-        return PatternQuery(
-            n_neighbors=len(outcomes),
-            mean_outcome_r=mean(outcomes),
-            median_outcome_r=median(outcomes),
-            win_rate=wins / len(outcomes),
-            examples=[n[1] for n in neighbors[:5]],
-        )
+        return self.query_batch(np.asarray(target_vec, dtype=np.float32).reshape(1, -1), k, where=where)[0]
+
+    def query_batch(
+        self, targets: np.ndarray | list[list[float]], k: int = 200, *,
+        where: PatternFilter | None = None, exact: bool = False,
+    ) -> list[PatternQuery]:
+        """similar_outcomes() for every row of `targets` (m, d) in one pass."""
+        targets = np.asarray(targets, dtype=np.float32)
+        if targets.ndim != 2:
+            raise ValueError(f"targets must be 2-D (m, d), got shape {targets.shape}")
+        found = self._search(targets, k, where, exact)
+        if found is None:
+            return [_EMPTY_QUERY] * len(targets)
+        rows, _ = found
+        valid = rows >= 0
+        counts = valid.sum(axis=1)
+        # Outcomes come from the sidecar column; only the examples are parsed.
+        outcomes = np.where(valid, self._rows.outcome_r[np.where(valid, rows, 0)], np.nan)
+        # Every row is padded at the tail only, so sorting leaves NaNs last and
+        # the median is the middle of the first `count` values.
+        ordered = np.sort(outcomes, axis=1)
+        safe = np.maximum(counts, 1)
+        lo = np.take_along_axis(ordered, ((safe - 1) // 2)[:, None], axis=1)[:, 0]
+        hi = np.take_along_axis(ordered, (safe // 2)[:, None], axis=1)[:, 0]
+        means = np.where(valid, outcomes, 0.0).sum(axis=1) / safe
+        medians = (lo + hi) / 2
+        win_rates = (outcomes > 0).sum(axis=1) / safe
+        out = []
+        for i, n in enumerate(counts.tolist()):
+            if n == 0:
+                out.append(_EMPTY_QUERY)
+                continue
+            out.append(PatternQuery(
+                n_neighbors=n,
+                mean_outcome_r=float(means[i]),
+                median_outcome_r=float(medians[i]),
+                win_rate=float(win_rates[i]),
+                examples=[self.record(int(r)) for r in rows[i, :min(n, 5)]],
+            ))
+        return out
+
+    def _search(
+        self, targets: np.ndarray, k: int, where: PatternFilter | None, exact: bool,
+    ) -> tuple[np.ndarray, np.ndarray] | None:
+        """(rows, sims), each (m, k) best first; short results pad rows with -1.
+        None when nothing can match (empty memory or wrong dimension)."""
+        if self._rows is None or self._rows.n == 0 or k <= 0:
+            return None
+        if targets.shape[1] != self._dim:
+            log.warning("vector_dim_mismatch", got=targets.shape[1], expected=self._dim)
+            return None
+        t_norm = _normalize(targets).astype(np.float32)
+        vectors = self._rows.vectors[:self._rows.n]
+        mask = self._mask(where) if where is not None else None
+        rows = np.full((len(targets), k), -1, dtype=np.int64)
+        sims = np.full((len(targets), k), -np.inf, dtype=np.float32)
+        ivf = None if exact else self._ann_index()
+        if ivf is not None and mask is not None:
+            # When few rows pass the filter, scoring all of them costs less
+            # than probing the lists, and is exact.
+            probed = len(vectors) * min(ivf.nprobe, ivf.n_lists) / ivf.n_lists
+            if np.count_nonzero(mask) <= max(k, probed):
+                ivf = None
+        if ivf is not None:
+            for i, q in enumerate(t_norm):
+                ids, s = ivf.search(vectors, q, k, mask=mask)
+                rows[i, :len(ids)], sims[i, :len(ids)] = ids, s
+            return rows, sims
+        subset = np.flatnonzero(mask) if mask is not None else None
+        pool = vectors[subset] if subset is not None else vectors
+        kk = min(k, len(pool))
+        if kk == 0:
+            return rows, sims
+        block = max(1, _BLOCK_CELLS // len(pool))
+        for start in range(0, len(t_norm), block):
+            scores = t_norm[start:start + block] @ pool.T
+            cut = len(pool) - kk
+            idx = np.argpartition(scores, cut, axis=1)[:, cut:]  # no negated copy
+            top = np.take_along_axis(scores, idx, axis=1)
+            order = np.argsort(-top, axis=1, kind="stable")
+            idx = np.take_along_axis(idx, order, axis=1)
+            stop = start + len(scores)
+            rows[start:stop, :kk] = subset[idx] if subset is not None else idx
+            sims[start:stop, :kk] = np.take_along_axis(top, order, axis=1)
+        return rows, sims
+
+    def _mask(self, where: PatternFilter) -> np.ndarray:
+        n = self._rows.n
+        mask = np.ones(n, dtype=bool)
+        if where.strategy is not None:
+            names = {where.strategy} if isinstance(where.strategy, str) else set(where.strategy)
+            codes = [c for c, name in enumerate(self._strategies) if name in names]
+            mask &= np.isin(self._rows.strategy[:n], codes)
+        if where.since is not None:
+            mask &= self._rows.timestamp[:n] >= where.since
+        if where.until is not None:
+            mask &= self._rows.timestamp[:n] < where.until
+        for key, value in where.metadata.items():
+            column = self._metadata_column(key)
+            codes = column.matching(value)
+            if len(codes) == 1:
+                mask &= column.codes[:n] == codes[0]
+            else:
+                mask &= np.isin(column.codes[:n], codes)
+        return mask
+
+    def _metadata_column(self, key: str) -> _Codes:
+        """Encoded column of metadata[key] per row; parses the log on first use."""
+        column = self._rows.metadata.get(key)
+        if column is None:
+            n = self._rows.n
+            column = _Codes(len(self._rows.vectors))
+            with self.path.open("rb") as f:
+                for row in range(n):
+                    rec = self._cache.get(row)
+                    if rec is None:
+                        f.seek(int(self._rows.offsets[row]))
+                        value = (_parse(f.readline()) or {}).get("metadata", {}).get(key)
+                    else:
+                        value = rec.metadata.get(key)
+                    column.codes[row] = column.code(value)
+            self._rows.metadata[key] = column
+            log.info("vector_memory_metadata_column", key=key, n=n, distinct=len(column.values))
+        return column
 
     def __len__(self) -> int:
-        return len(self._records)
+        return self._rows.n if self._rows is not None else 0
+
+
+_SIDECAR_FILES = (
+    "vectors.f32", "outcome_r.f64", "offsets.i64", "strategy.i32", "timestamp.i64",
+    "ivf_centroids.f32", "ivf_lists.i32",
+)
+
+
+def _parse(line: bytes) -> dict[str, Any] | None:
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError:
+        return None
+
+
+def _to_record(raw: dict[str, Any]) -> PatternRecord:
+    return PatternRecord(
+        record_id=raw["record_id"],
+        strategy=raw["strategy"],
+        feature_vector=tuple(raw["feature_vector"]),
+        feature_names=tuple(raw["feature_names"]),
+        outcome_r=float(raw["outcome_r"]),
+        outcome_label=raw["outcome_label"],
+        timestamp_unix=int(raw["timestamp_unix"]),
+        metadata=raw.get("metadata", {}),
+    )
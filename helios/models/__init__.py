@@ -5,6 +5,6 @@ Conformal calibration is the prime contribution of this package: every model's
 point prediction is paired with a calibrated lower bound on expected return,
 and that lower bound is what the sizer (helios.sizing.kelly) actually reads.
 """
-from helios.models.conformal import SplitConformal
+from helios.models.conformal import OnlineConformal, SplitConformal
 
-__all__ = ["SplitConformal"]
+__all__ = ["OnlineConformal", "SplitConformal"]
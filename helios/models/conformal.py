@@ -16,13 +16,42 @@ This is what powers the "the bot refuses to trade when it doesn't know"
 property: position size is computed off `lower(yhat, alpha)`, so a wide
 interval shrinks size automatically — and a negative lower bound zeros it
 out entirely (see helios.sizing.kelly).
+
+Two calibrators share that contract:
+
+  SplitConformal   fixed calibration set. Residuals are sorted once at
+                   construction; quantiles are cached per alpha.
+  OnlineConformal  streaming. Residuals arrive one at a time via update() and
+                   live in a bounded sliding window kept sorted (bisect: O(log n)
+                   search, one memmove), so a quantile is an index lookup, cached
+                   per alpha until the window changes. Optionally adapts its
+                   working alpha online (adaptive conformal inference, Gibbs &
+                   Candès 2021) so coverage holds under drift. save()/load()
+                   persist the window and alpha across restarts.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+import bisect
+import json
+import math
+import os
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
 
 import numpy as np
 
+STATE_VERSION = 1
+
+
+def _rank(n: int, alpha: float) -> int:
+    """1-based order statistic for the (1 - alpha) conformal quantile of n
+    residuals: `ceil((n+1)*(1-alpha))`, clamped to n."""
+    if not 0.0 < alpha < 1.0:
+        raise ValueError("alpha must be in (0, 1)")
+    return min(math.ceil((n + 1) * (1.0 - alpha)), n)
+
 
 @dataclass
 class SplitConformal:
@@ -32,7 +61,12 @@ class SplitConformal:
     one-sided lower/upper bounds at the desired alpha.
     """
 
-    residuals: np.ndarray  # |y - yhat| on the calibration set
+    residuals: np.ndarray  # |y - yhat| on the calibration set; read-only after construction
+    _sorted: np.ndarray = field(init=False, repr=False, compare=False)
+    _cache: dict[float, float] = field(init=False, repr=False, compare=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._sorted = np.sort(np.asarray(self.residuals, dtype=float))
 
     @classmethod
     def fit(cls, y_pred: np.ndarray, y_true: np.ndarray) -> SplitConformal:
@@ -46,13 +80,10 @@ class SplitConformal:
     def quantile(self, alpha: float) -> float:
         """Return the (1 - alpha) quantile of absolute residuals, with the
         finite-sample correction `ceil((n+1)*(1-alpha)) / n`."""
-        if not 0.0 < alpha < 1.0:
-            raise ValueError("alpha must be in (0, 1)")
-        n = len(self.residuals)
-        k = int(np.ceil((n + 1) * (1.0 - alpha)))
-        k = min(k, n)
-        q = np.sort(self.residuals)[k - 1]
-        return float(q)
+        q = self._cache.get(alpha)
+        if q is None:
+            q = self._cache[alpha] = float(self._sorted[_rank(len(self._sorted), alpha) - 1])
+        return q
 
     def lower(self, y_pred: float, alpha: float = 0.1) -> float:
         return float(y_pred - self.quantile(alpha))
@@ -63,3 +94,156 @@ class SplitConformal:
     def interval(self, y_pred: float, alpha: float = 0.1) -> tuple[float, float]:
         q = self.quantile(alpha)
         return (float(y_pred - q), float(y_pred + q))
+
+
+class OnlineConformal:
+    """Streaming split-conformal calibrator over a sliding residual window.
+
+    `alpha` is the target miscoverage. With `gamma > 0` the calibrator tracks
+    a working level `alpha_t`, nudged after every update by
+    `gamma * (alpha - miss)`: a miss (|y - yhat| beyond the current bound)
+    widens later intervals, a hit narrows them. lower/upper/interval default
+    to `alpha_t`; pass an explicit alpha to read a fixed level. When
+    `alpha_t` falls to 0 or below the bound is infinite (lower = -inf, so the
+    sizer stands aside) until enough hits bring it back.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.1,
+        window: int | None = 10_000,
+        gamma: float = 0.005,
+        min_samples: int = 30,
+    ) -> None:
+        if not 0.0 < alpha < 1.0:
+            raise ValueError("alpha must be in (0, 1)")
+        if window is not None and window < min_samples:
+            raise ValueError(f"window ({window}) must be >= min_samples ({min_samples})")
+        self.alpha = alpha
+        self.window = window
+        self.gamma = gamma
+        self.min_samples = min_samples
+        self.alpha_t = alpha
+        self.n_seen = 0      # update() calls scored against a bound
+        self.n_miss = 0
+        self._order: deque[float] = deque()  # arrival order, for eviction
+        self._sorted: list[float] = []
+        self._cache: dict[float, float] = {}
+
+    @classmethod
+    def from_split(cls, cal: SplitConformal, **kwargs) -> OnlineConformal:
+        """Seed a streaming calibrator with a fitted SplitConformal's residuals."""
+        online = cls(**kwargs)
+        online.extend(cal.residuals)
+        return online
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    @property
+    def ready(self) -> bool:
+        return len(self._sorted) >= self.min_samples
+
+    @property
+    def miss_rate(self) -> float:
+        return self.n_miss / self.n_seen if self.n_seen else 0.0
+
+    # ---- updates ----
+
+    def update(self, y_pred: float, y_true: float) -> bool:
+        """Score one realized outcome against the current bound, adapt
+        `alpha_t`, then add its residual. Returns True if it was covered
+        (always True until the calibrator is ready)."""
+        r = abs(float(y_true) - float(y_pred))
+        covered = True
+        if self.ready:
+            covered = r <= self.quantile()
+            self.n_seen += 1
+            self.n_miss += not covered
+            self.alpha_t += self.gamma * (self.alpha - (not covered))
+        self._push(r)
+        return covered
+
+    def extend(self, residuals: Iterable[float]) -> None:
+        """Add absolute residuals without scoring them (seeding, replay)."""
+        for r in residuals:
+            self._push(abs(float(r)))
+
+    def _push(self, r: float) -> None:
+        bisect.insort(self._sorted, r)
+        self._order.append(r)
+        if self.window is not None and len(self._order) > self.window:
+            old = self._order.popleft()
+            del self._sorted[bisect.bisect_left(self._sorted, old)]
+        self._cache.clear()
+
+    # ---- bounds ----
+
+    def quantile(self, alpha: float | None = None) -> float:
+        """(1 - alpha) conformal quantile of the window's residuals; `alpha`
+        defaults to the adaptive `alpha_t`."""
+        if not self.ready:
+            raise ValueError(f"Need >= {self.min_samples} residuals; have {len(self._sorted)}")
+        if alpha is None:
+            alpha = self.alpha_t
+            if alpha <= 0.0:
+                return math.inf
+            if alpha >= 1.0:
+                return 0.0
+        q = self._cache.get(alpha)
+        if q is None:
+            q = self._cache[alpha] = self._sorted[_rank(len(self._sorted), alpha) - 1]
+        return q
+
+    def lower(self, y_pred: float, alpha: float | None = None) -> float:
+        return float(y_pred - self.quantile(alpha))
+
+    def upper(self, y_pred: float, alpha: float | None = None) -> float:
+        return float(y_pred + self.quantile(alpha))
+
+    def interval(self, y_pred: float, alpha: float | None = None) -> tuple[float, float]:
+        q = self.quantile(alpha)
+        return (float(y_pred - q), float(y_pred + q))
+
+    # ---- persistence ----
+
+    def state_dict(self) -> dict:
+        return {
+            "version": STATE_VERSION,
+            "alpha": self.alpha,
+            "window": self.window,
+            "gamma": self.gamma,
+            "min_samples": self.min_samples,
+            "alpha_t": self.alpha_t,
+            "n_seen": self.n_seen,
+            "n_miss": self.n_miss,
+            "residuals": list(self._order),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> OnlineConformal:
+        if state.get("version") != STATE_VERSION:
+            raise ValueError(f"Unsupported calibrator state version: {state.get('version')!r}")
+        online = cls(alpha=state["alpha"], window=state["window"], gamma=state["gamma"],
+                     min_samples=state["min_samples"])
+        residuals = state["residuals"]
+        if online.window is not None:
+            residuals = residuals[-online.window:]
+        online._order.extend(residuals)
+        online._sorted = sorted(residuals)
+        online.alpha_t = state["alpha_t"]
+        online.n_seen = state["n_seen"]
+        online.n_miss = state["n_miss"]
+        return online
+
+    def save(self, path: Path) -> None:
+        """Write the calibrator state atomically (JSON, via a .partial file)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".partial")
+        tmp.write_text(json.dumps(self.state_dict()), encoding="utf-8")
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> OnlineConformal:
+        return cls.from_state(json.loads(Path(path).read_text(encoding="utf-8")))
@@ -16,14 +16,35 @@ Usage:
     status = monitor.check(current_window=last_24h_features)
     if status.is_drifted:
         bench_strategy()
+
+Streaming mode (StreamingDriftMonitor) keeps no raw samples. Each feature
+gets a HistogramSketch whose bin edges sit at `n_bins` reference quantiles.
+The reference and the live window are both counted into those bins, so:
+  - an observation is one bisect + increment (O(1) for a fixed bin count);
+  - KS is the largest reference/live CDF gap over the bin edges. That
+    under-states the exact statistic by at most one bin's mass (1/n_bins of
+    the reference, where the live data isn't piled into a single bin);
+  - PSI regroups the fine bins into `n_buckets` reference-quantile buckets,
+    the same buckets the batch path builds;
+  - sketches with the same edges merge by adding counts, and round-trip
+    through to_dict()/from_dict(), so shard-level sketches can be combined
+    offline.
+update(frame) counts a whole Polars frame of features in one pass: one
+searchsorted per column, one bincount for all of them. check() scores every
+feature in one vectorized pass over the stacked counts.
 """
 from __future__ import annotations
 
+import bisect
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 import numpy as np
+import polars as pl
 from scipy import stats
 
+MIN_SAMPLES = 30
+
 
 @dataclass(frozen=True, slots=True)
 class DriftStatus:
@@ -57,7 +78,7 @@ class DriftMonitor:
         current = np.asarray(current, dtype=float)
         baseline = baseline[~np.isnan(baseline)]
         current = current[~np.isnan(current)]
-        if len(baseline) < 30 or len(current) < 30:
+        if len(baseline) < MIN_SAMPLES or len(current) < MIN_SAMPLES:
             return DriftStatus(
                 feature_name=name, ks_statistic=0.0, psi_score=0.0,
                 is_drifted=False, reason="insufficient_samples",
@@ -82,20 +103,7 @@ class DriftMonitor:
         except Exception:  # noqa: BLE001
             psi = 0.0
 
-        drifted = ks_stat > self.ks_threshold or psi > self.psi_threshold
-        reason = ""
-        if drifted:
-            parts = []
-            if ks_stat > self.ks_threshold:
-                parts.append(f"ks={ks_stat:.2f}")
-            if psi > self.psi_threshold:
-                parts.append(f"psi={psi:.2f}")
-            reason = " ".join(parts)
-
-        return DriftStatus(
-            feature_name=name, ks_statistic=float(ks_stat),
-            psi_score=float(psi), is_drifted=drifted, reason=reason,
-        )
+        return _status(name, float(ks_stat), psi, self.ks_threshold, self.psi_threshold)
 
     def check_many(
         self, baseline_by_feature: dict[str, np.ndarray], current_by_feature: dict[str, np.ndarray]
@@ -105,9 +113,231 @@ class DriftMonitor:
             if name not in current_by_feature:
                 continue
             statuses.append(self.check_feature(name, baseline, current_by_feature[name]))
-        n_drifted = sum(1 for s in statuses if s.is_drifted)
-        return DriftReport(
-            overall_drifted=n_drifted > 0,
-            feature_statuses=tuple(statuses),
-            n_features_drifted=n_drifted,
+        return _report(statuses)
+
+
+def _status(name: str, ks_stat: float, psi: float, ks_threshold: float, psi_threshold: float) -> DriftStatus:
+    drifted = ks_stat > ks_threshold or psi > psi_threshold
+    reason = ""
+    if drifted:
+        parts = []
+        if ks_stat > ks_threshold:
+            parts.append(f"ks={ks_stat:.2f}")
+        if psi > psi_threshold:
+            parts.append(f"psi={psi:.2f}")
+        reason = " ".join(parts)
+    return DriftStatus(
+        feature_name=name, ks_statistic=float(ks_stat),
+        psi_score=float(psi), is_drifted=drifted, reason=reason,
+    )
+
+
+def _report(statuses: list[DriftStatus]) -> DriftReport:
+    n_drifted = sum(1 for s in statuses if s.is_drifted)
+    return DriftReport(
+        overall_drifted=n_drifted > 0,
+        feature_statuses=tuple(statuses),
+        n_features_drifted=n_drifted,
+    )
+
+
+# ----- Streaming -----
+
+
+@dataclass(slots=True)
+class HistogramSketch:
+    """Counts over fixed bins: (-inf, e0), [e0, e1), ..., [e_last, inf).
+
+    NaNs are counted apart and ignored by KS/PSI, as the batch path drops them.
+    """
+
+    edges: np.ndarray   # strictly increasing interior edges
+    counts: np.ndarray | None = None  # int64, len(edges) + 1; zeros if omitted
+    n_nan: int = 0
+
+    def __post_init__(self) -> None:
+        self.edges = np.asarray(self.edges, dtype=float)
+        if self.counts is None:
+            self.counts = np.zeros(len(self.edges) + 1, dtype=np.int64)
+        else:
+            self.counts = np.asarray(self.counts, dtype=np.int64)
+        if len(self.counts) != len(self.edges) + 1:
+            raise ValueError(f"{len(self.edges)} edges need {len(self.edges) + 1} counts, got {len(self.counts)}")
+
+    @classmethod
+    def from_reference(cls, values: np.ndarray, n_bins: int = 200) -> HistogramSketch:
+        """Edges at `n_bins` quantiles of `values` (ties collapse), counting `values` in."""
+        values = np.asarray(values, dtype=float)
+        finite = values[~np.isnan(values)]
+        if len(finite) == 0:
+            edges = np.empty(0)
+        else:
+            edges = np.unique(np.quantile(finite, np.linspace(0, 1, n_bins + 1)[1:-1]))
+        sketch = cls(edges=edges)
+        sketch.update_many(values)
+        return sketch
+
+    @property
+    def n(self) -> int:
+        return int(self.counts.sum())
+
+    def update(self, x: float) -> None:
+        if x != x:  # NaN
+            self.n_nan += 1
+        else:
+            self.counts[bisect.bisect_right(self.edges, x)] += 1
+
+    def update_many(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=float)
+        nan = np.isnan(values)
+        self.n_nan += int(nan.sum())
+        idx = np.searchsorted(self.edges, values[~nan], side="right")
+        self.counts += np.bincount(idx, minlength=len(self.counts))
+
+    def empty_like(self) -> HistogramSketch:
+        return HistogramSketch(edges=self.edges)
+
+    def merge(self, other: HistogramSketch) -> HistogramSketch:
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Cannot merge sketches with different bin edges")
+        return HistogramSketch(edges=self.edges, counts=self.counts + other.counts,
+                               n_nan=self.n_nan + other.n_nan)
+
+    def to_dict(self) -> dict:
+        return {"edges": self.edges.tolist(), "counts": self.counts.tolist(), "n_nan": self.n_nan}
+
+    @classmethod
+    def from_dict(cls, d: Mapping) -> HistogramSketch:
+        return cls(edges=d["edges"], counts=d["counts"], n_nan=d.get("n_nan", 0))
+
+
+class StreamingDriftMonitor:
+    """DriftMonitor over sketches: fixed memory per feature, incremental updates.
+
+    Build it from reference samples (a Polars frame or name -> array), feed
+    live observations with update()/observe(), and call check() whenever.
+    reset() starts a fresh live window against the same reference.
+    """
+
+    def __init__(
+        self,
+        reference: Mapping[str, HistogramSketch],
+        ks_threshold: float = 0.2,
+        psi_threshold: float = 0.25,
+        n_buckets: int = 10,
+    ) -> None:
+        self.ks_threshold = ks_threshold
+        self.psi_threshold = psi_threshold
+        self.n_buckets = n_buckets
+        self.reference = dict(reference)
+        self.current = {name: sk.empty_like() for name, sk in self.reference.items()}
+
+    @classmethod
+    def from_reference(
+        cls,
+        reference: pl.DataFrame | Mapping[str, np.ndarray],
+        n_bins: int = 200,
+        **kwargs,
+    ) -> StreamingDriftMonitor:
+        if isinstance(reference, pl.DataFrame):
+            reference = {name: reference.get_column(name).cast(pl.Float64).to_numpy() for name in reference.columns}
+        return cls({name: HistogramSketch.from_reference(v, n_bins) for name, v in reference.items()}, **kwargs)
+
+    @property
+    def features(self) -> list[str]:
+        return list(self.reference)
+
+    # ---- updates ----
+
+    def observe(self, name: str, value: float) -> None:
+        self.current[name].update(value)
+
+    def update(self, frame: pl.DataFrame) -> None:
+        """Count every monitored feature present in `frame` (nulls count as NaN)."""
+        names = [n for n in self.reference if n in frame.columns]
+        if not names or frame.height == 0:
+            return
+        values = frame.select(pl.col(names).cast(pl.Float64)).to_numpy()
+        sizes = np.array([len(self.current[n].counts) for n in names])
+        offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        flat: list[np.ndarray] = []
+        for j, name in enumerate(names):
+            col = values[:, j]
+            nan = np.isnan(col)
+            self.current[name].n_nan += int(nan.sum())
+            flat.append(np.searchsorted(self.current[name].edges, col[~nan], side="right") + offsets[j])
+        counts = np.bincount(np.concatenate(flat), minlength=int(sizes.sum()))
+        for j, name in enumerate(names):
+            self.current[name].counts += counts[offsets[j]:offsets[j] + sizes[j]]
+
+    def merge(self, other: StreamingDriftMonitor) -> None:
+        """Fold another monitor's live sketches (same reference) into this one."""
+        for name, sk in other.current.items():
+            self.current[name] = self.current[name].merge(sk)
+
+    def reset(self) -> None:
+        self.current = {name: sk.empty_like() for name, sk in self.reference.items()}
+
+    # ---- scoring ----
+
+    def check(self) -> DriftReport:
+        names = self.features
+        if not names:
+            return _report([])
+        width = max(len(self.reference[n].counts) for n in names)
+        ref = np.zeros((len(names), width))
+        cur = np.zeros((len(names), width))
+        for i, name in enumerate(names):
+            ref[i, :len(self.reference[name].counts)] = self.reference[name].counts
+            cur[i, :len(self.current[name].counts)] = self.current[name].counts
+        n_ref = ref.sum(axis=1, keepdims=True)
+        n_cur = cur.sum(axis=1, keepdims=True)
+        ref_cdf = np.cumsum(ref, axis=1) / np.maximum(n_ref, 1)
+        cur_cdf = np.cumsum(cur, axis=1) / np.maximum(n_cur, 1)
+        ks = np.abs(ref_cdf - cur_cdf).max(axis=1)
+
+        # PSI buckets: group fine bins by where the reference mass sits.
+        mid = ref_cdf - ref / np.maximum(n_ref, 1) / 2
+        bucket = np.minimum((mid * self.n_buckets).astype(int), self.n_buckets - 1)
+        bucket = bucket + np.arange(len(names))[:, None] * self.n_buckets
+        shape = (len(names), self.n_buckets)
+        ref_pct = np.bincount(bucket.ravel(), ref.ravel(), minlength=shape[0] * shape[1])
+        cur_pct = np.bincount(bucket.ravel(), cur.ravel(), minlength=shape[0] * shape[1])
+        ref_pct = ref_pct.reshape(shape) / np.maximum(n_ref, 1)
+        cur_pct = cur_pct.reshape(shape) / np.maximum(n_cur, 1)
+        ref_pct = np.where(ref_pct == 0, 1e-6, ref_pct)
+        cur_pct = np.where(cur_pct == 0, 1e-6, cur_pct)
+        psi = np.sum((cur_pct - ref_pct) * np.log(cur_pct / ref_pct), axis=1)
+
+        statuses = []
+        for i, name in enumerate(names):
+            if n_ref[i, 0] < MIN_SAMPLES or n_cur[i, 0] < MIN_SAMPLES:
+                statuses.append(DriftStatus(
+                    feature_name=name, ks_statistic=0.0, psi_score=0.0,
+                    is_drifted=False, reason="insufficient_samples",
+                ))
+            else:
+                statuses.append(_status(name, float(ks[i]), float(psi[i]), self.ks_threshold, self.psi_threshold))
+        return _report(statuses)
+
+    # ---- persistence ----
+
+    def to_dict(self) -> dict:
+        return {
+            "ks_threshold": self.ks_threshold,
+            "psi_threshold": self.psi_threshold,
+            "n_buckets": self.n_buckets,
+            "features": {
+                name: {"reference": self.reference[name].to_dict(), "current": self.current[name].to_dict()}
+                for name in self.reference
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, d: Mapping) -> StreamingDriftMonitor:
+        monitor = cls(
+            {name: HistogramSketch.from_dict(f["reference"]) for name, f in d["features"].items()},
+            ks_threshold=d["ks_threshold"], psi_threshold=d["psi_threshold"], n_buckets=d["n_buckets"],
         )
+        monitor.current = {name: HistogramSketch.from_dict(f["current"]) for name, f in d["features"].items()}
+        return monitor
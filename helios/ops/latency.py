@@ -0,0 +1,79 @@
+"""Fixed-size latency histograms for per-upstream request timing.
+
+Design:
+  - Log-spaced buckets (each `growth` x wider than the last) between
+    `min_seconds` and `max_seconds`, plus one underflow and one overflow
+    bucket. record() is O(1) and memory never grows with the sample count.
+  - quantile() reports the upper edge of the bucket holding the quantile, so
+    it overstates by at most one bucket width (5% at the default growth) and
+    never understates.
+"""
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import perf_counter
+
+
+class LatencyHistogram:
+    def __init__(self, min_seconds: float = 1e-4, max_seconds: float = 120.0, growth: float = 1.05) -> None:
+        if not 0 < min_seconds < max_seconds or growth <= 1:
+            raise ValueError(
+                f"need 0 < min_seconds < max_seconds and growth > 1, "
+                f"got {min_seconds}, {max_seconds}, {growth}"
+            )
+        self.min_seconds = min_seconds
+        self._log_growth = math.log(growth)
+        self._growth = growth
+        n = math.ceil(math.log(max_seconds / min_seconds) / self._log_growth)
+        self._counts = [0] * (n + 2)  # [underflow, n log buckets, overflow]
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seen = 0.0
+
+    def record(self, seconds: float) -> None:
+        if seconds < self.min_seconds:
+            i = 0
+        else:
+            i = min(len(self._counts) - 1, 1 + int(math.log(seconds / self.min_seconds) / self._log_growth))
+        self._counts[i] += 1
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seen = max(self.max_seen, seconds)
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Record the wall time of the `with` body, also when it raises."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(perf_counter() - start)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound on the q-quantile (0 <= q <= 1); 0.0 when empty."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for i, c in enumerate(self._counts):
+            seen += c
+            if seen >= rank:
+                if i == 0:
+                    return self.min_seconds
+                if i == len(self._counts) - 1:
+                    return self.max_seen
+                return min(self.max_seen, self.min_seconds * self._growth ** i)
+        return self.max_seen
+
+    def summary(self) -> dict[str, float]:
+        """count / mean / p50 / p90 / p99 / max, latencies in milliseconds."""
+        return {
+            "count": self.count,
+            "mean_ms": 1e3 * self.total_seconds / self.count if self.count else 0.0,
+            "p50_ms": 1e3 * self.quantile(0.50),
+            "p90_ms": 1e3 * self.quantile(0.90),
+            "p99_ms": 1e3 * self.quantile(0.99),
+            "max_ms": 1e3 * self.max_seen,
+        }
@@ -0,0 +1,99 @@
+"""Per-upstream token-bucket rate limiting, shared across tasks.
+
+Why this exists:
+  Each adapter used to pace itself with a private "min seconds since my last
+  call" check. That serializes one caller and is wrong for several: two
+  adapter instances (or two concurrent tasks on one instance) each think they
+  own the whole budget, and a fixed sleep after every call wastes whatever
+  budget the request latency already spent.
+
+Design:
+  - One TokenBucket per upstream, process-wide (`limiter_for(name)`), so the
+    A2/A3/A5 harvesters, enrichers and runners draw from the same budget.
+  - acquire() reserves a token synchronously (no await between reading and
+    updating the bucket), so it needs no lock and is safe from any event loop.
+    Tokens may go negative; the caller then sleeps off its share of the debt.
+    Callers are served in arrival order.
+  - penalize(seconds) pauses the whole bucket when the upstream says 429 /
+    Retry-After; already-reserved callers wait it out too.
+  - backoff_delay() is full-jitter exponential backoff for retries, so
+    concurrent retries do not stampede the upstream in lockstep.
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Callable, Mapping
+
+# (requests per second, burst). Free-tier budgets, kept a little under the cap.
+UPSTREAM_LIMITS: dict[str, tuple[float, float]] = {
+    "geckoterminal": (27 / 60, 3),     # 30/min free cap
+    "birdeye": (1.0, 1),               # 1 rps free tier
+    "kraken_futures": (4.0, 4),        # public charts endpoint
+    "dexscreener": (4.0, 5),           # 300/min on token + search endpoints
+}
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float = 1.0, clock: Callable[[], float] = time.monotonic) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"rate must be > 0 and burst >= 1, got rate={rate} burst={burst}")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = burst
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self.waited_seconds = 0.0  # cumulative time callers spent waiting
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        now = self._clock()
+        self._refill(now)
+        self._tokens -= tokens
+        wait = max(-self._tokens / self.rate if self._tokens < 0 else 0.0, self._blocked_until - now)
+        try:
+            while wait > 0:
+                self.waited_seconds += wait
+                await asyncio.sleep(wait)
+                wait = self._blocked_until - self._clock()  # a penalty may have landed meanwhile
+        except asyncio.CancelledError:
+            self._tokens += tokens  # give the reservation back
+            raise
+
+    def penalize(self, seconds: float) -> None:
+        """Pause every caller for `seconds` (e.g. an upstream Retry-After)."""
+        now = self._clock()
+        self._blocked_until = max(self._blocked_until, now + seconds)
+        self._refill(now)
+        self._tokens = min(self._tokens, 0.0)
+
+
+_LIMITERS: dict[str, TokenBucket] = {}
+
+
+def limiter_for(upstream: str) -> TokenBucket:
+    """The process-wide bucket for `upstream` (a key of UPSTREAM_LIMITS)."""
+    bucket = _LIMITERS.get(upstream)
+    if bucket is None:
+        rate, burst = UPSTREAM_LIMITS[upstream]
+        bucket = _LIMITERS[upstream] = TokenBucket(rate, burst)
+    return bucket
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0.0, min(cap, base * (2 ** attempt)))
+
+
+def retry_after_seconds(headers: Mapping[str, str], default: float) -> float:
+    """Retry-After (seconds form), never below `default`."""
+    raw = headers.get("Retry-After")
+    try:
+        return max(default, float(raw)) if raw is not None else default
+    except ValueError:
+        return default
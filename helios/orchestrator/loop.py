@@ -4,7 +4,8 @@ For each tick:
   1. Fetch a current snapshot of PortfolioState.
   2. For each enabled Strategy, call evaluate(ctx) -> List[Signal].
   3. For each Signal, allocator builds an Intent (sized via Kelly).
-  4. risk.apply(intent, state) -> Order | Rejection.
+  4. risk.apply_batch(intents, state) -> Order | Rejection per intent, with
+     exposure accumulated across the tick's approvals.
   5. router.submit(order, snap) -> Fill.
   6. Bandit.update on close, log everything.
 
@@ -17,18 +18,18 @@ from __future__ import annotations
 import asyncio
 import os
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from decimal import Decimal
 
 from helios.allocator import simple_allocate
-from helios.allocator.bandit import StrategyBandit
+from helios.allocator.bandit import BANDIT_STATE_PATH, StrategyBandit
 from helios.execution.paper_broker import MarketSnapshot
 from helios.execution.router import ExecutionRouter
 from helios.ops import get_logger
-from helios.risk import RiskConfig, apply as risk_apply
+from helios.risk import RiskConfig, apply_batch as risk_apply_batch
 from helios.strategies import Strategy, StrategyContext
 from helios.types import (
     Fill,
+    Intent,
     Order,
     PortfolioState,
     Rejection,
@@ -53,10 +54,17 @@ class Orchestrator:
     strategies: list[Strategy]
     router: ExecutionRouter
     risk_config: RiskConfig = field(default_factory=RiskConfig)
-    bandit: StrategyBandit = field(default_factory=StrategyBandit)
+    bandit: StrategyBandit = field(default_factory=StrategyBandit)  # memory only; see live()
     runtime: dict[StrategyId, StrategyRuntime] = field(default_factory=dict)
     kill_switch_path: str = field(default_factory=lambda: os.getenv("HELIOS_KILL_SWITCH_PATH", "/tmp/helios.kill"))
 
+    @classmethod
+    def live(cls, strategies: list[Strategy], router: ExecutionRouter, **kwargs) -> Orchestrator:
+        """Orchestrator whose bandit posteriors persist under BANDIT_STATE_PATH
+        and survive restarts. Backtests use the plain constructor."""
+        kwargs.setdefault("bandit", StrategyBandit(path=BANDIT_STATE_PATH))
+        return cls(strategies=strategies, router=router, **kwargs)
+
     async def prepare(self) -> None:
         for s in self.strategies:
             await s.prepare()
@@ -80,45 +88,88 @@ class Orchestrator:
             log.warning("tick_skipped_kill_active")
             return []
 
-        # Hot-reload kill into risk config
-        cfg = self.risk_config
-        if cfg.kill_switch_active != self._kill_active():
-            # RiskConfig is frozen; build a new one with the live kill state
-            from dataclasses import replace
-            cfg = replace(cfg, kill_switch_active=self._kill_active())
-
+        # The portfolio snapshot's clock is "now" — wall time live, bar time in
+        # backtest replay — so strategies stay PIT-correct in both.
         ctx = StrategyContext(
-            as_of=datetime.now(timezone.utc),
+            as_of=state.as_of,
             portfolio=state,
             universe=universe,
         )
 
-        outcomes: list[Fill | Rejection] = []
+        signals: list[Signal] = []
         for strat in self.strategies:
             try:
-                signals = await strat.evaluate(ctx)
+                signals.extend(await strat.evaluate(ctx))
             except Exception as e:  # noqa: BLE001
                 log.exception("strategy_evaluate_failed", strategy=strat.id.value, error=str(e))
                 continue
 
-            for sig in signals:
-                outcome = await self._handle_signal(sig, state, snapshots, regime_label, cfg)
-                if outcome is not None:
-                    outcomes.append(outcome)
-        return outcomes
+        return await self.process_signals(signals, state, snapshots, regime_label)
 
-    async def _handle_signal(
+    async def process_signals(
         self,
-        signal: Signal,
+        signals: list[Signal],
         state: PortfolioState,
         snapshots: dict[tuple[str, Venue], MarketSnapshot],
-        regime_label: str,
-        cfg: RiskConfig,
-    ) -> Fill | Rejection | None:
+        regime_label: str = "",
+    ) -> list[Fill | Rejection]:
+        """Size, risk-check and route already-evaluated signals, in order.
+
+        `tick()` calls this after evaluating strategies; the vectorized
+        backtest engine calls it directly with signals computed in batch, so
+        both paths share one allocation → risk → execution code path.
+        """
+        if self._kill_active():
+            log.warning("signals_skipped_kill_active", n=len(signals))
+            return []
+
+        # Hot-reload kill into risk config
+        cfg = self.risk_config
+        if cfg.kill_switch_active != self._kill_active():
+            # RiskConfig is frozen; build a new one with the live kill state
+            from dataclasses import replace
+            cfg = replace(cfg, kill_switch_active=self._kill_active())
+
+        # One Thompson draw per signal, all arms in a single call.
+        weights = self.bandit.sample_weights([(sig.strategy, regime_label) for sig in signals])
+        intents: list[Intent] = []
+        for sig, weight in zip(signals, weights, strict=True):
+            intent = self._size_signal(sig, state, float(weight))
+            if intent is not None:
+                intents.append(intent)
+        if not intents:
+            return []
+
+        # One risk pass for the whole tick: each approval we can route counts
+        # against the caps seen by the intents ranked after it.
+        def routable(order: Order) -> bool:
+            return (order.intent.symbol, order.intent.venue) in snapshots
+
+        outcomes: list[Fill | Rejection] = []
+        for result in risk_apply_batch(intents, state, cfg, emits=routable):
+            if isinstance(result, Rejection):
+                log.info(
+                    "intent_rejected",
+                    rule=result.rule,
+                    reason=result.reason,
+                    strategy=result.intent.strategy.value,
+                    symbol=result.intent.symbol,
+                )
+                outcomes.append(result)
+                continue
+
+            order: Order = result
+            snap = snapshots.get((order.intent.symbol, order.intent.venue))
+            if snap is None:
+                log.warning("no_snapshot_for_symbol", symbol=order.intent.symbol)
+                continue
+            outcomes.append(self.router.submit(order, snap))
+        return outcomes
+
+    def _size_signal(self, signal: Signal, state: PortfolioState, bandit_weight: float) -> Intent | None:
         rt = self.runtime.get(signal.strategy, StrategyRuntime())
         # Bandit weight modulates the conformal lower bound — strategies with
         # recently weak performance get sampled to a lower effective edge.
-        bandit_weight = self.bandit.sample_weight(signal.strategy, regime_label)
         scaled_signal = Signal(
             strategy=signal.strategy,
             symbol=signal.symbol,
@@ -142,28 +193,7 @@ class Orchestrator:
         )
         if intent is None:
             log.debug("signal_sized_to_zero", strategy=signal.strategy.value, symbol=signal.symbol)
-            return None
-
-        result = risk_apply(intent, state, cfg)
-        if isinstance(result, Rejection):
-            log.info(
-                "intent_rejected",
-                rule=result.rule,
-                reason=result.reason,
-                strategy=signal.strategy.value,
-                symbol=signal.symbol,
-            )
-            return result
-
-        # result is Order
-        order: Order = result
-        snap = snapshots.get((order.intent.symbol, order.intent.venue))
-        if snap is None:
-            log.warning("no_snapshot_for_symbol", symbol=order.intent.symbol)
-            return None
-
-        fill = self.router.submit(order, snap)
-        return fill
+        return intent
 
     def on_trade_closed(
         self,
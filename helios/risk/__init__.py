@@ -7,8 +7,9 @@ by accident.
 The `apply()` function is the canonical entry point. It returns either an
 `Order` (approved) or a `Rejection` (denied, with the specific rule that
 triggered). The orchestrator is required to route every `Intent` through
-`apply()` before any execution call.
+`apply()` — or `apply_batch()` for a whole tick's intents — before any
+execution call.
 """
-from helios.risk.overlay import RiskConfig, apply
+from helios.risk.overlay import RiskConfig, apply, apply_batch
 
-__all__ = ["RiskConfig", "apply"]
+__all__ = ["RiskConfig", "apply", "apply_batch"]
@@ -3,14 +3,22 @@
 Rules evaluated in order. First failing rule wins (short-circuit). This
 ordering is intentional: hard stops (kill switch, drawdown) before soft
 limits (per-position cap, leverage cap).
+
+The aggregate-exposure rules (R11, R12) sum over every open position, so
+they run in fixed-point ints (helios.fixed_point): one pass, leverage as
+ratio units, no `Decimal(str(float))` per position. A PortfolioState built
+by helios.execution.ledger carries those sums (and R07's per-strategy
+open-order notional) precomputed, and no scan happens at all.
 """
 from __future__ import annotations
 
 import uuid
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
 
+from helios.fixed_point import RATIO_ONE, USD_DP, ratio_units, to_fixed
 from helios.types import (
     Intent,
     Order,
@@ -81,18 +89,18 @@ def _now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def _reject(intent: Intent, rule: str, reason: str) -> Rejection:
-    return Rejection(intent=intent, rule=rule, reason=reason, rejected_at=_now())
+def _reject(intent: Intent, rule: str, reason: str, at: datetime | None = None) -> Rejection:
+    return Rejection(intent=intent, rule=rule, reason=reason, rejected_at=at or _now())
 
 
-def _approve(intent: Intent, qty: Decimal) -> Order:
+def _approve(intent: Intent, qty: Decimal, at: datetime | None = None) -> Order:
     return Order(
         intent=intent,
         qty=qty,
         order_type="market",  # execution layer may downgrade to limit; risk doesn't care
         limit_price=None,
         client_order_id=str(uuid.uuid4()),
-        approved_at=_now(),
+        approved_at=at or _now(),
     )
 
 
@@ -100,7 +108,10 @@ def _strategy_exposure(state: PortfolioState, strategy: StrategyId) -> Decimal:
     """Current open notional USD attributable to a strategy.
 
     Strategies are tagged via the open Intent on each Order; risk overlay reads it back.
+    A ledger-built state carries the sum already.
     """
+    if state.exposure is not None:
+        return state.exposure.open_order_usd.get(strategy, Decimal("0"))
     total = Decimal("0")
     for o in state.open_orders:
         if o.intent.strategy == strategy:
@@ -108,21 +119,19 @@ def _strategy_exposure(state: PortfolioState, strategy: StrategyId) -> Decimal:
     return total
 
 
-def _gross_exposure(state: PortfolioState) -> Decimal:
-    total = Decimal("0")
-    for p in state.positions:
-        total += abs(p.qty * p.avg_entry) * Decimal(str(p.leverage))
-    return total
-
-
-def _net_exposure(state: PortfolioState) -> Decimal:
-    total = Decimal("0")
+def _exposure_units(state: PortfolioState) -> tuple[int, int]:
+    """(gross, |net|) leveraged exposure at entry, in USD units x ratio units
+    (scale 10**-(USD_DP + RATIO_DP)). O(1) for a ledger-built state, else
+    one pass over the positions."""
+    if state.exposure is not None:
+        return state.exposure.gross_units, abs(state.exposure.net_units)
+    gross = 0
+    net = 0
     for p in state.positions:
-        signed = p.qty * p.avg_entry * Decimal(str(p.leverage))
-        if p.side == Side.SHORT:
-            signed = -signed
-        total += signed
-    return abs(total)
+        exposure = to_fixed(p.qty * p.avg_entry, USD_DP) * ratio_units(p.leverage)
+        gross += abs(exposure)
+        net += -exposure if p.side == Side.SHORT else exposure
+    return gross, abs(net)
 
 
 def _stop_distance_pct(intent: Intent) -> float:
@@ -137,6 +146,97 @@ def _stop_distance_pct(intent: Intent) -> float:
     return abs(float((stop - entry) / entry)) if entry > 0 else 0.0
 
 
+@dataclass(slots=True)
+class _Aggregates:
+    """What the rules read besides the intent, computed at most once per
+    evaluation pass. apply_batch() grows the exposure sums as it approves."""
+    state: PortfolioState
+    config: RiskConfig
+    now: datetime = field(default_factory=_now)  # one decision time per pass
+    _gate: tuple[str, str] | None = None
+    _gate_checked: bool = False
+    _lev_mult: float | None = None
+    _totals: tuple[int, int] | None = None  # (gross, |net|) exposure units
+    _scale: int | None = None
+    _units_of: Intent | None = None
+    _units: int = 0
+    _strategy_usd: dict[StrategyId, Decimal] = field(default_factory=dict)
+
+    def account_gate(self) -> tuple[str, str] | None:
+        """R01-R03: account-level halts, the same for every intent."""
+        if not self._gate_checked:
+            self._gate = _account_gate(self.state, self.config)
+            self._gate_checked = True
+        return self._gate
+
+    def leverage_multiplier(self) -> float:
+        # Drawdown brake adjusts the *leverage cap* — does not reject outright
+        if self._lev_mult is None:
+            dd = self.state.drawdown_pct
+            self._lev_mult = (
+                0.25 if dd >= self.config.drawdown_quarter_pct
+                else 0.5 if dd >= self.config.drawdown_halve_pct
+                else 1.0
+            )
+        return self._lev_mult
+
+    def strategy_usd(self, strategy: StrategyId) -> Decimal:
+        usd = self._strategy_usd.get(strategy)
+        if usd is None:
+            usd = self._strategy_usd[strategy] = _strategy_exposure(self.state, strategy)
+        return usd
+
+    def totals(self) -> tuple[int, int]:
+        if self._totals is None:
+            self._totals = _exposure_units(self.state)
+        return self._totals
+
+    def exposure_scale(self) -> int:
+        """NAV in the exposure sums' units."""
+        if self._scale is None:
+            self._scale = to_fixed(self.state.nav_usd, USD_DP) * RATIO_ONE
+        return self._scale
+
+    def intent_units(self, intent: Intent) -> int:
+        """Leveraged notional of `intent` in exposure units (last one cached)."""
+        if self._units_of is not intent:
+            self._units_of = intent
+            self._units = to_fixed(intent.notional_usd, USD_DP) * ratio_units(intent.leverage)
+        return self._units
+
+    def add(self, intent: Intent) -> None:
+        """Count an emitted intent toward the caps seen by the next ones."""
+        self._strategy_usd[intent.strategy] = self.strategy_usd(intent.strategy) + intent.notional_usd
+        gross, net = self.totals()
+        units = self.intent_units(intent)
+        self._totals = (gross + units, net + abs(units))
+
+
+def _account_gate(state: PortfolioState, config: RiskConfig) -> tuple[str, str] | None:
+    # R01
+    if config.kill_switch_active:
+        return "R01_kill_switch", "Kill switch is active"
+
+    # R02 — loss caps
+    daily_loss_pct = -float(state.realized_pnl_today_usd / state.nav_usd) if state.nav_usd > 0 else 0.0
+    weekly_loss_pct = -float(state.realized_pnl_week_usd / state.nav_usd) if state.nav_usd > 0 else 0.0
+    monthly_loss_pct = -float(state.realized_pnl_month_usd / state.nav_usd) if state.nav_usd > 0 else 0.0
+    if daily_loss_pct >= config.max_daily_loss_pct:
+        return "R02_daily_loss", f"Daily loss {daily_loss_pct:.2%} >= cap {config.max_daily_loss_pct:.2%}"
+    if weekly_loss_pct >= config.max_weekly_loss_pct:
+        return "R02_weekly_loss", f"Weekly loss {weekly_loss_pct:.2%} >= cap"
+    if monthly_loss_pct >= config.max_monthly_loss_pct:
+        return "R02_monthly_loss", f"Monthly loss {monthly_loss_pct:.2%} >= cap"
+
+    # R03 — drawdown flat threshold
+    if state.drawdown_pct >= config.max_drawdown_flat_pct:
+        return "R03_drawdown_flat", f"Drawdown {state.drawdown_pct:.2%} >= flat threshold"
+    return None
+
+
+_DEFERRED = frozenset({StrategyId.A4_OPTIONS_0DTE, StrategyId.A6_EARNINGS, StrategyId.A9_VRP_WHEEL})
+
+
 def apply(intent: Intent, state: PortfolioState, config: RiskConfig) -> Order | Rejection:
     """Apply the full risk-overlay ruleset. Return Order or Rejection.
 
@@ -154,65 +254,82 @@ def apply(intent: Intent, state: PortfolioState, config: RiskConfig) -> Order |
       R11 aggregate gross exposure
       R12 aggregate net exposure
     """
-    # R01
-    if config.kill_switch_active:
-        return _reject(intent, "R01_kill_switch", "Kill switch is active")
+    return _evaluate(intent, _Aggregates(state, config))
+
+
+def apply_batch(
+    intents: Sequence[Intent],
+    state: PortfolioState,
+    config: RiskConfig,
+    emits: Callable[[Order], bool] | None = None,
+) -> list[Order | Rejection]:
+    """Apply the ruleset to one tick's intents together. Results are in input order.
+
+    Intents are evaluated by priority — highest conformal lower bound
+    (`signal_ref.confidence_lower`) first, input order breaking ties — and
+    each approval counts toward R07/R11/R12 for the intents after it, so
+    the tick as a whole respects the caps, not just each intent against the
+    pre-tick state. Account-level rules (R01-R03) and the exposure sums are
+    computed once per batch. A single-intent batch equals apply().
+
+    `emits(order)` says whether the caller will actually send an approved
+    order (e.g. False when it has no market snapshot for the symbol); an
+    order it won't send is still returned but takes no capacity.
+    """
+    agg = _Aggregates(state, config)
+    out: list[Order | Rejection | None] = [None] * len(intents)
+    for i in sorted(range(len(intents)), key=lambda i: (-intents[i].signal_ref.confidence_lower, i)):
+        result = _evaluate(intents[i], agg)
+        if isinstance(result, Order) and (emits is None or emits(result)):
+            agg.add(intents[i])
+        out[i] = result
+    return out  # type: ignore[return-value]
 
-    # R02 — loss caps
-    daily_loss_pct = -float(state.realized_pnl_today_usd / state.nav_usd) if state.nav_usd > 0 else 0.0
-    weekly_loss_pct = -float(state.realized_pnl_week_usd / state.nav_usd) if state.nav_usd > 0 else 0.0
-    monthly_loss_pct = -float(state.realized_pnl_month_usd / state.nav_usd) if state.nav_usd > 0 else 0.0
-    if daily_loss_pct >= config.max_daily_loss_pct:
-        return _reject(intent, "R02_daily_loss", f"Daily loss {daily_loss_pct:.2%} >= cap {config.max_daily_loss_pct:.2%}")
-    if weekly_loss_pct >= config.max_weekly_loss_pct:
-        return _reject(intent, "R02_weekly_loss", f"Weekly loss {weekly_loss_pct:.2%} >= cap")
-    if monthly_loss_pct >= config.max_monthly_loss_pct:
-        return _reject(intent, "R02_monthly_loss", f"Monthly loss {monthly_loss_pct:.2%} >= cap")
 
-    # R03 — drawdown flat threshold
-    if state.drawdown_pct >= config.max_drawdown_flat_pct:
-        return _reject(intent, "R03_drawdown_flat", f"Drawdown {state.drawdown_pct:.2%} >= flat threshold")
+def _evaluate(intent: Intent, agg: _Aggregates) -> Order | Rejection:
+    state, config = agg.state, agg.config
+
+    # R01-R03
+    gate = agg.account_gate()
+    if gate is not None:
+        return _reject(intent, *gate, at=agg.now)
 
     # R04 — NAV gate
-    deferred = {StrategyId.A4_OPTIONS_0DTE, StrategyId.A6_EARNINGS, StrategyId.A9_VRP_WHEEL}
-    if intent.strategy in deferred and state.nav_usd < config.nav_gate_options:
+    if intent.strategy in _DEFERRED and state.nav_usd < config.nav_gate_options:
         return _reject(
             intent,
             "R04_nav_gate",
             f"Strategy {intent.strategy.value} requires NAV >= ${config.nav_gate_options}; have ${state.nav_usd}",
+            at=agg.now,
         )
 
     # R05 — economics floor
     if intent.notional_usd < config.min_notional_usd:
-        return _reject(intent, "R05_min_notional", f"Notional ${intent.notional_usd} below floor ${config.min_notional_usd}")
+        return _reject(intent, "R05_min_notional", f"Notional ${intent.notional_usd} below floor ${config.min_notional_usd}", at=agg.now)
 
     # R06 — per-position cap
     nav = state.nav_usd
     if nav <= 0:
-        return _reject(intent, "R06_zero_nav", "Account NAV is zero or negative")
+        return _reject(intent, "R06_zero_nav", "Account NAV is zero or negative", at=agg.now)
     pos_pct = float(intent.notional_usd / nav)
     cap = config.max_position_pct_meme if intent.strategy == StrategyId.A2_MEME_SNIPE else config.max_position_pct_of_nav
     if pos_pct > cap:
-        return _reject(intent, "R06_position_cap", f"Position {pos_pct:.2%} > cap {cap:.2%}")
+        return _reject(intent, "R06_position_cap", f"Position {pos_pct:.2%} > cap {cap:.2%}", at=agg.now)
 
     # R07 — per-strategy allocation cap (existing + this intent)
     strat_cap_pct = config.strategy_alloc_max.get(intent.strategy)
     if strat_cap_pct is not None:
-        existing = _strategy_exposure(state, intent.strategy)
+        existing = agg.strategy_usd(intent.strategy)
         projected = float((existing + intent.notional_usd) / nav)
         if projected > strat_cap_pct:
             return _reject(
                 intent,
                 "R07_strategy_alloc",
                 f"Strategy alloc {projected:.2%} > cap {strat_cap_pct:.2%} (existing ${existing} + new ${intent.notional_usd})",
+                at=agg.now,
             )
 
-    # Drawdown brake adjusts the *leverage cap* — does not reject outright
-    leverage_cap_multiplier = 1.0
-    if state.drawdown_pct >= config.drawdown_quarter_pct:
-        leverage_cap_multiplier = 0.25
-    elif state.drawdown_pct >= config.drawdown_halve_pct:
-        leverage_cap_multiplier = 0.5
+    leverage_cap_multiplier = agg.leverage_multiplier()
 
     # R08 — per-strategy leverage
     per_strat_lev = config.max_leverage_per_strategy.get(intent.strategy, 1.0) * leverage_cap_multiplier
@@ -221,6 +338,7 @@ def apply(intent: Intent, state: PortfolioState, config: RiskConfig) -> Order |
             intent,
             "R08_strategy_leverage",
             f"Leverage {intent.leverage}x > strategy cap {per_strat_lev}x (drawdown-adjusted)",
+            at=agg.now,
         )
 
     # R09 — overall leverage cap
@@ -230,6 +348,7 @@ def apply(intent: Intent, state: PortfolioState, config: RiskConfig) -> Order |
             intent,
             "R09_overall_leverage",
             f"Leverage {intent.leverage}x > overall cap {overall_lev_cap}x (drawdown-adjusted)",
+            at=agg.now,
         )
 
     # R10 — asymmetry / stop distance
@@ -239,30 +358,34 @@ def apply(intent: Intent, state: PortfolioState, config: RiskConfig) -> Order |
             intent,
             "R10_stop_distance",
             f"Stop distance {stop_dist:.2%} > cap {config.max_stop_distance_pct:.2%} — asymmetry violated",
+            at=agg.now,
         )
 
+    # R11 / R12 share one pass over the positions
+    gross_units, net_units = agg.totals()
+    intent_units = agg.intent_units(intent)
+    exposure_scale = agg.exposure_scale()
+
     # R11 — aggregate gross exposure
-    projected_gross = _gross_exposure(state) + intent.notional_usd * Decimal(str(intent.leverage))
-    gross_pct = float(projected_gross / nav)
+    gross_pct = (gross_units + intent_units) / exposure_scale
     if gross_pct > config.max_gross_exposure_pct_of_nav:
         return _reject(
             intent,
             "R11_gross_exposure",
             f"Gross {gross_pct:.2f}x > cap {config.max_gross_exposure_pct_of_nav:.2f}x",
+            at=agg.now,
         )
 
     # R12 — aggregate net exposure (simplified: assume new intent adds same-sign exposure)
-    sign = Decimal("1") if intent.signal_ref.direction == 1 else Decimal("-1")
-    projected_net_add = intent.notional_usd * Decimal(str(intent.leverage)) * sign
-    projected_net = _net_exposure(state) + abs(projected_net_add)
-    net_pct = float(projected_net / nav)
+    net_pct = (net_units + abs(intent_units)) / exposure_scale
     if net_pct > config.max_net_exposure_pct_of_nav:
         return _reject(
             intent,
             "R12_net_exposure",
             f"Net {net_pct:.2f}x > cap {config.max_net_exposure_pct_of_nav:.2f}x",
+            at=agg.now,
         )
 
     # All rules passed — approve
     qty = intent.notional_usd / intent.signal_ref.invalidation_price if intent.signal_ref.invalidation_price > 0 else Decimal("0")
-    return _approve(intent, qty)
+    return _approve(intent, qty, at=agg.now)
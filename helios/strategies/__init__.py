@@ -1,4 +1,4 @@
 """Strategies — each one a self-contained package implementing the Strategy ABC."""
-from helios.strategies.base import Strategy, StrategyContext
+from helios.strategies.base import Strategy, StrategyContext, VectorizedStrategy
 
-__all__ = ["Strategy", "StrategyContext"]
+__all__ = ["Strategy", "StrategyContext", "VectorizedStrategy"]
@@ -0,0 +1,218 @@
+"""Walk-forward fold training for A1: process pool, warm starts, fold cache.
+
+Why this exists:
+  train_a1() fitted every walk-forward fold serially and from scratch, and
+  reran all of them on every research iteration, even when only the last
+  fold's data had changed.
+
+Design:
+  - X and y are published once with helios.backtest.sweep.publish_inputs
+    (.npy files). Workers memory-map them in their initializer, so a task
+    carries only its index arrays and the booster params.
+  - Cold folds are independent and fan out over a ProcessPoolExecutor
+    (spawn context, like run_sweep). Each worker's XGBoost gets
+    `threads_per_worker` threads, which defaults to cpu_count // workers,
+    so the pool does not oversubscribe the cores. `max_workers=1` runs in
+    process.
+  - `warm_start=True` (expanding windows): fold k continues boosting from
+    fold k-1's booster and adds `warm_start_rounds` trees instead of
+    `n_estimators`. That is a chain, so it runs serially with every thread
+    on one fold. It does fewer rounds in total, not more folds at a time.
+  - With `cache_dir`, each fold is keyed by a sha256 over its train/val
+    rows, labels, booster params, the XGBoost version and (when warm
+    starting) its parent fold's key. The booster (.ubj) and the val
+    predictions plus importances (.npz) are stored under that key, written
+    atomically. A rerun loads unchanged folds instead of fitting them. A
+    changed early fold changes the keys of every warm-started fold after it.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing as mp
+import os
+import shutil
+import tempfile
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from helios.backtest.sweep import attach_inputs, publish_inputs
+from helios.backtest.walkforward import Split
+from helios.ops import get_logger
+
+log = get_logger(__name__)
+
+# Set in each worker by _init_worker(); read by _fit_task().
+_WORKER_INPUTS: dict[str, Any] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class FoldResult:
+    fold: int
+    val_pred: np.ndarray      # P(y=1) on the fold's val rows
+    importances: np.ndarray   # per feature, XGBoost's default importance type
+    key: str                  # content hash ("" when uncached)
+    cached: bool = False
+
+
+def fold_key(
+    x: np.ndarray, y: np.ndarray, split: Split, params: Mapping[str, Any], parent: str = "",
+) -> str:
+    import xgboost as xgb
+
+    h = hashlib.sha256()
+    h.update(json.dumps({"params": dict(params), "xgboost": xgb.__version__, "parent": parent},
+                        sort_keys=True, default=str).encode())
+    for idx in (split.train_idx, split.val_idx):
+        h.update(np.ascontiguousarray(idx, dtype=np.int64).tobytes())
+        h.update(np.ascontiguousarray(x[idx]).tobytes())
+        h.update(np.ascontiguousarray(y[idx]).tobytes())
+    return h.hexdigest()
+
+
+def train_folds(
+    x: np.ndarray,
+    y: np.ndarray,
+    splits: Sequence[Split],
+    params: Mapping[str, Any],
+    *,
+    max_workers: int | None = 1,
+    threads_per_worker: int | None = None,
+    warm_start: bool = False,
+    warm_start_rounds: int = 50,
+    cache_dir: str | Path | None = None,
+    workdir: str | Path | None = None,
+) -> list[FoldResult]:
+    """Fit an XGBClassifier(**params) per split; results in split order."""
+    cache = Path(cache_dir) if cache_dir is not None else None
+    if cache is not None:
+        cache.mkdir(parents=True, exist_ok=True)
+    cpus = os.cpu_count() or 1
+
+    if warm_start:
+        return _train_chain(x, y, splits, params, warm_start_rounds, threads_per_worker or cpus, cache)
+
+    results: dict[int, FoldResult] = {}
+    pending: list[tuple[Split, str]] = []
+    for split in splits:
+        key = fold_key(x, y, split, params) if cache is not None else ""
+        hit = _load(cache, key, split.fold) if cache is not None else None
+        if hit is not None:
+            results[split.fold] = hit
+        else:
+            pending.append((split, key))
+    if results:
+        log.info("a1_folds_cached", cached=len(results), pending=len(pending))
+
+    workers = min(max_workers or cpus, len(pending)) or 1
+    threads = threads_per_worker or max(1, cpus // workers)
+    tasks = [(split.fold, split.train_idx, split.val_idx, dict(params), threads, None, key)
+             for split, key in pending]
+    if workers == 1:
+        _init_worker_inputs({"X": x, "y": y})
+        try:
+            for task in tasks:
+                results[task[0]] = _finish(cache, task, _fit_task(task))
+        finally:
+            _init_worker_inputs({})
+    elif tasks:
+        tmp = Path(tempfile.mkdtemp(prefix="helios_folds_", dir=workdir))
+        try:
+            manifest = publish_inputs({"X": np.asarray(x), "y": np.asarray(y)}, tmp)
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=mp.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(manifest,),
+            ) as pool:
+                for task, out in zip(tasks, pool.map(_fit_task, tasks), strict=True):
+                    results[task[0]] = _finish(cache, task, out)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+    return [results[split.fold] for split in splits]
+
+
+def _train_chain(
+    x: np.ndarray, y: np.ndarray, splits: Sequence[Split], params: Mapping[str, Any],
+    warm_start_rounds: int, threads: int, cache: Path | None,
+) -> list[FoldResult]:
+    _init_worker_inputs({"X": x, "y": y})
+    out: list[FoldResult] = []
+    parent_key, parent_model = "", None
+    try:
+        for i, split in enumerate(splits):
+            fold_params = dict(params) if i == 0 else {**params, "n_estimators": warm_start_rounds}
+            key = fold_key(x, y, split, fold_params, parent=parent_key) if cache is not None else ""
+            hit = _load(cache, key, split.fold) if cache is not None else None
+            if hit is not None:
+                out.append(hit)
+                parent_model = str(cache / f"{key}.ubj")
+            else:
+                task = (split.fold, split.train_idx, split.val_idx, fold_params, threads, parent_model, key)
+                val_pred, importances, booster = _fit_task(task, keep_booster=True)
+                out.append(_finish(cache, task, (val_pred, importances, booster.save_raw("ubj"))))
+                parent_model = booster
+            parent_key = key
+    finally:
+        _init_worker_inputs({})
+    return out
+
+
+# ---- workers ----
+
+
+def _init_worker_inputs(inputs: dict[str, Any]) -> None:
+    global _WORKER_INPUTS
+    _WORKER_INPUTS = inputs
+
+
+def _init_worker(manifest: list[tuple[str, str, str]]) -> None:
+    _init_worker_inputs(attach_inputs(manifest))
+
+
+def _fit_task(task: tuple, keep_booster: bool = False):
+    import xgboost as xgb
+
+    _, train_idx, val_idx, params, threads, init_model, _ = task
+    x, y = _WORKER_INPUTS["X"], _WORKER_INPUTS["y"]
+    model = xgb.XGBClassifier(**params, n_jobs=threads)
+    model.fit(x[train_idx], y[train_idx], xgb_model=init_model)
+    val_pred = model.predict_proba(x[val_idx])[:, 1]
+    importances = np.asarray(model.feature_importances_, dtype=float)
+    booster = model.get_booster()
+    return (val_pred, importances, booster) if keep_booster else (val_pred, importances, booster.save_raw("ubj"))
+
+
+# ---- cache ----
+
+
+def _finish(cache: Path | None, task: tuple, out: tuple) -> FoldResult:
+    fold, key = task[0], task[-1]
+    val_pred, importances, raw_model = out
+    if cache is not None:
+        _atomic_write(cache / f"{key}.ubj", bytes(raw_model))
+        buf = cache / f"{key}.npz.partial"
+        with buf.open("wb") as f:
+            np.savez(f, val_pred=val_pred, importances=importances)
+        os.replace(buf, cache / f"{key}.npz")
+    return FoldResult(fold=fold, val_pred=val_pred, importances=importances, key=key)
+
+
+def _load(cache: Path, key: str, fold: int) -> FoldResult | None:
+    npz, model = cache / f"{key}.npz", cache / f"{key}.ubj"
+    if not (npz.exists() and model.exists()):
+        return None
+    with np.load(npz) as data:
+        return FoldResult(fold=fold, val_pred=data["val_pred"], importances=data["importances"],
+                          key=key, cached=True)
+
+
+def _atomic_write(path: Path, payload: bytes) -> None:
+    tmp = path.with_name(path.name + ".partial")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
@@ -0,0 +1,208 @@
+"""Streaming A1 features — O(1) per bar, same output as compute_features().
+
+Why this exists:
+  compute_features() recomputes every rolling window over the full history
+  on each call. That is the right shape for training, but live evaluation
+  would pay O(history) per tick when only one bar arrived.
+
+Design:
+  - Per symbol: the last 21 closes (for ret_1/5/20) and one `_RollingWindow`
+    per rolling statistic. Each window keeps a ring buffer plus running
+    count / mean / M2 (sliding Welford add + remove), so mean and sample
+    std are O(1) per bar.
+  - Semantics follow Polars' rolling ops with `min_samples = window_size`:
+    a statistic is null until the window holds `window_size` non-null
+    values. A null funding rate therefore nulls funding_zscore_24 for the
+    next 24 bars, exactly like the batch path.
+  - Sliding Welford drifts slowly, so each window is re-summed from its
+    ring buffer every `window_size` updates (amortized O(1)).
+  - A window holding one repeated value reports variance exactly 0, as
+    Polars does. Z-scores over such a window are non-finite in both paths
+    (Polars' mean carries rounding noise, so the sign of the inf is not
+    reproducible; only "non-finite" is).
+
+Warm-start from history with `warm_start(frame)`, then call `update(bar)`
+per new bar. Rows match compute_features() to floating-point precision —
+see tests/helios/strategies/test_a1_incremental.py.
+"""
+from __future__ import annotations
+
+import math
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import polars as pl
+
+from helios.strategies.a1_perp_trend.features import FEATURE_NAMES
+
+
+class _RollingWindow:
+    """Fixed-size window over a nullable float stream: O(1) mean and std."""
+
+    __slots__ = ("_buf", "_m2", "_mean", "_n", "_pos", "_run", "_since_rebuild", "size")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._buf: list[float | None] = [None] * size
+        self._pos = 0             # next slot to overwrite
+        self._n = 0               # non-null values in the window
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._run = 0             # trailing run of identical non-null values
+        self._since_rebuild = 0
+
+    def push(self, x: float | None) -> None:
+        old = self._buf[self._pos]
+        self._buf[self._pos] = x
+        self._pos = (self._pos + 1) % self.size
+        if old is not None:
+            self._remove(old)
+        if x is not None:
+            self._add(x)
+            prev = self._buf[self._pos - 2] if self.size > 1 else None
+            self._run = self._run + 1 if (self._run and prev == x) else 1
+        else:
+            self._run = 0
+        self._since_rebuild += 1
+        if self._since_rebuild >= self.size:
+            self._rebuild()
+
+    def _add(self, x: float) -> None:
+        self._n += 1
+        delta = x - self._mean
+        self._mean += delta / self._n
+        self._m2 += delta * (x - self._mean)
+
+    def _remove(self, x: float) -> None:
+        self._n -= 1
+        if self._n == 0:
+            self._mean = self._m2 = 0.0
+            return
+        delta = x - self._mean
+        self._mean -= delta / self._n
+        self._m2 -= delta * (x - self._mean)
+
+    def _rebuild(self) -> None:
+        vals = [v for v in self._buf if v is not None]
+        self._n = len(vals)
+        self._mean = math.fsum(vals) / self._n if vals else 0.0
+        self._m2 = math.fsum((v - self._mean) ** 2 for v in vals)
+        self._since_rebuild = 0
+
+    @property
+    def full(self) -> bool:
+        return self._n == self.size
+
+    def mean(self) -> float | None:
+        if not self.full:
+            return None
+        if self._run >= self.size:
+            return self._buf[self._pos - 1]
+        return self._mean
+
+    def std(self) -> float | None:
+        if not self.full or self.size < 2:
+            return None
+        if self._run >= self.size:
+            return 0.0
+        return math.sqrt(max(self._m2, 0.0) / (self.size - 1))
+
+
+@dataclass
+class _SymbolState:
+    closes: deque[float | None] = field(default_factory=lambda: deque(maxlen=21))
+    ret_20: _RollingWindow = field(default_factory=lambda: _RollingWindow(20))
+    ret_60: _RollingWindow = field(default_factory=lambda: _RollingWindow(60))
+    volume_5: _RollingWindow = field(default_factory=lambda: _RollingWindow(5))
+    volume_60: _RollingWindow = field(default_factory=lambda: _RollingWindow(60))
+    funding_24: _RollingWindow = field(default_factory=lambda: _RollingWindow(24))
+
+
+class IncrementalA1Features:
+    """Per-symbol streaming state for the A1 feature set.
+
+    `update(bar)` takes one bar (a mapping with symbol, event_time,
+    available_at, close, volume and optionally funding_rate) and returns the
+    row compute_features() would produce for it. Bars for a symbol must
+    arrive in event_time order.
+    """
+
+    def __init__(self) -> None:
+        self._symbols: dict[str, _SymbolState] = {}
+
+    def warm_start(self, bars: pl.DataFrame) -> None:
+        """Replay history (same schema as compute_features input)."""
+        cols = ["symbol", "event_time", "available_at", "close", "volume"]
+        if "funding_rate" in bars.columns:
+            cols.append("funding_rate")
+        for row in bars.sort(["symbol", "event_time"]).select(cols).iter_rows(named=True):
+            self.update(row)
+
+    def update(self, bar: Mapping[str, Any]) -> dict[str, Any]:
+        symbol = bar["symbol"]
+        st = self._symbols.get(symbol)
+        if st is None:
+            st = self._symbols[symbol] = _SymbolState()
+
+        close = _float(bar["close"])
+        prev = st.closes[-1] if st.closes else None
+        ret_1 = _sub(_div(close, prev), 1.0)
+        ret_5 = _sub(_div(close, _lag(st.closes, 5)), 1.0)
+        ret_20 = _sub(_div(close, _lag(st.closes, 20)), 1.0)
+        st.closes.append(close)
+
+        st.ret_20.push(ret_1)
+        st.ret_60.push(ret_1)
+        st.volume_5.push(_float(bar["volume"]))
+        st.volume_60.push(_float(bar["volume"]))
+        vol_20 = st.ret_20.std()
+
+        funding_z = None
+        if "funding_rate" in bar:
+            fr = _float(bar["funding_rate"])
+            st.funding_24.push(fr)
+            funding_z = _div(_sub(fr, st.funding_24.mean()), st.funding_24.std())
+
+        values = {
+            "ret_1": ret_1,
+            "ret_5": ret_5,
+            "ret_20": ret_20,
+            "vol_20": vol_20,
+            "vol_zscore_20_vs_60": _div(vol_20, st.ret_60.std()),
+            "momentum_zscore_20": _div(st.ret_20.mean(), vol_20),
+            "volume_ratio_5_vs_60": _div(st.volume_5.mean(), st.volume_60.mean()),
+            "funding_zscore_24": funding_z,
+            "oi_change_pct_24": None,  # placeholder until the OI adapter ships
+        }
+        return {
+            "symbol": symbol,
+            "event_time": bar["event_time"],
+            "available_at": bar["available_at"],
+            **{name: values[name] for name in FEATURE_NAMES},
+        }
+
+
+def _float(x: Any) -> float | None:
+    return None if x is None else float(x)
+
+
+def _lag(closes: deque[float | None], k: int) -> float | None:
+    # `closes` excludes the current bar, so shift(k) is k-1 back from the end
+    return closes[-k] if len(closes) >= k else None
+
+
+def _sub(a: float | None, b: float | None) -> float | None:
+    return None if a is None or b is None else a - b
+
+
+def _div(a: float | None, b: float | None) -> float | None:
+    """Null-propagating division with IEEE semantics (x/0 → ±inf, 0/0 → NaN)."""
+    if a is None or b is None:
+        return None
+    if b == 0.0:
+        if a == 0.0 or math.isnan(a):
+            return math.nan
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+    return a / b
@@ -14,15 +14,19 @@ key audit-log entries off the artifact hash.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 
 import numpy as np
 import polars as pl  # noqa: F401  (used by placeholder check)
 
 from helios.backtest.tearsheet import TearSheet, tearsheet
 from helios.backtest.walkforward import walk_forward_splits
+from helios.data.store.feature_store import FeatureSpec
 from helios.models import SplitConformal
 from helios.ops import get_logger
+from helios.strategies.a1_perp_trend import features as a1_features
 from helios.strategies.a1_perp_trend.features import FEATURE_NAMES
+from helios.strategies.a1_perp_trend.folds import train_folds
 
 log = get_logger(__name__)
 
@@ -103,6 +107,15 @@ def make_labels(df: pl.DataFrame, horizon: int = 4) -> pl.DataFrame:
     return df
 
 
+def a1_feature_spec() -> FeatureSpec:
+    """FeatureStore spec for A1: compute_features + make_labels, with close
+    carried through for the label and cost model."""
+    # Longest dependency: rolling_std(60) over ret_1 needs 60 prior bars.
+    return FeatureSpec.from_module(
+        a1_features, name="a1", warmup_bars=60, label=make_labels, passthrough=("close",),
+    )
+
+
 def train_a1(
     feat_df: pl.DataFrame,
     horizon: int = 4,
@@ -114,14 +127,21 @@ def train_a1(
     apply_costs: bool = True,
     cost_bps_per_fill: float = 6.0,
     target_vol_per_bar: float | None = None,
+    max_workers: int | None = 1,
+    threads_per_worker: int | None = None,
+    warm_start: bool = False,
+    cache_dir: str | Path | None = None,
 ) -> TrainResult:
     """Walk-forward train a gradient-boosted classifier on the A1 feature set.
 
     Returns OOS metrics and a fitted conformal calibrator on aggregated OOS
-    predictions.
+    predictions. Folds are fitted by helios.strategies.a1_perp_trend.folds:
+    `max_workers` / `threads_per_worker` size the process pool, `warm_start`
+    chains each fold's booster off the previous one, and `cache_dir` skips
+    folds whose data and params are unchanged since the last run.
     """
     try:
-        import xgboost as xgb
+        import xgboost  # noqa: F401
     except ImportError as e:  # pragma: no cover
         raise RuntimeError(
             "xgboost is required for training. Install via `pip install xgboost`."
@@ -157,29 +177,30 @@ def train_a1(
     all_oos_vol: list[float] = []
     importances_accum: dict[str, float] = {f: 0.0 for f in FEATURE_NAMES}
 
-    final_model = None
-    for split in splits:
-        model = xgb.XGBClassifier(
-            n_estimators=200,
-            max_depth=4,
-            learning_rate=0.05,
-            subsample=0.8,
-            colsample_bytree=0.8,
-            random_state=random_state,
-            eval_metric="logloss",
-            tree_method="hist",
-            verbosity=0,
-        )
-        model.fit(X[split.train_idx], y[split.train_idx])
-        pred = model.predict_proba(X[split.val_idx])[:, 1]
-        all_oos_pred.extend(pred.tolist())
+    params = {
+        "n_estimators": 200,
+        "max_depth": 4,
+        "learning_rate": 0.05,
+        "subsample": 0.8,
+        "colsample_bytree": 0.8,
+        "random_state": random_state,
+        "eval_metric": "logloss",
+        "tree_method": "hist",
+        "verbosity": 0,
+    }
+    folds = train_folds(
+        X, y, splits, params,
+        max_workers=max_workers, threads_per_worker=threads_per_worker,
+        warm_start=warm_start, cache_dir=cache_dir,
+    )
+    for split, fold in zip(splits, folds, strict=True):
+        all_oos_pred.extend(fold.val_pred.tolist())
         all_oos_y.extend(y[split.val_idx].tolist())
         all_oos_ret.extend(fwd_ret[split.val_idx].tolist())
         if vol_20 is not None:
             all_oos_vol.extend(vol_20[split.val_idx].tolist())
-        for fname, imp in zip(FEATURE_NAMES, model.feature_importances_, strict=False):
+        for fname, imp in zip(FEATURE_NAMES, fold.importances, strict=False):
             importances_accum[fname] += float(imp)
-        final_model = model
 
     oos_pred = np.array(all_oos_pred)
     oos_y = np.array(all_oos_y)
@@ -224,6 +245,7 @@ def train_a1(
         "a1_train_done",
         n_samples=len(X),
         n_folds=len(splits),
+        n_folds_cached=sum(f.cached for f in folds),
         n_trades=n_trades,
         trade_hit_rate=trade_hit_rate,
         oos_sharpe=ts.sharpe,
@@ -16,20 +16,42 @@ What we still flag UNKNOWN:
 This means with v1, the RugFilter will still REJECT most tokens — but for
 RELAXED-FILTER analysis we know which checks bind, which is the actual point
 of shadow mode.
+
+Latency (the A2 edge is the gap between pool creation and entry):
+  * DexScreener, Helius getAccountInfo and Helius getAsset go out
+    concurrently. Birdeye holders need the supply from getAccountInfo, so
+    that one call is chained behind it rather than spent speculatively on
+    the 1 rps Birdeye budget.
+  * The LP heuristic reads dexId off the DexScreener snapshot instead of
+    re-fetching the pair.
+  * Every upstream call goes through an EnrichmentCache: results live for a
+    short TTL per (source, mint), and concurrent callers for the same key
+    share one in-flight request. The default cache is process-wide, so the
+    shadow, live and resnap paths reuse each other's fetches.
+  * Per-source latency histograms (`latency`) time the real requests only.
 """
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
-from decimal import Decimal
+from typing import Any, TypeVar
 
 from helios.data.adapters.birdeye import BirdeyeAdapter
 from helios.data.adapters.dexscreener import DexScreenerAdapter
-from helios.data.adapters.helius import HeliusAdapter
+from helios.data.adapters.helius import HeliusAdapter, HeliusAssetInfo, MintAuthorityInfo
 from helios.ops import get_logger
+from helios.ops.latency import LatencyHistogram
 from helios.strategies.a2_meme_snipe.snapshot import TokenSnapshot
 
 log = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Holder concentration when Birdeye can't say: (top_1, top_10, n_returned)
+_UNKNOWN_HOLDERS = (1.0, 1.0, 0)
+
 
 def _infer_lp_locked(pair_dex: str | None, pool_age_seconds: int) -> tuple[bool, float]:
     """LP-lock heuristic by DEX, for v1 (no Raydium/PumpSwap program decoding yet).
@@ -54,116 +76,234 @@ def _infer_lp_locked(pair_dex: str | None, pool_age_seconds: int) -> tuple[bool,
     return False, 0.0
 
 
+class EnrichmentCache:
+    """Short-TTL results per (source, key), with in-flight request sharing.
+
+    A lookup that finds a fresh result returns it; one that finds a request
+    still in flight awaits the same request. Failures are not cached — the
+    next caller retries. Oldest entries are dropped past `max_entries`.
+
+    A cancelled caller does not cancel a request others are still awaiting;
+    when the last caller waiting on a request is cancelled, the request is
+    cancelled too (and forgotten, so a later caller starts a fresh one).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 15.0,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        # (source, key) -> [task, expires_at, waiters]; expires_at is inf while in flight
+        self._entries: dict[tuple[str, str], list[Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, source: str, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        entry = self._entries.get((source, key))
+        if entry is not None and entry[1] > self._clock():
+            self.hits += 1
+        else:
+            self.misses += 1
+            entry = self._start(source, key, fetch)
+        entry[2] += 1
+        try:
+            # Shielded: a cancelled caller must not cancel a request others share.
+            return await asyncio.shield(entry[0])
+        except asyncio.CancelledError:
+            if entry[2] == 1 and not entry[0].done():
+                if self._entries.get((source, key)) is entry:
+                    del self._entries[(source, key)]
+                entry[0].cancel()  # nobody else is waiting for it
+            raise
+        finally:
+            entry[2] -= 1
+
+    def _start(self, source: str, key: str, fetch: Callable[[], Awaitable[T]]) -> list[Any]:
+        entry: list[Any] = [asyncio.ensure_future(fetch()), float("inf"), 0]
+        self._entries.pop((source, key), None)  # re-insert as newest
+        self._entries[(source, key)] = entry
+
+        def _settle(task: asyncio.Future) -> None:
+            if self._entries.get((source, key)) is not entry:
+                return
+            if task.cancelled() or task.exception() is not None:
+                del self._entries[(source, key)]
+            else:
+                entry[1] = self._clock() + self.ttl_seconds
+
+        entry[0].add_done_callback(_settle)
+        if len(self._entries) > self.max_entries:
+            now = self._clock()
+            for k in [k for k, e in self._entries.items() if e[1] <= now]:
+                del self._entries[k]
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_SHARED_CACHE: EnrichmentCache | None = None
+
+
+def shared_enrichment_cache() -> EnrichmentCache:
+    """The process-wide cache used by enrichers and resnaps that aren't given one."""
+    global _SHARED_CACHE
+    if _SHARED_CACHE is None:
+        _SHARED_CACHE = EnrichmentCache()
+    return _SHARED_CACHE
+
+
 class SnapshotEnricher:
     def __init__(
         self,
         dexscreener: DexScreenerAdapter | None = None,
         helius: HeliusAdapter | None = None,
         birdeye: BirdeyeAdapter | None = None,
+        cache: EnrichmentCache | None = None,
     ) -> None:
         self.dex = dexscreener or DexScreenerAdapter()
         self.helius = helius or HeliusAdapter()
         self.birdeye = birdeye or BirdeyeAdapter()
+        self.cache = cache or shared_enrichment_cache()
+        # Per-source request latency (cache hits excluded)
+        self.latency: dict[str, LatencyHistogram] = {
+            src: LatencyHistogram() for src in ("dexscreener", "helius_mint", "helius_asset", "birdeye")
+        }
 
-    async def enrich(self, mint_address: str) -> TokenSnapshot | None:
-        """Fetch and merge data from all three sources. Returns None if the
-        token isn't tracked anywhere (e.g. brand-new with no DEX activity)."""
-        base_snap = await self.dex.fetch_token_snapshot(mint_address)
-        if base_snap is None:
-            log.info("enrich_no_dexscreener", mint=mint_address)
-            return None
+    async def _fetch(self, source: str, mint_address: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        async def timed() -> T:
+            with self.latency[source].time():
+                return await fetch()
 
-        try:
-            mint_info = await self.helius.get_mint_authority_info(mint_address)
-        except Exception as e:  # noqa: BLE001
-            log.warning("helius_mint_info_failed", mint=mint_address, error=str(e))
-            mint_info = None
+        return await self.cache.get(source, mint_address, timed)
 
+    async def _fetch_or_none(
+        self, source: str, mint_address: str, fetch: Callable[[], Awaitable[T]], event: str,
+    ) -> T | None:
         try:
-            asset_info = await self.helius.get_asset_info(mint_address)
+            return await self._fetch(source, mint_address, fetch)
         except Exception as e:  # noqa: BLE001
-            log.warning("helius_asset_failed", mint=mint_address, error=str(e))
-            asset_info = None
+            log.warning(event, mint=mint_address, error=str(e))
+            return None
 
+    async def dex_snapshot(self, mint_address: str) -> TokenSnapshot | None:
+        """The DexScreener-only snapshot, through the shared cache."""
+        return await self._fetch(
+            "dexscreener", mint_address, lambda: self.dex.fetch_token_snapshot(mint_address),
+        )
+
+    async def mint_info(self, mint_address: str) -> MintAuthorityInfo | None:
+        """Helius mint account (authorities, supply, Token-2022 flags); None on failure."""
+        return await self._fetch_or_none(
+            "helius_mint", mint_address,
+            lambda: self.helius.get_mint_authority_info(mint_address), "helius_mint_info_failed",
+        )
+
+    async def asset_info(self, mint_address: str) -> HeliusAssetInfo | None:
+        """Helius DAS metadata; None on failure."""
+        return await self._fetch_or_none(
+            "helius_asset", mint_address,
+            lambda: self.helius.get_asset_info(mint_address), "helius_asset_failed",
+        )
+
+    async def holders(
+        self, mint_address: str, mint_info: MintAuthorityInfo | None,
+    ) -> tuple[float, float, int]:
+        """Birdeye (top_1, top_10, n_returned) vs supply; the unknown (1.0, 1.0, 0)
+        without a supply or on failure."""
         ui_supply = 0.0
         if mint_info and mint_info.supply > 0 and mint_info.decimals >= 0:
             ui_supply = mint_info.supply / (10 ** mint_info.decimals)
+        if ui_supply <= 0:
+            return _UNKNOWN_HOLDERS
+        return await self._fetch_or_none(
+            "birdeye", mint_address,
+            lambda: self.birdeye.get_holder_concentration_vs_supply(mint_address, ui_supply, limit=100),
+            "birdeye_holders_failed",
+        ) or _UNKNOWN_HOLDERS
 
-        top_10 = 1.0
-        top_1 = 1.0
-        n_returned = 0
-        if ui_supply > 0:
-            try:
-                top_1, top_10, n_returned = await self.birdeye.get_holder_concentration_vs_supply(
-                    mint_address, ui_supply, limit=100
-                )
-            except Exception as e:  # noqa: BLE001
-                log.warning("birdeye_holders_failed", mint=mint_address, error=str(e))
-
-        # LP-lock heuristic (honest stub — see module docstring)
-        dex_id = await self._infer_dex_id(mint_address)
-        lp_locked, lp_pct = _infer_lp_locked(dex_id, base_snap.pool_age_seconds)
-
-        # Build the fully-enriched snapshot. Note dev_wallet_pct treated as
-        # top_1_pct as the best proxy we have without explicit deployer ID.
-        return TokenSnapshot(
-            mint_address=base_snap.mint_address,
-            symbol=(asset_info.symbol if asset_info and asset_info.symbol else base_snap.symbol),
-            name=(asset_info.name if asset_info and asset_info.name else base_snap.name),
-            venue_pair_address=base_snap.venue_pair_address,
-            pool_age_seconds=base_snap.pool_age_seconds,
-            liquidity_usd=base_snap.liquidity_usd,
-            fully_diluted_value_usd=base_snap.fully_diluted_value_usd,
-            volume_5m_usd=base_snap.volume_5m_usd,
-            volume_1h_usd=base_snap.volume_1h_usd,
-            txns_5m=base_snap.txns_5m,
-            txns_1h=base_snap.txns_1h,
-            # Authority fields from Helius
-            mint_authority_renounced=mint_info.mint_authority_renounced if mint_info else False,
-            freeze_authority_renounced=mint_info.freeze_authority_renounced if mint_info else False,
-            # LP lock from heuristic
-            lp_locked_or_burned=lp_locked,
-            lp_lock_pct=lp_pct,
-            # Concentration from Birdeye (top_1 used as dev_wallet proxy)
-            top_10_holder_pct=top_10,
-            dev_wallet_pct=top_1,
-            n_holders=n_returned,  # NOTE: not real holder count — limited by Birdeye limit
-            # Provenance
-            metadata_verified=asset_info.metadata_verified if asset_info else base_snap.metadata_verified,
-            dev_history_known=False,    # v1: no indexed history yet
-            dev_rug_history_count=0,
-            # Microstructure: spread approximated from buy/sell txn imbalance (rough)
-            bid_ask_spread_pct=None,    # explicit unknown -> filter rejects on M01
-            last_trade_price_usd=base_snap.last_trade_price_usd,
-            snapshot_time=datetime.now(timezone.utc),
-            # Token-2022 extension flags from Helius
-            has_permanent_delegate=mint_info.has_permanent_delegate if mint_info else False,
-            has_transfer_hook=mint_info.has_transfer_hook if mint_info else False,
-            has_mint_close_authority=mint_info.has_mint_close_authority if mint_info else False,
-            default_state_frozen=mint_info.default_state_frozen if mint_info else False,
-            transfer_fee_basis_points=mint_info.transfer_fee_basis_points if mint_info else 0,
-            is_non_transferable=mint_info.is_non_transferable if mint_info else False,
-            is_token_2022=mint_info.is_token_2022 if mint_info else False,
-        )
+    async def _mint_and_holders(self, mint_address: str) -> tuple[MintAuthorityInfo | None, tuple[float, float, int]]:
+        mint_info = await self.mint_info(mint_address)
+        return mint_info, await self.holders(mint_address, mint_info)
 
-    async def _infer_dex_id(self, mint_address: str) -> str | None:
-        # DexScreener already returned dex info inside the fetch, but our adapter
-        # discarded it. For v1 we re-fetch lightly — the right fix is to surface
-        # dexId on TokenSnapshot. TODO: extend TokenSnapshot.
+    async def enrich(self, mint_address: str) -> TokenSnapshot | None:
+        """Fetch and merge data from all three sources. Returns None if the
+        token isn't tracked anywhere (e.g. brand-new with no DEX activity)."""
+        side = asyncio.gather(self._mint_and_holders(mint_address), self.asset_info(mint_address))
         try:
-            resp = await self.dex._client.get(
-                f"https://api.dexscreener.com/latest/dex/tokens/{mint_address}"
-            )
-            resp.raise_for_status()
-            pairs = [p for p in (resp.json().get("pairs") or []) if p.get("chainId") == "solana"]
-            if not pairs:
+            base_snap = await self.dex_snapshot(mint_address)
+            if base_snap is None:
+                log.info("enrich_no_dexscreener", mint=mint_address)
                 return None
-            pair = max(pairs, key=lambda p: float(p.get("liquidity", {}).get("usd", 0) or 0))
-            return pair.get("dexId")
-        except Exception:
-            return None
+            (mint_info, holders), asset_info = await side
+        finally:
+            if not side.done():
+                side.cancel()  # stops an unneeded Birdeye call
+                side.add_done_callback(lambda f: f.cancelled() or f.exception())
+        return merge_snapshot(base_snap, mint_info, asset_info, holders)
 
     async def close(self) -> None:
         await self.dex.close()
         await self.helius.close()
         await self.birdeye.close()
+
+
+def merge_snapshot(
+    base_snap: TokenSnapshot,
+    mint_info: MintAuthorityInfo | None,
+    asset_info: HeliusAssetInfo | None,
+    holders: tuple[float, float, int] = _UNKNOWN_HOLDERS,
+) -> TokenSnapshot:
+    """The fully-enriched snapshot from each source's result (None = that
+    source failed, its fields stay UNKNOWN)."""
+    top_1, top_10, n_returned = holders
+    # LP-lock heuristic (honest stub — see module docstring)
+    lp_locked, lp_pct = _infer_lp_locked(base_snap.dex_id, base_snap.pool_age_seconds)
+    # Build the fully-enriched snapshot. Note dev_wallet_pct treated as
+    # top_1_pct as the best proxy we have without explicit deployer ID.
+    return TokenSnapshot(
+        mint_address=base_snap.mint_address,
+        symbol=(asset_info.symbol if asset_info and asset_info.symbol else base_snap.symbol),
+        name=(asset_info.name if asset_info and asset_info.name else base_snap.name),
+        venue_pair_address=base_snap.venue_pair_address,
+        pool_age_seconds=base_snap.pool_age_seconds,
+        liquidity_usd=base_snap.liquidity_usd,
+        fully_diluted_value_usd=base_snap.fully_diluted_value_usd,
+        volume_5m_usd=base_snap.volume_5m_usd,
+        volume_1h_usd=base_snap.volume_1h_usd,
+        txns_5m=base_snap.txns_5m,
+        txns_1h=base_snap.txns_1h,
+        # Authority fields from Helius
+        mint_authority_renounced=mint_info.mint_authority_renounced if mint_info else False,
+        freeze_authority_renounced=mint_info.freeze_authority_renounced if mint_info else False,
+        # LP lock from heuristic
+        lp_locked_or_burned=lp_locked,
+        lp_lock_pct=lp_pct,
+        # Concentration from Birdeye (top_1 used as dev_wallet proxy)
+        top_10_holder_pct=top_10,
+        dev_wallet_pct=top_1,
+        n_holders=n_returned,  # NOTE: not real holder count — limited by Birdeye limit
+        # Provenance
+        metadata_verified=asset_info.metadata_verified if asset_info else base_snap.metadata_verified,
+        dev_history_known=False,    # v1: no indexed history yet
+        dev_rug_history_count=0,
+        # Microstructure: spread approximated from buy/sell txn imbalance (rough)
+        bid_ask_spread_pct=None,    # explicit unknown -> filter rejects on M01
+        last_trade_price_usd=base_snap.last_trade_price_usd,
+        snapshot_time=datetime.now(timezone.utc),
+        # Token-2022 extension flags from Helius
+        has_permanent_delegate=mint_info.has_permanent_delegate if mint_info else False,
+        has_transfer_hook=mint_info.has_transfer_hook if mint_info else False,
+        has_mint_close_authority=mint_info.has_mint_close_authority if mint_info else False,
+        default_state_frozen=mint_info.default_state_frozen if mint_info else False,
+        transfer_fee_basis_points=mint_info.transfer_fee_basis_points if mint_info else 0,
+        is_non_transferable=mint_info.is_non_transferable if mint_info else False,
+        is_token_2022=mint_info.is_token_2022 if mint_info else False,
+        dex_id=base_snap.dex_id,
+    )
@@ -0,0 +1,276 @@
+"""ExitMonitor — concurrent, per-position exit checks for A2 live positions.
+
+The runner used to sweep open positions one DexScreener fetch at a time, and
+only closed anything once the whole sweep was done, so time-to-exit grew with
+the number of positions. The monitor instead:
+
+  * Fetches every due mint at once: mints are grouped into batches of up to
+    `batch_size` (one multi-token request each), with at most
+    `max_concurrency` batches in flight.
+  * Fills spare room in an outgoing batch with the positions due soonest, so
+    a calm position rides along with an urgent one at no extra request.
+  * Decides as each batch lands. A tripped threshold fires `on_exit` right
+    away, without waiting for the other batches.
+  * Schedules each position's next check from how far its price is from the
+    nearest exit level and how volatile it has been. If the nearest level is
+    a relative distance d away and the price moves about sigma per
+    sqrt(second), the earliest plausible crossing is about (d / sigma)^2
+    seconds out. The monitor rechecks after `safety` of that, clamped to
+    [min_interval, max_interval], and never after the time exit.
+  * On shutdown, drops pending price checks but lets exits already firing
+    finish (up to `exit_drain_seconds`): a close cancelled mid-swap would
+    leave a position nobody tracks.
+
+exit_reason() holds the exit rules the runner's sweep applied (stop, target,
+trailing stop, time exit, checked in that order after updating the peak).
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import math
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Protocol
+
+from helios.ops import get_logger
+
+log = get_logger(__name__)
+
+
+class MonitoredPosition(Protocol):
+    entry_unix: int
+    target_price_usd: Decimal
+    stop_price_usd: Decimal
+    peak_price_usd: Decimal
+    trailing_pct: float
+    max_hold_seconds: int
+
+
+def exit_reason(pos: MonitoredPosition, price: Decimal, now: float) -> str | None:
+    """Raise the position's peak to `price`, then the first exit that trips, if any."""
+    if price > pos.peak_price_usd:
+        pos.peak_price_usd = price
+    if price <= pos.stop_price_usd:
+        return "stop_loss"
+    if price >= pos.target_price_usd:
+        return "target"
+    if price <= pos.peak_price_usd * Decimal(1.0 - pos.trailing_pct):
+        return "trailing_stop"
+    if now - pos.entry_unix >= pos.max_hold_seconds:
+        return "time_exit"
+    return None
+
+
+@dataclass
+class _Track:
+    last_price: float = 0.0
+    last_unix: float = 0.0
+    var_per_second: float = 0.0  # EWMA of squared log return per second
+
+
+@dataclass(frozen=True, slots=True)
+class ExitMonitorConfig:
+    batch_size: int = 30              # mints per price request
+    max_concurrency: int = 4          # price requests in flight
+    min_interval: float = 0.5         # never recheck a position faster than this
+    # ... or slower than this. Exit polls share the 4 rps "dexscreener" bucket
+    # with the entry path, so calm positions must back off far enough to
+    # leave it headroom; the volatility schedule tightens near a level.
+    max_interval: float = 15.0
+    safety: float = 0.25              # fraction of the expected time-to-threshold
+    default_sigma: float = 0.01       # per sqrt(second), until a position has history
+    vol_halflife_checks: float = 10.0
+    exit_drain_seconds: float = 60.0  # on shutdown, wait this long for in-flight closes
+
+
+class ExitMonitor:
+    def __init__(
+        self,
+        positions: Mapping[str, MonitoredPosition],
+        fetch_prices: Callable[[Sequence[str]], Awaitable[Mapping[str, Decimal]]],
+        on_exit: Callable[[str, str], Awaitable[None]],
+        config: ExitMonitorConfig | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """`positions` is the runner's live mapping (mint -> position); the
+        monitor only reads it. `on_exit(mint, reason)` must remove the mint."""
+        self.positions = positions
+        self.fetch_prices = fetch_prices
+        self.on_exit = on_exit
+        self.config = config or ExitMonitorConfig()
+        self._clock = clock
+        self._tracks: dict[str, _Track] = {}
+        self._due: dict[str, float] = {}          # mint -> next check time
+        self._heap: list[tuple[float, str]] = []  # (time, mint); stale if != _due
+        self._in_flight: set[str] = set()
+        self._exiting: set[str] = set()
+        self._exit_tasks: set[asyncio.Task] = set()
+        self._wake = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.config.max_concurrency)
+        self.checks = 0
+        self.fetch_errors = 0
+
+    # ----- Scheduling -----
+
+    def track(self, mint: str) -> None:
+        """Check `mint` as soon as possible (call on entry)."""
+        self._schedule(mint, self._clock())
+
+    def _schedule(self, mint: str, at: float) -> None:
+        self._due[mint] = at
+        heapq.heappush(self._heap, (at, mint))
+        self._wake.set()
+
+    def next_interval(self, mint: str, pos: MonitoredPosition, price: Decimal, now: float) -> float:
+        cfg = self.config
+        track = self._tracks.get(mint)
+        var = track.var_per_second if track and track.var_per_second > 0 else cfg.default_sigma ** 2
+        p = float(price)
+        levels = (
+            float(pos.stop_price_usd),
+            float(pos.target_price_usd),
+            float(pos.peak_price_usd) * (1.0 - pos.trailing_pct),
+        )
+        d = min((abs(math.log(p / lvl)) for lvl in levels if lvl > 0 and p > 0), default=0.0)
+        interval = cfg.safety * d * d / var
+        interval = min(max(interval, cfg.min_interval), cfg.max_interval)
+        return min(interval, max(0.0, pos.entry_unix + pos.max_hold_seconds - now))
+
+    def _observe(self, mint: str, price: Decimal, now: float) -> None:
+        track = self._tracks.setdefault(mint, _Track())
+        p = float(price)
+        if track.last_price > 0 and p > 0 and now > track.last_unix:
+            r2 = math.log(p / track.last_price) ** 2 / (now - track.last_unix)
+            alpha = 1.0 - 0.5 ** (1.0 / self.config.vol_halflife_checks)
+            track.var_per_second = r2 if track.var_per_second == 0 else (
+                (1 - alpha) * track.var_per_second + alpha * r2
+            )
+        track.last_price, track.last_unix = p, now
+
+    # ----- Checking -----
+
+    async def check(self, mints: Sequence[str]) -> None:
+        """Fetch `mints` (batched, bounded concurrency) and act on each batch as it lands."""
+        skipped = [m for m in mints if m not in self.positions or m in self._exiting]
+        self._in_flight.difference_update(skipped)
+        mints = [m for m in mints if m in self.positions and m not in self._exiting]
+        self._in_flight.update(mints)
+        size = self.config.batch_size
+        batches = [mints[i:i + size] for i in range(0, len(mints), size)]
+        await asyncio.gather(*(self._check_batch(b) for b in batches))
+
+    async def sweep(self) -> None:
+        """Check every open position now."""
+        await self.check(list(self.positions))
+
+    async def _check_batch(self, batch: list[str]) -> None:
+        try:
+            async with self._slots:
+                try:
+                    prices = await self.fetch_prices(batch)
+                except Exception as e:
+                    self.fetch_errors += 1
+                    log.warning("a2_exit_price_fetch_failed", n=len(batch), error=str(e))
+                    prices = {}
+            now = self._clock()
+            for mint in batch:
+                pos = self.positions.get(mint)
+                if pos is None or mint in self._exiting:
+                    continue
+                price = prices.get(mint)
+                if price is None:
+                    self._schedule(mint, now + self.config.min_interval)
+                    continue
+                self.checks += 1
+                self._observe(mint, price, now)
+                reason = exit_reason(pos, price, now)
+                if reason is not None:
+                    self._fire(mint, reason)
+                else:
+                    self._schedule(mint, now + self.next_interval(mint, pos, price, now))
+        finally:
+            self._in_flight.difference_update(batch)
+
+    def _fire(self, mint: str, reason: str) -> None:
+        self._exiting.add(mint)
+        self._due.pop(mint, None)
+        self._tracks.pop(mint, None)
+
+        async def run() -> None:
+            try:
+                await self.on_exit(mint, reason)
+            except Exception as e:
+                log.warning("a2_exit_failed", mint=mint, reason=reason, error=str(e))
+            finally:
+                self._exiting.discard(mint)
+
+        task = asyncio.create_task(run())
+        self._exit_tasks.add(task)
+        task.add_done_callback(self._exit_tasks.discard)
+
+    def _riders(self, n_due: int) -> list[str]:
+        """Not-yet-due mints, soonest first, that fit in the last batch's spare room."""
+        spare = -n_due % self.config.batch_size
+        if not spare:
+            return []
+        soonest = heapq.nsmallest(spare, ((at, m) for m, at in self._due.items() if m in self.positions))
+        for _, mint in soonest:
+            del self._due[mint]  # its heap entry goes stale
+        return [mint for _, mint in soonest]
+
+    # ----- Loop -----
+
+    async def run(self) -> None:
+        """Check positions as they come due, until cancelled. Positions the
+        monitor hasn't seen yet are checked at once (track() just wakes it)."""
+        pending: set[asyncio.Task] = set()
+        try:
+            while True:
+                now = self._clock()
+                for mint in self.positions:
+                    if mint not in self._due and mint not in self._in_flight and mint not in self._exiting:
+                        self._schedule(mint, now)
+                due: list[str] = []
+                while self._heap and self._heap[0][0] <= now:
+                    at, mint = heapq.heappop(self._heap)
+                    if self._due.get(mint) != at:
+                        continue  # superseded
+                    del self._due[mint]
+                    if mint in self.positions and mint not in self._in_flight:
+                        due.append(mint)
+                if due:
+                    due += self._riders(len(due))
+                    self._in_flight.update(due)  # before the task runs, so the scan above skips them
+                    task = asyncio.create_task(self.check(due))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                self._wake.clear()
+                timeout = self._heap[0][0] - self._clock() if self._heap else self.config.max_interval
+                try:
+                    async with asyncio.timeout(max(0.0, timeout)):
+                        await self._wake.wait()
+                except TimeoutError:
+                    pass
+        finally:
+            # Pending price checks are safe to drop. In-flight exits are not:
+            # on_exit has already untracked the position, so cancelling it
+            # mid-swap would lose the position and its fill record.
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await self.drain()
+
+    async def drain(self) -> None:
+        """Wait up to `exit_drain_seconds` for in-flight exits, without
+        cancelling them (even if the caller is cancelled meanwhile)."""
+        tasks = set(self._exit_tasks)
+        if not tasks:
+            return
+        _, not_done = await asyncio.shield(
+            asyncio.wait(tasks, timeout=self.config.exit_drain_seconds)
+        )
+        if not_done:
+            log.error("a2_exit_drain_timeout", still_exiting=sorted(self._exiting))
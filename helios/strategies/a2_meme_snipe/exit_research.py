@@ -15,6 +15,8 @@ Method:
   1. Read a2_outcomes.jsonl → list of (mint, entry_unix, entry_price).
   2. Re-fetch 1-minute OHLCV from Birdeye for [entry, entry+window].
   3. Run a grid of exit policies over each token's real candle path.
+     (vectorized over every token and policy at once, see exit_sim.py; the
+     sim_* functions below are the scalar reference it must match)
   4. Average net-of-slippage return across all tokens per policy.
   5. Rank policies; report whether any clears zero after slippage.
 
@@ -31,9 +33,11 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from statistics import mean, median
 from typing import Callable, Optional
 
+import numpy as np
+
+from helios.strategies.a2_meme_snipe.exit_sim import CandlePaths, simulate_grid
 from helios.strategies.a2_meme_snipe.outcomes import Candle, apply_slippage
 
 
@@ -106,6 +110,8 @@ def sim_momentum_exit(candles: list[Candle], entry: float, window_min: int, drop
 class PolicySpec:
     name: str
     fn: Callable[[list[Candle], float], float]
+    kind: str = ""                       # exit_sim policy kind; "" = scalar fn only
+    params: tuple[float, ...] = ()
 
 
 def build_policy_grid() -> list[PolicySpec]:
@@ -116,19 +122,22 @@ def build_policy_grid() -> list[PolicySpec]:
             specs.append(PolicySpec(
                 f"target{t}x_stop{int(s*100)}",
                 lambda c, e, t=t, s=s: sim_fixed_target_stop(c, e, t, s),
+                "target_stop", (t, s),
             ))
     # Trailing
     for p in (0.2, 0.3, 0.5):
-        specs.append(PolicySpec(f"trail{int(p*100)}", lambda c, e, p=p: sim_trailing(c, e, p)))
+        specs.append(PolicySpec(f"trail{int(p*100)}", lambda c, e, p=p: sim_trailing(c, e, p),
+                                "trailing", (p,)))
     # Time exits
     for m in (5, 15, 30, 60, 120):
-        specs.append(PolicySpec(f"time{m}m", lambda c, e, m=m: sim_time_exit(c, e, m)))
+        specs.append(PolicySpec(f"time{m}m", lambda c, e, m=m: sim_time_exit(c, e, m), "time", (m,)))
     # Target or time
     for t in (1.5, 2.0, 3.0):
         for m in (15, 30, 60):
             specs.append(PolicySpec(
                 f"target{t}x_or_{m}m",
                 lambda c, e, t=t, m=m: sim_target_or_time(c, e, t, m),
+                "target_or_time", (t, m),
             ))
     # Momentum exit (sell into the dump)
     for w in (3, 5, 10):
@@ -137,6 +146,7 @@ def build_policy_grid() -> list[PolicySpec]:
                 specs.append(PolicySpec(
                     f"mom_w{w}_drop{int(d*100)}_arm{int(arm*100)}",
                     lambda c, e, w=w, d=d, arm=arm: sim_momentum_exit(c, e, w, d, arm),
+                    "momentum", (w, d, arm),
                 ))
     return specs
 
@@ -156,28 +166,38 @@ class PolicyResult:
 def evaluate_policies(
     token_candles: list[tuple[float, list[Candle]]],
     slippage_each_leg: float = 0.10,
+    specs: Optional[list[PolicySpec]] = None,
 ) -> list[PolicyResult]:
-    """token_candles: list of (entry_price, candles). Returns ranked PolicyResults."""
-    specs = build_policy_grid()
-    results: list[PolicyResult] = []
-    for spec in specs:
-        raws: list[float] = []
-        for entry, candles in token_candles:
-            if not candles or entry <= 0:
-                continue
-            raws.append(spec.fn(candles, entry))
-        if not raws:
-            continue
-        nets = [apply_slippage(r, slippage_each_leg) for r in raws]
-        nets_sorted = sorted(nets)
-        p90 = nets_sorted[int(0.9 * (len(nets_sorted) - 1))] if nets_sorted else 0.0
-        results.append(PolicyResult(
-            name=spec.name, n=len(raws),
-            mean_raw=mean(raws), median_raw=median(raws),
-            mean_net=mean(nets), median_net=median(nets),
-            win_rate=sum(1 for x in nets if x > 0) / len(nets),
-            p90_net=p90,
-        ))
+    """token_candles: list of (entry_price, candles). Returns ranked PolicyResults.
+
+    Specs with a `kind` run through the vectorized simulator in one pass;
+    any without one fall back to their scalar fn."""
+    specs = specs if specs is not None else build_policy_grid()
+    usable = [(entry, candles) for entry, candles in token_candles if candles and entry > 0]
+    if not usable or not specs:
+        return []
+    vector = [i for i, spec in enumerate(specs) if spec.kind]
+    raws = np.empty((len(specs), len(usable)))
+    if vector:
+        raws[vector] = simulate_grid(CandlePaths.pack(usable),
+                                     [(specs[i].kind, specs[i].params) for i in vector])
+    for i, spec in enumerate(specs):
+        if not spec.kind:
+            raws[i] = [spec.fn(candles, entry) for entry, candles in usable]
+
+    nets = apply_slippage(raws, slippage_each_leg)  # plain arithmetic: works elementwise
+    nets_sorted = np.sort(nets, axis=1)
+    n = len(usable)
+    results = [
+        PolicyResult(
+            name=spec.name, n=n,
+            mean_raw=float(raws[i].mean()), median_raw=float(np.median(raws[i])),
+            mean_net=float(nets[i].mean()), median_net=float(np.median(nets[i])),
+            win_rate=float(np.count_nonzero(nets[i] > 0) / n),
+            p90_net=float(nets_sorted[i, int(0.9 * (n - 1))]),
+        )
+        for i, spec in enumerate(specs)
+    ]
     # Rank by mean_net desc (EV is what matters for a many-shots strategy)
     return sorted(results, key=lambda r: -r.mean_net)
 
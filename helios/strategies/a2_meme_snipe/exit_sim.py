@@ -0,0 +1,227 @@
+"""Vectorized exit-policy simulator — a whole policy grid over all tokens at once.
+
+Why this exists:
+  exit_research.py ran every policy as a Python loop over Candle objects,
+  one token and one parameter set at a time: tokens x policies x bars
+  interpreter steps. A grid of ~100 policies over a few thousand 4h paths
+  took minutes, which made iterating on the grid painful.
+
+Design:
+  - CandlePaths packs the candle paths into padded (tokens, bars) arrays.
+    Pads never trigger anything: highs pad with -inf, lows with +inf,
+    closes with NaN (every comparison with NaN is False).
+  - Threshold exits reduce to a first-hit index. A stop at level x fires at
+    the first bar whose low <= x, which is the first bar where the running
+    min of lows <= x; since the running min never increases, that index is
+    simply count(running_min > x). Same for targets with the running max.
+    Each distinct level is computed once per block and shared by every
+    policy that uses it (5 targets x 3 stops -> 8 passes, not 15).
+  - The momentum exit fires at the first armed bar whose trailing change
+    is <= -drop; with unarmed/invalid bars set to +inf, the running min of
+    the change gives every drop threshold as a count, per (window, arm).
+  - The trailing stop's trigger moves with the running peak, so it
+    evaluates `low <= peak * (1 - trail)` over the block and takes the
+    argmax of the first True.
+  - Every comparison and return is computed with the same float operations,
+    in the same price space, as the scalar sim_* functions in
+    exit_research.py, so results match them exactly, not just to a
+    tolerance. Those scalar functions remain the reference.
+  - Tokens are processed in row blocks so a 24h grid over thousands of
+    tokens does not materialize gigabytes of intermediates.
+
+Policy kinds (params):
+  hold ()                         exit at the last close
+  target_stop (target_mult, stop_pct)
+  trailing (trail_pct,)
+  time (minutes,)
+  target_or_time (target_mult, minutes)
+  momentum (window_min, drop_pct, min_gain_to_arm)
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from helios.strategies.a2_meme_snipe.outcomes import Candle
+
+PolicyKey = tuple[str, tuple[float, ...]]
+
+_BLOCK_CELLS = 1 << 22  # tokens x bars per block
+
+
+@dataclass(frozen=True, slots=True)
+class CandlePaths:
+    entry: np.ndarray   # (n,) entry price
+    high: np.ndarray    # (n, T), padded with -inf
+    low: np.ndarray     # (n, T), padded with +inf
+    close: np.ndarray   # (n, T), padded with NaN
+    length: np.ndarray  # (n,) real bars per row, >= 1
+
+    @classmethod
+    def pack(cls, token_candles: Sequence[tuple[float, Sequence[Candle]]]) -> CandlePaths:
+        """(entry_price, candles) per token; every path must be non-empty."""
+        n = len(token_candles)
+        length = np.fromiter((len(c) for _, c in token_candles), dtype=np.int64, count=n)
+        if n and length.min() < 1:
+            raise ValueError("every candle path must have at least one bar")
+        width = int(length.max()) if n else 0
+        high = np.full((n, width), -np.inf)
+        low = np.full((n, width), np.inf)
+        close = np.full((n, width), np.nan)
+        for i, (_, candles) in enumerate(token_candles):
+            k = len(candles)
+            high[i, :k] = [c.h for c in candles]
+            low[i, :k] = [c.l for c in candles]
+            close[i, :k] = [c.c for c in candles]
+        entry = np.fromiter((e for e, _ in token_candles), dtype=np.float64, count=n)
+        return cls(entry=entry, high=high, low=low, close=close, length=length)
+
+    def __len__(self) -> int:
+        return len(self.entry)
+
+    def rows(self, start: int, stop: int) -> CandlePaths:
+        width = int(self.length[start:stop].max()) if stop > start else 0
+        return CandlePaths(
+            entry=self.entry[start:stop], high=self.high[start:stop, :width],
+            low=self.low[start:stop, :width], close=self.close[start:stop, :width],
+            length=self.length[start:stop],
+        )
+
+
+def simulate_grid(paths: CandlePaths, policies: Sequence[PolicyKey]) -> np.ndarray:
+    """Raw returns, shape (len(policies), len(paths)). Entries must be > 0."""
+    out = np.empty((len(policies), len(paths)))
+    if not len(paths):
+        return out
+    step = max(1, _BLOCK_CELLS // max(1, paths.high.shape[1]))
+    for start in range(0, len(paths), step):
+        stop = min(len(paths), start + step)
+        block = _Block(paths.rows(start, stop))
+        for p, (kind, params) in enumerate(policies):
+            out[p, start:stop] = block.run(kind, params)
+    return out
+
+
+class _Block:
+    """One row block plus the running extrema / first-hit indexes its policies share."""
+
+    def __init__(self, paths: CandlePaths) -> None:
+        self.p = paths
+        self.rows = np.arange(len(paths))
+        self.e = paths.entry
+        self.e_col = paths.entry[:, None]
+        self.cols = np.arange(paths.high.shape[1])
+        self.last_close = paths.close[self.rows, paths.length - 1]
+        self.final = (self.last_close - self.e) / self.e
+        self._cummax_h: np.ndarray | None = None
+        self._cummin_l: np.ndarray | None = None
+        self._first: dict[tuple[str, float], np.ndarray] = {}
+        self._momentum_change: dict[tuple[str, int], np.ndarray] = {}
+        self._momentum_min: dict[tuple[str, int, float], np.ndarray] = {}
+
+    # ---- shared pieces ----
+
+    @property
+    def cummax_h(self) -> np.ndarray:
+        if self._cummax_h is None:
+            self._cummax_h = np.maximum.accumulate(self.p.high, axis=1)
+        return self._cummax_h
+
+    @property
+    def cummin_l(self) -> np.ndarray:
+        if self._cummin_l is None:
+            self._cummin_l = np.minimum.accumulate(self.p.low, axis=1)
+        return self._cummin_l
+
+    def first_target(self, mult: float) -> np.ndarray:
+        """First bar with high >= entry * mult; >= length when never."""
+        key = ("target", mult)
+        if key not in self._first:
+            tp = self.e_col * mult
+            self._first[key] = np.count_nonzero(self.cummax_h < tp, axis=1)
+        return self._first[key]
+
+    def first_stop(self, stop_pct: float) -> np.ndarray:
+        """First bar with low <= entry * (1 - stop_pct); >= length when never."""
+        key = ("stop", stop_pct)
+        if key not in self._first:
+            sl = self.e_col * (1.0 - stop_pct)
+            self._first[key] = np.count_nonzero(self.cummin_l > sl, axis=1)
+        return self._first[key]
+
+    def first_armed(self, min_gain: float) -> np.ndarray:
+        """First bar with (high - entry) / entry >= min_gain; 0 when min_gain <= 0."""
+        if min_gain <= 0.0:
+            return np.zeros(len(self.e), dtype=np.int64)
+        key = ("arm", min_gain)
+        if key not in self._first:
+            gain = (self.cummax_h - self.e_col) / self.e_col
+            self._first[key] = np.count_nonzero(gain < min_gain, axis=1)
+        return self._first[key]
+
+    def _first_true(self, cond: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        idx = np.argmax(cond, axis=1)
+        return idx, cond[self.rows, idx]
+
+    # ---- policies ----
+
+    def run(self, kind: str, params: tuple[float, ...]) -> np.ndarray:
+        return getattr(self, f"_{kind}")(*params)
+
+    def _hold(self) -> np.ndarray:
+        return self.final
+
+    def _target_stop(self, target_mult: float, stop_pct: float) -> np.ndarray:
+        t_idx, s_idx = self.first_target(target_mult), self.first_stop(stop_pct)
+        n = self.p.length
+        out = np.where(t_idx < n, target_mult - 1.0, self.final)
+        # conservative: a stop in the same bar as the target fires first
+        return np.where((s_idx < n) & (s_idx <= t_idx), -stop_pct, out)
+
+    def _trailing(self, trail_pct: float) -> np.ndarray:
+        peak = np.maximum(self.e_col, self.cummax_h)
+        trigger = peak * (1.0 - trail_pct)
+        idx, hit = self._first_true(self.p.low <= trigger)
+        return np.where(hit, (trigger[self.rows, idx] - self.e) / self.e, self.final)
+
+    def _time(self, minutes: float) -> np.ndarray:
+        idx = np.minimum(int(minutes), self.p.length) - 1
+        idx = np.where(idx < 0, self.p.length - 1, idx)  # candles[-1], as in sim_time_exit
+        return (self.p.close[self.rows, idx] - self.e) / self.e
+
+    def _target_or_time(self, target_mult: float, minutes: float) -> np.ndarray:
+        m = max(1, int(minutes))  # bar 0 always checks the time exit
+        t_idx = self.first_target(target_mult)
+        n = self.p.length
+        timed = self.p.close[self.rows, np.minimum(m, n) - 1]
+        out = np.where(m <= n, (timed - self.e) / self.e, self.final)
+        return np.where((t_idx < n) & (t_idx <= m - 1), target_mult - 1.0, out)
+
+    def _momentum(self, window_min: float, drop_pct: float, min_gain_to_arm: float) -> np.ndarray:
+        w = int(window_min)
+        if w >= self.p.close.shape[1]:
+            return self.final
+        key = ("momentum", w, self._arm_key(min_gain_to_arm))
+        if key not in self._momentum_min:
+            # change over the trailing w bars at bar j + w; +inf where it can't fire
+            # (past <= 0, padding, not yet armed). Its running min turns every
+            # drop threshold into a first-hit count, as for stops.
+            if key[:2] not in self._momentum_change:
+                past, cur = self.p.close[:, : self.p.close.shape[1] - w], self.p.close[:, w:]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    change = (cur - past) / past
+                self._momentum_change[key[:2]] = np.where((past > 0) & ~np.isnan(change), change, np.inf)
+            change = self._momentum_change[key[:2]]
+            armed_from = self.first_armed(min_gain_to_arm)
+            live = self.cols[: change.shape[1]] + w >= armed_from[:, None]
+            self._momentum_min[key] = np.minimum.accumulate(np.where(live, change, np.inf), axis=1)
+        idx = np.count_nonzero(self._momentum_min[key] > -drop_pct, axis=1)
+        hit = idx < self._momentum_min[key].shape[1]
+        exit_close = self.p.close[self.rows, np.where(hit, idx, 0) + w]
+        return np.where(hit, (exit_close - self.e) / self.e, self.final)
+
+    @staticmethod
+    def _arm_key(min_gain: float) -> float:
+        return min_gain if min_gain > 0.0 else 0.0
@@ -1,7 +1,9 @@
 """Outcome harvester — reads shadow log, fetches OHLCV for each observation
 whose outcome window has matured, computes outcomes, writes to outcomes log.
 
-Idempotent: previously-harvested obs_ids are skipped.
+Idempotent: previously-harvested obs_ids are skipped. Each call parses only
+the observations appended since the last call plus the ones still pending
+(window not matured, or a failed fetch); see LogStore.resume().
 
 For each observation with timestamp T, we compute outcomes at three windows:
     1h   close at T+1h vs entry, plus max/min in the window
@@ -9,138 +11,158 @@ For each observation with timestamp T, we compute outcomes at three windows:
     24h  close at T+24h vs entry, plus max/min in the window
 
 Entry price is snapshot.last_trade_price_usd at observation time. OHLCV is
-1-minute candles from Birdeye starting at T - 60s (one bar back for the entry
+1-minute candles from GeckoTerminal starting at T - 60s (one bar back for the entry
 reference) through T + window_seconds + 60s (one bar past for safety).
 """
 from __future__ import annotations
 
-import asyncio
 from dataclasses import asdict
 from datetime import datetime, timezone
 from decimal import Decimal
 from pathlib import Path
 
 from helios.data.adapters.geckoterminal import GeckoTerminalAdapter
+from helios.data.harvest_engine import FetchJob, HarvestEngine
+from helios.data.store.candle_cache import default_candle_cache
 from helios.ops import get_logger
 from helios.strategies.a2_meme_snipe.log import (
     OUTCOMES_LOG_DEFAULT,
     SHADOW_LOG_DEFAULT,
     harvested_obs_ids,
-    read_observations,
+    shadow_store,
     write_outcome,
 )
 from helios.strategies.a2_meme_snipe.outcomes import (
-    compute_outcome,
-    parse_birdeye_candles,
+    CandleColumns,
+    WindowOutcome,
+    compute_outcomes_batch,
     policy_buy_and_hold,
-    policy_fixed_target_stop,
-    policy_trailing_stop,
 )
 
 log = get_logger(__name__)
 
 WINDOWS = {"1h": 3600, "4h": 14400, "24h": 86400}
+# GeckoTerminal pages at most 20 x 1000 one-minute candles per fetch (~13.9 days)
+_MAX_SPAN_SECONDS = 7 * 86400
+# Candles can lag a matured window while the indexer catches up; this long
+# past the largest window, an empty answer is final (a dead or unindexed pool).
+_NO_CANDLES_GRACE_SECONDS = 6 * 3600
+
+
+def _entry_price(obs: dict) -> float | None:
+    raw = obs.get("snapshot", {}).get("last_trade_price_usd")
+    try:
+        price = float(Decimal(str(raw)))
+    except (TypeError, ValueError, ArithmeticError):
+        return None
+    return price if price > 0 else None
 
 
 async def harvest(
     shadow_path: Path = SHADOW_LOG_DEFAULT,
     outcomes_path: Path = OUTCOMES_LOG_DEFAULT,
     birdeye: GeckoTerminalAdapter | None = None,
-    request_sleep_seconds: float = 1.1,
+    concurrency: int = 8,
+    retries: int = 2,
 ) -> dict[str, int]:
     """Walk observations; for each one whose largest window is matured, fetch
-    OHLCV and write an outcome record. Returns counts of processed/skipped."""
+    OHLCV and write an outcome record. Returns counts of processed/skipped.
+
+    Rows are classified first; the matured ones become FetchJobs on a
+    HarvestEngine, so overlapping windows of the same mint share one fetch
+    and requests are paced by the shared GeckoTerminal bucket. Each fetched
+    span is scored in one compute_outcomes_batch() call covering all of its
+    observations and all WINDOWS."""
     own = birdeye is None
-    birdeye = birdeye or GeckoTerminalAdapter()
+    birdeye = birdeye or GeckoTerminalAdapter(cache=default_candle_cache())
     counts = {"processed": 0, "skipped_recent": 0, "skipped_done": 0, "failed": 0}
     seen = harvested_obs_ids(outcomes_path)
     now = datetime.now(timezone.utc).timestamp()
-    obs_list = list(read_observations(shadow_path))
+    largest = max(WINDOWS.values())
+    batch = shadow_store(shadow_path).resume("a2_harvest")
+    jobs: list[FetchJob] = []
+    for position, obs in batch.rows:
+        obs_id = obs.get("obs_id")
+        if not obs_id or obs_id in seen:
+            counts["skipped_done"] += 1
+            batch.done(position)
+            continue
+        try:
+            ts = datetime.fromisoformat(obs["timestamp_iso"]).timestamp()
+        except (KeyError, ValueError):
+            counts["failed"] += 1
+            batch.done(position)  # unparseable: retrying can't help
+            continue
+        # Use the largest window we know about — if it isn't matured, skip
+        if now - ts < largest:
+            counts["skipped_recent"] += 1
+            continue
+        entry_price = _entry_price(obs)
+        mint = obs.get("mint")
+        if entry_price is None or not mint:
+            counts["failed"] += 1
+            batch.done(position)
+            continue
+        seen.add(obs_id)  # a duplicate obs_id later in the batch is already covered
+        entry_unix = int(ts)
+        jobs.append(FetchJob(mint, entry_unix - 60, entry_unix + largest + 60, (position, obs, entry_unix, entry_price)))
+
+    engine = HarvestEngine(
+        lambda mint, start, end: birdeye.fetch_ohlcv(mint, start, end, interval="1m"),
+        time_of=lambda c: c.get("unixTime", 0),
+        name="a2_harvest", concurrency=concurrency, retries=retries,
+        max_span_seconds=_MAX_SPAN_SECONDS,
+    )
     try:
-        for obs in obs_list:
-            obs_id = obs.get("obs_id")
-            if not obs_id or obs_id in seen:
-                counts["skipped_done"] += 1
-                continue
-            try:
-                ts_iso = obs["timestamp_iso"]
-                ts = datetime.fromisoformat(ts_iso).timestamp()
-            except (KeyError, ValueError):
-                counts["failed"] += 1
-                continue
-            # Use the largest window we know about — if it isn't matured, skip
-            largest = max(WINDOWS.values())
-            if now - ts < largest:
-                counts["skipped_recent"] += 1
-                continue
-
-            entry_price_raw = obs.get("snapshot", {}).get("last_trade_price_usd")
-            try:
-                entry_price = float(Decimal(str(entry_price_raw)))
-            except (TypeError, ValueError):
-                counts["failed"] += 1
-                continue
-            if entry_price <= 0:
-                counts["failed"] += 1
-                continue
-
-            mint = obs.get("mint")
-            if not mint:
-                counts["failed"] += 1
+        async for span in engine.stream_spans(jobs):
+            if span.error is not None:
+                for job in span.jobs:
+                    log.warning("ohlcv_fetch_failed", mint=span.key, obs_id=job.tag[1]["obs_id"], error=span.error)
+                counts["failed"] += len(span.jobs)
                 continue
-
-            time_from = int(ts) - 60
-            time_to = int(ts) + largest + 60
-            try:
-                raw_candles = await birdeye.fetch_ohlcv(mint, time_from, time_to, interval="1m")
-                await asyncio.sleep(request_sleep_seconds)
-            except Exception as e:  # noqa: BLE001
-                log.warning("ohlcv_fetch_failed", mint=mint, obs_id=obs_id, error=str(e))
-                counts["failed"] += 1
-                continue
-
-            candles = parse_birdeye_candles(raw_candles)
-            if not candles:
-                counts["failed"] += 1
-                continue
-
-            entry_unix = int(ts)
-            outcomes_per_window: dict[str, dict] = {}
-            for label, secs in WINDOWS.items():
-                window_candles = [c for c in candles if c.unix_time <= entry_unix + secs]
-                o = compute_outcome(window_candles, entry_unix, entry_price)
-                if o is None:
+            # every observation of the span against one columnar candle array
+            per_obs = compute_outcomes_batch(
+                CandleColumns.from_birdeye(span.items),
+                [(entry_unix, entry_price) for _, _, entry_unix, entry_price in (j.tag for j in span.jobs)],
+                WINDOWS, target_mult=3.0, stop_pct=0.5, trail_pct=0.5,
+            )
+            for job, windows in zip(span.jobs, per_obs, strict=True):
+                position, obs, entry_unix, entry_price = job.tag
+                if not windows:
+                    counts["failed"] += 1
+                    if now - entry_unix >= largest + _NO_CANDLES_GRACE_SECONDS:
+                        log.warning("ohlcv_no_candles", mint=span.key, obs_id=obs["obs_id"])
+                        batch.done(position)  # retrying can't help any more
                     continue
-                outcomes_per_window[label] = {
-                    "core": asdict(o),
-                    "policies": {
-                        "buy_and_hold": policy_buy_and_hold(o),
-                        "target3x_stop50": policy_fixed_target_stop(
-                            window_candles, entry_unix, entry_price, 3.0, 0.5
-                        ),
-                        "trailing50": policy_trailing_stop(
-                            window_candles, entry_unix, entry_price, 0.5
-                        ),
-                    },
-                }
-            if not outcomes_per_window:
-                counts["failed"] += 1
-                continue
-
-            record = {
-                "obs_id": obs_id,
-                "mint": mint,
-                "entry_unix": entry_unix,
-                "entry_price_usd": entry_price,
-                "filter_decision": obs.get("filter_decision"),
-                "filter_reasons": obs.get("filter_reasons", []),
-                "windows": outcomes_per_window,
-                "harvested_iso": datetime.now(timezone.utc).isoformat(),
-            }
-            write_outcome(record, outcomes_path)
-            counts["processed"] += 1
+                write_outcome(_outcome_record(obs, entry_unix, entry_price, windows), outcomes_path)
+                batch.done(position)
+                counts["processed"] += 1
+        batch.commit()
     finally:
         if own:
             await birdeye.close()
 
     return counts
+
+
+def _outcome_record(obs: dict, entry_unix: int, entry_price: float, windows: dict[str, WindowOutcome]) -> dict:
+    return {
+        "obs_id": obs["obs_id"],
+        "mint": obs["mint"],
+        "entry_unix": entry_unix,
+        "entry_price_usd": entry_price,
+        "filter_decision": obs.get("filter_decision"),
+        "filter_reasons": obs.get("filter_reasons", []),
+        "windows": {
+            label: {
+                "core": asdict(w.outcome),
+                "policies": {
+                    "buy_and_hold": policy_buy_and_hold(w.outcome),
+                    "target3x_stop50": w.target_stop,
+                    "trailing50": w.trailing,
+                },
+            }
+            for label, w in windows.items()
+        },
+        "harvested_iso": datetime.now(timezone.utc).isoformat(),
+    }
@@ -4,15 +4,15 @@ Jupiter swap executor.
 Pipeline:
     PoolCreationEvent  (from helios.data.adapters.helius_ws)
         ↓
-    SnapshotEnricher   (DexScreener + Helius RPC + Birdeye)
-        ↓
-    RugFilter          (the K/L/C/P/M battery)
+    StagedScreener     (SnapshotEnricher sources + RugFilter, cheapest first:
+                        Helius mint authorities, then DexScreener, then Birdeye)
         ↓
     pre-trade Jupiter quote
         ↓
     SwapResult         (paper or live)
         ↓
-    PositionManager    (trailing stop, hard exit, time-based exit)
+    ExitMonitor        (trailing stop, hard exit, time-based exit; batched
+                        concurrent price checks, scheduled per position)
         ↓
     write outcome to /data/logs/a2_live_fills.jsonl
 
@@ -27,7 +27,7 @@ import asyncio
 import json
 import os
 import time
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timezone
 from decimal import Decimal
 from pathlib import Path
@@ -45,6 +45,8 @@ from helios.execution.solana.wallet import SafetyMode, SolanaWallet
 from helios.ops import get_logger
 from helios.strategies.a2_meme_snipe import RugFilter
 from helios.strategies.a2_meme_snipe.enricher import SnapshotEnricher
+from helios.strategies.a2_meme_snipe.exit_monitor import ExitMonitor, ExitMonitorConfig
+from helios.strategies.a2_meme_snipe.screening import StagedScreener
 from helios.strategies.a2_meme_snipe.snapshot import TokenSnapshot
 
 log = get_logger(__name__)
@@ -81,6 +83,7 @@ class LiveRunnerConfig:
     sandwich_protection: bool = True          # use Jito bundles when in live mode
     max_daily_loss_sol: float = 0.5           # hard kill at -0.5 SOL realized
     paper_mode_simulated_winrate: float = 0.0 # not used; outcomes come from real prices
+    exit_monitor: ExitMonitorConfig = field(default_factory=ExitMonitorConfig)
 
 
 @dataclass
@@ -95,6 +98,12 @@ class _RuntimeStats:
     shots_this_hour: list[float] = field(default_factory=list)
 
 
+def _assume_clean_dev_history(snap: TokenSnapshot) -> TokenSnapshot:
+    if snap.dev_history_known:
+        return snap
+    return replace(snap, dev_history_known=True, dev_rug_history_count=0)
+
+
 class A2LiveRunner:
     """The live A2 strategy execution loop."""
 
@@ -116,6 +125,9 @@ class A2LiveRunner:
         self.wallet = wallet
         self.enricher = enricher or SnapshotEnricher()
         self.rug = rug_filter or RugFilter()
+        # For the live runner, we ALWAYS relax P02 (dev-history) since we don't
+        # yet have the deployer-history indexer.
+        self.screener = StagedScreener(self.enricher, self.rug, prepare=_assume_clean_dev_history)
         self.rpc = HeliusRPC()
         self.router = router or JupiterRouter(
             wallet=self.wallet, rpc=self.rpc,
@@ -124,6 +136,10 @@ class A2LiveRunner:
         )
         self.jito = JitoBundle() if self.config.sandwich_protection else None
         self.open_positions: dict[str, LivePosition] = {}
+        self.exit_monitor = ExitMonitor(
+            self.open_positions, self._fetch_exit_prices, self._close_position,
+            config=self.config.exit_monitor,
+        )
         self.stats = _RuntimeStats()
 
     # ----- Public API -----
@@ -139,22 +155,22 @@ class A2LiveRunner:
         )
 
         producer = self._stream_via_websocket if use_websocket else self._stream_via_poller
+        # Exits run on their own schedule, not on new-pool events.
+        monitor = asyncio.create_task(self.exit_monitor.run())
 
         try:
             async for event in producer():
-                # Two concurrent things to do on every tick:
-                #   1) potentially enter a new position from this event
-                #   2) update + maybe exit existing positions
-                await asyncio.gather(
-                    self._consider_entry(event),
-                    self._sweep_exits(),
-                    return_exceptions=True,
-                )
+                try:
+                    await self._consider_entry(event)
+                except Exception as e:  # noqa: BLE001
+                    log.warning("a2_entry_failed", mint=event.mint_address, error=str(e))
 
                 if self._daily_kill_triggered():
                     log.error("a2_daily_kill_triggered", realized_pnl_sol=self.stats.realized_pnl_sol)
                     break
         finally:
+            monitor.cancel()
+            await asyncio.gather(monitor, return_exceptions=True)
             await self._shutdown()
 
     # ----- Producer wiring -----
@@ -185,26 +201,18 @@ class A2LiveRunner:
         self.stats.shots_attempted += 1
 
         try:
-            snap = await self.enricher.enrich(event.mint_address)
+            result = await self.screener.screen(event.mint_address)
         except Exception as e:  # noqa: BLE001
             log.warning("enrich_failed_live", mint=event.mint_address, error=str(e))
             return
-        if snap is None:
-            return
-
-        # For the live runner, we ALWAYS relax P02 (dev-history) since we don't
-        # yet have the deployer-history indexer.
-        if not snap.dev_history_known:
-            from dataclasses import replace
-            snap = replace(snap, dev_history_known=True, dev_rug_history_count=0)
-
-        report = self.rug.check(snap)
-        if not report.passed:
+        if result.report is None:
+            return  # no DEX data yet
+        if not result.passed:
             self.stats.shots_filtered_out += 1
             return
 
         # Filter passed → enter
-        await self._enter_position(snap)
+        await self._enter_position(result.snapshot)
 
     async def _enter_position(self, snap: TokenSnapshot) -> None:
         per_shot_lamports = int(self.config.per_shot_sol * 1_000_000_000)
@@ -242,6 +250,7 @@ class A2LiveRunner:
             trailing_pct=self.config.trailing_stop_pct,
         )
         self.open_positions[snap.mint_address] = position
+        self.exit_monitor.track(snap.mint_address)
         log.info(
             "a2_position_opened",
             mint=snap.mint_address[:8] + "...",
@@ -253,36 +262,11 @@ class A2LiveRunner:
 
     # ----- Exit path -----
 
-    async def _sweep_exits(self) -> None:
-        if not self.open_positions:
-            return
-        now = int(time.time())
-        to_close: list[tuple[str, str]] = []  # (mint, reason)
-
-        for mint, pos in list(self.open_positions.items()):
-            # Pull current price via DexScreener-cached enrichment (lightweight)
-            try:
-                snap = await self.enricher.dex.fetch_token_snapshot(mint)
-            except Exception:  # noqa: BLE001
-                continue
-            if snap is None:
-                continue
-            current = snap.last_trade_price_usd
-            if current > pos.peak_price_usd:
-                pos.peak_price_usd = current
-
-            # Exit conditions
-            if current <= pos.stop_price_usd:
-                to_close.append((mint, "stop_loss"))
-            elif current >= pos.target_price_usd:
-                to_close.append((mint, "target"))
-            elif current <= pos.peak_price_usd * Decimal(1.0 - pos.trailing_pct):
-                to_close.append((mint, "trailing_stop"))
-            elif now - pos.entry_unix >= pos.max_hold_seconds:
-                to_close.append((mint, "time_exit"))
-
-        for mint, reason in to_close:
-            await self._close_position(mint, reason)
+    async def _fetch_exit_prices(self, mints: list[str]) -> dict[str, Decimal]:
+        """Current prices for `mints`, one multi-token DexScreener request per
+        chunk (no cache: exits need fresh prices). The adapter paces itself."""
+        snaps = await self.enricher.dex.fetch_token_snapshots(mints)
+        return {mint: snap.last_trade_price_usd for mint, snap in snaps.items()}
 
     async def _close_position(self, mint: str, reason: str) -> None:
         pos = self.open_positions.pop(mint, None)
@@ -399,4 +383,6 @@ class A2LiveRunner:
             wins=self.stats.positions_closed_win,
             losses=self.stats.positions_closed_loss,
             realized_pnl_sol=f"{self.stats.realized_pnl_sol:+.4f}",
+            enrich_latency={src: h.summary() for src, h in self.enricher.latency.items()},
+            screen_stages=self.screener.summary(),
         )
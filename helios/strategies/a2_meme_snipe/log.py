@@ -8,6 +8,12 @@ logs/a2_outcomes.jsonl — one record per harvested outcome:
 
 The harvester keys outcomes back to observations via obs_id. Idempotent: an
 obs_id present in outcomes.jsonl is skipped on re-harvest.
+
+Both files are read through LogStore (helios.data.store.log_store): the
+harvester resumes the shadow log from its cursor, harvested obs_ids come from
+a persisted key index, and old segments roll over into Parquet.
+read_observations()/read_outcomes() return the full history, archived
+segments first.
 """
 from __future__ import annotations
 
@@ -19,6 +25,9 @@ from decimal import Decimal
 from pathlib import Path
 from typing import Any, Iterable
 
+import pyarrow as pa
+
+from helios.data.store.log_store import LogStore
 from helios.strategies.a2_meme_snipe.snapshot import TokenSnapshot
 
 # Default log paths. In Railway with a /data volume mount, HELIOS_LOGS_DIR
@@ -29,6 +38,14 @@ _LOGS_DIR = _os.getenv("HELIOS_LOGS_DIR", "logs")
 SHADOW_LOG_DEFAULT = Path(_LOGS_DIR) / "a2_shadow.jsonl"
 OUTCOMES_LOG_DEFAULT = Path(_LOGS_DIR) / "a2_outcomes.jsonl"
 
+SHADOW_DATASET = "a2_shadow"
+OUTCOMES_DATASET = "a2_outcomes"
+_SHADOW_COLUMNS = {"obs_id": pa.string(), "mint": pa.string(), "filter_decision": pa.string()}
+_OUTCOME_COLUMNS = {
+    "obs_id": pa.string(), "mint": pa.string(), "entry_unix": pa.int64(),
+    "entry_price_usd": pa.float64(), "filter_decision": pa.string(),
+}
+
 
 def _json_default(o: Any) -> Any:
     if isinstance(o, Decimal):
@@ -80,20 +97,20 @@ def write_observation(
     return obs_id
 
 
+def shadow_store(path: Path = SHADOW_LOG_DEFAULT) -> LogStore:
+    return LogStore(path, time_field="timestamp_iso", export_columns=_SHADOW_COLUMNS)
+
+
+def outcomes_store(path: Path = OUTCOMES_LOG_DEFAULT) -> LogStore:
+    return LogStore(path, time_field="harvested_iso", export_columns=_OUTCOME_COLUMNS)
+
+
 def read_observations(path: Path = SHADOW_LOG_DEFAULT) -> Iterable[dict]:
-    if not path.exists():
-        return []
-    out = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                out.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    return out
+    return shadow_store(path).read_all()
+
+
+def count_observations(path: Path = SHADOW_LOG_DEFAULT) -> int:
+    return shadow_store(path).count()
 
 
 def write_outcome(record: dict, path: Path = OUTCOMES_LOG_DEFAULT) -> None:
@@ -103,20 +120,12 @@ def write_outcome(record: dict, path: Path = OUTCOMES_LOG_DEFAULT) -> None:
 
 
 def read_outcomes(path: Path = OUTCOMES_LOG_DEFAULT) -> Iterable[dict]:
-    if not path.exists():
-        return []
-    out = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                out.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    return out
+    return outcomes_store(path).read_all()
+
+
+def count_outcomes(path: Path = OUTCOMES_LOG_DEFAULT) -> int:
+    return outcomes_store(path).count()
 
 
 def harvested_obs_ids(path: Path = OUTCOMES_LOG_DEFAULT) -> set[str]:
-    return {r["obs_id"] for r in read_outcomes(path) if "obs_id" in r}
+    return outcomes_store(path).keys("obs_id", lambda r: r.get("obs_id"))
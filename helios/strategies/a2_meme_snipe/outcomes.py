@@ -11,21 +11,28 @@ Key metrics:
     time_to_2x_sec     seconds from T until first bar whose high >= 2 * entry
     time_to_peak_sec   seconds from T until the bar with max high
 
+compute_outcome() is the scalar reference for one window. The harvester uses
+compute_outcomes_batch(): every window of every observation on one candle
+array in a single vectorized sweep (see its docstring).
+
 Honest slippage: the metrics use raw prices. The runner overlays a slippage
 budget per leg (default 10% in / 10% out for memecoins) when computing the
 "realized would-have-pnl" report.
 """
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass(frozen=True, slots=True)
 class Candle:
     unix_time: int
     o: float
     h: float
-    l: float
+    l: float  # noqa: E741 - o/h/l/c/v, as Birdeye names them
     c: float
     v: float
 
@@ -102,6 +109,139 @@ def compute_outcome(candles: list[Candle], entry_unix: int, entry_price: float)
     )
 
 
+@dataclass(frozen=True, slots=True)
+class CandleColumns:
+    """Columnar candles, sorted by time."""
+    time: np.ndarray  # int64 unix seconds
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+
+    @classmethod
+    def from_birdeye(cls, items: Sequence[dict]) -> CandleColumns:
+        n = len(items)
+        time = np.fromiter((int(it["unixTime"]) for it in items), dtype=np.int64, count=n)
+        high = np.fromiter((float(it["h"]) for it in items), dtype=np.float64, count=n)
+        low = np.fromiter((float(it["l"]) for it in items), dtype=np.float64, count=n)
+        close = np.fromiter((float(it["c"]) for it in items), dtype=np.float64, count=n)
+        if n > 1 and np.any(time[1:] < time[:-1]):
+            order = np.argsort(time, kind="stable")
+            time, high, low, close = time[order], high[order], low[order], close[order]
+        return cls(time=time, high=high, low=low, close=close)
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+
+@dataclass(frozen=True, slots=True)
+class WindowOutcome:
+    outcome: Outcome
+    target_stop: float  # policy_fixed_target_stop over the window
+    trailing: float     # policy_trailing_stop over the window
+
+
+def compute_outcomes_batch(
+    candles: CandleColumns,
+    entries: Sequence[tuple[int, float]],
+    windows: Mapping[str, int],
+    target_mult: float = 3.0,
+    stop_pct: float = 0.5,
+    trail_pct: float = 0.5,
+) -> list[dict[str, WindowOutcome]]:
+    """Every window of every (entry_unix, entry_price) observation at once.
+
+    Window `label` of an observation covers candles with
+    entry_unix <= unix_time <= entry_unix + windows[label]; a window with no
+    candles (or an entry price <= 0) is absent from that observation's dict.
+    Values equal compute_outcome() and the policy_* functions on the same
+    window exactly.
+
+    Each observation's longest window is gathered into one padded row
+    (highs pad with -inf, lows with +inf). Running max/min along the row
+    give every window's extremes by indexing at its last bar, and first-hit
+    bars (2x, target, stop, peak) are counts of the running extremes below
+    or above the level — so the work is one pass over the candles per
+    observation, shared by all windows and fields.
+    """
+    out: list[dict[str, WindowOutcome]] = [{} for _ in entries]
+    if not len(candles) or not entries or not windows:
+        return out
+    labels = list(windows)
+    secs = np.array([windows[k] for k in labels], dtype=np.int64)
+    entry_unix = np.array([int(u) for u, _ in entries], dtype=np.int64)
+    entry = np.array([float(p) for _, p in entries], dtype=np.float64)
+    ok = np.flatnonzero(entry > 0)
+    if not len(ok):
+        return out
+    entry_unix, entry = entry_unix[ok], entry[ok]
+
+    t = candles.time
+    start = np.searchsorted(t, entry_unix, side="left")                        # (m,)
+    stop = np.searchsorted(t, entry_unix[:, None] + secs[None, :], side="right")  # (m, k)
+    last = stop - start[:, None] - 1                   # row index of each window's last bar; -1 = empty
+    width = int(max(1, last.max() + 1))
+    idx = start[:, None] + np.arange(width)
+    real = idx < stop.max(axis=1, keepdims=True)
+    idx = np.minimum(idx, len(t) - 1)
+    high = np.where(real, candles.high[idx], -np.inf)
+    low = np.where(real, candles.low[idx], np.inf)
+    cum_h = np.maximum.accumulate(high, axis=1)
+    cum_l = np.minimum.accumulate(low, axis=1)
+
+    e = entry[:, None]
+    rows = np.arange(len(entry))[:, None]
+    at = np.maximum(last, 0)
+    max_high = cum_h[rows, at]
+    min_low = cum_l[rows, at]
+    final_close = candles.close[np.minimum(start[:, None] + at, len(t) - 1)]
+    window_unix = t[np.minimum(start[:, None] + at, len(t) - 1)]
+
+    first_2x = np.count_nonzero(cum_h < 2.0 * e, axis=1)[:, None]               # (m, 1)
+    peak = np.count_nonzero(cum_h[:, None, :] < max_high[:, :, None], axis=2)   # (m, k)
+    tgt = np.count_nonzero(cum_h < e * target_mult, axis=1)[:, None]
+    stp = np.count_nonzero(cum_l > e * (1.0 - stop_pct), axis=1)[:, None]
+    trig = np.maximum(e, cum_h) * (1.0 - trail_pct)
+    trail_hit = low <= trig
+    trail_at = np.argmax(trail_hit, axis=1)
+    trail_any = trail_hit[rows[:, 0], trail_at]
+    trail_ret = (trig[rows[:, 0], trail_at] - entry) / entry
+
+    max_pump = (max_high - e) / e
+    max_dump = np.maximum(0.0, (e - min_low) / e)
+    final = (final_close - e) / e
+    target_stop = np.where(tgt <= last, target_mult - 1.0, final)
+    target_stop = np.where((stp <= last) & (stp <= tgt), -stop_pct, target_stop)
+    trailing = np.where(trail_any[:, None] & (trail_at[:, None] <= last), trail_ret[:, None], final)
+
+    for j, obs in enumerate(ok.tolist()):
+        eu, ep = int(entry_unix[j]), float(entry[j])
+        for k, label in enumerate(labels):
+            n = int(last[j, k]) + 1
+            if n <= 0:
+                continue
+            mh = float(max_high[j, k])
+            t2x = int(first_2x[j, 0])
+            out[obs][label] = WindowOutcome(
+                outcome=Outcome(
+                    entry_price=ep,
+                    entry_unix=eu,
+                    window_unix=int(window_unix[j, k]),
+                    n_candles=n,
+                    final_pct=float(final[j, k]),
+                    max_pump_pct=float(max_pump[j, k]),
+                    max_dump_pct=float(max_dump[j, k]),
+                    hit_2x=mh >= 2.0 * ep,
+                    hit_5x=mh >= 5.0 * ep,
+                    hit_10x=mh >= 10.0 * ep,
+                    time_to_2x_sec=int(t[start[j] + t2x]) - eu if t2x < n else None,
+                    time_to_peak_sec=int(t[start[j] + int(peak[j, k])]) - eu,
+                ),
+                target_stop=float(target_stop[j, k]),
+                trailing=float(trailing[j, k]),
+            )
+    return out
+
+
 # -------- Exit-policy simulators (operate on the same candle series) --------
 
 def policy_buy_and_hold(outcome: Outcome) -> float:
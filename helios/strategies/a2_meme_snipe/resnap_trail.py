@@ -23,10 +23,10 @@ import os
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
 
 from helios.data.adapters.dexscreener import DexScreenerAdapter
 from helios.ops import get_logger
+from helios.strategies.a2_meme_snipe.enricher import EnrichmentCache, shared_enrichment_cache
 
 log = get_logger(__name__)
 
@@ -98,15 +98,19 @@ def _collect_tokens_to_resnap(
 
 
 async def resnap_once(
-    dex: Optional[DexScreenerAdapter] = None,
+    dex: DexScreenerAdapter | None = None,
     shadow_path: Path = A2_SHADOW_PATH,
     trail_path: Path = TRAIL_PATH,
+    cache: EnrichmentCache | None = None,
 ) -> dict[str, int]:
     """Single pass: for each token in the last 24h, fetch fresh DexScreener
-    state and append to the trail file.
+    state and append to the trail file. Fetches go through the enrichment
+    cache (process-wide by default), so a mint the shadow or live path just
+    snapshotted is not fetched twice.
     """
     own_dex = dex is None
     dex = dex or DexScreenerAdapter()
+    cache = cache or shared_enrichment_cache()
     seen = _read_existing(trail_path)
     counts = {"resnapped": 0, "skipped_done": 0, "failed": 0, "no_data": 0}
     now = datetime.now(timezone.utc)
@@ -122,7 +126,7 @@ async def resnap_once(
                 counts["skipped_done"] += 1
                 continue
             try:
-                snap = await dex.fetch_token_snapshot(mint)
+                snap = await cache.get("dexscreener", mint, lambda mint=mint: dex.fetch_token_snapshot(mint))
             except Exception as e:  # noqa: BLE001
                 log.warning("resnap_failed", mint=mint, error=str(e))
                 counts["failed"] += 1
@@ -25,6 +25,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
+from typing import Protocol
 
 from helios.strategies.a2_meme_snipe.snapshot import TokenSnapshot
 
@@ -86,6 +87,20 @@ class FilterReport:
         return self.decision == FilterDecision.PASS
 
 
+class TokenAuthorities(Protocol):
+    """The mint-account fields the K-bucket reads. Both TokenSnapshot and the
+    Helius MintAuthorityInfo have them, so authorities can be screened before
+    any market data is fetched."""
+    mint_authority_renounced: bool
+    freeze_authority_renounced: bool
+    has_permanent_delegate: bool
+    has_transfer_hook: bool
+    has_mint_close_authority: bool
+    default_state_frozen: bool
+    transfer_fee_basis_points: int
+    is_non_transferable: bool
+
+
 class RugFilter:
     """Apply the full check battery. Short-circuits at first hard-reject (K-bucket)
     but collects ALL failing checks otherwise — useful for shadow-mode audit
@@ -95,33 +110,58 @@ class RugFilter:
     def __init__(self, config: FilterConfig | None = None) -> None:
         self.config = config or FilterConfig()
 
+    def check_authorities(self, token: TokenAuthorities) -> FilterReport:
+        """The mint-account half of the K-bucket (K01, K02, K05-K10) alone.
+
+        Any REJECT here is also a REJECT from check() on the full snapshot,
+        so callers can stop before paying for market or holder data. PASS only
+        means these checks passed; LP lock (K03/K04) needs market data.
+        """
+        reason = self._renounce_reason(token) or self._extension_reason(token)
+        if reason is not None:
+            return FilterReport(FilterDecision.REJECT, (reason,))
+        return FilterReport(FilterDecision.PASS, ())
+
+    def _renounce_reason(self, token: TokenAuthorities) -> str | None:
+        cfg = self.config
+        if cfg.require_mint_renounced and not token.mint_authority_renounced:
+            return "K01_mint_authority_active"
+        if cfg.require_freeze_renounced and not token.freeze_authority_renounced:
+            return "K02_freeze_authority_active"
+        return None
+
+    def _extension_reason(self, token: TokenAuthorities) -> str | None:
+        """Token-2022 dangerous-extension short-circuits."""
+        cfg = self.config
+        if token.has_permanent_delegate:
+            return "K05_permanent_delegate_set_honeypot"
+        if token.has_transfer_hook:
+            return "K06_transfer_hook_set_sell_block_risk"
+        if token.has_mint_close_authority:
+            return "K07_mint_close_authority_set"
+        if token.default_state_frozen:
+            return "K08_default_state_frozen_honeypot"
+        if token.is_non_transferable:
+            return "K10_non_transferable_hard_honeypot"
+        if token.transfer_fee_basis_points > cfg.max_transfer_fee_basis_points:
+            return f"K09_transfer_fee_{token.transfer_fee_basis_points}_bps_above_{cfg.max_transfer_fee_basis_points}_bps"
+        return None
+
     def check(self, snap: TokenSnapshot) -> FilterReport:
         cfg = self.config
         reasons: list[str] = []
 
         # ---- K: Authorities (hard rejects, evaluated first) ----
-        if cfg.require_mint_renounced and not snap.mint_authority_renounced:
-            return FilterReport(FilterDecision.REJECT, ("K01_mint_authority_active",))
-        if cfg.require_freeze_renounced and not snap.freeze_authority_renounced:
-            return FilterReport(FilterDecision.REJECT, ("K02_freeze_authority_active",))
-        if cfg.require_lp_locked and not snap.lp_locked_or_burned:
-            return FilterReport(FilterDecision.REJECT, ("K03_lp_not_locked",))
-        if snap.lp_lock_pct < cfg.min_lp_lock_pct:
-            return FilterReport(FilterDecision.REJECT, (f"K04_lp_lock_pct_{snap.lp_lock_pct:.2f}_below_{cfg.min_lp_lock_pct:.2f}",))
-
-        # Token-2022 dangerous-extension short-circuits
-        if snap.has_permanent_delegate:
-            return FilterReport(FilterDecision.REJECT, ("K05_permanent_delegate_set_honeypot",))
-        if snap.has_transfer_hook:
-            return FilterReport(FilterDecision.REJECT, ("K06_transfer_hook_set_sell_block_risk",))
-        if snap.has_mint_close_authority:
-            return FilterReport(FilterDecision.REJECT, ("K07_mint_close_authority_set",))
-        if snap.default_state_frozen:
-            return FilterReport(FilterDecision.REJECT, ("K08_default_state_frozen_honeypot",))
-        if snap.is_non_transferable:
-            return FilterReport(FilterDecision.REJECT, ("K10_non_transferable_hard_honeypot",))
-        if snap.transfer_fee_basis_points > cfg.max_transfer_fee_basis_points:
-            return FilterReport(FilterDecision.REJECT, (f"K09_transfer_fee_{snap.transfer_fee_basis_points}_bps_above_{cfg.max_transfer_fee_basis_points}_bps",))
+        reason = self._renounce_reason(snap)
+        if reason is None:
+            if cfg.require_lp_locked and not snap.lp_locked_or_burned:
+                reason = "K03_lp_not_locked"
+            elif snap.lp_lock_pct < cfg.min_lp_lock_pct:
+                reason = f"K04_lp_lock_pct_{snap.lp_lock_pct:.2f}_below_{cfg.min_lp_lock_pct:.2f}"
+            else:
+                reason = self._extension_reason(snap)
+        if reason is not None:
+            return FilterReport(FilterDecision.REJECT, (reason,))
 
         # ---- L: Liquidity ----
         if snap.liquidity_usd < cfg.min_liquidity_usd:
@@ -0,0 +1,138 @@
+"""StagedScreener — RugFilter decisions that stop paying for data once a token fails.
+
+Full enrichment fetches DexScreener, Helius mint + asset info and Birdeye
+holders for every new pool, then lets the RugFilter reject most of them on
+the first authority check. The screener asks in cost order instead:
+
+  authority  Helius mint account only -> RugFilter.check_authorities()
+             (K01 mint / K02 freeze authority, K05-K10 Token-2022 traps).
+  market     DexScreener + Helius asset info, concurrently. The full filter
+             runs with holder concentration still UNKNOWN; any reject that is
+             not a C-bucket (concentration) code is final.
+  holders    Birdeye top holders (needs the supply from stage 1), then the
+             full filter on the complete snapshot.
+
+Every early reject is one the full filter would also give, and survivors get
+exactly the full filter's verdict, so the set of passing tokens is unchanged.
+The reasons on an early reject are that stage's only: a token stopped at
+"authority" does not list its later L/C/P/M failures. Shadow mode, which
+audits every failing check, keeps using SnapshotEnricher.enrich() + check().
+
+Each stage counts tokens entered and rejected and keeps a latency histogram.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from helios.data.adapters.helius import MintAuthorityInfo
+from helios.ops import get_logger
+from helios.ops.latency import LatencyHistogram
+from helios.strategies.a2_meme_snipe.enricher import SnapshotEnricher, merge_snapshot
+from helios.strategies.a2_meme_snipe.rug_filter import FilterDecision, FilterReport, RugFilter
+from helios.strategies.a2_meme_snipe.snapshot import TokenSnapshot
+
+log = get_logger(__name__)
+
+STAGES = ("authority", "market", "holders")
+
+# What merge_snapshot() records when the mint account can't be read: nothing
+# renounced, no supply (so no holder lookup either).
+_UNKNOWN_MINT = MintAuthorityInfo(
+    mint_authority_renounced=False, freeze_authority_renounced=False, supply=0, decimals=0,
+)
+
+
+@dataclass(slots=True)
+class StageStats:
+    entered: int = 0
+    rejected: int = 0
+    no_data: int = 0  # market stage: DexScreener doesn't track the mint
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def reject_rate(self) -> float:
+        return self.rejected / self.entered if self.entered else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class ScreenResult:
+    """`report` is None when the mint has no DexScreener data at all (the
+    case where enrich() returns None). `snapshot` is the best snapshot built
+    by the stage that decided: None after the authority stage, holder
+    concentration UNKNOWN after the market stage."""
+    stage: str
+    report: FilterReport | None
+    snapshot: TokenSnapshot | None
+
+    @property
+    def passed(self) -> bool:
+        return self.report is not None and self.report.passed
+
+
+class StagedScreener:
+    def __init__(
+        self,
+        enricher: SnapshotEnricher,
+        rug_filter: RugFilter | None = None,
+        prepare: Callable[[TokenSnapshot], TokenSnapshot] | None = None,
+    ) -> None:
+        """`prepare` adjusts each merged snapshot before it is filtered (the
+        live runner uses it to waive the dev-history check)."""
+        self.enricher = enricher
+        self.rug = rug_filter or RugFilter()
+        self.prepare = prepare or (lambda snap: snap)
+        self.stats: dict[str, StageStats] = {stage: StageStats() for stage in STAGES}
+
+    async def screen(self, mint_address: str) -> ScreenResult:
+        e = self.enricher
+
+        stats = self.stats["authority"]
+        stats.entered += 1
+        with stats.latency.time():
+            mint_info = await e.mint_info(mint_address)
+            report = self.rug.check_authorities(mint_info or _UNKNOWN_MINT)
+        if not report.passed:
+            stats.rejected += 1
+            return ScreenResult("authority", report, None)
+
+        stats = self.stats["market"]
+        stats.entered += 1
+        with stats.latency.time():
+            base_snap, asset_info = await asyncio.gather(e.dex_snapshot(mint_address), e.asset_info(mint_address))
+            if base_snap is None:
+                log.info("screen_no_dexscreener", mint=mint_address)
+                stats.no_data += 1
+                return ScreenResult("market", None, None)
+            snap = self.prepare(merge_snapshot(base_snap, mint_info, asset_info))
+            report = self.rug.check(snap)
+            final = tuple(r for r in report.reasons if not r.startswith("C"))
+        if final:
+            stats.rejected += 1
+            return ScreenResult("market", FilterReport(FilterDecision.REJECT, final), snap)
+
+        stats = self.stats["holders"]
+        stats.entered += 1
+        with stats.latency.time():
+            holders = await e.holders(mint_address, mint_info)
+            snap = self.prepare(merge_snapshot(base_snap, mint_info, asset_info, holders))
+            report = self.rug.check(snap)
+        if not report.passed:
+            stats.rejected += 1
+        return ScreenResult("holders", report, snap)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Per stage: entered, rejected, reject rate and latency percentiles."""
+        out: dict[str, dict[str, float]] = {}
+        for stage, s in self.stats.items():
+            lat = s.latency.summary()
+            out[stage] = {
+                "entered": s.entered,
+                "rejected": s.rejected,
+                "no_data": s.no_data,
+                "reject_rate": round(s.reject_rate, 4),
+                "p50_ms": round(lat["p50_ms"], 1),
+                "p99_ms": round(lat["p99_ms"], 1),
+            }
+        return out
@@ -71,3 +71,5 @@ class TokenSnapshot:
     transfer_fee_basis_points: int = 0           # K09 — >100 bps suspect
     is_non_transferable: bool = False            # K10 — HARD HONEYPOT
     is_token_2022: bool = False                  # informational only
+    # Venue the pool trades on (DexScreener dexId: pumpswap, raydium, ...).
+    dex_id: str | None = None
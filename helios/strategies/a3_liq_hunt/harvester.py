@@ -8,7 +8,9 @@ For each row in a3_shadow.jsonl with signal != None:
   4. Write to a3_outcomes.jsonl
 
 Idempotent: skips signals already in a3_outcomes.jsonl by their (timestamp, symbol)
-key. Safe to re-run.
+key. Safe to re-run. Both logs are read through LogStore: the shadow log resumes
+from the harvester's cursor and the harvested keys come from a persisted index,
+so a cycle parses only new and still-pending rows.
 """
 from __future__ import annotations
 
@@ -20,13 +22,24 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
+import pyarrow as pa
+
 from helios.data.adapters.kraken_futures import KrakenFuturesMarketData
+from helios.data.harvest_engine import FetchJob, HarvestEngine
+from helios.data.store.candle_cache import default_candle_cache
+from helios.data.store.log_store import LogStore
 from helios.ops import get_logger
 
 log = get_logger(__name__)
 
 A3_SHADOW_PATH = Path(os.getenv("HELIOS_LOGS_DIR", "logs")) / "a3_shadow.jsonl"
 A3_OUTCOMES_PATH = Path(os.getenv("HELIOS_LOGS_DIR", "logs")) / "a3_outcomes.jsonl"
+A3_SHADOW_DATASET = "a3_shadow"
+A3_OUTCOMES_DATASET = "a3_outcomes"
+_OUTCOME_COLUMNS = {
+    "signal_timestamp_iso": pa.string(), "symbol": pa.string(), "variant": pa.string(),
+    "exit_reason": pa.string(), "realized_r_multiple": pa.float64(),
+}
 
 # Kraken symbol map matches A3 runner
 SYMBOLS_MAP = {
@@ -59,21 +72,18 @@ def _key_of(record: dict) -> str:
     return f"{record.get('timestamp_iso','')}|{record.get('symbol','')}"
 
 
+def shadow_store(path: Path = A3_SHADOW_PATH) -> LogStore:
+    return LogStore(path, time_field="timestamp_iso", export_columns={"symbol": pa.string()})
+
+
+def outcomes_store(path: Path = A3_OUTCOMES_PATH) -> LogStore:
+    return LogStore(path, time_field="harvested_iso", export_columns=_OUTCOME_COLUMNS)
+
+
 def _read_existing_outcomes(path: Path = A3_OUTCOMES_PATH) -> set[str]:
-    if not path.exists():
-        return set()
-    seen: set[str] = set()
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                rec = json.loads(line)
-                seen.add(f"{rec.get('signal_timestamp_iso','')}|{rec.get('symbol','')}")
-            except json.JSONDecodeError:
-                continue
-    return seen
+    return outcomes_store(path).keys(
+        "signal_key", lambda rec: f"{rec.get('signal_timestamp_iso','')}|{rec.get('symbol','')}",
+    )
 
 
 def _write_outcome(rec: dict, path: Path = A3_OUTCOMES_PATH) -> None:
@@ -160,59 +170,71 @@ async def harvest_a3(
     outcomes_path: Path = A3_OUTCOMES_PATH,
     kraken: Optional[KrakenFuturesMarketData] = None,
     window_hours: int = OUTCOME_WINDOW_HOURS,
+    concurrency: int = 4,
+    retries: int = 2,
 ) -> dict[str, int]:
-    """Walk a3_shadow.jsonl, harvest matured signal outcomes. Idempotent."""
+    """Walk a3_shadow.jsonl, harvest matured signal outcomes. Idempotent.
+
+    Signals on the same symbol with overlapping windows share one bars fetch
+    (HarvestEngine); requests are paced by the shared Kraken Futures bucket."""
     if not shadow_path.exists():
         return {"processed": 0, "skipped_recent": 0, "skipped_no_signal": 0,
                 "skipped_done": 0, "failed": 0}
 
     own_kraken = kraken is None
-    kraken = kraken or KrakenFuturesMarketData()
+    kraken = kraken or KrakenFuturesMarketData(cache=default_candle_cache())
     seen = _read_existing_outcomes(outcomes_path)
     counts = {"processed": 0, "skipped_recent": 0, "skipped_no_signal": 0,
               "skipped_done": 0, "failed": 0}
     now = datetime.now(timezone.utc)
 
-    try:
-        with shadow_path.open("r", encoding="utf-8") as f:
-            rows = [json.loads(line) for line in f if line.strip()]
+    batch = shadow_store(shadow_path).resume("a3_harvest")
+    jobs: list[FetchJob] = []
+    for position, rec in batch.rows:
+        key = _key_of(rec)
+        if key in seen:
+            counts["skipped_done"] += 1
+            batch.done(position)
+            continue
+        signal = rec.get("signal")
+        if not signal:
+            counts["skipped_no_signal"] += 1
+            batch.done(position)
+            continue
+        try:
+            signal_time = datetime.fromisoformat(rec["timestamp_iso"])
+        except (ValueError, KeyError):
+            counts["failed"] += 1
+            batch.done(position)  # unparseable: retrying can't help
+            continue
+        if (now - signal_time).total_seconds() < MIN_WINDOW_HOURS * 3600:
+            counts["skipped_recent"] += 1
+            continue
+        seen.add(key)
+        symbol = rec.get("symbol", "")
+        end = min(now, signal_time + timedelta(hours=window_hours))
+        jobs.append(FetchJob(SYMBOLS_MAP.get(symbol, f"PF_{symbol}USD"),
+                             int(signal_time.timestamp()), int(end.timestamp()), (position, rec)))
 
-        for rec in rows:
-            key = _key_of(rec)
-            if key in seen:
-                counts["skipped_done"] += 1
-                continue
-            signal = rec.get("signal")
-            if not signal:
-                counts["skipped_no_signal"] += 1
-                continue
-            try:
-                signal_time = datetime.fromisoformat(rec["timestamp_iso"])
-            except (ValueError, KeyError):
-                counts["failed"] += 1
-                continue
-            if (now - signal_time).total_seconds() < MIN_WINDOW_HOURS * 3600:
-                counts["skipped_recent"] += 1
-                continue
+    async def fetch(kraken_sym: str, start: int, end: int) -> list:
+        return await kraken.fetch_bars(kraken_sym, "5m", datetime.fromtimestamp(start, timezone.utc),
+                                       datetime.fromtimestamp(end, timezone.utc))
 
+    engine = HarvestEngine(fetch, time_of=lambda bar: bar.event_time.timestamp(),
+                           name="a3_harvest", concurrency=concurrency, retries=retries)
+    try:
+        async for result in engine.stream(jobs):
+            position, rec = result.job.tag
             symbol = rec.get("symbol", "")
-            kraken_sym = SYMBOLS_MAP.get(symbol, f"PF_{symbol}USD")
-            current_price = float(rec.get("current_price", 0))
-            try:
-                bars = await kraken.fetch_bars(
-                    kraken_sym, "5m",
-                    signal_time,
-                    min(now, signal_time + timedelta(hours=window_hours)),
-                )
-            except Exception as e:  # noqa: BLE001
-                log.warning("a3_harvest_bars_failed", symbol=symbol, error=str(e))
+            if result.error is not None:
+                log.warning("a3_harvest_bars_failed", symbol=symbol, error=result.error)
                 counts["failed"] += 1
                 continue
-            if not bars:
+            if not result.items:
                 counts["failed"] += 1
                 continue
-
-            outcome = _simulate_outcome(bars, signal, current_price, symbol, rec["timestamp_iso"])
+            current_price = float(rec.get("current_price", 0))
+            outcome = _simulate_outcome(result.items, rec["signal"], current_price, symbol, rec["timestamp_iso"])
             if outcome is None:
                 counts["failed"] += 1
                 continue
@@ -221,7 +243,8 @@ async def harvest_a3(
                 "harvested_iso": now.isoformat(),
             }, outcomes_path)
             counts["processed"] += 1
-            seen.add(key)
+            batch.done(position)
+        batch.commit()
     finally:
         if own_kraken:
             await kraken.close()
@@ -3,16 +3,67 @@
 Given a stream of mention events (each: ticker + timestamp + source + maybe
 content), maintain rolling stats and emit signals when mention velocity
 accelerates ahead of price.
+
+Design:
+  - Each ticker keeps its mentions in ingest order in a bounded deque,
+    pruned from the head when a new mention lands (the original retention
+    rules). _score() evaluates that deque with the original per-mention
+    logic, so emitted signals and their fields are exactly what it produces.
+  - The deque is mirrored into a per-ticker ring of minute buckets (weight
+    sum, count, and the raw mentions of that minute), indexed by
+    `minute % ring` and tagged with the minute they hold: a mention is added
+    to its bucket on ingest and removed when the deque drops it. The ring is
+    plain Python lists, so ingest touches no NumPy scalars.
+  - On top of the ring each ticker keeps running moments: the sum and sum
+    of squares of its live bucket weights (minutes from `floor` on), with a
+    bound on the rounding error of each. A screen takes out the few buckets
+    it must not count as whole minutes (the two cut by the baseline/signal
+    edges, which go back in from their raw mentions, and the signal minutes
+    after the cut) and retires the minutes that fell out of the baseline,
+    so it is O(1) per ticker, amortized. evaluate() screens one ticker with
+    scalar math; evaluate_all() gathers the per-ticker moments and screens
+    every ticker in one NumPy pass.
+  - A mention the ring cannot place (its slot holds a newer minute, e.g. an
+    out-of-order straggler) is counted as spilled, and so is a bucket pushed
+    out by a newer minute while its mentions are still in the deque. A
+    ticker with spilled mentions, with mentions stamped past the window
+    being screened (clock skew), or screened at a `now` before its floor
+    skips screening and goes to _score().
+  - The screen rejects only when the error bounds (plus a relative margin
+    for the reference's own arithmetic) show _score() returns None. A
+    survivor (rare: a spike above the z threshold) first checks the price
+    correlation gate from the ring, which gives bit-identical minute sums;
+    only a ticker that can still fire is re-scored over its deque.
 """
 from __future__ import annotations
 
+import math
 from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from statistics import mean, pstdev
+from typing import Any
 
 import numpy as np
 
+# Extra ring slots for mentions stamped ahead of `now` (clock skew between
+# sources); mentions further ahead send their ticker straight to _score().
+_FUTURE_MINUTES = 2
+# Screening rejects only when it is this far (relative) on the wrong side of a threshold.
+_SCREEN_MARGIN = 1e-9
+# Twice the unit roundoff: a bound on the relative error of one float operation.
+_ULP = 2.0 ** -52
+# The variance lower bound gives up this much (relative) for its own rounding.
+_VAR_SLACK = 4 * _ULP
+# A ticker's running moments are recomputed from its ring once their error
+# bounds pass this fraction of their size.
+_RESYNC = 1e-12
+# The correlation gate looks back this far (seconds).
+_CORR_WINDOW = 600
+# _score()'s `corr` default: compute the correlation from the deque.
+_UNSET: Any = object()
+
 
 @dataclass(frozen=True, slots=True)
 class MentionEvent:
@@ -39,18 +90,46 @@ class SentimentSignal:
 @dataclass
 class _TickerState:
     ticker: str
-    # Sliding window of (unix_seconds, weight, source) per mention
+    # (unix_seconds, weight, source) per mention, in ingest order
     mentions: deque = field(default_factory=lambda: deque(maxlen=10_000))
+    # The ring of minute buckets: per slot, the minute held (-1: none), its
+    # weight sum and count, and the mentions themselves in ingest order
+    tags: list[int] = field(default_factory=list)
+    weights: list[float] = field(default_factory=list)
+    counts: list[int] = field(default_factory=list)
+    slots: list[deque] = field(default_factory=list)
+    spilled: int = 0              # mentions in `mentions` that no bucket holds
+    dirty: set[int] = field(default_factory=set)  # slots whose weight sum needs a recount
+    newest: int = -1              # newest minute ever bucketed
+    # Running moments of the live buckets (minute >= floor): weight sum and
+    # sum of squares, a bound on the rounding error of each, and how many
+    # live buckets hold mentions
+    floor: int = 0
+    s1: float = 0.0
+    s2: float = 0.0
+    e1: float = 0.0
+    e2: float = 0.0
+    filled: int = 0
     # Price observations for correlation calc (timestamp, price)
     prices: deque = field(default_factory=lambda: deque(maxlen=600))
     last_signal_unix: float = 0.0  # cooldown
 
+    def shift(self, old: float, new: float) -> None:
+        """Replace a live bucket weight `old` with `new` in the running moments."""
+        d1 = new - old
+        self.s1 += d1
+        self.e1 += _ULP * (abs(d1) + abs(self.s1))
+        d2 = new * new - old * old
+        self.s2 += d2
+        self.e2 += _ULP * (new * new + old * old + abs(d2) + abs(self.s2))
+
 
 class SentimentDetector:
     """Stateful per-ticker mention-velocity tracker.
 
-    Memory: holds last ~1h of mentions for each ticker we've seen. With ~10k
-    cap per ticker, hundreds of tickers, total memory is small (< 50 MB).
+    Memory: holds last ~1h of mentions for each ticker we've seen, plus one
+    ring of minute buckets over them. Hundreds of tickers stay small
+    (< 50 MB).
     """
 
     def __init__(
@@ -71,28 +150,120 @@ class SentimentDetector:
         self.max_price_correlation = max_price_correlation
         self.suggested_hold_seconds = suggested_hold_seconds
         self._tickers: dict[str, _TickerState] = {}
+        # Slots cover the baseline (or the 10-min correlation window, if longer)
+        # back from the newest mention, plus the future allowance.
+        self._ring = math.ceil(max(baseline_window_seconds, 600) / 60) + 1 + _FUTURE_MINUTES
+
+    def _state(self, ticker: str) -> _TickerState:
+        state = self._tickers.get(ticker)
+        if state is None:
+            ring = self._ring
+            state = _TickerState(ticker=ticker, tags=[-1] * ring, weights=[0.0] * ring,
+                                 counts=[0] * ring, slots=[deque() for _ in range(ring)])
+            self._tickers[ticker] = state
+        return state
 
     # ----- Ingestion -----
 
     def ingest_mention(self, ev: MentionEvent) -> None:
-        ticker = ev.ticker.upper().lstrip("$")
-        if ticker not in self._tickers:
-            self._tickers[ticker] = _TickerState(ticker=ticker)
-        state = self._tickers[ticker]
+        state = self._state(ev.ticker.upper().lstrip("$"))
         unix = ev.timestamp.timestamp()
-        state.mentions.append((unix, ev.weight, ev.source))
+        if len(state.mentions) == state.mentions.maxlen:
+            self._unbucket(state, state.mentions[0])  # append() evicts it
+        mention = (unix, ev.weight, ev.source)
+        state.mentions.append(mention)
+        self._bucket(state, mention)
         # Prune mentions older than the baseline window
         cutoff = unix - self.baseline_window
         while state.mentions and state.mentions[0][0] < cutoff:
-            state.mentions.popleft()
+            self._unbucket(state, state.mentions.popleft())
+
+    def _bucket(self, state: _TickerState, mention: tuple[float, float, str]) -> None:
+        minute = int(mention[0] // 60)
+        slot = minute % self._ring
+        tag = state.tags[slot]
+        if tag != minute:
+            if tag > minute:
+                state.spilled += 1  # the slot holds a newer minute
+                return
+            # A newer minute takes the slot; any mentions still held there spill
+            state.spilled += state.counts[slot]
+            if tag >= state.floor:
+                if state.counts[slot]:
+                    state.filled -= 1
+                state.shift(state.weights[slot], 0.0)
+            state.tags[slot] = minute
+            state.weights[slot] = 0.0
+            state.counts[slot] = 0
+            state.slots[slot].clear()
+            state.dirty.discard(slot)
+            if minute > state.newest:
+                state.newest = minute
+        old = state.weights[slot]
+        state.weights[slot] = old + mention[1]
+        if minute >= state.floor:
+            if not state.counts[slot]:
+                state.filled += 1
+            state.shift(old, old + mention[1])
+        state.counts[slot] += 1
+        state.slots[slot].append(mention)
+
+    def _unbucket(self, state: _TickerState, mention: tuple[float, float, str]) -> None:
+        minute = int(mention[0] // 60)
+        slot = minute % self._ring
+        if state.tags[slot] != minute:
+            state.spilled -= 1
+            return
+        # Mentions leave in ingest order, so this one heads its bucket. The
+        # weight sum is recounted before the next screen rather than
+        # decremented, so it stays bit-identical to summing in ingest order.
+        state.slots[slot].popleft()
+        state.counts[slot] -= 1
+        if not state.counts[slot] and minute >= state.floor:
+            state.filled -= 1
+        state.dirty.add(slot)
+
+    @staticmethod
+    def _recount(state: _TickerState) -> None:
+        for slot in state.dirty:
+            w = 0.0
+            for _, wt, _ in state.slots[slot]:
+                w += wt  # sequential, as _score() sums a minute; sum() compensates
+            if state.tags[slot] >= state.floor:
+                state.shift(state.weights[slot], w)
+            state.weights[slot] = w
+        state.dirty.clear()
+
+    def _retire(self, state: _TickerState, first: int) -> None:
+        """Move the floor up to `first`: older buckets leave the running moments."""
+        ring, tags = self._ring, state.tags
+        if first - state.floor < ring:
+            live = (m % ring for m in range(state.floor, first) if tags[m % ring] == m)
+        else:
+            live = (slot for slot in range(ring) if state.floor <= tags[slot] < first)
+        for slot in live:
+            if state.counts[slot]:
+                state.filled -= 1
+            state.shift(state.weights[slot], 0.0)
+        state.floor = first
+
+    def _resync(self, state: _TickerState) -> None:
+        """Recompute the running moments from the ring, resetting their error bounds."""
+        s1 = s2 = a1 = 0.0
+        for slot in range(self._ring):
+            if state.tags[slot] >= state.floor:
+                w = state.weights[slot]
+                s1 += w
+                s2 += w * w
+                a1 += abs(w)
+        state.s1, state.s2 = s1, s2
+        state.e1 = _ULP * self._ring * a1
+        state.e2 = 2 * _ULP * self._ring * s2
 
     def ingest_price(self, ticker: str, price: float, ts: datetime | None = None) -> None:
         """Record a price observation. Used for the correlation gate only.
         Optional — if no prices ingested, correlation check is skipped."""
-        ticker = ticker.upper().lstrip("$")
-        if ticker not in self._tickers:
-            self._tickers[ticker] = _TickerState(ticker=ticker)
-        state = self._tickers[ticker]
+        state = self._state(ticker.upper().lstrip("$"))
         ts = ts or datetime.now(timezone.utc)
         unix = ts.timestamp()
         state.prices.append((unix, float(price)))
@@ -103,23 +274,209 @@ class SentimentDetector:
     # ----- Signal emission -----
 
     def evaluate(self, ticker: str, now: datetime | None = None) -> SentimentSignal | None:
-        ticker = ticker.upper().lstrip("$")
-        state = self._tickers.get(ticker)
+        state = self._tickers.get(ticker.upper().lstrip("$"))
         if state is None or not state.mentions:
             return None
+        now = now or datetime.now(timezone.utc)
+        if not self._screen_one(state, now.timestamp()):
+            return None
+        return self._emit(state, now)
 
+    def evaluate_all(
+        self, now: datetime | None = None, tickers: Iterable[str] | None = None,
+    ) -> list[SentimentSignal]:
+        """evaluate() every ticker (or just `tickers`) at `now`; signals in ticker order."""
+        if tickers is None:
+            states = [s for s in self._tickers.values() if s.mentions]
+        else:
+            found = (self._tickers.get(t.upper().lstrip("$")) for t in tickers)
+            states = [s for s in found if s is not None and s.mentions]
+        if not states:
+            return []
         now = now or datetime.now(timezone.utc)
+        passed = self._screen(states, now.timestamp())
+        signals = (self._emit(s, now) for s, ok in zip(states, passed, strict=True) if ok)
+        return [sig for sig in signals if sig is not None]
+
+    def _emit(self, state: _TickerState, now: datetime) -> SentimentSignal | None:
+        """_score() a screen survivor, unless the ring already shows the
+        correlation gate rejects it (then _score() would return None too)."""
+        known, corr = self._ring_correlation(state, now.timestamp())
+        if not known:
+            return self._score(state, now)
+        if corr is not None and abs(corr) >= self.max_price_correlation:
+            return None
+        return self._score(state, now, corr)
+
+    def _moments(
+        self, state: _TickerState, baseline_start: float, baseline_end: float,
+    ) -> tuple[float, float, float, float, int, float, int] | None:
+        """(total, its error bound, sum of squares, its error bound, filled
+        minutes) of the baseline buckets, and the signal window's (weight,
+        mentions); None if the ring cannot see every mention involved."""
+        self._recount(state)
+        ring = self._ring
+        first = int(baseline_start // 60)
+        last = first + ring - 1
+        split = min(int(baseline_end // 60), last)  # the minute cut by baseline_end
+        if state.spilled or state.newest > last or first < state.floor:
+            return None
+        self._retire(state, first)
+        if state.e1 > _RESYNC * (abs(state.s1) + 1.0) or state.e2 > _RESYNC * (abs(state.s2) + 1.0):
+            self._resync(state)
+        tags, weights, counts, slots = state.tags, state.weights, state.counts, state.slots
+        total, e1, sumsq, e2, buckets = state.s1, state.e1, state.s2, state.e2, state.filled
+        sig = 0.0
+        sig_n = 0
+        # Take the edge minutes and the signal minutes out of the live moments;
+        # the edges go back in from their raw mentions.
+        for minute in range(first if first < split else split, last + 1):
+            if first < minute < split:
+                continue
+            slot = minute % ring
+            if tags[slot] != minute or not counts[slot]:
+                continue
+            w = weights[slot]
+            total -= w
+            e1 += _ULP * abs(total)
+            sumsq -= w * w
+            e2 += _ULP * (w * w + abs(sumsq))
+            buckets -= 1
+            if minute > split:
+                sig += w
+                sig_n += counts[slot]
+                continue
+            w = 0.0
+            n = 0
+            for t, wt, _ in slots[slot]:
+                if t >= baseline_end:
+                    sig += wt
+                    sig_n += 1
+                elif t >= baseline_start:
+                    w += wt
+                    n += 1
+            if n:
+                total += w
+                e1 += _ULP * abs(total)
+                sumsq += w * w
+                e2 += _ULP * (w * w + abs(sumsq))
+                buckets += 1
+        return total, e1, sumsq, e2, buckets, sig, sig_n
+
+    def _screen_one(self, state: _TickerState, now_unix: float) -> bool:
+        """_screen() for one ticker, in scalar math."""
+        if now_unix - state.last_signal_unix < self.signal_cooldown:
+            return False
+        baseline_start = now_unix - self.baseline_window
+        baseline_end = now_unix - self.signal_window
+        moments = self._moments(state, baseline_start, baseline_end)
+        if moments is None:
+            return True  # mentions the screen cannot see
+        total, e1, sumsq, e2, buckets, sig, sig_n = moments
+        if (buckets < 5 or not sig_n
+                or total + e1 < self.min_baseline_mentions - _SCREEN_MARGIN * (1.0 + abs(total))):
+            return False
+        baseline_minutes = max(1.0, (baseline_end - baseline_start) / 60.0)
+        size = max(buckets, int(baseline_minutes))  # buckets + zero padding
+        # Bounds over the exact bucket values: mean from below, |mean| and
+        # the spread from above and below
+        mu_lo = (total - e1) / size
+        mu_hi = (abs(total) + e1) / size
+        var_lo = (sumsq - e2) / size - mu_hi * mu_hi
+        var_lo = var_lo - _VAR_SLACK * ((abs(sumsq) + e2) / size + mu_hi * mu_hi)
+        if var_lo <= 0.0:
+            return True  # possibly a uniform baseline: _score() decides
+        std_lo = math.sqrt(var_lo)
+        signal_per_min = sig * (60.0 / self.signal_window)
+        z = max(signal_per_min - mu_lo, 0.0) / std_lo
+        z_slack = _SCREEN_MARGIN * (1.0 + z + (abs(signal_per_min) + mu_hi) / std_lo)
+        return z >= self.z_threshold - z_slack
+
+    def _screen(self, states: list[_TickerState], now_unix: float) -> np.ndarray:
+        """False where _score() certainly returns None; _screen_one() over
+        every ticker, its arithmetic done in one NumPy pass."""
+        baseline_start = now_unix - self.baseline_window
+        baseline_end = now_unix - self.signal_window
+        n = len(states)
+        last_signal = np.fromiter((s.last_signal_unix for s in states), dtype=float, count=n)
+        cooled = now_unix - last_signal >= self.signal_cooldown
+        rows = np.zeros((n, 7))
+        unseen = np.zeros(n, dtype=bool)
+        for i, state in enumerate(states):
+            if not cooled[i]:
+                continue
+            moments = self._moments(state, baseline_start, baseline_end)
+            if moments is None:
+                unseen[i] = True
+            else:
+                rows[i] = moments
+        total, e1, sumsq, e2, buckets, sig, sig_n = rows.T
+
+        baseline_minutes = max(1.0, (baseline_end - baseline_start) / 60.0)
+        size = np.maximum(buckets, int(baseline_minutes))  # buckets + zero padding
+        mu_lo = (total - e1) / size
+        mu_hi = (np.abs(total) + e1) / size
+        var_lo = (sumsq - e2) / size - mu_hi * mu_hi
+        var_lo = var_lo - _VAR_SLACK * ((np.abs(sumsq) + e2) / size + mu_hi * mu_hi)
+        spread = var_lo > 0.0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std_lo = np.sqrt(np.where(spread, var_lo, 1.0))
+            signal_per_min = sig * (60.0 / self.signal_window)
+            z = np.maximum(signal_per_min - mu_lo, 0.0) / std_lo
+            z_slack = _SCREEN_MARGIN * (1.0 + z + (np.abs(signal_per_min) + mu_hi) / std_lo)
+        return cooled & (unseen | (
+            (buckets >= 5)
+            & (sig_n > 0)
+            & (total + e1 >= self.min_baseline_mentions - _SCREEN_MARGIN * (1.0 + np.abs(total)))
+            & (~spread | (z >= self.z_threshold - z_slack))
+        ))
+
+    def _ring_correlation(self, state: _TickerState, now_unix: float) -> tuple[bool, float | None]:
+        """(True, the correlation _score() would compute) from the ring, or
+        (False, None) when the ring cannot see every mention involved."""
+        if len(state.prices) < 5:
+            return True, None
+        window_start = now_unix - _CORR_WINDOW
+        first = int(window_start // 60)
+        if state.spilled or state.newest - first >= self._ring:
+            return False, None
+        self._recount(state)
+        mention_buckets: dict[int, float] = {}
+        for minute in range(first, state.newest + 1):
+            slot = minute % self._ring
+            if state.tags[slot] != minute or not state.counts[slot]:
+                continue
+            if minute > first:
+                mention_buckets[minute] = state.weights[slot]
+                continue
+            w = 0.0
+            n = 0
+            for t, wt, _ in state.slots[slot]:
+                if t >= window_start:
+                    w += wt
+                    n += 1
+            if n:
+                mention_buckets[minute] = w
+        return True, self._bucket_correlation(mention_buckets, state.prices, window_start)
+
+    def _score(
+        self, state: _TickerState, now: datetime, corr: float | None = _UNSET,
+    ) -> SentimentSignal | None:
+        """The reference per-mention evaluation over `state`'s raw mentions.
+        `corr`, if given, is the price correlation already computed for `now`."""
         now_unix = now.timestamp()
 
         # Cooldown
         if now_unix - state.last_signal_unix < self.signal_cooldown:
             return None
 
+        mentions = state.mentions
+
         # Baseline: weighted mentions per minute over [now - baseline_window, now - signal_window]
         baseline_start = now_unix - self.baseline_window
         baseline_end = now_unix - self.signal_window
         baseline_mentions = [
-            (t, w) for (t, w, _) in state.mentions if baseline_start <= t < baseline_end
+            (t, w) for (t, w, _) in mentions if baseline_start <= t < baseline_end
         ]
         baseline_minutes = max(1.0, (baseline_end - baseline_start) / 60.0)
         baseline_weighted_total = sum(w for _, w in baseline_mentions)
@@ -150,7 +507,7 @@ class SentimentDetector:
         # Signal window: weighted mentions in last signal_window seconds
         signal_start = now_unix - self.signal_window
         signal_mentions = [
-            (t, w, s) for (t, w, s) in state.mentions if t >= signal_start
+            (t, w, s) for (t, w, s) in mentions if t >= signal_start
         ]
         if not signal_mentions:
             return None
@@ -163,7 +520,8 @@ class SentimentDetector:
             return None
 
         # Correlation gate: did price already move with mentions in last 10 min?
-        corr = self._compute_mention_price_correlation(state, now_unix)
+        if corr is _UNSET:
+            corr = self._compute_mention_price_correlation(mentions, state.prices, now_unix)
         if corr is not None and abs(corr) >= self.max_price_correlation:
             # Already priced in
             return None
@@ -175,7 +533,7 @@ class SentimentDetector:
 
         state.last_signal_unix = now_unix
         return SentimentSignal(
-            ticker=ticker,
+            ticker=state.ticker,
             z_score=float(z),
             mentions_last_minute=signal_per_min,
             mentions_per_min_baseline=baseline_per_min,
@@ -186,21 +544,30 @@ class SentimentDetector:
             contributing_sources=contributing,
         )
 
-    def _compute_mention_price_correlation(self, state: _TickerState, now_unix: float) -> float | None:
+    @staticmethod
+    def _compute_mention_price_correlation(
+        mentions: list[tuple[float, float, str]], prices: deque, now_unix: float,
+    ) -> float | None:
         """Compute correlation between minute-bucketed mention counts and prices
         over the last 10 minutes. None if not enough data."""
-        if len(state.prices) < 5:
+        if len(prices) < 5:
             return None
-        window_start = now_unix - 600  # 10 min
+        window_start = now_unix - _CORR_WINDOW
         # Bucket mentions and prices into 1-min buckets
         mention_buckets: dict[int, float] = {}
-        for t, w, _ in state.mentions:
+        for t, w, _ in mentions:
             if t < window_start:
                 continue
             b = int(t // 60)
             mention_buckets[b] = mention_buckets.get(b, 0.0) + w
+        return SentimentDetector._bucket_correlation(mention_buckets, prices, window_start)
+
+    @staticmethod
+    def _bucket_correlation(
+        mention_buckets: dict[int, float], prices: deque, window_start: float,
+    ) -> float | None:
         price_buckets: dict[int, list[float]] = {}
-        for t, p in state.prices:
+        for t, p in prices:
             if t < window_start:
                 continue
             b = int(t // 60)
@@ -12,6 +12,10 @@ The ticker-to-mint resolution is the tricky part. Many tickers collide
 We use DexScreener's `/dex/search?q=$WIF` and pick the Solana pair with the
 highest liquidity. We cache the resolution per ticker so we don't re-call
 DexScreener every harvest cycle.
+
+Both logs are read through LogStore: the shadow log resumes from the
+harvester's cursor and the harvested keys come from a persisted index, so a
+cycle parses only new and still-pending rows.
 """
 from __future__ import annotations
 
@@ -24,15 +28,26 @@ from pathlib import Path
 from typing import Optional
 
 import httpx
+import pyarrow as pa
 
 from helios.data.adapters.geckoterminal import GeckoTerminalAdapter
+from helios.data.harvest_engine import FetchJob, HarvestEngine
+from helios.data.store.candle_cache import default_candle_cache
+from helios.data.store.log_store import LogStore
 from helios.ops import get_logger
+from helios.ops.ratelimit import limiter_for
 
 log = get_logger(__name__)
 
 A5_SHADOW_PATH = Path(os.getenv("HELIOS_LOGS_DIR", "logs")) / "a5_shadow.jsonl"
 A5_OUTCOMES_PATH = Path(os.getenv("HELIOS_LOGS_DIR", "logs")) / "a5_outcomes.jsonl"
 A5_TICKER_CACHE = Path(os.getenv("HELIOS_LOGS_DIR", "logs")) / "a5_ticker_to_mint.json"
+A5_SHADOW_DATASET = "a5_shadow"
+A5_OUTCOMES_DATASET = "a5_outcomes"
+_OUTCOME_COLUMNS = {
+    "signal_timestamp_iso": pa.string(), "ticker": pa.string(), "resolved_mint": pa.string(),
+    "exit_reason": pa.string(), "realized_return_pct": pa.float64(),
+}
 
 OUTCOME_WINDOW_HOURS = 4
 MIN_WINDOW_HOURS = 2
@@ -87,6 +102,7 @@ async def _resolve_ticker_to_mint(
     cached = cache.get(ticker)
     if cached:
         return cached
+    await limiter_for("dexscreener").acquire()
     try:
         resp = await client.get(
             "https://api.dexscreener.com/latest/dex/search",
@@ -119,21 +135,18 @@ def _key_of(record: dict) -> str:
     return f"{record.get('timestamp_iso','')}|{sig.get('ticker', record.get('ticker',''))}"
 
 
+def shadow_store(path: Path = A5_SHADOW_PATH) -> LogStore:
+    return LogStore(path, time_field="timestamp_iso")
+
+
+def outcomes_store(path: Path = A5_OUTCOMES_PATH) -> LogStore:
+    return LogStore(path, time_field="harvested_iso", export_columns=_OUTCOME_COLUMNS)
+
+
 def _read_existing(path: Path = A5_OUTCOMES_PATH) -> set[str]:
-    if not path.exists():
-        return set()
-    seen: set[str] = set()
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                rec = json.loads(line)
-                seen.add(f"{rec.get('signal_timestamp_iso','')}|{rec.get('ticker','')}")
-            except json.JSONDecodeError:
-                continue
-    return seen
+    return outcomes_store(path).keys(
+        "signal_key", lambda rec: f"{rec.get('signal_timestamp_iso','')}|{rec.get('ticker','')}",
+    )
 
 
 def _write(rec: dict, path: Path = A5_OUTCOMES_PATH) -> None:
@@ -191,78 +204,105 @@ async def harvest_a5(
     outcomes_path: Path = A5_OUTCOMES_PATH,
     birdeye: Optional[GeckoTerminalAdapter] = None,
     window_hours: int = OUTCOME_WINDOW_HOURS,
+    concurrency: int = 8,
+    retries: int = 2,
 ) -> dict[str, int]:
+    """Walk a5_shadow.jsonl, harvest matured signal outcomes. Idempotent.
+
+    Each distinct ticker is resolved once per cycle; signals on the same mint
+    with overlapping windows then share one OHLCV fetch (HarvestEngine)."""
     if not shadow_path.exists():
         return {"processed": 0, "skipped_recent": 0, "skipped_done": 0,
                 "skipped_no_mint": 0, "failed": 0}
 
     own_birdeye = birdeye is None
-    birdeye = birdeye or GeckoTerminalAdapter()
+    birdeye = birdeye or GeckoTerminalAdapter(cache=default_candle_cache())
     cache = _TickerCache()
     seen = _read_existing(outcomes_path)
     counts = {"processed": 0, "skipped_recent": 0, "skipped_done": 0,
               "skipped_no_mint": 0, "failed": 0}
     now = datetime.now(timezone.utc)
 
+    batch = shadow_store(shadow_path).resume("a5_harvest")
+    matured: list[tuple[int, dict, str, datetime]] = []
+    for position, rec in batch.rows:
+        key = _key_of(rec)
+        if key in seen:
+            counts["skipped_done"] += 1
+            batch.done(position)
+            continue
+        signal = rec.get("signal") or {}
+        if not signal:
+            batch.done(position)
+            continue
+        ticker = (signal.get("ticker") or rec.get("ticker", "")).upper().lstrip("$")
+        if not ticker:
+            batch.done(position)
+            continue
+        try:
+            sig_time = datetime.fromisoformat(rec["timestamp_iso"])
+        except (ValueError, KeyError):
+            counts["failed"] += 1
+            batch.done(position)  # unparseable: retrying can't help
+            continue
+        if (now - sig_time).total_seconds() < MIN_WINDOW_HOURS * 3600:
+            counts["skipped_recent"] += 1
+            continue
+        seen.add(key)
+        matured.append((position, rec, ticker, sig_time))
+
     try:
         async with httpx.AsyncClient(timeout=15.0) as http:
-            with shadow_path.open("r", encoding="utf-8") as f:
-                rows = [json.loads(line) for line in f if line.strip()]
-
-            for rec in rows:
-                key = _key_of(rec)
-                if key in seen:
-                    counts["skipped_done"] += 1
-                    continue
-                signal = rec.get("signal") or {}
-                if not signal:
-                    continue
-                ticker = (signal.get("ticker") or rec.get("ticker", "")).upper().lstrip("$")
-                if not ticker:
-                    continue
-                try:
-                    sig_time = datetime.fromisoformat(rec["timestamp_iso"])
-                except (ValueError, KeyError):
-                    counts["failed"] += 1
-                    continue
-                if (now - sig_time).total_seconds() < MIN_WINDOW_HOURS * 3600:
-                    counts["skipped_recent"] += 1
-                    continue
-
-                mint = await _resolve_ticker_to_mint(ticker, http, cache)
-                if not mint:
-                    counts["skipped_no_mint"] += 1
-                    continue
-
-                # Fetch 1-min OHLCV signal_time → signal_time + window
-                from_ts = int(sig_time.timestamp())
-                to_ts = int(min(now, sig_time + timedelta(hours=window_hours)).timestamp())
-                try:
-                    raw = await birdeye.fetch_ohlcv(mint, from_ts, to_ts, interval="1m")
-                except Exception as e:  # noqa: BLE001
-                    log.warning("a5_harvest_ohlcv_failed", ticker=ticker, mint=mint, error=str(e))
-                    counts["failed"] += 1
-                    continue
-                if not raw:
-                    counts["failed"] += 1
-                    continue
-                entry_price = float(raw[0].get("o", 0))
-                outcome = _simulate(raw, entry_price)
-                if outcome is None:
-                    counts["failed"] += 1
-                    continue
-                rec_out = {
-                    **outcome.__dict__,
-                    "signal_timestamp_iso": rec["timestamp_iso"],
-                    "ticker": ticker,
-                    "resolved_mint": mint,
-                    "z_score_at_signal": signal.get("z_score"),
-                    "mentions_per_min_at_signal": signal.get("mentions_last_minute"),
-                    "harvested_iso": now.isoformat(),
-                }
-                _write(rec_out, outcomes_path)
-                counts["processed"] += 1
-                seen.add(key)
+            tickers = list(dict.fromkeys(t for _, _, t, _ in matured))
+            mints = dict(zip(tickers, await asyncio.gather(
+                *(_resolve_ticker_to_mint(t, http, cache) for t in tickers)
+            ), strict=True))
+        jobs: list[FetchJob] = []
+        for position, rec, ticker, sig_time in matured:
+            mint = mints[ticker]
+            if not mint:
+                counts["skipped_no_mint"] += 1
+                continue
+            # 1-min OHLCV signal_time → signal_time + window
+            from_ts = int(sig_time.timestamp())
+            to_ts = int(min(now, sig_time + timedelta(hours=window_hours)).timestamp())
+            jobs.append(FetchJob(mint, from_ts, to_ts, (position, rec, ticker)))
+
+        engine = HarvestEngine(
+            lambda mint, start, end: birdeye.fetch_ohlcv(mint, start, end, interval="1m"),
+            time_of=lambda c: c.get("unixTime", 0),
+            name="a5_harvest", concurrency=concurrency, retries=retries,
+        )
+        async for result in engine.stream(jobs):
+            position, rec, ticker = result.job.tag
+            mint = result.job.key
+            if result.error is not None:
+                log.warning("a5_harvest_ohlcv_failed", ticker=ticker, mint=mint, error=result.error)
+                counts["failed"] += 1
+                continue
+            raw = result.items
+            if not raw:
+                counts["failed"] += 1
+                continue
+            entry_price = float(raw[0].get("o", 0))
+            outcome = _simulate(raw, entry_price)
+            if outcome is None:
+                counts["failed"] += 1
+                continue
+            signal = rec["signal"]
+            rec_out = {
+                **outcome.__dict__,
+                "signal_timestamp_iso": rec["timestamp_iso"],
+                "ticker": ticker,
+                "resolved_mint": mint,
+                "z_score_at_signal": signal.get("z_score"),
+                "mentions_per_min_at_signal": signal.get("mentions_last_minute"),
+                "harvested_iso": now.isoformat(),
+            }
+            _write(rec_out, outcomes_path)
+            counts["processed"] += 1
+            batch.done(position)
+        batch.commit()
     finally:
         if own_birdeye:
             await birdeye.close()
@@ -88,20 +88,18 @@ class A5ShadowRunner:
         while True:
             iteration += 1
             now = datetime.now(timezone.utc)
-            for ticker in self.tickers:
-                sig = self.detector.evaluate(ticker, now=now)
-                if sig is not None:
-                    record = {
-                        "timestamp_iso": now.isoformat(),
-                        "ticker": sig.ticker,
-                        "signal": asdict(sig),
-                    }
-                    _write_record(record)
-                    log.info(
-                        "a5_signal",
-                        ticker=sig.ticker, z=f"{sig.z_score:.2f}",
-                        mentions_per_min=f"{sig.mentions_last_minute:.1f}",
-                        baseline=f"{sig.mentions_per_min_baseline:.2f}",
-                        sources=sig.contributing_sources,
-                    )
+            for sig in self.detector.evaluate_all(now, tickers=self.tickers):
+                record = {
+                    "timestamp_iso": now.isoformat(),
+                    "ticker": sig.ticker,
+                    "signal": asdict(sig),
+                }
+                _write_record(record)
+                log.info(
+                    "a5_signal",
+                    ticker=sig.ticker, z=f"{sig.z_score:.2f}",
+                    mentions_per_min=f"{sig.mentions_last_minute:.1f}",
+                    baseline=f"{sig.mentions_per_min_baseline:.2f}",
+                    sources=sig.contributing_sources,
+                )
             await asyncio.sleep(self.evaluate_interval)
@@ -20,8 +20,17 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 
+import polars as pl
+
 from helios.types import PortfolioState, Signal, StrategyId
 
+# Columns a VectorizedStrategy.evaluate_batch() frame carries, one row per
+# Signal. `venue`, `target_price` and `features_hash` may be omitted.
+SIGNAL_FRAME_COLUMNS: tuple[str, ...] = (
+    "event_time", "symbol", "direction", "magnitude", "confidence",
+    "confidence_lower", "invalidation_price", "target_price", "features_hash",
+)
+
 
 @dataclass(frozen=True, slots=True)
 class StrategyContext:
@@ -53,5 +62,22 @@ class Strategy(ABC):
 
     def __init_subclass__(cls, **kw: object) -> None:
         super().__init_subclass__(**kw)
-        if not hasattr(cls, "id"):
+        # Intermediate interfaces re-list ABC as a direct base and carry no id
+        if not hasattr(cls, "id") and ABC not in cls.__bases__:
             raise TypeError(f"{cls.__name__} must declare class attr `id: StrategyId`")
+
+
+class VectorizedStrategy(Strategy, ABC):
+    """A strategy whose signals depend only on market data, never on
+    portfolio state — so the whole history can be evaluated in one pass.
+
+    The vectorized backtest engine calls `evaluate_batch()` once with the full
+    bar frame (schema of helios.data.bars_frame) and replays the resulting
+    rows through the same allocator → risk → broker path as `tick()`. Rows
+    within one `event_time` must be in the order `evaluate()` would emit them.
+    """
+
+    @abstractmethod
+    def evaluate_batch(self, bars: pl.DataFrame) -> pl.DataFrame:
+        """Return one row per Signal with SIGNAL_FRAME_COLUMNS."""
+        ...
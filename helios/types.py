@@ -5,6 +5,7 @@ async tasks and the risk overlay without aliasing bugs.
 """
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -119,6 +120,20 @@ class Position:
     opened_at: datetime
 
 
+@dataclass(frozen=True, slots=True)
+class ExposureSummary:
+    """Exposure aggregates maintained incrementally by a PortfolioLedger.
+
+    gross/net are leveraged entry notionals in fixed-point units of
+    10**-(USD_DP + RATIO_DP) (see helios.fixed_point) — exactly what the
+    risk overlay would compute by scanning `positions`. `open_order_usd` is
+    the open-order notional per strategy (R07's "existing" exposure).
+    """
+    gross_units: int
+    net_units: int  # signed; shorts negative
+    open_order_usd: Mapping[StrategyId, Decimal]
+
+
 @dataclass(frozen=True, slots=True)
 class PortfolioState:
     """Snapshot of the entire account at a point in time. Consumed by the risk overlay."""
@@ -131,6 +146,8 @@ class PortfolioState:
     realized_pnl_week_usd: Decimal
     realized_pnl_month_usd: Decimal
     as_of: datetime
+    # Set by PortfolioLedger snapshots; None means "scan positions/open_orders".
+    exposure: ExposureSummary | None = None
 
     @property
     def drawdown_pct(self) -> float:
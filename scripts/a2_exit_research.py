@@ -1,7 +1,9 @@
 """Run the exit-policy grid against real candle paths for harvested A2 tokens.
 
-Re-fetches 1m OHLCV from Birdeye for each token in a2_outcomes.jsonl, runs the
-full exit-policy grid, prints the ranked results + the decisive verdict.
+Reads 1m OHLCV for each token in a2_outcomes.jsonl through the local candle
+cache (GeckoTerminal only for windows not cached yet — a re-run with a new
+policy grid makes no network calls), runs the full exit-policy grid, prints
+the ranked results + the decisive verdict.
 
 Run inside the Railway container (has the volume + Birdeye key):
     railway ssh "cd /app && python -m scripts.a2_exit_research"
@@ -19,6 +21,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 from helios.data.adapters.geckoterminal import GeckoTerminalAdapter
+from helios.data.store.candle_cache import CandleCache, default_candle_cache
 from helios.ops import configure_logging, get_logger
 from helios.strategies.a2_meme_snipe.exit_research import (
     evaluate_policies,
@@ -37,6 +40,7 @@ async def main() -> int:
     parser.add_argument("--limit", type=int, default=None, help="Cap tokens for a fast run")
     parser.add_argument("--slippage", type=float, default=0.10, help="per-leg slippage fraction")
     parser.add_argument("--window-hours", type=int, default=WINDOW_HOURS)
+    parser.add_argument("--cache-root", default=None, help="Candle cache root (default: logs/candle_cache)")
     args = parser.parse_args()
 
     configure_logging(level="WARNING")
@@ -50,7 +54,8 @@ async def main() -> int:
         print("No tokens — nothing to research.")
         return 1
 
-    birdeye = GeckoTerminalAdapter()
+    cache = CandleCache(args.cache_root) if args.cache_root else default_candle_cache()
+    birdeye = GeckoTerminalAdapter(cache=cache)
     token_candles: list[tuple[float, list[Candle]]] = []
     fetched, failed = 0, 0
     try:
@@ -73,7 +78,8 @@ async def main() -> int:
     finally:
         await birdeye.close()
 
-    print(f"\nUsable token paths: {len(token_candles)}  (failed fetches: {failed})\n")
+    print(f"\nUsable token paths: {len(token_candles)}  (failed fetches: {failed})")
+    print(f"Candle cache: {cache.hits} windows served locally, {cache.fetches} upstream fetches\n")
     if not token_candles:
         print("No usable candle data — Birdeye may have purged history for dead tokens.")
         return 1
@@ -19,7 +19,7 @@ from helios.strategies.a2_meme_snipe.harvester import harvest
 from helios.strategies.a2_meme_snipe.log import (
     OUTCOMES_LOG_DEFAULT,
     SHADOW_LOG_DEFAULT,
-    read_observations,
+    count_observations,
     read_outcomes,
 )
 from helios.strategies.a2_meme_snipe.outcomes import apply_slippage
@@ -116,7 +116,7 @@ async def main() -> int:
         print(f"  processed={counts['processed']}  skipped_recent={counts['skipped_recent']}  "
               f"skipped_done={counts['skipped_done']}  failed={counts['failed']}")
 
-    obs_n = len(list(read_observations()))
+    obs_n = count_observations()
     outcomes = list(read_outcomes())
     print(f"\nObservations logged: {obs_n}    Outcomes harvested: {len(outcomes)}")
     print_summary(outcomes, window=args.window, slippage_pct=args.slippage)
@@ -53,7 +53,8 @@ from helios.strategies.a2_meme_snipe import RugFilter
 from helios.strategies.a2_meme_snipe.enricher import SnapshotEnricher
 from helios.strategies.a2_meme_snipe.harvester import harvest
 from helios.strategies.a2_meme_snipe.log import (
-    read_observations,
+    count_observations,
+    count_outcomes,
     read_outcomes,
     write_observation,
 )
@@ -205,8 +206,8 @@ async def main() -> int:
 
     def update_status(stage: str, **extra) -> None:
         try:
-            total_obs = len(list(read_observations()))
-            total_out = len(list(read_outcomes()))
+            total_obs = count_observations()
+            total_out = count_outcomes()
             _write_status({
                 "started_at_utc": started_at,
                 "last_update_utc": datetime.now(timezone.utc).isoformat(timespec="seconds"),
@@ -235,7 +236,7 @@ async def main() -> int:
                     relax_p02=not args.no_relax_p02,
                     llm_scorer=llm_scorer,
                 )
-                total_obs = len(list(read_observations()))
+                total_obs = count_observations()
                 dt = time.time() - iter_start
                 print(f"[{iso}] iter={iteration:>4d}  shadow ok  "
                       f"pass={n_pass:>2d} reject={n_reject:>2d} fail={n_fail:>2d}  "
@@ -251,7 +252,7 @@ async def main() -> int:
                     update_status("harvesting")
                     print(f"[{iso}] running harvest...", flush=True)
                     counts = await harvest()
-                    total_out = len(list(read_outcomes()))
+                    total_out = count_outcomes()
                     print(f"[{iso}] harvest ok  processed={counts['processed']:>4d}  "
                           f"skipped_recent={counts['skipped_recent']:>4d}  "
                           f"skipped_done={counts['skipped_done']:>4d}  "
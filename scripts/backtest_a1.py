@@ -10,10 +10,14 @@ Pre-registered analysis sequence (no more search):
 Each result is one trial. We do NOT re-sweep horizons. We do NOT re-tune the
 threshold. The signal either holds or it doesn't.
 
-Run:  python -m scripts.backtest_a1
+Run:  python -m scripts.backtest_a1 [--feature-cache DIR]
+
+With --feature-cache, features + labels are served from a FeatureStore under
+DIR: a rerun only fetches and computes the bars since the previous run.
 """
 from __future__ import annotations
 
+import argparse
 import asyncio
 import sys
 from datetime import datetime, timedelta, timezone
@@ -22,10 +26,12 @@ import polars as pl
 
 from helios.data.adapters.kraken_futures import KrakenFuturesMarketData
 from helios.data.bars_frame import align_funding_to_bars, bars_to_frame, funding_to_frame
+from helios.data.store import FeatureStore, ParquetStore
 from helios.ops import configure_logging, get_logger
 from helios.strategies.a1_perp_trend.features import compute_features
 from helios.strategies.a1_perp_trend.train import (
     TrainResult,
+    a1_feature_spec,
     train_a1,
     train_a1_cross_symbol,
 )
@@ -49,7 +55,10 @@ COMPUTED_FEATURES = [
 
 async def fetch_all(symbols: list[str], interval: str, days: int) -> pl.DataFrame:
     end = datetime.now(timezone.utc)
-    start = end - timedelta(days=days)
+    return await fetch_range(symbols, interval, end - timedelta(days=days), end)
+
+
+async def fetch_range(symbols: list[str], interval: str, start: datetime, end: datetime) -> pl.DataFrame:
     log = get_logger("fetch")
     client = KrakenFuturesMarketData()
     try:
@@ -101,19 +110,45 @@ def verdict(name: str, r: TrainResult) -> str:
     return f"  → {name}: FAILS gate. Signal does not survive this filter."
 
 
+async def cached_features(cache_root: str) -> pl.DataFrame:
+    """Features + labels from the FeatureStore; only uncached bars are fetched."""
+    end = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    start = end - timedelta(days=LOOKBACK_DAYS)
+    store = FeatureStore(ParquetStore(cache_root))
+
+    def load(a: datetime, b: datetime) -> pl.DataFrame:
+        print(f"  fetching {a:%Y-%m-%d %H:%M} → {b:%Y-%m-%d %H:%M}")
+        return asyncio.run(fetch_range(SYMBOLS, INTERVAL, a, b))
+
+    # FeatureStore is synchronous; its loader runs the fetch on its own loop.
+    return await asyncio.to_thread(
+        store.get, a1_feature_spec(), SYMBOLS, INTERVAL, start, end, load, HORIZON,
+    )
+
+
 async def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--feature-cache", default=None, help="FeatureStore root (ParquetStore dir)")
+    args = ap.parse_args()
     configure_logging(level="WARNING")  # quiet xgboost / train info logs for the summary
-    print("Fetching Kraken Futures bars + funding...")
-    merged = await fetch_all(SYMBOLS, INTERVAL, LOOKBACK_DAYS)
-    print(f"  {merged.height:,} rows, {merged['symbol'].n_unique()} symbols, "
-          f"{merged['event_time'].min()} → {merged['event_time'].max()}")
-    print(f"  bars with funding attached: {int(merged['funding_rate'].is_not_null().sum()):,}")
-
-    feat = compute_features(merged)
-    feat = feat.join(
-        merged.select(["symbol", "event_time", "close"]),
-        on=["symbol", "event_time"], how="left",
-    ).drop_nulls(subset=[*COMPUTED_FEATURES, "close"])
+    if args.feature_cache:
+        print(f"Loading A1 features from cache {args.feature_cache}...")
+        feat = await cached_features(args.feature_cache)
+        print(f"  {feat.height:,} rows, {feat['symbol'].n_unique()} symbols, "
+              f"{feat['event_time'].min()} → {feat['event_time'].max()}")
+    else:
+        print("Fetching Kraken Futures bars + funding...")
+        merged = await fetch_all(SYMBOLS, INTERVAL, LOOKBACK_DAYS)
+        print(f"  {merged.height:,} rows, {merged['symbol'].n_unique()} symbols, "
+              f"{merged['event_time'].min()} → {merged['event_time'].max()}")
+        print(f"  bars with funding attached: {int(merged['funding_rate'].is_not_null().sum()):,}")
+
+        feat = compute_features(merged)
+        feat = feat.join(
+            merged.select(["symbol", "event_time", "close"]),
+            on=["symbol", "event_time"], how="left",
+        )
+    feat = feat.drop_nulls(subset=[*COMPUTED_FEATURES, "close"])
     print(f"  feature rows: {feat.height:,}\n")
 
     print(f"LOCKED horizon: {HORIZON}h. Threshold 0.55. n_trials counts each scenario below as 1.\n")
@@ -3,16 +3,23 @@
 Fetches Kraken Futures bars + funding for the expanded universe, runs the
 A8 expanded backtest, prints the headline.
 
-Run: python -m scripts.backtest_a8_expanded
+With --sweep, grids the entry/exit APY thresholds in parallel through
+helios.backtest.sweep (the fetched frames are shared, not re-pickled per
+config) and reports the Deflated Sharpe of the best pair.
+
+Run: python -m scripts.backtest_a8_expanded [--sweep] [--workers N] [--checkpoint FILE]
 """
 from __future__ import annotations
 
+import argparse
 import asyncio
 import sys
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import polars as pl
 
+from helios.backtest.sweep import param_grid, run_sweep
 from helios.data.adapters.kraken_futures import KrakenFuturesMarketData
 from helios.data.bars_frame import bars_to_frame, funding_to_frame
 from helios.ops import configure_logging, get_logger
@@ -24,6 +31,8 @@ from helios.strategies.a8_cash_carry.expanded import (
 
 INTERVAL = "1h"
 LOOKBACK_DAYS = 540
+SWEEP_ENTRY_APY = (0.05, 0.08, 0.10, 0.15, 0.20)
+SWEEP_EXIT_APY = (0.0, 0.02, 0.04)
 
 
 async def fetch_universe(symbols, days):
@@ -51,12 +60,59 @@ async def fetch_universe(symbols, days):
     return perp_per, fund_per
 
 
+def a8_trial(inputs, entry_apy: float, exit_apy: float) -> dict:
+    """Sweep evaluation: one (entry, exit) threshold pair over the shared frames."""
+    perp = {k.split(":", 1)[1]: v for k, v in inputs.items() if k.startswith("perp:")}
+    fund = {k.split(":", 1)[1]: v for k, v in inputs.items() if k.startswith("funding:")}
+    cfg = A8ExpandedConfig(entry_apy=entry_apy, exit_apy=exit_apy)
+    result = backtest_a8_expanded(perp, perp, fund, cfg)
+    capital_base = cfg.notional_per_symbol_usd * len(perp)
+    returns = np.diff(result.equity_curve, prepend=0.0) / capital_base if capital_base > 0 else np.array([])
+    return {
+        "sharpe": result.tearsheet.sharpe,
+        "cum_pnl": result.cumulative_pnl_usd,
+        "max_dd": result.tearsheet.max_drawdown,
+        "n_entries": result.n_entries,
+        "periods_per_year": int(cfg.annualization_hours),
+        "returns": returns,
+    }
+
+
+def run_threshold_sweep(perp_per, fund_per, workers, checkpoint) -> int:
+    inputs = {f"perp:{s}": df for s, df in perp_per.items()}
+    inputs.update({f"funding:{s}": df for s, df in fund_per.items()})
+    sweep = run_sweep(
+        a8_trial,
+        param_grid(entry_apy=SWEEP_ENTRY_APY, exit_apy=SWEEP_EXIT_APY),
+        inputs,
+        max_workers=workers,
+        checkpoint=checkpoint,
+    )
+    print(f"{'entry':>8}{'exit':>8}{'sharpe':>9}{'pnl':>11}{'maxDD':>8}{'entries':>9}")
+    for trial in sweep.trials:
+        p, m = trial.params, trial.metrics
+        print(f"{p['entry_apy']:>8.0%}{p['exit_apy']:>8.0%}{m['sharpe']:>+9.2f}"
+              f"{m['cum_pnl']:>+11.2f}{m['max_dd']:>7.1%}{m['n_entries']:>9d}")
+    if sweep.best:
+        p, m = sweep.best.params, sweep.best.metrics
+        print(f"BEST: entry {p['entry_apy']:.0%} / exit {p['exit_apy']:.0%} → Sharpe {m['sharpe']:+.2f}, "
+              f"Deflated Sharpe over {sweep.n_trials} configs {sweep.deflated_sharpe:.2f}")
+    return 0
+
+
 async def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sweep", action="store_true", help="grid entry/exit APY thresholds")
+    ap.add_argument("--workers", type=int, default=None, help="sweep processes (default: CPU count)")
+    ap.add_argument("--checkpoint", default=None, help="JSONL file; rerun to resume a crashed sweep")
+    args = ap.parse_args()
     configure_logging(level="WARNING")
     print(f"Fetching {len(EXPANDED_UNIVERSE)} Kraken Futures perps...")
     perp_per, fund_per = await fetch_universe(EXPANDED_UNIVERSE, LOOKBACK_DAYS)
     print(f"  Got data for {len(perp_per)} / {len(EXPANDED_UNIVERSE)} symbols")
     print()
+    if args.sweep:
+        return run_threshold_sweep(perp_per, fund_per, args.workers, args.checkpoint)
 
     print("=" * 70)
     print(f"{'A8 EXPANDED BACKTEST':^70}")
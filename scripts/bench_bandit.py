@@ -0,0 +1,73 @@
+"""Benchmark StrategyBandit tick overhead with 5, 50 and 500 arms.
+
+An arm is a (strategy, regime) pair; a tick draws one Thompson weight per
+arm, as Orchestrator.process_signals does when every arm has a signal.
+Timed per tick:
+
+  loop      the previous path: BetaPosterior.sample() (random.betavariate)
+            per signal
+  batch     StrategyBandit.sample_weights(): all arms in one numpy call, or
+            one scalar draw per arm below SMALL_BATCH arms
+  alloc     allocation_weights() with `--draws` Monte Carlo draws per arm
+  update    one journaled update (append one line to the journal)
+  ckpt      checkpoint(): full state, atomic write
+
+Run: python -m scripts.bench_bandit [--repeats 200] [--draws 1000]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from helios.allocator.bandit import BetaPosterior, StrategyBandit
+from helios.types import StrategyId
+
+STRATEGIES = tuple(StrategyId)
+
+
+def _keys(n: int) -> list[tuple[StrategyId, str]]:
+    return [(STRATEGIES[i % len(STRATEGIES)], f"regime{i // len(STRATEGIES)}") for i in range(n)]
+
+
+def best_us(fn, repeats: int) -> float:
+    fn()
+    best = float("inf")
+    for _ in range(repeats):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best * 1e6
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeats", type=int, default=200)
+    ap.add_argument("--draws", type=int, default=1000)
+    args = ap.parse_args()
+    print(f"{'arms':>6}{'loop us':>10}{'batch us':>10}{'speedup':>9}{'alloc us':>11}{'update us':>11}{'ckpt us':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (5, 50, 500):
+            keys = _keys(n)
+            rng = random.Random(0)
+            legacy = {k: BetaPosterior(1.0 + i % 7, 1.0 + i % 5) for i, k in enumerate(keys)}
+            bandit = StrategyBandit(path=Path(tmp) / f"bandit{n}.json", checkpoint_every=10**9)
+            for i, (s, r) in enumerate(keys * 4):
+                bandit.update(s, r, win=i % 3 == 0)
+
+            loop = best_us(lambda legacy=legacy, rng=rng, keys=keys: [legacy[k].sample(rng) for k in keys],
+                           args.repeats)
+            batch = best_us(lambda bandit=bandit, keys=keys: bandit.sample_weights(keys), args.repeats)
+            alloc = best_us(lambda bandit=bandit, keys=keys: bandit.allocation_weights(keys, args.draws),
+                            max(5, args.repeats // 20))
+            update = best_us(lambda bandit=bandit, keys=keys: bandit.update(*keys[0], win=True), args.repeats)
+            ckpt = best_us(bandit.checkpoint, max(5, args.repeats // 20))
+            print(f"{n:>6}{loop:>10.1f}{batch:>10.1f}{loop / batch:>8.1f}x{alloc:>11.0f}{update:>11.1f}{ckpt:>10.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""Benchmark per-call cost of conformal bounds at 1k, 10k and 100k residuals.
+
+Per tick the allocator reads a lower bound for every intent, and a streaming
+calibrator also absorbs each realized outcome. Timed per call:
+
+  resort    the previous SplitConformal.quantile(): np.sort of the whole
+            residual buffer on every call
+  split     SplitConformal.quantile() now: sorted once, cached per alpha
+  cached    OnlineConformal.lower() with no update in between
+  update    OnlineConformal.update(): score against the bound, adapt alpha_t,
+            insert, evict the oldest (window full)
+  upd+lower update() then lower(), so the per-alpha cache is cold
+
+Run: python -m scripts.bench_conformal [--calls 2000]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from helios.models.conformal import OnlineConformal, SplitConformal
+
+
+def _resort_quantile(residuals: np.ndarray, alpha: float) -> float:
+    n = len(residuals)
+    k = min(int(np.ceil((n + 1) * (1.0 - alpha))), n)
+    return float(np.sort(residuals)[k - 1])
+
+
+def per_call_us(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--calls", type=int, default=2000)
+    args = ap.parse_args()
+    rng = np.random.default_rng(0)
+    print(f"{'residuals':>10}{'resort us':>11}{'split us':>10}{'cached us':>11}{'update us':>11}"
+          f"{'upd+lower us':>14}")
+    for n in (1_000, 10_000, 100_000):
+        residuals = np.abs(rng.standard_t(3, n))
+        outcomes = rng.standard_t(3, args.calls).tolist()
+        split = SplitConformal(residuals=residuals)
+        online = OnlineConformal(window=n)
+        online.extend(residuals)
+        calls = min(args.calls, 200) if n == 100_000 else args.calls
+
+        resort = per_call_us(lambda i, residuals=residuals: _resort_quantile(residuals, 0.1), calls)
+        split_us = per_call_us(lambda i, split=split: split.quantile(0.1), args.calls)
+
+        def update_then_lower(i: int, online=online, outcomes=outcomes) -> None:
+            online.update(0.0, outcomes[i])
+            online.lower(0.0)
+
+        cached = per_call_us(lambda i, online=online: online.lower(0.0), args.calls)
+        update = per_call_us(lambda i, online=online, outcomes=outcomes: online.update(0.0, outcomes[i]), args.calls)
+        update_lower = per_call_us(update_then_lower, args.calls)
+        print(f"{n:>10}{resort:>11.1f}{split_us:>10.2f}{cached:>11.2f}{update:>11.2f}{update_lower:>14.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
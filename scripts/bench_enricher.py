@@ -0,0 +1,184 @@
+"""Benchmark SnapshotEnricher.enrich() latency against local stand-in upstreams.
+
+Three asyncio HTTP servers on 127.0.0.1 play DexScreener, Helius RPC and
+Birdeye, each answering after a lognormal delay (median `--latency-ms`,
+sigma 0.5, so the tail is realistic). The adapters' httpx clients are routed
+to them by host, so the real adapter parsing code runs. Three flows take
+`--mints` distinct mints one after another:
+
+  sequential  the previous enrich(): DexScreener, mint info, asset info,
+              Birdeye holders, then a second DexScreener fetch for dexId
+  enricher    SnapshotEnricher.enrich(): one fan-out, Birdeye chained
+              behind mint info, dexId read off the first response
+  staged      StagedScreener.screen(): mint authorities first, market and
+              holder data only for survivors (the live runner's decision path)
+
+`--active-authority` of the mints still hold a mint authority (the common
+K01 reject). Requests per mint and per-stage reject rates are printed too.
+
+Run: python -m scripts.bench_enricher [--mints 200] [--latency-ms 80] [--active-authority 0.7]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+import httpx
+
+from helios.data.adapters.birdeye import BirdeyeAdapter
+from helios.data.adapters.dexscreener import DexScreenerAdapter
+from helios.data.adapters.helius import HeliusAdapter
+from helios.ops.latency import LatencyHistogram
+from helios.ops.ratelimit import TokenBucket
+from helios.strategies.a2_meme_snipe.enricher import EnrichmentCache, SnapshotEnricher
+from helios.strategies.a2_meme_snipe.screening import StagedScreener
+
+
+def _dexscreener_body(mint: str) -> dict:
+    return {"pairs": [{
+        "chainId": "solana", "dexId": "pumpswap", "pairAddress": f"pair-{mint}",
+        "baseToken": {"address": mint, "symbol": "DOG", "name": "Dog"},
+        "liquidity": {"usd": 50_000}, "fdv": 200_000, "volume": {"m5": 1_000, "h1": 9_000},
+        "txns": {"m5": {"buys": 40, "sells": 30}, "h1": {"buys": 300, "sells": 250}},
+        "pairCreatedAt": int(time.time() * 1000) - 300_000, "priceUsd": "0.001",
+    }]}
+
+
+def _helius_body(request: dict, active_authority: float) -> dict:
+    if request["method"] == "getAccountInfo":
+        mint = request["params"][0]
+        active = random.Random(mint).random() < active_authority
+        info = {"mintAuthority": "Dev111" if active else None, "freezeAuthority": None,
+                "supply": "1000000000000", "decimals": 6}
+        result = {"value": {"data": {"program": "spl-token", "parsed": {"info": info}}}}
+    else:
+        result = {"content": {"metadata": {"name": "Doggo", "symbol": "DOGGO"}}}
+    return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+
+def _birdeye_body() -> dict:
+    return {"success": True, "data": {"items": [{"ui_amount": 1_000.0 / (i + 1)} for i in range(100)]}}
+
+
+async def _serve(name: str, args: argparse.Namespace, rng: random.Random,
+                 requests: dict[str, int]) -> asyncio.Server:
+    """Minimal keep-alive HTTP/1.1 server answering like upstream `name`."""
+    median_s = args.latency_ms / 1e3
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                lines = head.decode().split("\r\n")
+                path = lines[0].split(" ")[1]
+                headers = dict(line.split(": ", 1) for line in lines[1:] if ": " in line)
+                length = int(headers.get("content-length") or headers.get("Content-Length") or 0)
+                body = await reader.readexactly(length) if length else b""
+                requests[name] += 1
+                await asyncio.sleep(median_s * rng.lognormvariate(0.0, 0.5))
+                if name == "dexscreener":
+                    out = _dexscreener_body(path.rstrip("/").rsplit("/", 1)[-1])
+                elif name == "helius":
+                    out = _helius_body(json.loads(body), args.active_authority)
+                else:
+                    out = _birdeye_body()
+                payload = json.dumps(out).encode()
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                             + f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+class _Route(httpx.AsyncBaseTransport):
+    """Send every request to the local stand-in for its upstream host."""
+
+    def __init__(self, ports: dict[str, int]) -> None:
+        self._ports = ports
+        self._inner = httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        upstream = next(name for name in self._ports if name in host)
+        request.url = request.url.copy_with(scheme="http", host="127.0.0.1", port=self._ports[upstream])
+        return await self._inner.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+async def _sequential_enrich(e: SnapshotEnricher, mint: str) -> None:
+    """The pre-fan-out enrich() call order, for comparison."""
+    snap = await e.dex.fetch_token_snapshot(mint)
+    if snap is None:
+        return
+    info = await e.helius.get_mint_authority_info(mint)
+    await e.helius.get_asset_info(mint)
+    await e.birdeye.get_holder_concentration_vs_supply(mint, info.supply / 10 ** info.decimals, limit=100)
+    resp = await e.dex._client.get(f"https://api.dexscreener.com/latest/dex/tokens/{mint}")
+    resp.raise_for_status()
+
+
+async def run(args: argparse.Namespace) -> int:
+    rng = random.Random(7)
+    requests = dict.fromkeys(("dexscreener", "helius", "birdeye"), 0)
+    servers = {name: await _serve(name, args, rng, requests) for name in requests}
+    ports = {name: s.sockets[0].getsockname()[1] for name, s in servers.items()}
+
+    def client(**kw) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=_Route(ports), timeout=15.0, **kw)
+
+    enricher = SnapshotEnricher(
+        dexscreener=DexScreenerAdapter(client=client()),
+        helius=HeliusAdapter(api_key="bench", client=client()),
+        birdeye=BirdeyeAdapter(api_key="bench", client=client(), limiter=TokenBucket(1e6, 1e6)),
+        cache=EnrichmentCache(),
+    )
+    screener = StagedScreener(enricher)
+    flows = (("sequential", _sequential_enrich), ("enricher", SnapshotEnricher.enrich),
+             ("staged", lambda _, mint: screener.screen(mint)))
+    print(f"{'flow':>11}{'mints':>7}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'mean ms':>9}{'req/mint':>10}")
+    try:
+        for label, flow in flows:
+            hist = LatencyHistogram()
+            before = sum(requests.values())
+            for i in range(args.mints):
+                with hist.time():
+                    await flow(enricher, f"{label}-mint-{i}")
+            s = hist.summary()
+            per_mint = (sum(requests.values()) - before) / args.mints
+            print(f"{label:>11}{args.mints:>7}{s['p50_ms']:>9.1f}{s['p90_ms']:>9.1f}"
+                  f"{s['p99_ms']:>9.1f}{s['mean_ms']:>9.1f}{per_mint:>10.2f}")
+        print("\nstaged screening:")
+        for stage, st in screener.summary().items():
+            print(f"  {stage:<10} entered={st['entered']:<5} reject_rate={st['reject_rate']:.2f} "
+                  f"p50={st['p50_ms']}ms p99={st['p99_ms']}ms")
+        print("\nper-source request latency inside the enricher:")
+        for source, h in enricher.latency.items():
+            s = h.summary()
+            print(f"  {source:<13} n={s['count']:<5} p50={s['p50_ms']:.1f}ms p99={s['p99_ms']:.1f}ms")
+    finally:
+        await enricher.close()
+        for s in servers.values():
+            s.close()
+    return 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mints", type=int, default=200)
+    ap.add_argument("--latency-ms", type=float, default=80.0)
+    ap.add_argument("--active-authority", type=float, default=0.7)
+    return asyncio.run(run(ap.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
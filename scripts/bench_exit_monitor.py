@@ -0,0 +1,186 @@
+"""Benchmark A2 time-to-exit-decision: per-mint sweep vs ExitMonitor.
+
+A local stub DexScreener (asyncio HTTP server on 127.0.0.1, lognormal delay
+with median `--latency-ms`) serves the tokens endpoint, including the
+comma-separated multi-token form. The real DexScreenerAdapter is routed to it.
+
+For 1, 10 and 50 open positions (all at price 1.0, stop 0.5), each trial
+lets the flow run `--warmup` seconds (plus a random phase of up to one),
+then gaps one random mint to 0.4 and times how long until the flow decides
+to exit it:
+
+  sweep    the previous _sweep_exits(): fetch_token_snapshot() per mint,
+           one after another, exits decided after the whole sweep. The
+           runner swept once per new-pool event; `--tick` models that
+           event rate (0 sweeps back to back, the best case)
+  monitor  ExitMonitor with its default config: batched multi-token fetches,
+           per-position scheduling, exit fired when its batch lands
+
+Also reported: DexScreener requests per second each flow spends while
+warming up (the budget is ~5 rps, shared). `--max-interval` overrides the
+monitor's slowest recheck, the knob that trades gap-detection latency for
+requests.
+
+Run: python -m scripts.bench_exit_monitor [--trials 5] [--latency-ms 80] [--warmup 3] [--tick 1.0]
+     [--max-interval 1.0]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from decimal import Decimal
+
+import httpx
+
+from helios.data.adapters.dexscreener import DexScreenerAdapter
+from helios.strategies.a2_meme_snipe.exit_monitor import ExitMonitor, ExitMonitorConfig, exit_reason
+from helios.strategies.a2_meme_snipe.live_runner import LivePosition
+
+
+class _StubDex:
+    def __init__(self, median_s: float, rng: random.Random) -> None:
+        self.median_s = median_s
+        self.rng = rng
+        self.prices: dict[str, float] = {}
+        self.requests = 0
+
+    def _pair(self, mint: str) -> dict:
+        return {
+            "chainId": "solana", "dexId": "pumpswap", "pairAddress": f"pair-{mint}",
+            "baseToken": {"address": mint, "symbol": "DOG", "name": "Dog"},
+            "liquidity": {"usd": 50_000}, "priceUsd": str(self.prices.get(mint, 1.0)),
+        }
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                path = head.decode().split("\r\n", 1)[0].split(" ")[1]
+                self.requests += 1
+                await asyncio.sleep(self.median_s * self.rng.lognormvariate(0.0, 0.5))
+                mints = path.rstrip("/").rsplit("/", 1)[-1].split(",")
+                payload = json.dumps({"pairs": [self._pair(m) for m in mints]}).encode()
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                             + f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+
+class _Route(httpx.AsyncBaseTransport):
+    def __init__(self, port: int) -> None:
+        self._port = port
+        self._inner = httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.url = request.url.copy_with(scheme="http", host="127.0.0.1", port=self._port)
+        return await self._inner.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+def _positions(n: int) -> dict[str, LivePosition]:
+    now = int(time.time())
+    return {
+        f"mint{i:03d}": LivePosition(
+            mint=f"mint{i:03d}", entry_unix=now, entry_price_usd=Decimal(1), entry_sol_amount=0,
+            received_tokens=0, target_price_usd=Decimal(3), stop_price_usd=Decimal("0.5"),
+            peak_price_usd=Decimal(1),
+        )
+        for i in range(n)
+    }
+
+
+async def _sweep_loop(positions, dex: DexScreenerAdapter, on_exit, tick: float) -> None:
+    while True:
+        started = time.perf_counter()
+        to_close = []
+        for mint, pos in list(positions.items()):
+            snap = await dex.fetch_token_snapshot(mint)
+            if snap is None:
+                continue
+            reason = exit_reason(pos, snap.last_trade_price_usd, time.time())
+            if reason is not None:
+                to_close.append((mint, reason))
+        for mint, reason in to_close:
+            await on_exit(mint, reason)
+        await asyncio.sleep(max(0.0, tick - (time.perf_counter() - started)))
+
+
+async def _trial(flow: str, n: int, stub: _StubDex, dex: DexScreenerAdapter,
+                 args: argparse.Namespace, rng: random.Random) -> tuple[float, float]:
+    positions = _positions(n)
+    stub.prices = {}
+    decided: dict[str, float] = {}
+
+    async def on_exit(mint: str, reason: str) -> None:
+        positions.pop(mint, None)
+        decided[mint] = time.perf_counter()
+
+    async def fetch_prices(mints):
+        snaps = await dex.fetch_token_snapshots(mints)
+        return {m: s.last_trade_price_usd for m, s in snaps.items()}
+
+    if flow == "sweep":
+        task = asyncio.create_task(_sweep_loop(positions, dex, on_exit, args.tick))
+    else:
+        config = ExitMonitorConfig(max_interval=args.max_interval)
+        task = asyncio.create_task(ExitMonitor(positions, fetch_prices, on_exit, config).run())
+    try:
+        requests_before = stub.requests
+        warmup = args.warmup + rng.random()  # land the gap at a random phase of the tick
+        await asyncio.sleep(warmup)
+        rps = (stub.requests - requests_before) / warmup
+        victim = rng.choice(sorted(positions))
+        stub.prices[victim] = 0.4
+        tripped = time.perf_counter()
+        while victim not in decided:
+            if task.done():
+                task.result()  # the flow died: surface why
+                raise RuntimeError(f"{flow} stopped before deciding {victim}")
+            await asyncio.sleep(0.005)
+        return decided[victim] - tripped, rps
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def run(args: argparse.Namespace) -> int:
+    rng = random.Random(11)
+    stub = _StubDex(args.latency_ms / 1e3, rng)
+    server = await asyncio.start_server(stub.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    dex = DexScreenerAdapter(client=httpx.AsyncClient(transport=_Route(port), timeout=15.0))
+    print(f"{'positions':>10}{'flow':>9}{'p50 s':>8}{'max s':>8}{'req/s':>8}")
+    try:
+        for n in (1, 10, 50):
+            for flow in ("sweep", "monitor"):
+                results = [await _trial(flow, n, stub, dex, args, rng) for _ in range(args.trials)]
+                lat = sorted(r[0] for r in results)
+                rps = sum(r[1] for r in results) / len(results)
+                print(f"{n:>10}{flow:>9}{lat[len(lat) // 2]:>8.2f}{lat[-1]:>8.2f}{rps:>8.1f}", flush=True)
+    finally:
+        await dex.close()
+        server.close()
+    return 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--trials", type=int, default=5)
+    ap.add_argument("--latency-ms", type=float, default=80.0)
+    ap.add_argument("--warmup", type=float, default=3.0)
+    ap.add_argument("--tick", type=float, default=1.0)
+    ap.add_argument("--max-interval", type=float, default=ExitMonitorConfig().max_interval)
+    return asyncio.run(run(ap.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
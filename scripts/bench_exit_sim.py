@@ -0,0 +1,77 @@
+"""Benchmark the A2 exit-policy grid: scalar sim_* loops vs exit_sim.
+
+Synthetic memecoin-shaped 1m paths (`--tokens` paths of up to `--bars`
+bars: a drifting random walk with wide wicks, random lengths) run through
+the full build_policy_grid(). Times:
+
+  scalar   every spec.fn over every token (what evaluate_policies used to do)
+  pack     CandlePaths.pack() — Candle objects into padded arrays
+  vector   simulate_grid() over the packed paths
+
+and checks the two produce identical returns.
+
+Run: python -m scripts.bench_exit_sim [--tokens 2000] [--bars 240] [--repeats 3]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from helios.strategies.a2_meme_snipe.exit_research import build_policy_grid
+from helios.strategies.a2_meme_snipe.exit_sim import CandlePaths, simulate_grid
+from helios.strategies.a2_meme_snipe.outcomes import Candle
+
+
+def synth(n_tokens: int, max_bars: int, rng: np.random.Generator) -> list[tuple[float, list[Candle]]]:
+    out = []
+    for _ in range(n_tokens):
+        n = int(rng.integers(max_bars // 4, max_bars + 1))
+        close = np.exp(np.cumsum(rng.normal(0.001, 0.05, n)))
+        open_ = np.r_[1.0, close[:-1]]
+        high = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0, 0.03, n)))
+        low = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0, 0.03, n)))
+        out.append((1.0, [Candle(60 * j, float(open_[j]), float(high[j]), float(low[j]), float(close[j]), 0.0)
+                          for j in range(n)]))
+    return out
+
+
+def best_ms(fn, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best * 1e3
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--tokens", type=int, default=2000)
+    ap.add_argument("--bars", type=int, default=240)
+    ap.add_argument("--repeats", type=int, default=3)
+    args = ap.parse_args()
+
+    tokens = synth(args.tokens, args.bars, np.random.default_rng(7))
+    specs = build_policy_grid()
+    keys = [(s.kind, s.params) for s in specs]
+    print(f"{args.tokens} tokens x up to {args.bars} bars, {len(specs)} policies")
+
+    t = time.perf_counter()
+    scalar = np.array([[s.fn(c, e) for e, c in tokens] for s in specs])
+    scalar_ms = (time.perf_counter() - t) * 1e3  # one run: it is the slow side
+    pack_ms = best_ms(lambda: CandlePaths.pack(tokens), args.repeats)
+    paths = CandlePaths.pack(tokens)
+    vector_ms = best_ms(lambda: simulate_grid(paths, keys), args.repeats)
+    vector = simulate_grid(paths, keys)
+
+    print(f"{'scalar ms':>12}{'pack ms':>10}{'vector ms':>12}{'speedup':>10}{'speedup+pack':>14}{'identical':>11}")
+    print(f"{scalar_ms:>12.1f}{pack_ms:>10.1f}{vector_ms:>12.1f}{scalar_ms / vector_ms:>9.1f}x"
+          f"{scalar_ms / (vector_ms + pack_ms):>13.1f}x{str(np.array_equal(scalar, vector)):>11}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Benchmark one tick of risk checks: apply() per intent vs apply_batch().
+
+A tick carries `--intents` intents spread over the live strategies and 50
+symbols, against a state holding `--positions` open positions. Caps are
+relaxed so every intent runs all twelve rules (the slowest path). Two state
+kinds are timed:
+
+  scan     a hand-built PortfolioState: the overlay scans positions
+  ledger   a PortfolioLedger snapshot: exposure sums arrive precomputed
+
+apply() per intent checks every intent against the stale pre-tick state;
+apply_batch() also accumulates the approvals, so it does strictly more work
+per intent and is still the faster of the two.
+
+Run: python -m scripts.bench_risk_batch [--intents 1000] [--positions 50] [--repeats 5]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from helios.execution.ledger import PortfolioLedger
+from helios.execution.paper_broker import MarketSnapshot, PaperBroker
+from helios.risk import RiskConfig, apply, apply_batch
+from helios.types import Intent, Order, PortfolioState, Position, Side, Signal, StrategyId, Venue
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+STRATEGIES = (StrategyId.A1_PERP_TREND, StrategyId.A3_LIQ_HUNT, StrategyId.A5_SENT_VEL, StrategyId.A7_FUNDING_REV)
+
+
+def _intent(i: int) -> Intent:
+    strategy = STRATEGIES[i % len(STRATEGIES)]
+    symbol = f"S{i % 50:03d}-PERP"
+    sig = Signal(
+        strategy=strategy, symbol=symbol, venue=Venue.KRAKEN_FUTURES, direction=1,
+        magnitude=0.5, confidence=0.6, confidence_lower=0.01 + (i % 97) / 1000,
+        invalidation_price=Decimal("100"), target_price=Decimal("106"),
+        features_hash="bench", created_at=NOW,
+    )
+    return Intent(
+        strategy=strategy, symbol=symbol, venue=Venue.KRAKEN_FUTURES, side=Side.LONG,
+        notional_usd=Decimal("25") + i % 7, leverage=1.5, stop_price=Decimal("98"),
+        take_profit_price=Decimal("106"), signal_ref=sig,
+    )
+
+
+def build_states(n_positions: int) -> tuple[PortfolioState, PortfolioState]:
+    broker = PaperBroker(starting_cash=Decimal("1000000"))
+    ledger = PortfolioLedger(broker, as_of=NOW)
+    marks = {}
+    for i in range(n_positions):
+        intent = _intent(i)
+        order = Order(intent=intent, qty=Decimal("1.25"), order_type="market", limit_price=None,
+                      client_order_id=str(i), approved_at=NOW)
+        px = Decimal("100.5") + i
+        marks[(intent.symbol, intent.venue)] = px
+        ledger.mark({(intent.symbol, intent.venue): px}, NOW)
+        broker.submit(order, MarketSnapshot(mid_price=px, spread_bps=5.0, bar_volume=1e5, bar_volatility=0.004))
+    ledger_state = ledger.snapshot()
+    scan_state = PortfolioState(
+        nav_usd=ledger_state.nav_usd, peak_nav_usd=ledger_state.peak_nav_usd, cash_usd=broker.cash,
+        positions=tuple(
+            Position(symbol=p.symbol, venue=p.venue, side=p.side, qty=p.qty, avg_entry=p.avg_entry,
+                     unrealized_pnl_usd=Decimal("0"), realized_pnl_usd=Decimal("0"), leverage=1.5,
+                     opened_at=NOW)
+            for p in ledger_state.positions
+        ),
+        open_orders=(), realized_pnl_today_usd=Decimal("0"), realized_pnl_week_usd=Decimal("0"),
+        realized_pnl_month_usd=Decimal("0"), as_of=NOW,
+    )
+    return scan_state, ledger_state
+
+
+def best_ms(fn, repeats: int) -> float:
+    fn()
+    best = float("inf")
+    for _ in range(repeats):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best * 1e3
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--intents", type=int, default=1000)
+    ap.add_argument("--positions", type=int, default=50)
+    ap.add_argument("--repeats", type=int, default=5)
+    args = ap.parse_args()
+
+    cfg = RiskConfig(
+        max_position_pct_of_nav=1.0,
+        strategy_alloc_max={},
+        max_gross_exposure_pct_of_nav=1000.0,
+        max_net_exposure_pct_of_nav=1000.0,
+    )
+    intents = [_intent(i) for i in range(args.intents)]
+    print(f"{args.intents} intents, {args.positions} positions")
+    print(f"{'state':>8}{'apply loop ms':>15}{'apply_batch ms':>16}{'speedup':>9}{'approved':>10}")
+    for name, state in zip(("scan", "ledger"), build_states(args.positions), strict=True):
+        loop_ms = best_ms(lambda s=state: [apply(i, s, cfg) for i in intents], args.repeats)
+        batch_ms = best_ms(lambda s=state: apply_batch(intents, s, cfg), args.repeats)
+        approved = sum(isinstance(r, Order) for r in apply_batch(intents, state, cfg))
+        print(f"{name:>8}{loop_ms:>15.2f}{batch_ms:>16.2f}{loop_ms / batch_ms:>8.1f}x{approved:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""Benchmark ParquetStore.read() against the glob-everything SQL path.
+
+Builds a synthetic multi-year 1m-bar dataset (one part file per day, all
+symbols in each file), then times "one symbol over one week" three ways:
+
+  glob     fresh duckdb connection + read_parquet('**/*.parquet') view, as
+           ParquetStore.query() worked before the catalog
+  catalog  ParquetStore.query() through the long-lived catalog
+  read     ParquetStore.read() with partition + row-group pruning
+
+Run: python -m scripts.bench_store_read [--years 2] [--symbols 4] [--root DIR]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pyarrow as pa
+
+from helios.data.store import ParquetStore
+
+MINUTES_PER_DAY = 24 * 60
+T0 = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def build_store(root: Path, years: int, n_symbols: int) -> ParquetStore:
+    store = ParquetStore(root)
+    if store.datasets():
+        return store
+    rng = np.random.default_rng(7)
+    symbols = [f"SYM{i:02d}" for i in range(n_symbols)]
+    minute = np.arange(MINUTES_PER_DAY, dtype="timedelta64[m]")
+    for day in range(365 * years):
+        base = np.datetime64(T0.replace(tzinfo=None) + timedelta(days=day), "us")
+        times = np.tile(base + minute, n_symbols)
+        n = times.size
+        close = 100.0 + rng.standard_normal(n).cumsum() * 0.01
+        store.write("bars_1m", pa.table({
+            "symbol": np.repeat(symbols, MINUTES_PER_DAY),
+            "event_time": pa.array(times, type=pa.timestamp("us", tz="UTC")),
+            "available_at": pa.array(times + np.timedelta64(1, "s"), type=pa.timestamp("us", tz="UTC")),
+            "open": close, "high": close * 1.001, "low": close * 0.999, "close": close,
+            "volume": rng.random(n) * 10,
+        }))
+    return store
+
+
+def glob_query(root: Path, sql: str) -> pa.Table:
+    con = duckdb.connect()
+    for ds_dir in root.iterdir():
+        if ds_dir.is_dir():
+            glob = str(ds_dir / "**" / "*.parquet")
+            con.execute(
+                f"CREATE VIEW {ds_dir.name} AS SELECT * FROM read_parquet('{glob}', hive_partitioning=true)"
+            )
+    _arrow = con.execute(sql).arrow()
+    return _arrow.read_all() if hasattr(_arrow, "read_all") else _arrow
+
+
+def timeit(fn, repeats: int) -> tuple[float, int]:
+    rows = fn().num_rows  # warm
+    t = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - t) / repeats * 1000.0, rows
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--years", type=int, default=2)
+    ap.add_argument("--symbols", type=int, default=4)
+    ap.add_argument("--repeats", type=int, default=5)
+    ap.add_argument("--root", type=Path, default=None)
+    args = ap.parse_args()
+
+    root = args.root or Path(tempfile.mkdtemp(prefix="helios_bench_"))
+    t = time.perf_counter()
+    store = build_store(root, args.years, args.symbols)
+    n_files = len(store.catalog.files("bars_1m"))
+    print(f"Store at {root}: {n_files} part files (built in {time.perf_counter() - t:.1f}s)")
+
+    start = T0 + timedelta(days=365 * args.years - 30)
+    end = start + timedelta(days=7)
+    sql = (
+        "SELECT event_time, close FROM bars_1m WHERE symbol = 'SYM01' "
+        f"AND event_time >= TIMESTAMPTZ '{start.isoformat()}' "
+        f"AND event_time < TIMESTAMPTZ '{end.isoformat()}'"
+    )
+
+    results = {
+        "glob": timeit(lambda: glob_query(root, sql), args.repeats),
+        "catalog": timeit(lambda: store.query(sql), args.repeats),
+        "read": timeit(
+            lambda: store.read("bars_1m", symbols=["SYM01"], start=start, end=end,
+                               columns=["event_time", "close"]),
+            args.repeats,
+        ),
+    }
+    base = results["glob"][0]
+    print(f"{'path':<10}{'ms/query':>12}{'rows':>10}{'speedup':>10}")
+    for name, (ms, rows) in results.items():
+        print(f"{name:<10}{ms:>12.2f}{rows:>10}{base / ms:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
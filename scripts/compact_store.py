@@ -0,0 +1,57 @@
+"""Compact small Parquet part files in a ParquetStore.
+
+Merges small parts within each day partition into event_time-sorted,
+size-targeted files and reports before/after file counts and cold query
+latency. Safe to run while readers and writers are active.
+
+Run: python -m scripts.compact_store --root data/store [--dataset bars_1m ...]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from helios.data.store import CompactionConfig, ParquetStore, compact_dataset
+from helios.ops import configure_logging
+
+
+def main() -> int:
+    defaults = CompactionConfig()
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--root", type=Path, required=True)
+    ap.add_argument("--dataset", action="append", default=None,
+                    help="Dataset to compact (repeatable). Default: all datasets.")
+    ap.add_argument("--small-file-mb", type=float, default=defaults.small_file_bytes / 2**20)
+    ap.add_argument("--target-file-mb", type=float, default=defaults.target_file_bytes / 2**20)
+    ap.add_argument("--row-group-rows", type=int, default=defaults.row_group_rows)
+    ap.add_argument("--min-files", type=int, default=defaults.min_files)
+    ap.add_argument("--grace-seconds", type=float, default=defaults.grace_seconds,
+                    help="How long superseded parts stay on disk for in-flight readers.")
+    args = ap.parse_args()
+
+    configure_logging(level="WARNING")
+    store = ParquetStore(args.root)
+    config = CompactionConfig(
+        small_file_bytes=int(args.small_file_mb * 2**20),
+        target_file_bytes=int(args.target_file_mb * 2**20),
+        row_group_rows=args.row_group_rows,
+        min_files=args.min_files,
+        grace_seconds=args.grace_seconds,
+    )
+
+    print(f"{'dataset':<24}{'parts':>8}{'files':>16}{'MB':>16}{'query ms':>18}{'reclaimed':>11}")
+    for ds in args.dataset or store.datasets():
+        r = compact_dataset(store, ds, config)
+        print(
+            f"{ds:<24}{r.partitions_compacted:>8}"
+            f"{r.files_before:>8} → {r.files_after:<5}"
+            f"{r.bytes_before / 2**20:>7.1f} → {r.bytes_after / 2**20:<6.1f}"
+            f"{r.query_ms_before:>8.1f} → {r.query_ms_after:<7.1f}"
+            f"{r.reclaimed_files:>9}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -116,6 +116,37 @@ def _build_tasks(args) -> list[SupervisedTask]:
             await resnap_loop(interval_minutes=60.0)
         tasks.append(SupervisedTask(name="a2_resnap", factory=resnap_factory))
 
+    # ---- Parquet store compaction (merges small part files, opt-in) ----
+    if args.compact_store:
+        from helios.data.store import ParquetStore
+        from helios.data.store.compaction import compact_loop
+
+        async def compaction_factory():
+            await compact_loop(ParquetStore(args.compact_store), interval_minutes=60.0)
+        tasks.append(SupervisedTask(name="store_compaction", factory=compaction_factory))
+
+    # ---- Shadow/outcome log rollover into Parquet (opt-in) ----
+    if args.archive_store:
+        from helios.data.store import ParquetStore
+        from helios.data.store.log_store import rollover_loop
+        from helios.strategies.a2_meme_snipe import log as a2_log
+        from helios.strategies.a3_liq_hunt import harvester as a3_h
+        from helios.strategies.a5_sentiment import harvester as a5_h
+
+        logs = [
+            (a2_log.shadow_store(), a2_log.SHADOW_DATASET),
+            (a2_log.outcomes_store(), a2_log.OUTCOMES_DATASET),
+            (a3_h.shadow_store(), a3_h.A3_SHADOW_DATASET),
+            (a3_h.outcomes_store(), a3_h.A3_OUTCOMES_DATASET),
+            (a5_h.shadow_store(), a5_h.A5_SHADOW_DATASET),
+            (a5_h.outcomes_store(), a5_h.A5_OUTCOMES_DATASET),
+        ]
+
+        async def rollover_factory():
+            await rollover_loop(logs, ParquetStore(args.archive_store), interval_minutes=60.0,
+                                max_bytes=args.archive_mb * 1024 * 1024)
+        tasks.append(SupervisedTask(name="log_rollover", factory=rollover_factory))
+
     return tasks
 
 
@@ -147,6 +178,12 @@ async def main() -> int:
     parser.add_argument("--max-concurrent-positions", type=int, default=5)
     parser.add_argument("--poller-only", action="store_true",
                         help="A2 live uses DexScreener polling instead of Helius WS")
+    parser.add_argument("--compact-store", default=None, metavar="ROOT",
+                        help="Run hourly Parquet compaction on this ParquetStore root")
+    parser.add_argument("--archive-store", default=None, metavar="ROOT",
+                        help="Roll shadow/outcome JSONL over into this ParquetStore root")
+    parser.add_argument("--archive-mb", type=int, default=256,
+                        help="Seal a JSONL log segment once it reaches this size")
     args = parser.parse_args()
 
     configure_logging(level="INFO")
@@ -156,6 +193,8 @@ async def main() -> int:
     print(f"  A2 live:    {'ON (paper-mode)' if args.enable_a2_live else 'OFF (paid Helius WS needed)'}")
     print(f"  A3 shadow:  {'OFF' if args.disable_a3 else 'ON'}")
     print(f"  A5 shadow:  {'OFF' if args.disable_a5 else 'ON'}")
+    print(f"  Compaction: {args.compact_store or 'OFF'}")
+    print(f"  Log archive: {args.archive_store or 'OFF'}")
     print(f"  Live safety: {'LIVE TRADES ENABLED' if os.getenv('SAFETY_LIVE_TRADING') == 'I_UNDERSTAND_THE_RISK' else 'paper-mode (default)'}")
     print("=" * 70, flush=True)
 
@@ -15,15 +15,22 @@ Three books compared, all market-neutral long/short top&bottom-3:
 
 Output: aggregated out-of-sample Sharpe, Deflated Sharpe, total return, max DD.
 A book only "passes" if OOS Deflated Sharpe > 0.95 (>95% confident true Sharpe>0).
+
+The per-window train search (every window × every config) runs as one
+parallel helios.backtest.sweep over the shared log-price/funding matrices.
+
+Run: python -m scripts.research_combined_book [--workers N]
 """
 from __future__ import annotations
 
+import argparse
 import asyncio
 import sys
 from datetime import datetime, timedelta, timezone
 
 import numpy as np
 
+from helios.backtest.sweep import run_sweep
 from helios.backtest.tearsheet import deflated_sharpe
 from helios.data.adapters.kraken_futures import KrakenFuturesMarketData
 from helios.data.bars_frame import (
@@ -84,11 +91,10 @@ async def fetch_price_funding():
     return pm.select(cols).to_numpy().astype(float), fm.select(cols).to_numpy().astype(float)
 
 
-def reversal_returns(prices, lookback, hold, fee_bps, t_start, t_end,
+def reversal_returns(log_p, lookback, hold, fee_bps, t_start, t_end,
                      funding=None, funding_weight=False):
-    """Period-return series for reversal over [t_start, t_end). Optionally
-    weight positions by funding extremity."""
-    log_p = np.log(prices)
+    """Period-return series for reversal over [t_start, t_end) of the
+    log-price matrix. Optionally weight positions by funding extremity."""
     rets = []
     t = max(lookback, t_start)
     while t + hold < t_end:
@@ -128,29 +134,41 @@ def sharpe_of(rets, hold):
     return float(rets.mean() / rets.std(ddof=1) * np.sqrt(ppy))
 
 
-def rolling_walkforward(prices, funding, train_hours, test_hours, funding_weight=False, fixed=None):
+def train_trial(inputs, t, lookback, hold, train_hours, funding_weight):
+    """Sweep evaluation: in-sample Sharpe of one config on the window ending at t."""
+    tr = reversal_returns(inputs["log_prices"], lookback, hold, FEE_BPS, t - train_hours, t,
+                          inputs["funding"], funding_weight)
+    return {"sharpe": sharpe_of(tr, hold), "n": len(tr)}
+
+
+def rolling_walkforward(log_p, funding, train_hours, test_hours, funding_weight=False, fixed=None,
+                        workers=None):
     """Re-select best reversal config on each train window, trade OOS on the
     next test window. Returns concatenated OOS period returns + chosen holds."""
-    T = prices.shape[0]
+    T = log_p.shape[0]
+    starts = list(range(train_hours, T - test_hours + 1, test_hours))
+    if fixed is not None:
+        chosen = {t: fixed for t in starts}
+    else:
+        grid = [
+            {"t": t, "lookback": lb, "hold": h, "train_hours": train_hours, "funding_weight": funding_weight}
+            for t in starts for (lb, h) in CONFIGS
+        ]
+        sweep = run_sweep(train_trial, grid, {"log_prices": log_p, "funding": funding}, max_workers=workers)
+        best_sh: dict[int, float] = {}
+        chosen = {t: CONFIGS[0] for t in starts}
+        for trial in sweep.trials:  # grid order == CONFIGS order per window; first max wins
+            p = trial.params
+            if trial.metrics["sharpe"] > best_sh.get(p["t"], -1e9):
+                best_sh[p["t"]] = trial.metrics["sharpe"]
+                chosen[p["t"]] = (p["lookback"], p["hold"])
     oos_rets = []
     holds_used = []
-    t = train_hours
-    while t + test_hours <= T:
-        if fixed is not None:
-            best_cfg = fixed
-        else:
-            best_sh, best_cfg = -1e9, CONFIGS[0]
-            for (lb, h) in CONFIGS:
-                tr = reversal_returns(prices, lb, h, FEE_BPS, t - train_hours, t,
-                                      funding, funding_weight)
-                sh = sharpe_of(tr, h)
-                if sh > best_sh:
-                    best_sh, best_cfg = sh, (lb, h)
-        lb, h = best_cfg
-        te = reversal_returns(prices, lb, h, FEE_BPS, t, t + test_hours, funding, funding_weight)
+    for t in starts:
+        lb, h = chosen[t]
+        te = reversal_returns(log_p, lb, h, FEE_BPS, t, t + test_hours, funding, funding_weight)
         oos_rets.append(te)
         holds_used.append(h)
-        t += test_hours
     allr = np.concatenate(oos_rets) if oos_rets else np.array([])
     return allr, holds_used
 
@@ -171,12 +189,16 @@ def report(name, rets, hold_repr, n_trials):
 
 
 async def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--workers", type=int, default=None, help="sweep processes (default: CPU count)")
+    args = ap.parse_args()
     configure_logging(level="WARNING")
     print(f"Fetching {len(UNIVERSE)} perps + funding, {LOOKBACK_DAYS}d hourly...")
     prices, funding = await fetch_price_funding()
     if prices is None:
         print("no data"); return 1
     print(f"  matrix {prices.shape}\n")
+    log_p = np.log(prices)  # shared by every config and window
 
     TRAIN = 60 * 24   # 60-day train
     TEST = 14 * 24    # 14-day test, rolling
@@ -186,16 +208,16 @@ async def main() -> int:
     print("=" * 90)
 
     # Adaptive (re-select each window): n_trials = configs searched
-    adapt, holds = rolling_walkforward(prices, funding, TRAIN, TEST)
+    adapt, holds = rolling_walkforward(log_p, funding, TRAIN, TEST, workers=args.workers)
     hrep = int(np.median(holds)) if holds else 24
     report("reversal_adaptive", adapt, hrep, n_trials=len(CONFIGS))
 
     # Fixed 48h/24h
-    fixed, _ = rolling_walkforward(prices, funding, TRAIN, TEST, fixed=(48, 24))
+    fixed, _ = rolling_walkforward(log_p, funding, TRAIN, TEST, fixed=(48, 24))
     report("reversal_fixed_48_24", fixed, 24, n_trials=1)
 
     # Funding-weighted adaptive
-    fw, fwholds = rolling_walkforward(prices, funding, TRAIN, TEST, funding_weight=True)
+    fw, fwholds = rolling_walkforward(log_p, funding, TRAIN, TEST, funding_weight=True, workers=args.workers)
     report("reversal_funding_wt", fw, int(np.median(fwholds)) if fwholds else 24, n_trials=len(CONFIGS))
 
     print("=" * 90)
@@ -14,12 +14,17 @@ Why this is structurally different from A1/A2/A8 (all failed):
 Backtest:
   - Fetch hourly bars for the 15-perp universe
   - Build aligned log-return matrix
-  - Grid over (lookback L, hold H, sign) — long-short top/bottom 3
+  - Grid over (lookback L, hold H, sign) — long-short top/bottom 3, run
+    in parallel by helios.backtest.sweep over one shared log-price matrix
   - Net of maker fees (2 bps/leg Kraken Futures) on rebalance turnover
-  - Report annualized Sharpe, return, max DD, win rate per config
+  - Report annualized Sharpe, return, max DD, win rate per config, and the
+    Deflated Sharpe of the best config given the number of configs tried
+
+Run: python -m scripts.research_xsectional [--workers N] [--checkpoint FILE]
 """
 from __future__ import annotations
 
+import argparse
 import asyncio
 import sys
 from datetime import datetime, timedelta, timezone
@@ -27,6 +32,7 @@ from datetime import datetime, timedelta, timezone
 import numpy as np
 import polars as pl
 
+from helios.backtest.sweep import param_grid, run_sweep
 from helios.data.adapters.kraken_futures import KrakenFuturesMarketData
 from helios.data.bars_frame import bars_to_frame
 from helios.ops import configure_logging, get_logger
@@ -70,12 +76,11 @@ async def fetch_matrix(symbols, days):
     return mat
 
 
-def backtest_xsec(prices: np.ndarray, lookback: int, hold: int, sign: int, fee_bps: float) -> dict:
-    """prices: (T, N) array of close prices (NaN where missing).
+def backtest_xsec(log_p: np.ndarray, lookback: int, hold: int, sign: int, fee_bps: float) -> dict:
+    """log_p: (T, N) array of log close prices (NaN where missing).
     sign=+1 momentum (long winners), sign=-1 reversal (long losers).
-    Returns dict of metrics."""
-    T, N = prices.shape
-    log_p = np.log(prices)
+    Returns dict of metrics plus the per-period `returns`."""
+    T, N = log_p.shape
     port_returns: list[float] = []
     t = lookback
     while t + hold < T:
@@ -117,10 +122,20 @@ def backtest_xsec(prices: np.ndarray, lookback: int, hold: int, sign: int, fee_b
         "n": len(r), "sharpe": float(sharpe), "total_return": total,
         "max_dd": mdd, "mean_per_period": float(mean_p),
         "win_rate": float((r > 0).mean()),
+        "periods_per_year": periods_per_year, "returns": r,
     }
 
 
+def xsec_trial(inputs, lookback: int, hold: int, sign: int) -> dict:
+    """Sweep evaluation: one grid config over the shared log-price matrix."""
+    return backtest_xsec(inputs["log_prices"], lookback, hold, sign, PERP_FEE_BPS)
+
+
 async def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--workers", type=int, default=None, help="sweep processes (default: CPU count)")
+    ap.add_argument("--checkpoint", default=None, help="JSONL file; rerun to resume a crashed sweep")
+    args = ap.parse_args()
     configure_logging(level="WARNING")
     print(f"Fetching {len(UNIVERSE)} perps, {LOOKBACK_DAYS}d hourly...")
     mat = await fetch_matrix(UNIVERSE, LOOKBACK_DAYS)
@@ -137,23 +152,28 @@ async def main() -> int:
     print(f"{'sign':>9}{'lookback':>9}{'hold':>6}{'n':>6}{'sharpe':>9}{'tot_ret':>10}{'maxDD':>8}{'win%':>7}")
     print("-" * 88)
 
-    best = None
-    for sign, label in [(-1, "reversal"), (1, "momentum")]:
-        for lookback in (1, 4, 12, 24, 48):
-            for hold in (1, 4, 12, 24):
-                m = backtest_xsec(prices, lookback, hold, sign, PERP_FEE_BPS)
-                if m.get("n", 0) < 20:
-                    continue
-                print(f"{label:>9}{lookback:>9}{hold:>6}{m['n']:>6}{m['sharpe']:>+9.2f}"
-                      f"{m['total_return']:>+9.1%}{m['max_dd']:>7.1%}{m['win_rate']:>6.1%}")
-                if best is None or m["sharpe"] > best[1]["sharpe"]:
-                    best = ((label, lookback, hold), m)
+    sweep = run_sweep(
+        xsec_trial,
+        param_grid(sign=(-1, 1), lookback=(1, 4, 12, 24, 48), hold=(1, 4, 12, 24)),
+        {"log_prices": np.log(prices)},
+        min_periods=20,
+        max_workers=args.workers,
+        checkpoint=args.checkpoint,
+    )
+    labels = {-1: "reversal", 1: "momentum"}
+    for trial in sweep.trials:
+        m, p = trial.metrics, trial.params
+        if m.get("n", 0) < 20:
+            continue
+        print(f"{labels[p['sign']]:>9}{p['lookback']:>9}{p['hold']:>6}{m['n']:>6}{m['sharpe']:>+9.2f}"
+              f"{m['total_return']:>+9.1%}{m['max_dd']:>7.1%}{m['win_rate']:>6.1%}")
 
     print("=" * 88)
-    if best:
-        (lbl, lb, h), m = best
-        print(f"BEST: {lbl} lookback={lb}h hold={h}h → Sharpe {m['sharpe']:+.2f}, "
+    if sweep.best:
+        p, m = sweep.best.params, sweep.best.metrics
+        print(f"BEST: {labels[p['sign']]} lookback={p['lookback']}h hold={p['hold']}h → Sharpe {m['sharpe']:+.2f}, "
               f"total {m['total_return']:+.1%}, maxDD {m['max_dd']:.1%}, win {m['win_rate']:.1%}")
+        print(f"  Deflated Sharpe over {sweep.n_trials} configs: {sweep.deflated_sharpe:.2f}")
         print()
         if m["sharpe"] > 1.5:
             print("VERDICT: Promising. Sharpe > 1.5 net of maker fees on a market-neutral book.")
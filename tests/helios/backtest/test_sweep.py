@@ -0,0 +1,108 @@
+"""Tests for the parallel parameter-sweep runner."""
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import polars as pl
+import pytest
+from loguru import logger
+
+from helios.backtest.sweep import param_grid, run_sweep
+from helios.backtest.tearsheet import deflated_sharpe
+
+logger.remove()
+
+CALLS: list[dict] = []  # serial-mode call log
+FAIL_LOOKBACKS: set[int] = set()
+
+
+def momentum_trial(inputs, lookback, hold):
+    """Toy evaluation over a shared return matrix and a shared Polars frame."""
+    rets = np.asarray(inputs["rets"])
+    scale = float(inputs["meta"]["scale"][0])
+    signal = np.sign(rets[lookback - 1:-hold].sum(axis=1))
+    r = signal * rets[lookback:len(rets) - hold + 1].mean(axis=1) * scale
+    sharpe = float(r.mean() / r.std(ddof=1) * np.sqrt(252)) if r.std() > 0 else 0.0
+    return {"sharpe": sharpe, "n": len(r), "returns": r}
+
+
+def flaky_trial(inputs, lookback, hold):
+    CALLS.append({"lookback": lookback, "hold": hold})
+    if lookback in FAIL_LOOKBACKS:
+        raise RuntimeError("boom")
+    return momentum_trial(inputs, lookback, hold)
+
+
+@pytest.fixture(scope="module")
+def inputs():
+    rng = np.random.default_rng(3)
+    return {"rets": rng.normal(0.0, 0.01, (600, 4)), "meta": pl.DataFrame({"scale": [1.0]})}
+
+
+def test_param_grid_order():
+    grid = param_grid(a=(1, 2), b=("x", "y"))
+    assert grid == [{"a": 1, "b": "x"}, {"a": 1, "b": "y"}, {"a": 2, "b": "x"}, {"a": 2, "b": "y"}]
+
+
+def test_parallel_matches_serial_and_deflates_best(inputs):
+    grid = param_grid(lookback=(5, 10, 20), hold=(1, 5))
+    serial = run_sweep(momentum_trial, grid, inputs, max_workers=1)
+    parallel = run_sweep(momentum_trial, grid, inputs, max_workers=2)
+    assert [t.params for t in parallel.trials] == grid
+    assert [t.metrics for t in parallel.trials] == [t.metrics for t in serial.trials]
+    assert parallel.n_trials == len(grid)
+    best = max(serial.trials, key=lambda t: t.metrics["sharpe"])
+    assert parallel.best.params == best.params
+    assert parallel.deflated_sharpe == pytest.approx(
+        deflated_sharpe(best.metrics["sharpe"], best.returns, len(grid), 252)
+    )
+
+
+def test_checkpoint_resumes_after_crash(inputs, tmp_path):
+    grid = param_grid(lookback=(5, 10, 20), hold=(1, 5))
+    ckpt = tmp_path / "sweep.jsonl"
+    CALLS.clear()
+    FAIL_LOOKBACKS.add(20)
+    with pytest.raises(RuntimeError):
+        run_sweep(flaky_trial, grid, inputs, max_workers=1, checkpoint=ckpt)
+    assert len(ckpt.read_text().splitlines()) == 4  # lookback 5 and 10 finished
+
+    CALLS.clear()
+    FAIL_LOOKBACKS.clear()
+    ckpt.write_text(ckpt.read_text() + '{"fingerprint": "')  # torn write from the crash
+    report = run_sweep(flaky_trial, grid, inputs, max_workers=1, checkpoint=ckpt)
+    assert report.n_resumed == 4
+    assert CALLS == [{"lookback": 20, "hold": 1}, {"lookback": 20, "hold": 5}]
+    assert report.n_trials == len(grid)
+    full = run_sweep(momentum_trial, grid, inputs, max_workers=1)
+    assert [t.metrics for t in report.trials] == [t.metrics for t in full.trials]
+    np.testing.assert_allclose(report.best.returns, full.best.returns)
+    assert all(json.loads(line)["params"] in grid for line in ckpt.read_text().splitlines()[:4])
+    assert run_sweep(flaky_trial, grid, inputs, max_workers=1, checkpoint=ckpt).n_resumed == len(grid)
+
+
+def test_checkpoint_is_not_reused_for_other_functions_or_inputs(inputs, tmp_path):
+    grid = param_grid(lookback=(5, 10), hold=(1,))
+    ckpt = tmp_path / "sweep.jsonl"
+    run_sweep(momentum_trial, grid, inputs, max_workers=1, checkpoint=ckpt)
+    assert run_sweep(momentum_trial, grid, inputs, max_workers=1, checkpoint=ckpt).n_resumed == 2
+
+    CALLS.clear()
+    assert run_sweep(flaky_trial, grid, inputs, max_workers=1, checkpoint=ckpt).n_resumed == 0
+    assert len(CALLS) == 2
+    shifted = {**inputs, "rets": inputs["rets"] + 0.001}
+    assert run_sweep(momentum_trial, grid, shifted, max_workers=1, checkpoint=ckpt).n_resumed == 0
+    rescaled = {**inputs, "meta": pl.DataFrame({"scale": [2.0]})}
+    assert run_sweep(momentum_trial, grid, rescaled, max_workers=1, checkpoint=ckpt).n_resumed == 0
+
+
+def test_min_periods_excludes_short_trials(inputs):
+    grid = param_grid(lookback=(5, 590), hold=(1,))
+    report = run_sweep(momentum_trial, grid, inputs, max_workers=1, min_periods=50)
+    assert report.best.params == {"lookback": 5, "hold": 1}
+
+
+def test_duplicate_configs_rejected(inputs):
+    with pytest.raises(ValueError):
+        run_sweep(momentum_trial, [{"lookback": 5, "hold": 1}] * 2, inputs, max_workers=1)
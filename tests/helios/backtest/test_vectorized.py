@@ -0,0 +1,91 @@
+"""Parity tests: VectorizedBacktestEngine vs the event-driven BacktestEngine."""
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+from loguru import logger
+
+from helios.backtest.engine import BacktestEngine
+from helios.backtest.regression import BreakoutReference, frame_to_bars, synthetic_bar_frame
+from helios.backtest.vectorized import VectorizedBacktestEngine
+from helios.types import Venue
+
+logger.remove()
+
+
+def _fill_key(f):
+    return (f.symbol, f.venue, f.side, f.qty, f.price, f.fee_usd, f.slippage_bps)
+
+
+@pytest.fixture(scope="module")
+def frame():
+    return synthetic_bar_frame(n_bars=1500)
+
+
+async def _run_both(frame, lookback=48):
+    event = await BacktestEngine([BreakoutReference(frame, lookback=lookback)]).run(frame_to_bars(frame))
+    vec = await VectorizedBacktestEngine([BreakoutReference(frame, lookback=lookback)]).run(frame)
+    return event, vec
+
+
+async def test_fills_match_event_path(frame):
+    event, vec = await _run_both(frame)
+    assert len(event.fills) > 10
+    assert [_fill_key(f) for f in vec.fills] == [_fill_key(f) for f in event.fills]
+
+
+async def test_equity_and_tearsheet_match(frame):
+    event, vec = await _run_both(frame)
+    np.testing.assert_allclose(vec.equity_curve, np.array(event.equity_curve, dtype=float), rtol=1e-12)
+    for name in ("sharpe", "sortino", "calmar", "max_drawdown", "total_return"):
+        assert getattr(vec.tearsheet, name) == pytest.approx(getattr(event.tearsheet, name), rel=1e-9, abs=1e-12)
+
+
+async def test_arrow_input_and_ragged_symbols(frame):
+    # Drop a block of one symbol's bars: the mark matrix has NaN holes where
+    # a held position must keep its last close, as the ledger does.
+    ragged = frame.filter(~((frame["symbol"] == "ETH-PERP") & (frame["close"] > frame["close"].median())))
+    event, _ = await _run_both(ragged)
+    vec = await VectorizedBacktestEngine([BreakoutReference(ragged, lookback=48)]).run(ragged.to_arrow())
+    assert [_fill_key(f) for f in vec.fills] == [_fill_key(f) for f in event.fills]
+    np.testing.assert_allclose(vec.equity_curve, np.array(event.equity_curve, dtype=float), rtol=1e-12)
+
+
+async def test_no_signals_is_flat(frame):
+    vec = await VectorizedBacktestEngine([BreakoutReference(frame, lookback=10_000)]).run(frame)
+    assert vec.fills == []
+    assert vec.n_signal_ticks == 0
+    assert np.all(vec.equity_curve == 1000.0)
+
+
+class _TwoVenueBreakout(BreakoutReference):
+    """Alternates each signal between two venues; the frame has bars on one."""
+
+    def evaluate_batch(self, bars):
+        sigs = super().evaluate_batch(bars)
+        venues = [(Venue.KRAKEN_FUTURES if i % 2 else Venue.COINBASE_DERIV).value for i in range(sigs.height)]
+        return sigs.with_columns(pl.Series("venue", venues))
+
+
+async def test_signal_for_a_market_without_bars_never_fills(frame):
+    event = await BacktestEngine([_TwoVenueBreakout(frame, lookback=48)]).run(frame_to_bars(frame))
+    vec = await VectorizedBacktestEngine([_TwoVenueBreakout(frame, lookback=48)]).run(frame)
+    assert vec.fills and {f.venue for f in vec.fills} == {Venue.KRAKEN_FUTURES}
+    assert [_fill_key(f) for f in vec.fills] == [_fill_key(f) for f in event.fills]
+    np.testing.assert_allclose(vec.equity_curve, np.array(event.equity_curve, dtype=float), rtol=1e-12)
+
+
+async def test_symbol_on_two_venues_is_two_markets(frame):
+    # BTC-PERP trades on a second venue at its own prices: separate columns,
+    # books and marks, as the event path keys them by (symbol, venue).
+    other = synthetic_bar_frame(n_bars=1500, symbols=("BTC-PERP",), seed=12)
+    both = pl.concat([
+        frame.with_columns(pl.lit(Venue.KRAKEN_FUTURES.value).alias("venue")),
+        other.with_columns(pl.lit(Venue.COINBASE_DERIV.value).alias("venue")),
+    ])
+    event, vec = await _run_both(both)
+    btc = {f.venue for f in vec.fills if f.symbol == "BTC-PERP"}
+    assert btc == {Venue.KRAKEN_FUTURES, Venue.COINBASE_DERIV}
+    assert [_fill_key(f) for f in vec.fills] == [_fill_key(f) for f in event.fills]
+    np.testing.assert_allclose(vec.equity_curve, np.array(event.equity_curve, dtype=float), rtol=1e-12)
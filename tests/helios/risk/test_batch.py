@@ -0,0 +1,85 @@
+"""apply_batch(): one risk pass per tick with cumulative exposure accounting."""
+from __future__ import annotations
+
+from dataclasses import replace
+from decimal import Decimal
+
+from hypothesis import HealthCheck, given, settings
+from hypothesis import strategies as st
+
+from helios.risk import RiskConfig, apply, apply_batch
+from helios.types import Order, Rejection, StrategyId
+
+
+def _with(intent, **changes):
+    if "confidence_lower" in changes:
+        changes["signal_ref"] = replace(intent.signal_ref, confidence_lower=changes.pop("confidence_lower"))
+    return replace(intent, **changes)
+
+
+def test_approvals_accumulate_across_the_batch(base_intent, fresh_state):
+    # Each intent alone is 20% of NAV against A1's 40% allocation cap.
+    intents = [base_intent] * 3
+    assert all(isinstance(apply(i, fresh_state, RiskConfig()), Order) for i in intents)
+    results = apply_batch(intents, fresh_state, RiskConfig())
+    assert [type(r) for r in results] == [Order, Order, Rejection]
+    assert results[2].rule == "R07_strategy_alloc"
+
+
+def test_gross_exposure_accumulates(base_intent, fresh_state):
+    cfg = RiskConfig(strategy_alloc_max={}, max_net_exposure_pct_of_nav=100.0)
+    # 200 notional at 3x = 0.6x NAV each; the 2.0x gross cap admits three.
+    results = apply_batch([base_intent] * 4, fresh_state, cfg)
+    assert [r.rule for r in results if isinstance(r, Rejection)] == ["R11_gross_exposure"]
+    assert isinstance(results[3], Rejection)
+
+
+def test_higher_edge_wins_capacity_and_order_is_preserved(base_intent, fresh_state):
+    weak = _with(base_intent, notional_usd=Decimal("300"), confidence_lower=0.01)
+    strong = _with(base_intent, notional_usd=Decimal("300"), confidence_lower=0.05)
+    results = apply_batch([weak, strong], fresh_state, RiskConfig())
+    assert results[0].intent is weak and results[1].intent is strong
+    assert isinstance(results[1], Order)
+    assert isinstance(results[0], Rejection) and results[0].rule == "R07_strategy_alloc"
+
+
+def test_rejections_do_not_consume_capacity(base_intent, fresh_state):
+    too_levered = _with(base_intent, leverage=9.0, confidence_lower=0.09)
+    results = apply_batch([too_levered, base_intent, base_intent], fresh_state, RiskConfig())
+    assert results[0].rule == "R08_strategy_leverage"
+    assert isinstance(results[1], Order) and isinstance(results[2], Order)
+
+
+def test_account_rules_reject_every_intent(base_intent, fresh_state):
+    state = replace(fresh_state, realized_pnl_today_usd=Decimal("-50"))
+    results = apply_batch([base_intent, _with(base_intent, strategy=StrategyId.A3_LIQ_HUNT)], state, RiskConfig())
+    assert [r.rule for r in results] == ["R02_daily_loss", "R02_daily_loss"]
+
+
+@settings(max_examples=200, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@given(
+    nav=st.decimals(min_value=Decimal("100"), max_value=Decimal("100000"), places=2),
+    notional=st.decimals(min_value=Decimal("1"), max_value=Decimal("50000"), places=2),
+    leverage=st.floats(min_value=0.1, max_value=10.0),
+    strategy=st.sampled_from(list(StrategyId)),
+)
+def test_single_intent_batch_equals_apply(nav, notional, leverage, strategy, base_intent, fresh_state):
+    state = replace(fresh_state, nav_usd=nav, peak_nav_usd=nav, cash_usd=nav)
+    intent = _with(base_intent, notional_usd=notional, leverage=leverage, strategy=strategy)
+    [batched] = apply_batch([intent], state, RiskConfig())
+    single = apply(intent, state, RiskConfig())
+    assert type(batched) is type(single)
+    if isinstance(single, Rejection):
+        assert (batched.rule, batched.reason) == (single.rule, single.reason)
+    else:
+        assert batched.qty == single.qty
+
+
+def test_orders_that_are_not_emitted_take_no_capacity(base_intent, fresh_state):
+    # The strongest intent is approved but never sent (say, no market snapshot):
+    # both others still fit under A1's 40% allocation cap.
+    unroutable = _with(base_intent, symbol="NOSNAP", confidence_lower=0.09)
+    intents = [unroutable, base_intent, base_intent]
+    results = apply_batch(intents, fresh_state, RiskConfig(), emits=lambda o: o.intent.symbol != "NOSNAP")
+    assert all(isinstance(r, Order) for r in results)
+    assert isinstance(apply_batch(intents, fresh_state, RiskConfig())[2], Rejection)
@@ -0,0 +1,70 @@
+"""A1 fold training: pool vs in-process, fold cache, warm-start chain."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("xgboost")
+
+from helios.backtest.walkforward import walk_forward_splits
+from helios.strategies.a1_perp_trend.folds import train_folds
+
+PARAMS = {
+    "n_estimators": 20,
+    "max_depth": 3,
+    "learning_rate": 0.1,
+    "random_state": 0,
+    "eval_metric": "logloss",
+    "tree_method": "hist",
+    "verbosity": 0,
+}
+
+
+def _data(n: int = 600, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=(n, 5)).astype(np.float32)
+    y = (x[:, 0] + 0.5 * x[:, 1] + rng.normal(scale=0.5, size=n) > 0).astype(np.int64)
+    return x, y, walk_forward_splits(n, n_splits=3, val_size=100, min_train_size=200)
+
+
+def test_pool_matches_in_process(tmp_path):
+    x, y, splits = _data()
+    serial = train_folds(x, y, splits, PARAMS, max_workers=1, threads_per_worker=1)
+    pooled = train_folds(x, y, splits, PARAMS, max_workers=2, threads_per_worker=1, workdir=tmp_path)
+    assert [f.fold for f in pooled] == [s.fold for s in splits]
+    for a, b in zip(serial, pooled, strict=True):
+        np.testing.assert_allclose(a.val_pred, b.val_pred, rtol=1e-6)
+        np.testing.assert_allclose(a.importances, b.importances, rtol=1e-6)
+
+
+def test_cache_skips_unchanged_folds(tmp_path):
+    x, y, splits = _data()
+    first = train_folds(x, y, splits, PARAMS, cache_dir=tmp_path)
+    assert not any(f.cached for f in first)
+    again = train_folds(x, y, splits, PARAMS, cache_dir=tmp_path)
+    assert all(f.cached for f in again)
+    for a, b in zip(first, again, strict=True):
+        np.testing.assert_array_equal(a.val_pred, b.val_pred)
+
+    x2 = x.copy()
+    x2[splits[-1].val_idx[-1]] += 1.0  # only the last fold sees this row
+    changed = train_folds(x2, y, splits, PARAMS, cache_dir=tmp_path)
+    assert [f.cached for f in changed] == [True, True, False]
+
+
+def test_warm_start_chain_and_parent_invalidation(tmp_path):
+    x, y, splits = _data()
+    warm = train_folds(x, y, splits, PARAMS, warm_start=True, warm_start_rounds=5, cache_dir=tmp_path)
+    assert len(warm) == 3 and not any(f.cached for f in warm)
+    cold = train_folds(x, y, splits, PARAMS)
+    # Fold 0 is a full cold fit either way; later folds continue from it.
+    np.testing.assert_allclose(warm[0].val_pred, cold[0].val_pred, rtol=1e-6)
+    assert not np.allclose(warm[1].val_pred, cold[1].val_pred)
+
+    assert all(f.cached for f in train_folds(x, y, splits, PARAMS, warm_start=True,
+                                             warm_start_rounds=5, cache_dir=tmp_path))
+    # Later folds override n_estimators, so only fold 0's own key changes;
+    # the rest are invalidated through their parent.
+    longer = {**PARAMS, "n_estimators": 30}
+    changed = train_folds(x, y, splits, longer, warm_start=True, warm_start_rounds=5, cache_dir=tmp_path)
+    assert not any(f.cached for f in changed)
@@ -0,0 +1,93 @@
+"""IncrementalA1Features must match compute_features() bar-for-bar."""
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta, timezone
+
+import polars as pl
+from hypothesis import HealthCheck, given, settings
+from hypothesis import strategies as st
+
+from helios.strategies.a1_perp_trend.features import FEATURE_NAMES, compute_features
+from helios.strategies.a1_perp_trend.incremental import IncrementalA1Features
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+# Grid-valued inputs: distinct values differ by far more than rounding
+# noise, so "equal to float precision" is a meaningful check.
+closes = st.integers(min_value=50, max_value=400).map(float)
+volumes = st.integers(min_value=1, max_value=1000).map(float)
+funding = st.one_of(st.none(), st.integers(min_value=-30, max_value=30).map(lambda i: i * 1e-5))
+
+
+@st.composite
+def bar_frames(draw, with_funding: bool = True) -> pl.DataFrame:
+    rows = []
+    for symbol in draw(st.lists(st.sampled_from(["BTC", "ETH", "SOL"]), min_size=1, max_size=2, unique=True)):
+        n = draw(st.integers(min_value=1, max_value=140))
+        cs = draw(st.lists(closes, min_size=n, max_size=n))
+        vs = draw(st.lists(volumes, min_size=n, max_size=n))
+        fs = draw(st.lists(funding, min_size=n, max_size=n))
+        for i in range(n):
+            t = T0 + timedelta(hours=i)
+            row = {"symbol": symbol, "event_time": t, "available_at": t, "open": cs[i],
+                   "high": cs[i], "low": cs[i], "close": cs[i], "volume": vs[i]}
+            if with_funding:
+                row["funding_rate"] = fs[i]
+            rows.append(row)
+    schema = {"funding_rate": pl.Float64} if with_funding else None
+    return pl.DataFrame(rows, schema_overrides=schema)
+
+
+def _same(batch: float | None, stream: float | None) -> bool:
+    if batch is None or stream is None:
+        return batch is None and stream is None
+    if not math.isfinite(batch):
+        # Zero-variance window: both sides must be non-finite (see module doc)
+        return not math.isfinite(stream)
+    return math.isclose(batch, stream, rel_tol=1e-7, abs_tol=1e-12)
+
+
+def _assert_rows_match(batch_feats: pl.DataFrame, stream_rows: list[dict]) -> None:
+    batch = batch_feats.sort(["symbol", "event_time"]).iter_rows(named=True)
+    stream = sorted(stream_rows, key=lambda r: (r["symbol"], r["event_time"]))
+    for b, s in zip(batch, stream, strict=True):
+        assert (b["symbol"], b["event_time"]) == (s["symbol"], s["event_time"])
+        for name in FEATURE_NAMES:
+            assert _same(b[name], s[name]), (name, b["symbol"], b["event_time"], b[name], s[name])
+
+
+@settings(max_examples=60, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+@given(bar_frames())
+def test_streaming_matches_batch(frame):
+    feats = IncrementalA1Features()
+    # Interleave symbols by time, as a live feed would
+    rows = [feats.update(r) for r in frame.sort(["event_time", "symbol"]).iter_rows(named=True)]
+    _assert_rows_match(compute_features(frame), rows)
+
+
+@settings(max_examples=30, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+@given(bar_frames(with_funding=False), st.integers(min_value=0, max_value=140))
+def test_warm_start_then_stream(frame, split):
+    cutoff = T0 + timedelta(hours=split)
+    feats = IncrementalA1Features()
+    feats.warm_start(frame.filter(pl.col("event_time") < cutoff))
+    live = frame.filter(pl.col("event_time") >= cutoff).sort(["event_time", "symbol"])
+    rows = [feats.update(r) for r in live.iter_rows(named=True)]
+    # Batch features over the full history, restricted to the streamed bars
+    _assert_rows_match(compute_features(frame).filter(pl.col("event_time") >= cutoff), rows)
+
+
+def test_long_stream_stays_exact():
+    # Thousands of sliding updates: the periodic rebuild keeps Welford drift bounded
+    n = 3000
+    frame = pl.DataFrame({
+        "symbol": ["BTC"] * n,
+        "event_time": [T0 + timedelta(minutes=i) for i in range(n)],
+        "available_at": [T0 + timedelta(minutes=i) for i in range(n)],
+        "close": [30_000.0 + 500.0 * math.sin(i / 37.0) + (i % 7) for i in range(n)],
+        "volume": [1.0 + (i * 7919 % 113) for i in range(n)],
+        "funding_rate": [1e-4 * math.cos(i / 11.0) for i in range(n)],
+    })
+    feats = IncrementalA1Features()
+    _assert_rows_match(compute_features(frame), [feats.update(r) for r in frame.iter_rows(named=True)])
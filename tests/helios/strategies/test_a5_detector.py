@@ -1,13 +1,17 @@
 """Tests for the A5 sentiment-velocity detector."""
 from __future__ import annotations
 
+import random
+from collections import deque
 from datetime import datetime, timedelta, timezone
+from statistics import mean, pstdev
 
 import pytest
 
 from helios.strategies.a5_sentiment.detector import (
     MentionEvent,
     SentimentDetector,
+    SentimentSignal,
 )
 
 
@@ -125,3 +129,183 @@ def test_signal_includes_source_breakdown():
     assert sig is not None
     assert "x" in sig.contributing_sources
     assert "farcaster" in sig.contributing_sources
+
+
+def _random_stream(seed: int, tickers: int, now: datetime) -> list[MentionEvent]:
+    """~2h of in-order mentions: noisy baselines, some tickers spiking near `now`."""
+    rng = random.Random(seed)
+    events = []
+    for k in range(tickers):
+        rate = rng.choice((0.2, 1.0, 4.0))
+        spike = rng.random() < 0.5
+        t = 7200.0
+        while t > 0:
+            t -= rng.expovariate(rate * (25.0 if spike and t < 90 else 1.0)) * 60
+            if t > 0:
+                events.append((t, MentionEvent(
+                    ticker=f"T{k}", source=rng.choice(("x", "farcaster")),
+                    timestamp=now - timedelta(seconds=t),
+                    weight=rng.choice((0.1, 1.0, 1.0, 5.0, rng.uniform(0.1, 3.0))),
+                )))
+    return [ev for _, ev in sorted(events, key=lambda e: -e[0])]
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_ring_screen_never_drops_a_reference_signal(seed):
+    """evaluate()/evaluate_all() must emit exactly what the per-mention scoring
+    (_score, the original algorithm) emits on every ticker, at unaligned times."""
+    now = datetime(2026, 5, 25, 12, 0, 0, tzinfo=timezone.utc) + timedelta(seconds=17.25 * seed)
+    events = _random_stream(seed, 40, now)
+    screened, single, reference = (SentimentDetector(z_score_threshold=3.0, signal_cooldown_seconds=0)
+                                   for _ in range(3))
+    fired = 0
+    for step in range(4):
+        t = now + timedelta(seconds=23.5 * step)
+        for d in (screened, single, reference):
+            for ev in events:
+                if t - timedelta(seconds=23.5) < ev.timestamp <= t or (step == 0 and ev.timestamp <= t):
+                    d.ingest_mention(ev)
+        expected = [s for s in (reference._score(st, t) for st in reference._tickers.values()) if s]
+        assert screened.evaluate_all(t) == expected
+        assert [s for s in (single.evaluate(k, now=t) for k in single._tickers) if s] == expected
+        fired += len(expected)
+    assert fired > 0
+
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_scalar_screen_agrees_with_the_array_screen(seed):
+    """evaluate() screens one ring in a scalar loop; it must pass exactly the
+    tickers the NumPy screen of evaluate_all() passes, not just more of them."""
+    now = datetime(2026, 5, 25, 12, 0, 0, tzinfo=timezone.utc) + timedelta(seconds=11.75 * seed)
+    d = SentimentDetector(z_score_threshold=3.0, signal_cooldown_seconds=0)
+    for ev in _random_stream(seed, 60, now):
+        d.ingest_mention(ev)
+    states = list(d._tickers.values())
+    for at in (now, now + timedelta(seconds=31.5)):
+        batch = d._screen(states, at.timestamp()).tolist()
+        assert [d._screen_one(s, at.timestamp()) for s in states] == batch
+        assert 0 < sum(batch) < len(states)
+
+def test_evaluate_all_respects_cooldown_and_ticker_filter():
+    d = SentimentDetector(z_score_threshold=3.0, min_baseline_mentions=5.0)
+    now = datetime(2026, 5, 25, 12, 0, 0, tzinfo=timezone.utc)
+    for ticker in ("WIF", "PEPE"):
+        for i in range(60):
+            d.ingest_mention(_mention(ticker, 70 + i * 60, now=now))
+        for _ in range(30):
+            d.ingest_mention(_mention(ticker, 30, now=now))
+    assert [s.ticker for s in d.evaluate_all(now, tickers=["$wif", "BONK"])] == ["WIF"]
+    assert [s.ticker for s in d.evaluate_all(now)] == ["PEPE"]
+    assert d.evaluate_all(now) == []
+
+
+class _DequeDetector:
+    """The detector before minute buckets: one deque of mentions per ticker,
+    pruned from the head on ingest, scanned in full by evaluate()."""
+
+    def __init__(self, **kw) -> None:
+        self.d = SentimentDetector(**kw)  # thresholds and correlation helper only
+        self.mentions: dict[str, deque] = {}
+        self.prices: dict[str, deque] = {}
+        self.last_signal: dict[str, float] = {}
+
+    def ingest_mention(self, ev: MentionEvent) -> None:
+        q = self.mentions.setdefault(ev.ticker.upper().lstrip("$"), deque(maxlen=10_000))
+        unix = ev.timestamp.timestamp()
+        q.append((unix, ev.weight, ev.source))
+        while q and q[0][0] < unix - self.d.baseline_window:
+            q.popleft()
+
+    def ingest_price(self, ticker: str, price: float, ts: datetime) -> None:
+        q = self.prices.setdefault(ticker, deque(maxlen=600))
+        q.append((ts.timestamp(), float(price)))
+        while q and q[0][0] < ts.timestamp() - self.d.baseline_window:
+            q.popleft()
+
+    def evaluate(self, ticker: str, now: datetime) -> SentimentSignal | None:
+        d, mentions, now_unix = self.d, self.mentions.get(ticker), now.timestamp()
+        if not mentions or now_unix - self.last_signal.get(ticker, 0.0) < d.signal_cooldown:
+            return None
+        start, end = now_unix - d.baseline_window, now_unix - d.signal_window
+        base = [(t, w) for t, w, _ in mentions if start <= t < end]
+        minutes = max(1.0, (end - start) / 60.0)
+        total = sum(w for _, w in base)
+        if total < d.min_baseline_mentions:
+            return None
+        buckets: dict[int, float] = {}
+        for t, w in base:
+            buckets[int(t // 60)] = buckets.get(int(t // 60), 0.0) + w
+        if len(buckets) < 5:
+            return None
+        counts = list(buckets.values()) + [0.0] * max(0, int(minutes) - len(buckets))
+        mu = mean(counts)
+        std = pstdev(counts) if len(counts) > 1 else 0.0
+        if std == 0:
+            std = max(0.5, mu ** 0.5)
+        sig = [(t, w, s) for t, w, s in mentions if t >= end]
+        if not sig:
+            return None
+        per_min = sum(w for _, w, _ in sig) * (60.0 / d.signal_window)
+        z = (per_min - mu) / std
+        if z < d.z_threshold:
+            return None
+        corr = d._compute_mention_price_correlation(mentions, self.prices.get(ticker, deque()), now_unix)
+        if corr is not None and abs(corr) >= d.max_price_correlation:
+            return None
+        sources: dict[str, int] = {}
+        for _, _, src in sig:
+            sources[src] = sources.get(src, 0) + 1
+        self.last_signal[ticker] = now_unix
+        return SentimentSignal(
+            ticker=ticker, z_score=float(z), mentions_last_minute=per_min,
+            mentions_per_min_baseline=total / minutes, correlation_with_price=corr,
+            confidence=min(0.95, 0.4 + (z - d.z_threshold) * 0.05),
+            suggested_hold_seconds=d.suggested_hold_seconds, triggered_at=now,
+            contributing_sources=sources,
+        )
+
+
+def _messy_stream(rng: random.Random, now: datetime) -> list[MentionEvent]:
+    """Mentions over ~80 min, partly out of order, some stamped minutes ahead."""
+    events = []
+    for k in range(6):
+        rate, spike = rng.choice((0.3, 2.0, 6.0)), rng.random() < 0.5
+        for _ in range(rng.randint(20, 250)):
+            age = rng.uniform(-60, 4800)
+            if spike and rng.random() < 0.3:
+                age = rng.uniform(0, 90)
+            if rng.random() < 0.05:
+                age = -rng.uniform(120, 900)  # clock skew: up to 15 min ahead
+            events.append(MentionEvent(
+                ticker=f"T{k}", source=rng.choice(("x", "reddit")), timestamp=now - timedelta(seconds=age),
+                weight=rng.choice((0.1, 1.0, 5.0, rate)),
+            ))
+    events.sort(key=lambda e: e.timestamp + timedelta(seconds=rng.gauss(0, 300) if rng.random() < 0.2 else 0))
+    return events
+
+
+@pytest.mark.parametrize("chunk", range(4))
+def test_signals_match_the_deque_detector_on_messy_input(chunk):
+    fired = 0
+    for seed in range(chunk * 75, (chunk + 1) * 75):
+        rng = random.Random(seed)
+        now = datetime(2026, 5, 25, 12, 0, 0, tzinfo=timezone.utc) + timedelta(seconds=rng.uniform(0, 60))
+        kw = {"z_score_threshold": rng.choice((2.0, 3.0)), "min_baseline_mentions": 5.0,
+              "signal_cooldown_seconds": rng.choice((0, 120))}
+        new, each, old = SentimentDetector(**kw), SentimentDetector(**kw), _DequeDetector(**kw)
+        events = _messy_stream(rng, now)
+        for i, ev in enumerate(events):
+            for d in (new, each, old):
+                d.ingest_mention(ev)
+            if i % 7 == 0:
+                price = 1.0 + rng.random()
+                for d in (new, each, old):
+                    d.ingest_price(ev.ticker, price, ev.timestamp)
+            if i % max(1, len(events) // 3) == 0 or i == len(events) - 1:
+                at = max(ev.timestamp, now - timedelta(minutes=5)) + timedelta(seconds=rng.uniform(0, 30))
+                expected = [s for s in (old.evaluate(k, at) for k in sorted(old.mentions)) if s]
+                assert new.evaluate_all(at, tickers=sorted(old.mentions)) == expected, seed
+                assert [s for s in (each.evaluate(k, now=at) for k in sorted(old.mentions)) if s] == expected
+                fired += len(expected)
+    assert fired > 0
@@ -0,0 +1,171 @@
+"""SnapshotEnricher fan-out, EnrichmentCache sharing, and the latency histogram."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from helios.data.adapters.helius import HeliusAssetInfo, MintAuthorityInfo
+from helios.ops.latency import LatencyHistogram
+from helios.strategies.a2_meme_snipe.enricher import EnrichmentCache, SnapshotEnricher
+from helios.strategies.a2_meme_snipe.snapshot import TokenSnapshot
+
+DELAY = 0.05
+
+
+def _dex_snap(mint: str) -> TokenSnapshot:
+    return TokenSnapshot(
+        mint_address=mint, symbol="DOG", name="Dog", venue_pair_address="Pair1",
+        pool_age_seconds=300, liquidity_usd=Decimal("50000"), fully_diluted_value_usd=Decimal("200000"),
+        volume_5m_usd=Decimal("1000"), volume_1h_usd=Decimal("9000"), txns_5m=60, txns_1h=400,
+        mint_authority_renounced=False, freeze_authority_renounced=False, lp_locked_or_burned=False,
+        lp_lock_pct=0.0, top_10_holder_pct=1.0, dev_wallet_pct=1.0, n_holders=0, metadata_verified=True,
+        dev_history_known=False, dev_rug_history_count=0, bid_ask_spread_pct=0.03,
+        last_trade_price_usd=Decimal("0.001"), snapshot_time=datetime.now(timezone.utc), dex_id="pumpswap",
+    )
+
+
+class _Fake:
+    """Stands in for all three adapters; each call sleeps DELAY and is counted."""
+
+    def __init__(self, tracked: bool = True, mint_fails: bool = False) -> None:
+        self.tracked = tracked
+        self.mint_fails = mint_fails
+        self.calls: list[str] = []
+
+    async def _call(self, name: str) -> None:
+        self.calls.append(name)
+        await asyncio.sleep(DELAY)
+
+    async def fetch_token_snapshot(self, mint: str) -> TokenSnapshot | None:
+        await self._call("dex")
+        return _dex_snap(mint) if self.tracked else None
+
+    async def get_mint_authority_info(self, mint: str) -> MintAuthorityInfo:
+        await self._call("mint")
+        if self.mint_fails:
+            raise RuntimeError("rpc down")
+        return MintAuthorityInfo(mint_authority_renounced=True, freeze_authority_renounced=True,
+                                 supply=1_000_000_000, decimals=6)
+
+    async def get_asset_info(self, mint: str) -> HeliusAssetInfo:
+        await self._call("asset")
+        return HeliusAssetInfo(name="Doggo", symbol="DOGGO", metadata_verified=True)
+
+    async def get_holder_concentration_vs_supply(self, mint: str, ui_supply: float, limit: int = 20):
+        await self._call("birdeye")
+        assert ui_supply == 1000.0
+        return (0.05, 0.2, limit)
+
+
+def _enricher(fake: _Fake, cache: EnrichmentCache | None = None) -> SnapshotEnricher:
+    return SnapshotEnricher(dexscreener=fake, helius=fake, birdeye=fake, cache=cache or EnrichmentCache())
+
+
+async def test_enrich_fans_out_and_reuses_dexscreener_response():
+    fake = _Fake()
+    enricher = _enricher(fake)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    snap = await enricher.enrich("MINT")
+    elapsed = loop.time() - start
+
+    assert sorted(fake.calls) == ["asset", "birdeye", "dex", "mint"]  # no second DexScreener fetch
+    # dex / mint / asset overlap; only birdeye waits for the supply: two round trips, not four
+    assert elapsed < 3.5 * DELAY
+    assert snap is not None
+    assert (snap.symbol, snap.dex_id, snap.lp_locked_or_burned) == ("DOGGO", "pumpswap", True)
+    assert (snap.dev_wallet_pct, snap.top_10_holder_pct, snap.n_holders) == (0.05, 0.2, 100)
+    assert snap.mint_authority_renounced and snap.freeze_authority_renounced
+    assert {src: h.count for src, h in enricher.latency.items()} == {
+        "dexscreener": 1, "helius_mint": 1, "helius_asset": 1, "birdeye": 1,
+    }
+
+
+async def test_untracked_mint_skips_birdeye_and_failed_mint_info_degrades():
+    fake = _Fake(tracked=False)
+    assert await _enricher(fake).enrich("MINT") is None
+    await asyncio.sleep(2 * DELAY)
+    assert "birdeye" not in fake.calls
+
+    fake = _Fake(mint_fails=True)
+    snap = await _enricher(fake).enrich("MINT")
+    assert snap is not None and "birdeye" not in fake.calls  # no supply -> no holder call
+    assert (snap.mint_authority_renounced, snap.top_10_holder_pct, snap.n_holders) == (False, 1.0, 0)
+
+
+async def test_cache_shares_inflight_and_fresh_results_across_paths():
+    now = [0.0]
+    cache = EnrichmentCache(ttl_seconds=10.0, clock=lambda: now[0])
+    fake = _Fake()
+    a, b = _enricher(fake, cache), _enricher(fake, cache)
+
+    await asyncio.gather(a.enrich("MINT"), b.enrich("MINT"), a.dex_snapshot("MINT"))
+    assert sorted(fake.calls) == ["asset", "birdeye", "dex", "mint"]
+
+    await cache.get("dexscreener", "MINT", lambda: fake.fetch_token_snapshot("MINT"))
+    assert fake.calls.count("dex") == 1
+    now[0] = 11.0
+    await b.dex_snapshot("MINT")
+    assert fake.calls.count("dex") == 2
+    assert cache.hits > 0
+
+
+async def test_cache_does_not_keep_failures():
+    cache = EnrichmentCache()
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        await cache.get("src", "k", flaky)
+    assert await cache.get("src", "k", flaky) == "ok"
+    assert await cache.get("src", "k", flaky) == "ok"
+    assert len(calls) == 2
+
+
+def test_latency_histogram_quantiles_bound_from_above():
+    h = LatencyHistogram()
+    samples = [0.001 * (i + 1) for i in range(1000)]  # 1 ms .. 1 s
+    for s in samples:
+        h.record(s)
+    for q, exact in ((0.5, 0.5), (0.9, 0.9), (0.99, 0.99)):
+        assert exact <= h.quantile(q) <= exact * 1.05
+    assert h.quantile(1.0) == pytest.approx(1.0)
+    assert h.summary()["count"] == 1000
+    assert LatencyHistogram().quantile(0.5) == 0.0
+
+
+async def test_cancelling_the_last_waiter_cancels_the_request():
+    cache = EnrichmentCache()
+    started, cancelled = asyncio.Event(), asyncio.Event()
+
+    async def slow():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "late"
+
+    first = asyncio.create_task(cache.get("birdeye", "MINT", slow))
+    second = asyncio.create_task(cache.get("birdeye", "MINT", slow))
+    await started.wait()
+    first.cancel()
+    await asyncio.sleep(0)
+    assert not cancelled.is_set()  # `second` still wants it
+    second.cancel()
+    async with asyncio.timeout(1):
+        await cancelled.wait()
+
+    async def fast():
+        return "ok"
+
+    assert await cache.get("birdeye", "MINT", fast) == "ok"  # not the cancelled request
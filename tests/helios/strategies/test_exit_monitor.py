@@ -0,0 +1,173 @@
+"""ExitMonitor: exit rules, batched concurrent checks, scheduling, run loop."""
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+
+import pytest
+
+from helios.strategies.a2_meme_snipe.exit_monitor import ExitMonitor, ExitMonitorConfig, exit_reason
+
+
+@dataclass
+class _Pos:
+    entry_unix: int
+    target_price_usd: Decimal = Decimal("3")
+    stop_price_usd: Decimal = Decimal("0.5")
+    peak_price_usd: Decimal = Decimal("1")
+    trailing_pct: float = 0.5
+    max_hold_seconds: int = 3600
+
+
+class _Dex:
+    def __init__(self, prices: dict[str, Decimal], delay: float = 0.0, slow: set[str] = frozenset()) -> None:
+        self.prices = prices
+        self.delay = delay
+        self.slow = slow
+        self.requests: list[list[str]] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def fetch(self, mints):
+        self.requests.append(list(mints))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay * (10 if self.slow & set(mints) else 1))
+            return {m: self.prices[m] for m in mints if m in self.prices}
+        finally:
+            self.in_flight -= 1
+
+
+def _runner(n: int, prices: dict[str, Decimal] | None = None, **dex_kw):
+    now = int(time.time())
+    positions = {f"M{i}": _Pos(entry_unix=now) for i in range(n)}
+    dex = _Dex(prices if prices is not None else dict.fromkeys(positions, Decimal("1")), **dex_kw)
+    exits: list[tuple[str, str, float]] = []
+
+    async def on_exit(mint, reason):
+        positions.pop(mint, None)
+        exits.append((mint, reason, time.perf_counter()))
+
+    return positions, dex, exits, on_exit
+
+
+def test_exit_reason_order_and_peak_tracking():
+    now = 1_000
+    pos = _Pos(entry_unix=now)
+    assert exit_reason(pos, Decimal("0.5"), now) == "stop_loss"
+    assert exit_reason(pos, Decimal("3"), now) == "target"
+    assert pos.peak_price_usd == Decimal("3")
+    assert exit_reason(pos, Decimal("1.4"), now) == "trailing_stop"
+    pos = _Pos(entry_unix=now)
+    assert exit_reason(pos, Decimal("1.2"), now + 100) is None
+    assert exit_reason(pos, Decimal("1.2"), now + 3600) == "time_exit"
+
+
+async def test_check_batches_with_bounded_concurrency():
+    positions, dex, exits, on_exit = _runner(130, delay=0.01)
+    monitor = ExitMonitor(positions, dex.fetch, on_exit, ExitMonitorConfig(batch_size=30, max_concurrency=2))
+    await monitor.sweep()
+    assert sorted(len(r) for r in dex.requests) == [10, 30, 30, 30, 30]
+    assert dex.peak_in_flight == 2
+    assert monitor.checks == 130 and exits == []
+
+
+async def test_exit_fires_when_its_batch_lands_not_after_the_sweep():
+    prices = {f"M{i}": Decimal("1") for i in range(60)}
+    prices["M45"] = Decimal("0.4")  # second batch: stop
+    positions, dex, exits, on_exit = _runner(60, prices, delay=0.02, slow={"M0"})
+    monitor = ExitMonitor(positions, dex.fetch, on_exit, ExitMonitorConfig(batch_size=30))
+    start = time.perf_counter()
+    task = asyncio.create_task(monitor.sweep())
+    await asyncio.sleep(0.1)
+    assert [(m, r) for m, r, _ in exits] == [("M45", "stop_loss")]  # the slow batch is still out
+    assert exits[0][2] - start < 0.1
+    assert not task.done()
+    await task
+    assert "M45" not in positions
+
+
+def test_next_interval_shrinks_near_thresholds_and_with_volatility():
+    positions, dex, _, on_exit = _runner(1)
+    cfg = ExitMonitorConfig(min_interval=0.5, max_interval=15.0)
+    monitor = ExitMonitor(positions, dex.fetch, on_exit, cfg)
+    pos = positions["M0"]
+    now = pos.entry_unix
+    far = monitor.next_interval("M0", pos, Decimal("1.2"), now)
+    near = monitor.next_interval("M0", pos, Decimal("0.502"), now)
+    nearish = monitor.next_interval("M0", pos, Decimal("0.52"), now)
+    assert near == cfg.min_interval < nearish < far
+    assert far == cfg.max_interval
+
+    monitor._observe("M0", Decimal("1.0"), now)
+    monitor._observe("M0", Decimal("1.3"), now + 1)  # ~26% in a second
+    assert monitor.next_interval("M0", pos, Decimal("1.3"), now + 1) < far
+    assert monitor.next_interval("M0", pos, Decimal("1.2"), now + 3599.8) == pytest.approx(0.2)
+
+
+def test_default_schedule_backs_calm_positions_off_the_shared_bucket():
+    positions, dex, _, on_exit = _runner(1)
+    monitor = ExitMonitor(positions, dex.fetch, on_exit)
+    pos = positions["M0"]
+    # Far from every level at the default sigma: polled well under 1 rps
+    assert monitor.next_interval("M0", pos, Decimal("1.2"), pos.entry_unix) > 5.0
+
+
+async def test_run_loop_picks_up_positions_and_exits_on_trip():
+    positions, dex, exits, on_exit = _runner(10, delay=0.005)
+    monitor = ExitMonitor(positions, dex.fetch, on_exit, ExitMonitorConfig(min_interval=0.02, max_interval=0.05))
+    task = asyncio.create_task(monitor.run())
+    try:
+        await asyncio.sleep(0.05)
+        assert monitor.checks >= 10 and exits == []
+        dex.prices["M3"] = Decimal("0.3")
+        tripped = time.perf_counter()
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if exits:
+                break
+        assert [(m, r) for m, r, _ in exits] == [("M3", "stop_loss")]
+        assert exits[0][2] - tripped < 0.2
+        positions["NEW"] = _Pos(entry_unix=int(time.time()))
+        dex.prices["NEW"] = Decimal("5")
+        monitor.track("NEW")
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if len(exits) == 2:
+                break
+        assert exits[1][:2] == ("NEW", "target")
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+def test_riders_fill_spare_batch_room_soonest_first():
+    positions, dex, _, on_exit = _runner(5)
+    monitor = ExitMonitor(positions, dex.fetch, on_exit, ExitMonitorConfig(batch_size=4))
+    for i, at in enumerate((50.0, 10.0, 30.0, 20.0, 40.0)):
+        monitor._schedule(f"M{i}", at)
+    assert monitor._riders(2) == ["M1", "M3"]
+    assert sorted(monitor._due) == ["M0", "M2", "M4"]
+    assert monitor._riders(4) == []
+
+
+async def test_stopping_the_loop_lets_in_flight_exits_finish():
+    positions, dex, exits, _ = _runner(3)
+    started = asyncio.Event()
+
+    async def slow_exit(mint, reason):
+        positions.pop(mint, None)  # the runner untracks before the swap
+        started.set()
+        await asyncio.sleep(0.05)
+        exits.append((mint, reason, time.perf_counter()))
+
+    monitor = ExitMonitor(positions, dex.fetch, slow_exit, ExitMonitorConfig(min_interval=0.01, max_interval=0.02))
+    dex.prices["M1"] = Decimal("0.3")
+    task = asyncio.create_task(monitor.run())
+    await asyncio.wait_for(started.wait(), 1.0)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    assert [(m, r) for m, r, _ in exits] == [("M1", "stop_loss")]
@@ -0,0 +1,73 @@
+"""Vectorized exit-policy grid must reproduce the scalar sim_* functions exactly."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+import helios.strategies.a2_meme_snipe.exit_sim as exit_sim
+from helios.strategies.a2_meme_snipe.exit_research import (
+    PolicySpec,
+    build_policy_grid,
+    evaluate_policies,
+    sim_time_exit,
+)
+from helios.strategies.a2_meme_snipe.exit_sim import CandlePaths, simulate_grid
+from helios.strategies.a2_meme_snipe.outcomes import Candle
+
+GRID = build_policy_grid()
+EXTRA = [  # edge parameters outside the default grid
+    PolicySpec("hold", lambda c, e: (c[-1].c - e) / e, "hold", ()),
+    PolicySpec("time0", lambda c, e: sim_time_exit(c, e, 0), "time", (0,)),
+]
+
+
+def _paths(seed: int, n_tokens: int, max_bars: int) -> list[tuple[float, list[Candle]]]:
+    rng = np.random.default_rng(seed)
+    out = []
+    for i in range(n_tokens):
+        n = int(rng.integers(1, max_bars + 1))
+        close = np.exp(np.cumsum(rng.normal(0.002, 0.08, n)))
+        open_ = np.r_[1.0, close[:-1]]
+        high = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0, 0.04, n)))
+        low = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0, 0.04, n)))
+        if i % 5 == 0:
+            close[n // 2] = 0.0  # a zero close must not fire the momentum exit
+        candles = [Candle(60 * j, float(open_[j]), float(high[j]), float(low[j]), float(close[j]), 0.0)
+                   for j in range(n)]
+        out.append((float(rng.uniform(0.5, 1.5)), candles))
+    return out
+
+
+def _assert_matches_scalar(tokens, specs) -> None:
+    vector = simulate_grid(CandlePaths.pack(tokens), [(s.kind, s.params) for s in specs])
+    for p, spec in enumerate(specs):
+        scalar = np.array([spec.fn(c, e) for e, c in tokens])
+        np.testing.assert_array_equal(vector[p], scalar, err_msg=spec.name)
+
+
+def test_full_grid_matches_scalar_exactly():
+    _assert_matches_scalar(_paths(0, 200, 180), GRID + EXTRA)
+
+
+def test_row_blocks_do_not_change_results(monkeypatch):
+    monkeypatch.setattr(exit_sim, "_BLOCK_CELLS", 300)
+    _assert_matches_scalar(_paths(1, 60, 120), GRID)
+
+
+@settings(max_examples=50, deadline=None)
+@given(seed=st.integers(0, 10_000), max_bars=st.integers(1, 40))
+def test_short_and_ragged_paths_match_scalar(seed, max_bars):
+    _assert_matches_scalar(_paths(seed, 8, max_bars), GRID)
+
+
+def test_evaluate_policies_mixes_vector_and_scalar_specs():
+    tokens = _paths(2, 40, 90)
+    custom = PolicySpec("first_close", lambda c, e: (c[0].c - e) / e)  # no kind: scalar fallback
+    specs = [*GRID[:5], custom]
+    results = {r.name: r for r in evaluate_policies([*tokens, (1.0, [])], specs=specs)}
+    assert set(results) == {s.name for s in specs}
+    assert all(r.n == 40 for r in results.values())
+    expected = np.mean([(c[0].c - e) / e for e, c in tokens])
+    assert results["first_close"].mean_raw == pytest.approx(expected)
@@ -1,20 +1,24 @@
 """Tests for outcome metrics + exit-policy simulators."""
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from helios.strategies.a2_meme_snipe.outcomes import (
     Candle,
+    CandleColumns,
     apply_slippage,
     compute_outcome,
+    compute_outcomes_batch,
+    parse_birdeye_candles,
     policy_buy_and_hold,
     policy_fixed_target_stop,
     policy_trailing_stop,
 )
 
 
-def _c(t: int, o: float, h: float, l: float, c: float, v: float = 0.0) -> Candle:
-    return Candle(unix_time=t, o=o, h=h, l=l, c=c, v=v)
+def _c(t: int, o: float, h: float, low: float, c: float, v: float = 0.0) -> Candle:
+    return Candle(unix_time=t, o=o, h=h, l=low, c=c, v=v)
 
 
 def test_compute_outcome_pumps_then_dumps():
@@ -133,3 +137,31 @@ def test_apply_slippage_compresses_winners():
 
 def test_apply_slippage_zero_slippage_is_identity():
     assert apply_slippage(0.5, 0.0) == pytest.approx(0.5)
+
+
+def test_outcomes_batch_matches_scalar_per_window():
+    rng = np.random.default_rng(11)
+    windows = {"1h": 3600, "4h": 14400, "24h": 86400}
+    for _ in range(20):
+        n = int(rng.integers(1, 1500))
+        t = np.sort(rng.choice(np.arange(0, 150_000, 60), n, replace=False))
+        close = np.exp(np.cumsum(rng.normal(0, 0.05, n)))
+        open_ = np.r_[1.0, close[:-1]]
+        high = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0, 0.05, n)))
+        low = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0, 0.05, n)))
+        items = [{"unixTime": int(t[i]), "o": open_[i], "h": high[i], "l": low[i], "c": close[i]}
+                 for i in range(n)]
+        candles = parse_birdeye_candles(items)
+        entries = [(int(rng.integers(-1000, 150_000)), float(rng.uniform(0.3, 2.0))) for _ in range(6)]
+        batch = compute_outcomes_batch(CandleColumns.from_birdeye(items), [*entries, (0, 0.0)], windows)
+        assert batch[-1] == {}
+        for (entry_unix, entry_price), got in zip(entries, batch[:-1], strict=True):
+            for label, secs in windows.items():
+                window = [c for c in candles if c.unix_time <= entry_unix + secs]
+                ref = compute_outcome(window, entry_unix, entry_price)
+                if ref is None:
+                    assert label not in got
+                    continue
+                assert got[label].outcome == ref
+                assert got[label].target_stop == policy_fixed_target_stop(window, entry_unix, entry_price, 3.0, 0.5)
+                assert got[label].trailing == policy_trailing_stop(window, entry_unix, entry_price, 0.5)
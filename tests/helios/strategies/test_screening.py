@@ -0,0 +1,124 @@
+"""StagedScreener: same passing set as enrich() + RugFilter.check(), fewer calls."""
+from __future__ import annotations
+
+import random
+from dataclasses import replace
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from helios.data.adapters.helius import HeliusAssetInfo, MintAuthorityInfo
+from helios.strategies.a2_meme_snipe.enricher import EnrichmentCache, SnapshotEnricher
+from helios.strategies.a2_meme_snipe.rug_filter import RugFilter
+from helios.strategies.a2_meme_snipe.screening import StagedScreener
+from helios.strategies.a2_meme_snipe.snapshot import TokenSnapshot
+
+
+def _live_prepare(snap: TokenSnapshot) -> TokenSnapshot:
+    # Waive P02 like the live runner, and fill the spread the enricher leaves
+    # UNKNOWN so tokens can reach the holders stage and pass.
+    return replace(snap, dev_history_known=True, bid_ask_spread_pct=0.02)
+
+
+class _Upstreams:
+    """Random but deterministic per-mint answers from all three adapters."""
+
+    def __init__(self, seed: int) -> None:
+        self.seed = seed
+        self.calls: list[tuple[str, str]] = []
+
+    def _rng(self, mint: str, source: str) -> random.Random:
+        return random.Random(f"{self.seed}-{mint}-{source}")
+
+    async def get_mint_authority_info(self, mint: str) -> MintAuthorityInfo:
+        self.calls.append(("mint", mint))
+        r = self._rng(mint, "mint")
+        if r.random() < 0.05:
+            raise RuntimeError("rpc down")
+        return MintAuthorityInfo(
+            mint_authority_renounced=r.random() < 0.8, freeze_authority_renounced=r.random() < 0.9,
+            supply=r.choice((0, 10 ** 15, 10 ** 15, 10 ** 15)), decimals=6,
+            has_transfer_hook=r.random() < 0.05, transfer_fee_basis_points=r.choice((0, 0, 0, 500)),
+        )
+
+    async def get_asset_info(self, mint: str) -> HeliusAssetInfo:
+        self.calls.append(("asset", mint))
+        return HeliusAssetInfo(name="Dog", symbol="DOG", metadata_verified=self._rng(mint, "asset").random() < 0.9)
+
+    async def fetch_token_snapshot(self, mint: str) -> TokenSnapshot | None:
+        self.calls.append(("dex", mint))
+        r = self._rng(mint, "dex")
+        if r.random() < 0.05:
+            return None
+        return TokenSnapshot(
+            mint_address=mint, symbol="DOG", name="Dog", venue_pair_address="P",
+            pool_age_seconds=r.choice((10, 300, 900, 4000)),
+            liquidity_usd=Decimal(r.choice((5_000, 40_000, 90_000))),
+            fully_diluted_value_usd=Decimal(r.choice((100_000, 300_000, 3_000_000))),
+            volume_5m_usd=Decimal(r.choice((1_000, 10_000, 10_000))), volume_1h_usd=Decimal(50_000),
+            txns_5m=r.choice((10, 80, 80)), txns_1h=500,
+            mint_authority_renounced=False, freeze_authority_renounced=False, lp_locked_or_burned=False,
+            lp_lock_pct=0.0, top_10_holder_pct=1.0, dev_wallet_pct=1.0, n_holders=0, metadata_verified=True,
+            dev_history_known=False, dev_rug_history_count=0, bid_ask_spread_pct=None,
+            last_trade_price_usd=Decimal("0.001"), snapshot_time=datetime.now(timezone.utc),
+            dex_id=r.choice(("pumpswap", "raydium", "meteora")),
+        )
+
+    async def get_holder_concentration_vs_supply(self, mint: str, ui_supply: float, limit: int = 20):
+        self.calls.append(("birdeye", mint))
+        r = self._rng(mint, "birdeye")
+        return (r.choice((0.02, 0.02, 0.1)), r.choice((0.15, 0.15, 0.5)), r.choice((50, 100, 100)))
+
+
+def _enricher(up: _Upstreams) -> SnapshotEnricher:
+    return SnapshotEnricher(dexscreener=up, helius=up, birdeye=up, cache=EnrichmentCache())
+
+
+async def test_staged_screen_passes_exactly_what_the_full_filter_passes():
+    rug = RugFilter()
+    mints = [f"M{i}" for i in range(1000)]
+    full_up, staged_up = _Upstreams(3), _Upstreams(3)
+
+    full_enricher = _enricher(full_up)
+    expected = {}
+    for mint in mints:
+        snap = await full_enricher.enrich(mint)
+        expected[mint] = snap is not None and rug.check(_live_prepare(snap)).passed
+
+    screener = StagedScreener(_enricher(staged_up), rug, prepare=_live_prepare)
+    results = {mint: await screener.screen(mint) for mint in mints}
+
+    assert {m: r.passed for m, r in results.items()} == expected
+    assert any(expected.values())
+    for mint, r in results.items():
+        if r.passed:
+            assert r.snapshot == replace(
+                _live_prepare(await full_enricher.enrich(mint)), snapshot_time=r.snapshot.snapshot_time,
+            )
+    assert len(staged_up.calls) < 0.6 * len(full_up.calls)
+
+
+async def test_stage_counters_and_early_exits():
+    up = _Upstreams(5)
+    screener = StagedScreener(_enricher(up), prepare=_live_prepare)
+    for i in range(200):
+        await screener.screen(f"M{i}")
+    a, m, h = (screener.stats[s] for s in ("authority", "market", "holders"))
+
+    assert a.entered == 200 and a.latency.count == 200
+    assert m.entered == a.entered - a.rejected
+    assert h.entered == m.entered - m.rejected - m.no_data
+    assert a.rejected > 0 and m.rejected > 0
+    calls = {kind: sum(1 for k, _ in up.calls if k == kind) for kind in ("mint", "dex", "asset", "birdeye")}
+    assert calls["dex"] == calls["asset"] == m.entered
+    assert calls["birdeye"] <= h.entered
+    assert screener.summary()["authority"]["reject_rate"] == round(a.rejected / 200, 4)
+
+
+async def test_authority_reject_matches_full_filter_reason_order():
+    rug = RugFilter()
+    info = MintAuthorityInfo(mint_authority_renounced=True, freeze_authority_renounced=False,
+                             supply=1, decimals=0, has_permanent_delegate=True)
+    assert rug.check_authorities(info).reasons == ("K02_freeze_authority_active",)
+    info = replace(info, freeze_authority_renounced=True)
+    assert rug.check_authorities(info).reasons == ("K05_permanent_delegate_set_honeypot",)
+    assert rug.check_authorities(replace(info, has_permanent_delegate=False)).passed
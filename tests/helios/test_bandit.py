@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import random
 
-from helios.allocator.bandit import StrategyBandit
+from helios.allocator.bandit import BetaPosterior, StrategyBandit
+from helios.orchestrator import Orchestrator, loop
 from helios.types import StrategyId
 
 
@@ -41,3 +42,101 @@ def test_sample_weight_in_unit_interval():
     for _ in range(100):
         w = bandit.sample_weight(StrategyId.A1_PERP_TREND, "")
         assert 0.0 <= w <= 1.0
+
+
+def test_sample_weights_vectorized_and_allocation_prefers_winner():
+    bandit = StrategyBandit()
+    for _ in range(40):
+        bandit.update(StrategyId.A1_PERP_TREND, "", win=True)
+        bandit.update(StrategyId.A3_LIQ_HUNT, "", win=False)
+    keys = [(StrategyId.A1_PERP_TREND, ""), (StrategyId.A3_LIQ_HUNT, ""), (StrategyId.A1_PERP_TREND, "")]
+    w = bandit.sample_weights(keys)
+    assert w.shape == (3,) and w[0] > w[1] and w[0] != w[2]
+    alloc = bandit.allocation_weights(keys[:2], n_draws=2000)
+    assert alloc.sum() == 1.0 and alloc[0] > 0.99
+
+
+def test_decay_and_window_forget_old_outcomes():
+    decayed = StrategyBandit(decay=0.9)
+    windowed = StrategyBandit(window=20)
+    for b in (decayed, windowed):
+        for _ in range(100):
+            b.update(StrategyId.A1_PERP_TREND, "", win=True)
+        for _ in range(30):
+            b.update(StrategyId.A1_PERP_TREND, "", win=False)
+        assert b.mean_estimate(StrategyId.A1_PERP_TREND, "") < 0.2
+    post = windowed.posterior(StrategyId.A1_PERP_TREND, "")
+    assert (post.alpha, post.beta) == (1.0, 21.0)
+
+
+def test_posteriors_survive_restart_with_journal_and_checkpoint(tmp_path):
+    path = tmp_path / "bandit.json"
+    bandit = StrategyBandit(path=path, window=50, checkpoint_every=7)
+    outcomes = [(StrategyId.A1_PERP_TREND if i % 3 else StrategyId.A5_SENT_VEL, "trend", i % 4 != 0)
+                for i in range(60)]
+    for s, r, w in outcomes:
+        bandit.update(s, r, w)
+    assert path.exists() and path.with_name("bandit.json.journal").stat().st_size > 0
+    restored = StrategyBandit(path=path, window=50, checkpoint_every=7)
+    assert restored.posteriors == bandit.posteriors
+
+    # Crash after the snapshot landed but before the journal was truncated:
+    # replay must skip what the snapshot already holds.
+    journal = path.with_name("bandit.json.journal").read_text()
+    restored.checkpoint()
+    path.with_name("bandit.json.journal").write_text(journal + '{"seq": 999, "s"')
+    again = StrategyBandit(path=path, window=50)
+    assert again.posteriors == bandit.posteriors
+
+
+def test_posteriors_seed_the_arms():
+    seeded = StrategyBandit(posteriors={(StrategyId.A1_PERP_TREND, ""): BetaPosterior(9.0, 1.0)})
+    assert seeded.mean_estimate(StrategyId.A1_PERP_TREND, "") == 0.9
+    assert seeded.posteriors == {(StrategyId.A1_PERP_TREND, ""): BetaPosterior(9.0, 1.0)}
+    positional = StrategyBandit({(StrategyId.A1_PERP_TREND, ""): BetaPosterior(9.0, 1.0)})
+    assert positional.posteriors == seeded.posteriors
+
+
+def test_posteriors_mapping_edits_the_arms():
+    bandit = StrategyBandit()
+    a1, a3 = (StrategyId.A1_PERP_TREND, ""), (StrategyId.A3_LIQ_HUNT, "")
+    bandit.posteriors[a1] = BetaPosterior(9.0, 1.0)
+    bandit.posteriors[a3] = BetaPosterior(1.0, 3.0)
+    bandit.posteriors[a1].update(False)
+    assert bandit.mean_estimate(*a1) == 9.0 / 11.0
+    assert a1 in bandit.posteriors and len(bandit.posteriors) == 2
+    del bandit.posteriors[a1]
+    assert dict(bandit.posteriors) == {a3: BetaPosterior(1.0, 3.0)}
+    assert bandit.mean_estimate(*a1) == 0.5 and bandit.mean_estimate(*a3) == 0.25
+
+
+def test_torn_journal_tail_is_cut_before_the_next_append(tmp_path):
+    path = tmp_path / "bandit.json"
+    bandit = StrategyBandit(path=path)
+    bandit.update(StrategyId.A1_PERP_TREND, "", win=True)
+    journal = path.with_name("bandit.json.journal")
+    journal.write_text(journal.read_text() + '{"seq": 2, "s": "a1')  # killed mid-write
+
+    resumed = StrategyBandit(path=path)
+    resumed.update(StrategyId.A1_PERP_TREND, "", win=False)
+    again = StrategyBandit(path=path)
+    assert again.posterior(StrategyId.A1_PERP_TREND, "") == BetaPosterior(2.0, 2.0)
+
+
+def test_decay_and_window_are_restored_with_the_state(tmp_path):
+    path = tmp_path / "bandit.json"
+    bandit = StrategyBandit(path=path, decay=0.9, window=5)
+    for i in range(12):
+        bandit.update(StrategyId.A1_PERP_TREND, "", win=i % 3 == 0)
+    bandit.checkpoint()
+    bandit.update(StrategyId.A1_PERP_TREND, "", win=True)
+
+    restored = StrategyBandit(path=path)  # defaults: no forgetting
+    assert (restored.decay, restored.window) == (0.9, 5)
+    assert restored.posteriors == bandit.posteriors
+
+
+def test_orchestrator_bandit_is_memory_only_unless_live(tmp_path, monkeypatch):
+    monkeypatch.setattr(loop, "BANDIT_STATE_PATH", tmp_path / "bandit_state.json")
+    assert Orchestrator(strategies=[], router=None).bandit.path is None
+    assert Orchestrator.live([], None).bandit.path == tmp_path / "bandit_state.json"
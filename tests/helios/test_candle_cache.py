@@ -0,0 +1,134 @@
+"""CandleCache: coverage bookkeeping, gap-only fetches, adapter read-through."""
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+
+import httpx
+
+from helios.data.adapters.geckoterminal import GeckoTerminalAdapter
+from helios.data.adapters.kraken_futures import KrakenFuturesMarketData
+from helios.data.store.candle_cache import CandleCache, merge_ranges, missing_ranges
+from helios.ops.ratelimit import TokenBucket
+
+T0 = 1_700_000_000 - 1_700_000_000 % 60
+
+
+def _candles(start: int, end: int) -> list[dict]:
+    first = start + (-start) % 60
+    return [{"unixTime": t, "o": 1.0, "h": 2.0, "l": 0.5, "c": 1.5, "v": 10.0} for t in range(first, end + 1, 60)]
+
+
+class _Upstream:
+    def __init__(self) -> None:
+        self.calls: list[tuple[int, int]] = []
+
+    async def __call__(self, start: int, end: int) -> list[dict]:
+        self.calls.append((start, end))
+        return _candles(start, end)
+
+
+def test_range_arithmetic():
+    assert merge_ranges([(50, 60), (0, 10), (11, 20), (15, 30)]) == [(0, 30), (50, 60)]
+    covered = [(0, 30), (50, 60)]
+    assert missing_ranges(covered, 10, 70) == [(31, 49), (61, 70)]
+    assert missing_ranges(covered, 0, 30) == []
+    assert missing_ranges([], 5, 9) == [(5, 9)]
+
+
+async def test_fetches_only_uncovered_gaps(tmp_path):
+    cache = CandleCache(tmp_path)
+    up = _Upstream()
+    first = await cache.fetch("gt", "MINT", "1m", T0, T0 + 3600, up)
+    assert first == [{**c, "available_at": first[0]["available_at"]} for c in _candles(T0, T0 + 3600)]
+
+    wider = await cache.fetch("gt", "MINT", "1m", T0 - 600, T0 + 7200, up)
+    assert up.calls == [(T0, T0 + 3600), (T0 - 600, T0 - 1), (T0 + 3601, T0 + 7200)]
+    assert [c["unixTime"] for c in wider] == list(range(T0 - 600, T0 + 7201, 60))
+
+    reopened = CandleCache(tmp_path)  # coverage persists
+    inside = await reopened.fetch("gt", "MINT", "1m", T0 + 60, T0 + 120, up)
+    assert [c["unixTime"] for c in inside] == [T0 + 60, T0 + 120]
+    assert len(up.calls) == 3 and reopened.hits == 1
+
+
+async def test_unsettled_tail_and_unknown_answers_are_not_cached(tmp_path):
+    cache = CandleCache(tmp_path)
+    now = int(time.time())
+    up = _Upstream()
+    rows = await cache.fetch("gt", "NEW", "1m", now - 3600, now, up)
+    assert rows[-1]["unixTime"] > now - 120
+    assert cache.covered("gt", "NEW", "1m")[-1][1] <= now - 120
+    await cache.fetch("gt", "NEW", "1m", now - 3600, now, up)
+    assert up.calls[1][0] > now - 180  # only the still-forming tail again
+
+    async def no_pool(start, end):
+        return None
+
+    assert await cache.fetch("gt", "GONE", "1m", T0, T0 + 600, no_pool) == []
+    assert cache.covered("gt", "GONE", "1m") == []
+
+
+async def test_kraken_bars_round_trip_through_cache(tmp_path):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        frm = int(request.url.params["from"])
+        to = int(request.url.params["to"])
+        first = frm + (-frm) % 300
+        candles = [{"time": t * 1000, "open": 100.5, "high": 101, "low": 99.25, "close": 100.75, "volume": 3}
+                   for t in range(first, to + 1, 300)]
+        return httpx.Response(200, json={"candles": candles})
+
+    kraken = KrakenFuturesMarketData(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                                     limiter=TokenBucket(1000.0, 10), cache=CandleCache(tmp_path))
+    start = datetime.fromtimestamp(T0 - T0 % 300, timezone.utc)
+    end = datetime.fromtimestamp(T0 - T0 % 300 + 3600, timezone.utc)
+    fresh = await kraken.fetch_bars("PF_XBTUSD", "5m", start, end)
+    n = len(requests)
+    again = await kraken.fetch_bars("PF_XBTUSD", "5m", start, end)
+    assert len(requests) == n
+    assert again == fresh and len(fresh) == 13
+    await kraken.close()
+
+
+async def test_crash_before_coverage_save_does_not_duplicate_candles(tmp_path):
+    cache = CandleCache(tmp_path)
+    up = _Upstream()
+    await cache.fetch("gt", "MINT", "1m", T0, T0 + 600, up)
+    (tmp_path / CandleCache.dataset("gt", "1m") / "_coverage.json").unlink()  # as if killed mid-fetch
+
+    again = await CandleCache(tmp_path).fetch("gt", "MINT", "1m", T0, T0 + 600, up)
+    assert len(up.calls) == 2
+    assert [c["unixTime"] for c in again] == list(range(T0, T0 + 601, 60))
+
+
+async def test_gap_fills_are_compacted_per_symbol(tmp_path):
+    cache = CandleCache(tmp_path, compact_every=4)
+    up = _Upstream()
+    for i in range(6):
+        await cache.fetch("gt", "AAA" if i % 2 else "BBB", "1m", T0 + i * 600, T0 + i * 600 + 540, up)
+    ds_dir = tmp_path / CandleCache.dataset("gt", "1m")
+    assert len(cache.store.catalog.files(ds_dir.name)) == 3  # one merged part + two new ones
+    rows = await cache.fetch("gt", "AAA", "1m", T0, T0 + 3600, up)
+    assert len(up.calls) == 6 + 4  # AAA's three windows were cached; its three gaps were not
+    assert len(rows) == len({r["unixTime"] for r in rows}) == 61
+
+
+async def test_page_capped_geckoterminal_fetch_only_covers_what_came_back(tmp_path):
+    def handler(request: httpx.Request) -> httpx.Response:
+        before = int(request.url.params["before_timestamp"])
+        ohlcv = [[t, 1, 2, 0.5, 1.5, 10] for t in range(before - 60, before - 60_001, -60)]
+        return httpx.Response(200, json={"data": {"attributes": {"ohlcv_list": ohlcv}}})
+
+    gecko = GeckoTerminalAdapter(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                                 limiter=TokenBucket(1000.0, 100), cache=CandleCache(tmp_path))
+    gecko._pool_cache["MINT"] = "POOL"
+    end = T0 - 30 * 86400
+    start = end - 20 * 86400  # far more than 20 pages of 1000 candles
+    rows = await gecko.fetch_ohlcv("MINT", start, end)
+    covered = gecko._cache.covered("geckoterminal", "MINT", "1m")
+    assert covered == [(rows[0]["unixTime"], end)]
+    assert rows[0]["unixTime"] > start
+    await gecko.close()
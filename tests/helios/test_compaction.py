@@ -0,0 +1,164 @@
+"""Tests for Parquet part-file compaction and its swap protocol."""
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from helios.data.store import CompactionConfig, ParquetStore, compact_dataset
+from helios.data.store.catalog import list_live_parts, read_journals, resolve_journals
+from helios.data.store.compaction import reclaim
+
+T0 = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def _batch(t: datetime, n: int = 10) -> pa.Table:
+    times = [t + timedelta(seconds=i) for i in range(n)]
+    return pa.table({
+        "symbol": ["BTC"] * n,
+        "close": [float(i) for i in range(n)],
+        "event_time": pa.array(times, type=pa.timestamp("us", tz="UTC")),
+        "available_at": pa.array(times, type=pa.timestamp("us", tz="UTC")),
+    })
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = ParquetStore(tmp_path / "store")
+    # 20 tiny appends on day 1 (written out of time order), 2 on day 2
+    for i in reversed(range(20)):
+        s.write("ticks", _batch(T0 + timedelta(minutes=i)))
+    for i in range(2):
+        s.write("ticks", _batch(T0 + timedelta(days=1, minutes=i)))
+    return s
+
+
+def _count(store: ParquetStore) -> int:
+    return store.query("SELECT count(*) AS n FROM ticks").column("n")[0].as_py()
+
+
+def test_compaction_merges_small_parts(store):
+    assert _count(store) == 220
+    report = compact_dataset(store, "ticks", CompactionConfig(grace_seconds=0))
+    assert report.files_before == 22
+    assert report.files_after == 3  # day 1 merged, day 2 below min_files
+    assert report.partitions_compacted == 1
+    assert report.rows == 220
+    assert report.reclaimed_files == 20
+    assert _count(store) == 220
+
+
+def test_compacted_file_sorted_with_row_groups(store):
+    compact_dataset(store, "ticks", CompactionConfig(grace_seconds=0, row_group_rows=50))
+    day1 = [f for f in store.catalog.files("ticks") if "day=01" in f]
+    assert len(day1) == 1
+    md = pq.read_metadata(day1[0])
+    assert md.num_row_groups == 4
+    times = pq.read_table(day1[0]).column("event_time").to_pylist()
+    assert times == sorted(times)
+
+
+def test_superseded_parts_hidden_during_grace(store):
+    compact_dataset(store, "ticks", CompactionConfig(grace_seconds=3600))
+    ds_dir = store.root / "ticks"
+    on_disk = list(ds_dir.rglob("*.parquet"))
+    assert len(on_disk) == 23  # inputs kept for in-flight readers
+    assert len(list_live_parts(ds_dir)) == 3
+    assert _count(store) == 220
+    # A fresh store sees the same consistent view
+    assert _count(ParquetStore(store.root)) == 220
+    assert reclaim(ds_dir, grace_seconds=0) == 20
+    assert len(list(ds_dir.rglob("*.parquet"))) == 3
+
+
+def test_incomplete_swap_hides_outputs(tmp_path):
+    part = tmp_path / "ds" / "year=2026" / "month=03" / "day=01"
+    part.mkdir(parents=True)
+    for name in ("a", "b", "out1", "out2"):
+        pq.write_table(_batch(T0), part / f"part-{name}.parquet")
+    (part / "_compaction-x.json").write_text(json.dumps({
+        "created_unix": 0, "inputs": ["part-a.parquet", "part-b.parquet"],
+        "outputs": ["part-out1.parquet", "part-out2.parquet", "part-out3.parquet"],
+    }))
+    live = {os.path.basename(f) for f in list_live_parts(tmp_path / "ds")}
+    assert live == {"part-a.parquet", "part-b.parquet"}
+    # Rollback after grace removes the orphaned outputs, keeps inputs
+    assert reclaim(tmp_path / "ds", grace_seconds=0) == 2
+    assert {p.name for p in part.glob("*.parquet")} == {"part-a.parquet", "part-b.parquet"}
+    assert not list(part.glob("_compaction-*.json"))
+
+
+def test_compaction_noop_when_nothing_small(store):
+    report = compact_dataset(store, "ticks", CompactionConfig(small_file_bytes=1, grace_seconds=0))
+    assert report.partitions_compacted == 0
+    assert report.files_before == report.files_after == 22
+
+
+def _chain(tmp_path, x_reclaimed: bool):
+    """J1 merged a,b,c -> x; J2 then merged x,d,e -> y."""
+    part = tmp_path / "ds" / "year=2026" / "month=03" / "day=01"
+    part.mkdir(parents=True)
+    names = ["a", "b", "c", "d", "e", "y"] + ([] if x_reclaimed else ["x"])
+    for name in names:
+        pq.write_table(_batch(T0), part / f"part-{name}.parquet")
+    for jname, created, ins, outs in (("j1", 100.0, "abc", "x"), ("j2", 200.0, "xde", "y")):
+        (part / f"_compaction-{jname}.json").write_text(json.dumps({
+            "created_unix": created,
+            "inputs": [f"part-{n}.parquet" for n in ins],
+            "outputs": [f"part-{n}.parquet" for n in outs],
+        }))
+    return part
+
+
+@pytest.mark.parametrize("x_reclaimed", [False, True])
+def test_chained_compaction_resolves_in_any_journal_order(tmp_path, x_reclaimed):
+    part = _chain(tmp_path, x_reclaimed)
+    files = {str(p) for p in part.glob("*.parquet")}
+    journals = sorted(read_journals(tmp_path / "ds"), key=lambda j: j.path.name)
+    assert resolve_journals(files, journals) == [True, True]
+    assert resolve_journals(files, journals[::-1]) == [True, True]
+    assert [os.path.basename(f) for f in list_live_parts(tmp_path / "ds")] == ["part-y.parquet"]
+
+
+@pytest.mark.parametrize("reverse_created", [False, True])
+def test_reclaim_walks_chains_oldest_first(tmp_path, reverse_created):
+    part = _chain(tmp_path, x_reclaimed=False)
+    if reverse_created:  # J2 stamped older than J1: must still wait for J1
+        j2 = part / "_compaction-j2.json"
+        j2.write_text(json.dumps({**json.loads(j2.read_text()), "created_unix": 50.0}))
+    for _ in range(2):
+        reclaim(tmp_path / "ds", grace_seconds=0)
+        assert [os.path.basename(f) for f in list_live_parts(tmp_path / "ds")] == ["part-y.parquet"]
+    assert {p.name for p in part.glob("*.parquet")} == {"part-y.parquet"}
+    assert not list(part.glob("_compaction-*.json"))
+
+
+def test_compacting_a_compacted_part_keeps_rows_exact(store):
+    config = CompactionConfig(grace_seconds=3600)
+    compact_dataset(store, "ticks", config)
+    for i in range(3):
+        store.write("ticks", _batch(T0 + timedelta(hours=1, minutes=i)))
+    report = compact_dataset(store, "ticks", config)
+    assert report.partitions_compacted == 1 and report.rows == 250
+    ds_dir = store.root / "ticks"
+    assert len(list(ds_dir.glob("**/_compaction-*.json"))) == 2
+    assert _count(ParquetStore(store.root)) == 250
+    reclaim(ds_dir, grace_seconds=0)
+    assert _count(ParquetStore(store.root)) == 250
+    assert len(list(ds_dir.rglob("*.parquet"))) == 3
+
+
+def test_long_lived_store_survives_reclaim_by_another_store(store):
+    # `store` has cached its listing and footers; a second store on the
+    # same root compacts and reclaims the parts it still lists.
+    assert _count(store) == 220
+    assert store.read("ticks").num_rows == 220
+    other = ParquetStore(store.root)
+    compact_dataset(other, "ticks", CompactionConfig(grace_seconds=0))
+    assert _count(store) == 220
+    assert store.read("ticks").num_rows == 220
+    assert len(store.catalog.files("ticks")) == 3
@@ -4,7 +4,7 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from helios.models.conformal import SplitConformal
+from helios.models.conformal import OnlineConformal, SplitConformal
 
 
 def test_fit_requires_min_samples():
@@ -59,3 +59,61 @@ def test_alpha_out_of_range_raises():
         cal.quantile(0.0)
     with pytest.raises(ValueError):
         cal.quantile(1.0)
+
+
+def test_online_matches_split_over_sliding_window():
+    rng = np.random.default_rng(2)
+    yhat = rng.normal(0, 1, 700)
+    y = yhat + rng.standard_t(3, 700)
+    online = OnlineConformal(window=200, gamma=0.0)
+    for i, (yp, yt) in enumerate(zip(yhat, y, strict=True)):
+        online.update(float(yp), float(yt))
+        if i + 1 >= 200 and i % 50 == 0:
+            lo = max(0, i + 1 - 200)
+            split = SplitConformal.fit(yhat[lo:i + 1], y[lo:i + 1])
+            for alpha in (0.05, 0.1, 0.3):
+                assert online.quantile(alpha) == split.quantile(alpha)
+    assert len(online) == 200
+
+
+def test_online_quantile_cache_invalidated_on_update():
+    online = OnlineConformal(gamma=0.0)
+    online.extend(np.arange(100, dtype=float))
+    q = online.quantile(0.1)
+    assert online.quantile(0.1) == q
+    online.extend([1000.0] * 20)
+    assert online.quantile(0.1) > q
+    with pytest.raises(ValueError):
+        OnlineConformal().quantile()
+
+
+def test_adaptive_alpha_restores_coverage_after_shift():
+    rng = np.random.default_rng(3)
+    online = OnlineConformal(alpha=0.1, window=500, gamma=0.01)
+    online.extend(np.abs(rng.normal(0, 1, 500)))
+    covered = [online.update(0.0, float(e)) for e in rng.normal(0, 3, 2000)]  # noise triples
+    assert online.alpha_t < 0.1
+    assert np.mean(covered[-1000:]) >= 0.87
+    # Without adaptation, coverage right after the shift falls well short.
+    fixed = OnlineConformal(alpha=0.1, window=500, gamma=0.0)
+    fixed.extend(np.abs(np.random.default_rng(3).normal(0, 1, 500)))
+    rng = np.random.default_rng(4)
+    early = [fixed.update(0.0, float(e)) for e in rng.normal(0, 3, 300)]
+    assert np.mean(early) < 0.8
+
+
+def test_online_state_roundtrip(tmp_path):
+    rng = np.random.default_rng(5)
+    online = OnlineConformal(window=300)
+    for yp, yt in zip(rng.normal(0, 1, 400), rng.normal(0, 1, 400), strict=True):
+        online.update(float(yp), float(yt))
+    path = tmp_path / "calib" / "a1.json"
+    online.save(path)
+    restored = OnlineConformal.load(path)
+    assert len(restored) == 300
+    assert restored.alpha_t == online.alpha_t and restored.n_miss == online.n_miss
+    assert restored.interval(0.2) == online.interval(0.2)
+    online.update(0.0, 5.0)
+    restored.update(0.0, 5.0)
+    assert restored.quantile(0.1) == online.quantile(0.1)
+    assert not path.with_name("a1.json.partial").exists()
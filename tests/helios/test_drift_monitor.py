@@ -1,9 +1,13 @@
 """Tests for the drift monitor."""
 from __future__ import annotations
 
+import json
+
 import numpy as np
+import polars as pl
+import pytest
 
-from helios.models.drift import DriftMonitor
+from helios.models.drift import DriftMonitor, HistogramSketch, StreamingDriftMonitor
 
 
 def test_no_drift_on_identical_distributions():
@@ -59,3 +63,66 @@ def test_check_many_aggregates():
     assert r.n_features_drifted == 1
     drifted_names = [s.feature_name for s in r.feature_statuses if s.is_drifted]
     assert drifted_names == ["shifted"]
+
+
+def _frames(seed: int, n: int = 5000):
+    rng = np.random.default_rng(seed)
+    ref = {"stable": rng.normal(0, 1, n), "mean": rng.normal(0, 1, n), "var": rng.exponential(1, n)}
+    cur = {"stable": rng.normal(0, 1, n), "mean": rng.normal(0.8, 1, n), "var": rng.exponential(2.5, n)}
+    return ref, cur
+
+
+def test_streaming_matches_batch_statistics():
+    ref, cur = _frames(0)
+    batch = DriftMonitor().check_many(ref, cur)
+    stream = StreamingDriftMonitor.from_reference(pl.DataFrame(ref))
+    stream.update(pl.DataFrame(cur))
+    report = stream.check()
+    assert report.n_features_drifted == batch.n_features_drifted == 2
+    for b, s in zip(batch.feature_statuses, report.feature_statuses, strict=True):
+        assert s.feature_name == b.feature_name and s.is_drifted == b.is_drifted
+        assert s.ks_statistic <= b.ks_statistic + 1e-12
+        assert s.ks_statistic == pytest.approx(b.ks_statistic, abs=0.01)
+        assert s.psi_score == pytest.approx(b.psi_score, rel=0.05, abs=0.005)
+
+
+def test_observe_and_frame_update_agree_and_skip_nulls():
+    ref, cur = _frames(1, 500)
+    by_frame = StreamingDriftMonitor.from_reference(ref)
+    by_obs = StreamingDriftMonitor.from_reference(ref)
+    frame = pl.DataFrame(cur).with_columns(pl.when(pl.col("mean") > 1).then(None).otherwise(pl.col("mean")).alias("mean"))
+    by_frame.update(frame)
+    for row in frame.iter_rows(named=True):
+        for name, v in row.items():
+            by_obs.observe(name, float("nan") if v is None else v)
+    for name in ref:
+        assert np.array_equal(by_frame.current[name].counts, by_obs.current[name].counts)
+    assert by_frame.current["mean"].n_nan == frame.get_column("mean").null_count() > 0
+
+
+def test_shard_sketches_merge_after_serialization():
+    ref, cur = _frames(2)
+    whole = StreamingDriftMonitor.from_reference(ref)
+    whole.update(pl.DataFrame(cur))
+    shards = []
+    for part in pl.DataFrame(cur).iter_slices(1200):
+        shard = StreamingDriftMonitor.from_reference(ref)
+        shard.update(part)
+        shards.append(json.loads(json.dumps(shard.to_dict())))
+    merged = StreamingDriftMonitor.from_dict(shards[0])
+    for state in shards[1:]:
+        merged.merge(StreamingDriftMonitor.from_dict(state))
+    assert merged.check() == whole.check()
+    with pytest.raises(ValueError):
+        HistogramSketch(edges=[0.0, 1.0]).merge(HistogramSketch(edges=[0.0, 2.0]))
+
+
+def test_streaming_insufficient_samples_and_reset():
+    ref, cur = _frames(3, 200)
+    m = StreamingDriftMonitor.from_reference(ref)
+    m.update(pl.DataFrame(cur).head(10))
+    assert all(s.reason == "insufficient_samples" for s in m.check().feature_statuses)
+    m.update(pl.DataFrame(cur))
+    assert m.check().overall_drifted
+    m.reset()
+    assert all(sk.n == 0 for sk in m.current.values())
@@ -0,0 +1,131 @@
+"""Tests for the content-addressed FeatureStore."""
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import polars as pl
+import pytest
+from loguru import logger
+
+from helios.data.store import FeatureStore, ParquetStore
+from helios.strategies.a1_perp_trend.features import FEATURE_NAMES, compute_features
+from helios.strategies.a1_perp_trend.train import a1_feature_spec, make_labels
+
+logger.remove()
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+HOUR = timedelta(hours=1)
+SYMBOLS = ("BTC", "ETH")
+N = 600
+
+
+def _bars() -> pl.DataFrame:
+    rng = np.random.default_rng(5)
+    frames = []
+    for k, sym in enumerate(SYMBOLS):
+        close = 100.0 * (k + 1) * np.exp(np.cumsum(rng.normal(0, 0.01, N)))
+        times = [T0 + i * HOUR for i in range(N)]
+        frames.append(pl.DataFrame({
+            "symbol": [sym] * N, "event_time": times, "available_at": times,
+            "open": close, "high": close * 1.002, "low": close * 0.998, "close": close,
+            "volume": rng.uniform(1, 100, N),
+            "funding_rate": rng.normal(0, 1e-4, N),
+        }))
+    return pl.concat(frames).with_columns(
+        pl.col("event_time").cast(pl.Datetime("us", "UTC")),
+        pl.col("available_at").cast(pl.Datetime("us", "UTC")),
+    )
+
+
+class Loader:
+    """Serves bars up to `now` (exclusive) and records every request."""
+
+    def __init__(self, bars: pl.DataFrame, now: datetime) -> None:
+        self.bars, self.now, self.calls = bars, now, []
+
+    def __call__(self, start: datetime, end: datetime) -> pl.DataFrame:
+        self.calls.append((start, end))
+        end = min(end, self.now)
+        return self.bars.filter((pl.col("event_time") >= start) & (pl.col("event_time") < end))
+
+
+def _scratch(bars: pl.DataFrame, start: datetime, end: datetime, horizon: int) -> pl.DataFrame:
+    feats = compute_features(bars).join(bars.select(["symbol", "event_time", "close"]),
+                                        on=["symbol", "event_time"], how="left")
+    return make_labels(feats, horizon).filter(
+        (pl.col("event_time") >= start) & (pl.col("event_time") < end)
+    ).sort(["symbol", "event_time"])
+
+
+def _assert_frames_close(got: pl.DataFrame, want: pl.DataFrame) -> None:
+    assert got.select(["symbol", "event_time"]).equals(want.select(["symbol", "event_time"]))
+    for col in [*FEATURE_NAMES, "close", "fwd_ret", "y"]:
+        np.testing.assert_allclose(
+            got[col].cast(pl.Float64).to_numpy(), want[col].cast(pl.Float64).to_numpy(),
+            rtol=1e-9, atol=1e-15, err_msg=col,
+        )
+
+
+@pytest.fixture
+def fs(tmp_path):
+    return FeatureStore(ParquetStore(tmp_path / "store"))
+
+
+def test_cache_hit_skips_compute_and_lineage_resolves(fs):
+    bars = _bars()
+    spec = a1_feature_spec()
+    start, end = T0 + 100 * HOUR, T0 + 400 * HOUR
+    loader = Loader(bars, now=T0 + N * HOUR)
+    first = fs.get(spec, SYMBOLS, "1h", start, end, loader, horizon=4)
+    _assert_frames_close(first, _scratch(bars, start, end, 4))
+    assert len(loader.calls) == 1
+    assert loader.calls[0] == (start - 60 * HOUR, end + 4 * HOUR)  # warmup + label lookahead
+
+    again = fs.get(spec, SYMBOLS, "1h", start, end, loader, horizon=4)
+    assert len(loader.calls) == 1
+    assert again.equals(first)
+
+    (h,) = first["features_hash"].unique().to_list()
+    lin = fs.lineage("a1", h)
+    assert lin is not None
+    assert lin.key.symbols == SYMBOLS and lin.key.horizon == 4
+    assert (lin.chunk.start, lin.chunk.end) == (start, end)
+
+
+def test_forward_extension_computes_only_the_gap(fs):
+    bars = _bars()
+    spec = a1_feature_spec()
+    start = T0 + 100 * HOUR
+    # Live edge at hour 300: the last 4 rows have no future bars for labels yet
+    loader = Loader(bars, now=T0 + 300 * HOUR)
+    first = fs.get(spec, SYMBOLS, "1h", start, T0 + 310 * HOUR, loader, horizon=4)
+    assert first["event_time"].max() == T0 + 299 * HOUR
+    assert first.filter(pl.col("event_time") == T0 + 299 * HOUR)["fwd_ret"].is_null().all()
+
+    loader.now = T0 + N * HOUR
+    extended = fs.get(spec, SYMBOLS, "1h", start, T0 + 500 * HOUR, loader, horizon=4)
+    # Recompute starts 4 bars (horizon) before the old coverage end, minus warmup
+    assert loader.calls[-1] == (T0 + 296 * HOUR - 60 * HOUR, T0 + 504 * HOUR)
+    _assert_frames_close(extended, _scratch(bars, start, T0 + 500 * HOUR, 4))
+    assert extended["features_hash"].n_unique() == 2
+
+
+def test_backward_extension_and_key_change(fs):
+    bars = _bars()
+    spec = a1_feature_spec()
+    loader = Loader(bars, now=T0 + N * HOUR)
+    fs.get(spec, SYMBOLS, "1h", T0 + 200 * HOUR, T0 + 400 * HOUR, loader, horizon=4)
+    wider = fs.get(spec, SYMBOLS, "1h", T0 + 80 * HOUR, T0 + 400 * HOUR, loader, horizon=4)
+    assert loader.calls[-1] == (T0 + 20 * HOUR, T0 + 204 * HOUR)
+    _assert_frames_close(wider, _scratch(bars, T0 + 80 * HOUR, T0 + 400 * HOUR, 4))
+
+    # A feature-module change is a different family: nothing is reused
+    n_calls = len(loader.calls)
+    edited = replace(spec, source_hash="0" * 16)
+    fs.get(edited, SYMBOLS, "1h", T0 + 200 * HOUR, T0 + 400 * HOUR, loader, horizon=4)
+    assert len(loader.calls) == n_calls + 1
+    # So is a different label horizon
+    fs.get(spec, SYMBOLS, "1h", T0 + 200 * HOUR, T0 + 400 * HOUR, loader, horizon=8)
+    assert len(loader.calls) == n_calls + 2
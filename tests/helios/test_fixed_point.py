@@ -0,0 +1,91 @@
+"""Fixed-point helpers, and PaperBroker's integer books vs the Decimal math they replaced."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from helios.execution.paper_broker import MarketSnapshot, PaperBroker
+from helios.fixed_point import (
+    RATIO_DP,
+    USD_DP,
+    div_round,
+    from_fixed,
+    precision_for,
+    rescale,
+    to_fixed,
+)
+from helios.types import Intent, Order, Side, Signal, StrategyId, Venue
+
+
+def test_rounding_is_half_even():
+    assert [div_round(n, 2) for n in (-5, -3, -1, 1, 3, 5)] == [-2, -2, 0, 0, 2, 2]
+    assert rescale(1_250, 3, 1) == 12
+    assert rescale(1_350, 3, 1) == 14
+    assert rescale(-1_250, 3, 1) == -12
+    assert to_fixed(Decimal("0.0000000005"), 9) == 0
+    assert to_fixed(Decimal("0.0000000015"), 9) == 2
+
+
+def test_round_trip_is_exact():
+    for s in ("0", "1", "-1", "123.456789012", "0.000000001", "98765.4321"):
+        assert from_fixed(to_fixed(Decimal(s), 9), 9) == Decimal(s)
+
+
+def _order(side: Side, qty: Decimal, venue: Venue) -> Order:
+    now = datetime.now(timezone.utc)
+    sig = Signal(
+        strategy=StrategyId.A1_PERP_TREND, symbol="X", venue=venue, direction=1,
+        magnitude=0.5, confidence=0.6, confidence_lower=0.02,
+        invalidation_price=Decimal("100"), target_price=None, features_hash="x", created_at=now,
+    )
+    intent = Intent(
+        strategy=StrategyId.A1_PERP_TREND, symbol="X", venue=venue, side=side,
+        notional_usd=Decimal("100"), leverage=1.0, stop_price=Decimal("98"),
+        take_profit_price=None, signal_ref=sig,
+    )
+    return Order(intent=intent, qty=qty, order_type="market", limit_price=None,
+                 client_order_id="o", approved_at=now)
+
+
+def test_fill_reports_the_rounded_qty():
+    broker = PaperBroker(starting_cash=Decimal("100000"))
+    snap = MarketSnapshot(Decimal("0.5"), 5.0, 1e4, 0.004)
+    fill = broker.submit(_order(Side.LONG, Decimal("1.00000049"), Venue.SOLANA_DEX), snap)
+    assert fill.qty == Decimal("1.000000") == broker.positions[("X", Venue.SOLANA_DEX)].qty
+
+
+_fills = st.lists(
+    st.tuples(
+        st.sampled_from([Side.LONG, Side.SHORT]),
+        st.decimals(min_value="0.001", max_value="50", places=3),
+        st.decimals(min_value="0.5", max_value="5000", places=4),
+    ),
+    min_size=1, max_size=30,
+)
+
+
+@settings(max_examples=150, deadline=None)
+@given(fills=_fills, venue=st.sampled_from([Venue.KRAKEN_FUTURES, Venue.SOLANA_DEX]))
+def test_broker_matches_decimal_reference(fills, venue):
+    """Cash, qty and NAV track exact Decimal accounting to well under a cent."""
+    broker = PaperBroker(starting_cash=Decimal("100000"))
+    cash = Decimal("100000")
+    qty = Decimal("0")
+    for side, q, mid in fills:
+        fill = broker.submit(_order(side, q, venue), MarketSnapshot(mid, 5.0, 1e4, 0.004))
+        notional = q * fill.price
+        cash += -(notional + fill.fee_usd) if side == Side.LONG else notional - fill.fee_usd
+        qty += q if side == Side.LONG else -q
+        # slippage factor is held at RATIO_DP, price at the venue's price_dp
+        sign = 1 if side == Side.LONG else -1
+        exact = mid * (1 + sign * Decimal(str(fill.slippage_bps / 1e4)))
+        quantum = Decimal(10) ** -precision_for(venue).price_dp
+        assert abs(fill.price - exact) <= exact * Decimal(10) ** -RATIO_DP + quantum
+    book = broker.positions[("X", venue)]
+    assert book.qty == qty
+    assert abs(broker.cash - cash) <= Decimal(len(fills)) * Decimal(10) ** -USD_DP
+    mark = {("X", venue): Decimal("123.45")}
+    assert abs(broker.nav(mark) - (cash + qty * Decimal("123.45"))) < Decimal("1e-9")
@@ -0,0 +1,71 @@
+"""HarvestEngine window coalescing and retries; TokenBucket pacing."""
+from __future__ import annotations
+
+import time
+
+from helios.data.harvest_engine import FetchJob, HarvestEngine, coalesce
+from helios.ops.ratelimit import TokenBucket
+
+
+class _Upstream:
+    def __init__(self, fail_first: int = 0) -> None:
+        self.calls: list[tuple[str, int, int]] = []
+        self.fail_first = fail_first
+
+    async def fetch(self, key: str, start: int, end: int) -> list[int]:
+        self.calls.append((key, start, end))
+        if len(self.calls) <= self.fail_first:
+            raise RuntimeError("429")
+        return list(range(start - start % 10, end + 1, 10))  # a candle every 10s
+
+
+def test_coalesce_merges_overlapping_and_adjacent_windows_per_key():
+    jobs = [FetchJob("a", 100, 200), FetchJob("b", 0, 50), FetchJob("a", 150, 300),
+            FetchJob("a", 301, 400), FetchJob("a", 500, 600)]
+    spans = coalesce(jobs)
+    assert [(s.key, s.start, s.end, len(s.jobs)) for s in spans] == [
+        ("a", 100, 400, 3), ("a", 500, 600, 1), ("b", 0, 50, 1),
+    ]
+    capped = coalesce(jobs, max_span_seconds=250)
+    assert [(s.start, s.end) for s in capped if s.key == "a"] == [(100, 300), (301, 400), (500, 600)]
+
+
+async def test_overlapping_jobs_share_one_fetch_and_get_their_own_slice():
+    up = _Upstream()
+    engine = HarvestEngine(up.fetch, time_of=lambda t: t, concurrency=4)
+    jobs = [FetchJob("mint", 100, 200, tag=1), FetchJob("mint", 150, 260, tag=2), FetchJob("other", 0, 30, tag=3)]
+    results = {r.job.tag: r for r in [r async for r in engine.stream(jobs)]}
+
+    assert sorted(up.calls) == [("mint", 100, 260), ("other", 0, 30)]
+    assert results[1].items == list(range(100, 201, 10))
+    assert results[2].items == list(range(150, 261, 10))
+    assert results[3].items == [0, 10, 20, 30]
+    m = engine.metrics
+    assert (m.jobs, m.spans, m.coalesced, m.backlog, m.failed_jobs) == (3, 2, 1, 0, 0)
+
+
+async def test_failed_fetches_retry_then_report_errors():
+    up = _Upstream(fail_first=1)
+    engine = HarvestEngine(up.fetch, time_of=lambda t: t, retries=2, base_delay_seconds=0.001)
+    [result] = [r async for r in engine.stream([FetchJob("a", 0, 20)])]
+    assert result.error is None and result.items == [0, 10, 20]
+    assert engine.metrics.retries == 1
+
+    up = _Upstream(fail_first=10)
+    engine = HarvestEngine(up.fetch, time_of=lambda t: t, retries=2, base_delay_seconds=0.001)
+    results = [r async for r in engine.stream([FetchJob("a", 0, 20), FetchJob("a", 10, 30)])]
+    assert [r.error for r in results] == ["429", "429"]
+    assert len(up.calls) == 3 and engine.metrics.failed_jobs == 2
+
+
+async def test_token_bucket_paces_callers_and_honours_penalties():
+    bucket = TokenBucket(rate=100.0, burst=2)
+    t0 = time.monotonic()
+    for _ in range(7):  # 2 from the burst, 5 paced at 10ms
+        await bucket.acquire()
+    assert 0.045 <= time.monotonic() - t0 < 0.5
+
+    bucket.penalize(0.1)
+    t0 = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - t0 >= 0.09
@@ -0,0 +1,143 @@
+"""PortfolioLedger: incremental totals agree with a from-scratch rebuild."""
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from helios.execution.ledger import PortfolioLedger
+from helios.execution.paper_broker import MarketSnapshot, PaperBroker
+from helios.risk import RiskConfig, apply
+from helios.risk.overlay import _exposure_units, _strategy_exposure
+from helios.types import Intent, Order, Rejection, Side, Signal, StrategyId, Venue
+
+T0 = datetime(2025, 3, 30, 22, tzinfo=timezone.utc)  # a Sunday evening
+SYMBOLS = ("BTC-PERP", "ETH-PERP", "SOL-PERP")
+
+
+def _order(symbol: str, side: Side, qty: Decimal, notional: str = "100") -> Order:
+    sig = Signal(
+        strategy=StrategyId.A1_PERP_TREND, symbol=symbol, venue=Venue.KRAKEN_FUTURES,
+        direction=1 if side == Side.LONG else -1, magnitude=0.5, confidence=0.6,
+        confidence_lower=0.02, invalidation_price=Decimal("100"), target_price=Decimal("104"),
+        features_hash="x", created_at=T0,
+    )
+    intent = Intent(
+        strategy=StrategyId.A1_PERP_TREND, symbol=symbol, venue=Venue.KRAKEN_FUTURES, side=side,
+        notional_usd=Decimal(notional), leverage=1.0, stop_price=Decimal("98"),
+        take_profit_price=None, signal_ref=sig,
+    )
+    return Order(intent=intent, qty=qty, order_type="market", limit_price=None,
+                 client_order_id=f"{symbol}-{side.value}-{qty}", approved_at=T0)
+
+
+def _snap(mid: Decimal) -> MarketSnapshot:
+    return MarketSnapshot(mid_price=mid, spread_bps=5.0, bar_volume=1e4, bar_volatility=0.004)
+
+
+_steps = st.lists(
+    st.tuples(
+        st.sampled_from(SYMBOLS),
+        st.sampled_from([Side.LONG, Side.SHORT, None]),  # None: mark only
+        st.decimals(min_value="0.01", max_value="3", places=2),
+        st.decimals(min_value="50", max_value="150", places=3),
+        st.integers(min_value=0, max_value=40),  # hours to advance
+    ),
+    min_size=1, max_size=40,
+)
+
+
+@settings(max_examples=100, deadline=None)
+@given(steps=_steps)
+def test_snapshot_matches_rebuild(steps):
+    broker = PaperBroker(starting_cash=Decimal("10000"))
+    ledger = PortfolioLedger(broker, as_of=T0)
+    t = T0
+    last: dict = {}
+    peak = Decimal("10000")
+    for symbol, side, qty, px, hours in steps:
+        t += timedelta(hours=hours)
+        key = (symbol, Venue.KRAKEN_FUTURES)
+        last[key] = px
+        peak = max(peak, ledger.mark({key: px}, t))
+        if side is not None:
+            broker.submit(_order(symbol, side, qty), _snap(px))
+
+    state = ledger.snapshot()
+    assert state.nav_usd == broker.nav(last)
+    assert state.peak_nav_usd == peak
+    assert state.cash_usd == broker.cash
+    held = {(p.symbol, p.venue): p for p in state.positions}
+    assert set(held) == {k for k, b in broker.positions.items() if b.qty_units}
+    for key, p in held.items():
+        book = broker.positions[key]
+        assert p.qty == abs(book.qty)
+        assert p.side == (Side.LONG if book.qty > 0 else Side.SHORT)
+
+    gross, net = _exposure_units(state)
+    scan_gross, scan_net = _exposure_units(replace(state, exposure=None))
+    # the scan rounds a Decimal product; the ledger rounds the exact int product
+    assert abs(gross - scan_gross) <= len(held) * 10**12
+    assert abs(net - scan_net) <= len(held) * 10**12
+
+
+def test_realized_pnl_windows_roll_by_calendar():
+    broker = PaperBroker(starting_cash=Decimal("1000"))
+    ledger = PortfolioLedger(broker, as_of=T0)
+    key = ("BTC-PERP", Venue.KRAKEN_FUTURES)
+
+    def trade(at: datetime, sell_px: str) -> Decimal:
+        ledger.mark({key: Decimal("100")}, at)
+        broker.submit(_order("BTC-PERP", Side.LONG, Decimal("1")), _snap(Decimal("100")))
+        broker.submit(_order("BTC-PERP", Side.SHORT, Decimal("1")), _snap(Decimal(sell_px)))
+        return broker.fills[-1].price - broker.fills[-2].price
+
+    loss_sun = trade(T0, "95")                     # Sunday, March
+    s = ledger.snapshot()
+    assert s.realized_pnl_today_usd == s.realized_pnl_week_usd == s.realized_pnl_month_usd == loss_sun < 0
+
+    mon = T0 + timedelta(hours=4)                  # Monday 02:00, still March: new day and ISO week
+    loss_mon = trade(mon, "97")
+    s = ledger.snapshot()
+    assert s.realized_pnl_today_usd == s.realized_pnl_week_usd == loss_mon
+    assert s.realized_pnl_month_usd == loss_sun + loss_mon
+
+    ledger.mark({key: Decimal("100")}, datetime(2025, 4, 1, 9, tzinfo=timezone.utc))  # Tuesday, April
+    s = ledger.snapshot()
+    assert s.realized_pnl_today_usd == s.realized_pnl_month_usd == 0
+    assert s.realized_pnl_week_usd == loss_mon
+
+
+def test_snapshot_reuses_views_until_a_fill():
+    broker = PaperBroker(starting_cash=Decimal("1000"))
+    ledger = PortfolioLedger(broker, as_of=T0)
+    key = ("BTC-PERP", Venue.KRAKEN_FUTURES)
+    ledger.mark({key: Decimal("100")}, T0)
+    broker.submit(_order("BTC-PERP", Side.LONG, Decimal("1")), _snap(Decimal("100")))
+    a = ledger.snapshot()
+    ledger.mark({key: Decimal("103")}, T0 + timedelta(hours=1))
+    b = ledger.snapshot()
+    assert b.positions is a.positions and b.exposure is a.exposure
+    assert b.nav_usd > a.nav_usd and b.as_of > a.as_of
+    broker.submit(_order("BTC-PERP", Side.LONG, Decimal("1")), _snap(Decimal("103")))
+    assert ledger.snapshot().positions is not a.positions
+
+
+def test_open_orders_feed_strategy_allocation_rule():
+    broker = PaperBroker(starting_cash=Decimal("1000"))
+    ledger = PortfolioLedger(broker, as_of=T0)
+    resting = _order("ETH-PERP", Side.LONG, Decimal("1"), notional="350")
+    ledger.order_opened(resting)
+    state = ledger.snapshot()
+    assert _strategy_exposure(state, StrategyId.A1_PERP_TREND) == Decimal("350")
+    assert _strategy_exposure(replace(state, exposure=None), StrategyId.A1_PERP_TREND) == Decimal("350")
+
+    intent = _order("BTC-PERP", Side.LONG, Decimal("1")).intent
+    result = apply(intent, state, RiskConfig())
+    assert isinstance(result, Rejection) and result.rule == "R07_strategy_alloc"
+
+    ledger.order_closed(resting.client_order_id)
+    assert isinstance(apply(intent, ledger.snapshot(), RiskConfig()), Order)
@@ -0,0 +1,190 @@
+"""LogStore: resumable JSONL readers, persisted key indexes, Parquet rollover."""
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pyarrow as pa
+import pytest
+
+import helios.data.store.log_store as log_store
+from helios.data.store import LogStore, ParquetStore
+from helios.strategies.a2_meme_snipe import log as a2_log
+from helios.strategies.a2_meme_snipe.harvester import harvest
+
+
+def _append(path, *records, raw: str = "") -> None:
+    with path.open("a", encoding="utf-8") as f:
+        f.writelines(json.dumps(r) + "\n" for r in records)
+        f.write(raw)
+
+
+def _row(i: int, day: int = 1) -> dict:
+    return {"obs_id": f"o{i}", "n": i, "timestamp_iso": f"2025-01-{day:02d}T12:00:00+00:00"}
+
+
+def test_resume_offers_pending_rows_and_the_new_tail(tmp_path):
+    store = LogStore(tmp_path / "s.jsonl")
+    _append(store.path, _row(0), _row(1), raw='{"obs_id": "torn"')
+    batch = store.resume("h")
+    assert [r["n"] for _, r in batch.rows] == [0, 1]
+    batch.done(batch.rows[0][0])
+    batch.commit()
+
+    _append(store.path, raw=', "n": 9}\n')  # the writer finishes the torn line
+    _append(store.path, _row(2))
+    batch = store.resume("h")
+    assert [r["n"] for _, r in batch.rows] == [1, 9, 2]
+
+    replay = store.resume("h")  # nothing committed → same batch again
+    assert [p for p, _ in replay.rows] == [p for p, _ in batch.rows]
+
+
+def test_key_index_parses_only_new_lines(tmp_path, monkeypatch):
+    store = LogStore(tmp_path / "o.jsonl")
+    _append(store.path, _row(0), _row(1))
+    assert store.keys("obs_id", lambda r: r.get("obs_id")) == {"o0", "o1"}
+
+    parsed = []
+    real = log_store._parse
+    monkeypatch.setattr(log_store, "_parse", lambda line: parsed.append(line) or real(line))
+    _append(store.path, _row(2))
+    assert store.keys("obs_id", lambda r: r.get("obs_id")) == {"o0", "o1", "o2"}
+    assert len(parsed) == 1
+    assert LogStore(store.path).keys("obs_id", lambda r: r.get("obs_id")) == {"o0", "o1", "o2"}
+    assert len(parsed) == 1
+
+
+def test_rollover_exports_to_parquet_and_reclaims_consumed_segments(tmp_path):
+    pstore = ParquetStore(tmp_path / "store")
+    store = LogStore(tmp_path / "s.jsonl", export_columns={"obs_id": pa.string(), "n": pa.int64()})
+    _append(store.path, _row(0, day=1), _row(1, day=2))
+    pending = store.resume("h")
+    pending.done(pending.rows[1][0])
+    pending.commit()  # row 0 stays pending
+
+    assert store.rollover(pstore, "shadow", max_bytes=1) == 2
+    _append(store.path, _row(2, day=3))  # writers keep appending to the same path
+    assert store.count() == 3
+    assert [r["n"] for r in store.read()] == [0, 1, 2]
+    got = pstore.query("SELECT obs_id, n, record->>'$.timestamp_iso' AS ts FROM shadow ORDER BY n")
+    assert got.column("obs_id").to_pylist() == ["o0", "o1"]
+    assert got.column("ts").to_pylist()[1] == "2025-01-02T12:00:00+00:00"
+
+    batch = store.resume("h")  # the pending row resolves from the sealed segment
+    assert [r["n"] for _, r in batch.rows] == [0, 2]
+    assert store.rollover(pstore, "shadow", max_bytes=1 << 30) == 0
+    assert list(store.index_dir.glob("seg-*.jsonl"))  # still needed by the cursor
+
+    for p, _ in batch.rows:
+        batch.done(p)
+    batch.commit()
+    store.rollover(pstore, "shadow", max_bytes=1 << 30)
+    assert not list(store.index_dir.glob("seg-*.jsonl"))
+    assert store.count() == 3
+    assert [r["n"] for r in store.read()] == [2]
+
+
+def test_export_replayed_after_a_crash_adds_no_duplicate_rows(tmp_path, monkeypatch):
+    pstore = ParquetStore(tmp_path / "store")
+    store = LogStore(tmp_path / "s.jsonl", export_columns={"obs_id": pa.string()})
+    _append(store.path, _row(0, day=1), _row(1, day=2))
+    assert store.seal(max_bytes=1)
+
+    def crash(meta):
+        raise OSError("killed before meta.json recorded the export")
+
+    with monkeypatch.context() as m:
+        m.setattr(store, "_save_meta", crash)
+        with pytest.raises(OSError):
+            store.archive(pstore, "shadow")
+    assert store.archive(pstore, "shadow") == 2  # replayed: parts already there
+    got = pstore.query("SELECT obs_id FROM shadow ORDER BY obs_id")
+    assert got.column("obs_id").to_pylist() == ["o0", "o1"]
+    assert ParquetStore(pstore.root).query("SELECT count(*) AS n FROM shadow").column("n")[0].as_py() == 2
+
+
+class _FakeOHLCV:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def fetch_ohlcv(self, mint, time_from, time_to, interval="1m"):
+        self.calls.append(mint)
+        if mint == "bad":
+            raise RuntimeError("rate limited")
+        if mint == "empty":
+            return []
+        return [{"unixTime": time_from + 60 * i, "o": 1.0, "h": 1.1, "l": 0.9, "c": 1.0} for i in range(5)]
+
+    async def close(self) -> None:
+        pass
+
+
+async def test_a2_harvest_resumes_instead_of_rescanning(tmp_path):
+    shadow, outcomes = tmp_path / "a2_shadow.jsonl", tmp_path / "a2_outcomes.jsonl"
+    old = (datetime.now(timezone.utc) - timedelta(days=2)).isoformat()
+    new = datetime.now(timezone.utc).isoformat()
+
+    def obs(obs_id, mint, ts):
+        return {"obs_id": obs_id, "mint": mint, "timestamp_iso": ts, "filter_decision": "pass",
+                "snapshot": {"last_trade_price_usd": "1.0"}}
+
+    _append(shadow, obs("a", "good", old), obs("b", "bad", old), obs("c", "good", new))
+    fake = _FakeOHLCV()
+    counts = await harvest(shadow, outcomes, birdeye=fake, retries=0)
+    assert counts == {"processed": 1, "skipped_recent": 1, "skipped_done": 0, "failed": 1}
+
+    _append(shadow, obs("d", "good", old))
+    fake.calls.clear()
+    counts = await harvest(shadow, outcomes, birdeye=fake, retries=0)
+    # "a" is never re-read; the failed and not-yet-matured rows are retried
+    assert counts == {"processed": 1, "skipped_recent": 1, "skipped_done": 0, "failed": 1}
+    assert fake.calls == ["bad", "good"]
+    assert sorted(r["obs_id"] for r in LogStore(outcomes).read()) == ["a", "d"]
+
+
+async def test_a2_harvest_resolves_rows_that_can_never_succeed(tmp_path):
+    shadow, outcomes = tmp_path / "a2_shadow.jsonl", tmp_path / "a2_outcomes.jsonl"
+    old = (datetime.now(timezone.utc) - timedelta(days=2)).isoformat()
+    _append(shadow,
+            {"obs_id": "no_ts", "mint": "good", "snapshot": {"last_trade_price_usd": "1.0"}},
+            {"obs_id": "no_mint", "timestamp_iso": old, "snapshot": {"last_trade_price_usd": "1.0"}},
+            {"obs_id": "bad", "mint": "bad", "timestamp_iso": old,
+             "snapshot": {"last_trade_price_usd": "1.0"}})
+    counts = await harvest(shadow, outcomes, birdeye=_FakeOHLCV(), retries=0)
+    assert counts["failed"] == 3
+    # Only the transient fetch failure stays pending, so rollover can reclaim
+    # the segment once that row resolves.
+    batch = LogStore(shadow).resume("a2_harvest")
+    assert [r["obs_id"] for _, r in batch.rows] == ["bad"]
+
+
+async def test_a2_harvest_gives_up_on_missing_candles_past_the_grace(tmp_path):
+    shadow, outcomes = tmp_path / "a2_shadow.jsonl", tmp_path / "a2_outcomes.jsonl"
+    now = datetime.now(timezone.utc)
+    for obs_id, age in (("fresh", timedelta(hours=25)), ("stale", timedelta(days=3))):
+        _append(shadow, {"obs_id": obs_id, "mint": "empty", "timestamp_iso": (now - age).isoformat(),
+                         "snapshot": {"last_trade_price_usd": "1.0"}})
+    counts = await harvest(shadow, outcomes, birdeye=_FakeOHLCV(), retries=0)
+    assert counts["failed"] == 2
+    # The indexer may still backfill the fresh row; the stale one is resolved.
+    batch = LogStore(shadow).resume("a2_harvest")
+    assert [r["obs_id"] for _, r in batch.rows] == ["fresh"]
+
+
+def test_a2_readers_return_archived_history_after_rollover(tmp_path):
+    pstore = ParquetStore(tmp_path / "archive")
+    path = tmp_path / "a2_outcomes.jsonl"
+    store = a2_log.outcomes_store(path)
+    for i in range(3):
+        a2_log.write_outcome({**_row(i, day=1 + i), "harvested_iso": f"2025-01-{1 + i:02d}T12:00:00+00:00"}, path)
+    assert store.rollover(pstore, a2_log.OUTCOMES_DATASET, max_bytes=1) == 3
+    a2_log.write_outcome({**_row(3, day=4), "harvested_iso": "2025-01-04T12:00:00+00:00"}, path)
+    key_index = store.keys("obs_id", lambda r: r.get("obs_id"))  # holds the next segment back
+    assert key_index == {"o0", "o1", "o2", "o3"}
+    assert store.rollover(pstore, a2_log.OUTCOMES_DATASET, max_bytes=1) == 1
+    a2_log.write_outcome({**_row(4, day=5), "harvested_iso": "2025-01-05T12:00:00+00:00"}, path)
+
+    assert [r["n"] for r in store.read()] == [3, 4]  # sealed segment kept for the key index, then the tail
+    assert [r["n"] for r in a2_log.read_outcomes(path)] == [0, 1, 2, 3, 4]
+    assert a2_log.count_outcomes(path) == 5
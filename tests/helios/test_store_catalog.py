@@ -0,0 +1,104 @@
+"""Tests for the long-lived DuckDB catalog behind ParquetStore.query()."""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pyarrow as pa
+import pytest
+
+from helios.data.pit import as_of_query
+from helios.data.store import ParquetStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ParquetStore(tmp_path / "store")
+
+
+def _bars(t0: datetime, n: int, symbol: str = "BTC") -> pa.Table:
+    times = [t0 + timedelta(minutes=i) for i in range(n)]
+    return pa.table({
+        "symbol": [symbol] * n,
+        "close": [100.0 + i for i in range(n)],
+        "event_time": pa.array(times, type=pa.timestamp("us", tz="UTC")),
+        "available_at": pa.array(times, type=pa.timestamp("us", tz="UTC")),
+    })
+
+
+T0 = datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc)
+
+
+def test_views_not_rebuilt_without_writes(store):
+    store.write("bars_1m", _bars(T0, 5))
+    store.query("SELECT count(*) AS n FROM bars_1m")
+    gen = store.catalog.generation
+    for _ in range(5):
+        assert store.query("SELECT count(*) AS n FROM bars_1m").column("n")[0].as_py() == 5
+    assert store.catalog.generation == gen
+
+
+def test_write_invalidates_only_that_dataset(store):
+    store.write("bars_1m", _bars(T0, 5))
+    store.write("funding", _bars(T0, 2))
+    store.query("SELECT 1")
+    store.write("bars_1m", _bars(T0 + timedelta(days=1), 3))
+    assert store.catalog.files("funding") and len(store.catalog.files("bars_1m")) == 2
+    n = store.query("SELECT count(*) AS n FROM bars_1m").column("n")[0].as_py()
+    assert n == 8
+
+
+def test_new_dataset_visible_after_first_query(store):
+    store.write("bars_1m", _bars(T0, 1))
+    store.query("SELECT 1")
+    store.write("trades", _bars(T0, 4))
+    assert store.query("SELECT count(*) AS n FROM trades").column("n")[0].as_py() == 4
+
+
+def test_query_as_of_uses_pit_views(store):
+    store.write("bars_1m", _bars(T0, 10))
+    cutoff = T0 + timedelta(minutes=3)
+    assert store.query("SELECT * FROM bars_1m", as_of=cutoff).num_rows == 4
+    # The raw view is unaffected by a previous as-of query
+    assert store.query("SELECT * FROM bars_1m").num_rows == 10
+
+
+def test_repeated_as_of_queries_rebind_cutoff(store):
+    store.write("bars_1m", _bars(T0, 10))
+    counts = [
+        as_of_query(store, "SELECT * FROM bars_1m", as_of=T0 + timedelta(minutes=i)).num_rows
+        for i in range(10)
+    ]
+    assert counts == list(range(1, 11))
+
+
+def test_query_params_are_bound(store):
+    store.write("bars_1m", _bars(T0, 5, "BTC"))
+    store.write("bars_1m", _bars(T0, 3, "ETH"))
+    out = as_of_query(
+        store, "SELECT * FROM bars_1m WHERE symbol = $sym",
+        as_of=T0 + timedelta(hours=1), params={"sym": "ETH"},
+    )
+    assert out.num_rows == 3
+
+
+def test_concurrent_as_of_queries_are_isolated(store):
+    store.write("bars_1m", _bars(T0, 50))
+
+    def run(i: int) -> int:
+        cutoff = T0 + timedelta(minutes=i)
+        return as_of_query(store, "SELECT * FROM bars_1m", as_of=cutoff).num_rows
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(run, range(50)))
+    assert results == [i + 1 for i in range(50)]
+
+
+def test_refresh_picks_up_out_of_process_writes(store, tmp_path):
+    store.write("bars_1m", _bars(T0, 2))
+    store.query("SELECT 1")
+    other = ParquetStore(tmp_path / "store")
+    other.write("bars_1m", _bars(T0, 3))
+    assert store.query("SELECT count(*) AS n FROM bars_1m").column("n")[0].as_py() == 2
+    store.catalog.refresh("bars_1m")
+    assert store.query("SELECT count(*) AS n FROM bars_1m").column("n")[0].as_py() == 5
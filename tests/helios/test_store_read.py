@@ -0,0 +1,132 @@
+"""Tests for ParquetStore.read() — pruned, predicate-pushdown reads."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from helios.data.store import ParquetStore
+from helios.data.store.pruning import ReadFilter, prune_row_groups
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = ParquetStore(tmp_path / "store")
+    # 10 days x 2 symbols x 24 hourly bars, one write per day
+    for day in range(10):
+        rows = []
+        for sym in ("BTC", "ETH"):
+            for h in range(24):
+                t = T0 + timedelta(days=day, hours=h)
+                rows.append((sym, t, t + timedelta(seconds=30), float(day * 24 + h)))
+        s.write("bars_1h", pa.table({
+            "symbol": [r[0] for r in rows],
+            "event_time": pa.array([r[1] for r in rows], type=pa.timestamp("us", tz="UTC")),
+            "available_at": pa.array([r[2] for r in rows], type=pa.timestamp("us", tz="UTC")),
+            "close": [r[3] for r in rows],
+        }))
+    return s
+
+
+def test_read_matches_sql(store):
+    start, end = T0 + timedelta(days=3, hours=5), T0 + timedelta(days=6)
+    got = store.read("bars_1h", symbols=["ETH"], start=start, end=end, output="polars")
+    ref = pl.from_arrow(store.query(
+        "SELECT symbol, event_time, available_at, close FROM bars_1h "
+        "WHERE symbol = 'ETH' AND event_time >= $s AND event_time < $e",
+        params={"s": start, "e": end},
+    ))
+    assert got.sort("event_time").equals(ref.sort("event_time"))
+    assert got.height == 3 * 24 - 5
+
+
+def test_read_projects_columns(store):
+    out = store.read("bars_1h", symbols=["BTC"], columns=["close"])
+    assert out.column_names == ["close"]
+    assert out.num_rows == 240
+
+
+def test_read_as_of_hides_unavailable_rows(store):
+    as_of = T0 + timedelta(hours=2)  # bar 2 becomes available 30s later
+    out = store.read("bars_1h", as_of=as_of)
+    assert out.num_rows == 2 * 2
+    assert max(out.column("available_at").to_pylist()) <= as_of
+
+
+def test_read_empty_result_keeps_schema(store):
+    out = store.read("bars_1h", symbols=["DOGE"])
+    assert out.num_rows == 0
+    assert "close" in out.column_names
+
+
+def test_read_unknown_dataset(store):
+    assert store.read("nope").num_rows == 0
+
+
+def test_row_group_stats_prune(tmp_path):
+    times = [T0 + timedelta(minutes=i) for i in range(1000)]
+    t = pa.table({
+        "symbol": ["A"] * 500 + ["B"] * 500,
+        "event_time": pa.array(times, type=pa.timestamp("us", tz="UTC")),
+        "available_at": pa.array(times, type=pa.timestamp("us", tz="UTC")),
+    })
+    path = tmp_path / "f.parquet"
+    pq.write_table(t, path, row_group_size=100)
+    md = pq.read_metadata(path)
+    assert prune_row_groups(md, ReadFilter.build(["B"], None, None, None)) == [5, 6, 7, 8, 9]
+    flt = ReadFilter.build(None, T0 + timedelta(minutes=250), T0 + timedelta(minutes=300), None)
+    assert prune_row_groups(md, flt) == [2]
+
+
+def test_backfill_under_an_earlier_partition_date_is_still_read(tmp_path):
+    s = ParquetStore(tmp_path / "s")
+    t = pa.table({
+        "event_time": pa.array([T0 + timedelta(days=2)], type=pa.timestamp("us", tz="UTC")),
+        "available_at": pa.array([T0 + timedelta(days=2)], type=pa.timestamp("us", tz="UTC")),
+    })
+    res = s.write("x", t, partition_date=T0)
+    assert "day=01" in res.path
+    assert s.read("x", start=T0 + timedelta(days=2)).num_rows == 1  # pruning widened by the lag
+
+
+def test_non_utc_partition_date_is_rejected(tmp_path):
+    s = ParquetStore(tmp_path / "s")
+    t = pa.table({
+        "event_time": pa.array([T0 + timedelta(hours=3)], type=pa.timestamp("us", tz="UTC")),
+        "available_at": pa.array([T0 + timedelta(hours=3)], type=pa.timestamp("us", tz="UTC")),
+    })
+    # 20:00 on Dec 31 in New York is 01:00 UTC on Jan 1: which day is meant?
+    ny = datetime(2024, 12, 31, 20, tzinfo=timezone(timedelta(hours=-5)))
+    with pytest.raises(ValueError, match="UTC"):
+        s.write("x", t, partition_date=ny)
+    assert s.read("x").num_rows == 0
+    assert "year=2025/month=01/day=01" in s.write("x", t, partition_date=T0).path.replace("\\", "/")
+    assert "day=01" in s.write("x", t, partition_date=T0.replace(tzinfo=None)).path
+    assert s.read("x", start=T0).num_rows == 2
+
+
+def test_partition_lag_is_cached_until_raised_or_refreshed(tmp_path, monkeypatch):
+    s = ParquetStore(tmp_path / "s")
+
+    def at(day: int) -> pa.Table:
+        ts = pa.array([T0 + timedelta(days=day)], type=pa.timestamp("us", tz="UTC"))
+        return pa.table({"event_time": ts, "available_at": ts})
+
+    s.write("x", at(2), partition_date=T0)
+    reads = []
+    read_text = type(s.root).read_text
+    monkeypatch.setattr(type(s.root), "read_text", lambda p, *a, **k: reads.append(p) or read_text(p, *a, **k))
+    for _ in range(3):
+        s.write("x", at(1))
+        assert s.read("x", start=T0 + timedelta(days=2)).num_rows == 1
+    assert reads == []
+    # Another store on the root files a later backfill; refresh() picks up its lag
+    ParquetStore(tmp_path / "s").write("x", at(6), partition_date=T0)
+    s.refresh("x")
+    assert s.read("x", start=T0 + timedelta(days=6)).num_rows == 1
+    assert [p.name for p in reads] == ["_partition_lag.json"] * 2  # the other store's, then ours
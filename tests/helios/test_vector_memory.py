@@ -1,8 +1,7 @@
 """Tests for the pattern-memory vector store."""
 from __future__ import annotations
 
-from pathlib import Path
-
+import numpy as np
 import pytest
 
 from helios.memory.vector_store import PatternRecord, VectorMemory
@@ -62,3 +61,213 @@ def test_dim_mismatch_returns_empty(mem):
     mem.add(_rec("a", [1.0, 0.0, 0.0], 2.0))
     # Wrong dim
     assert mem.query([1.0, 0.0]) == []
+
+
+def test_reload_maps_sidecar_without_parsing_log(tmp_path, monkeypatch):
+    path = tmp_path / "p.jsonl"
+    m1 = VectorMemory(path=path)
+    m1.add(_rec("a", [1.0, 0.0, 0.0], 2.0))
+    m1.add(_rec("b", [0.0, 1.0, 0.0], -1.0, label="loss"))
+
+    import helios.memory.vector_store as vs
+    parsed = []
+    monkeypatch.setattr(vs, "_parse", lambda line: parsed.append(line) or None)
+    m2 = VectorMemory(path=path)
+    assert len(m2) == 2 and parsed == []
+    monkeypatch.undo()
+    assert m2.query([0.0, 1.0, 0.0], k=1)[0][1].record_id == "b"  # parsed lazily
+    assert m2.similar_outcomes([1.0, 0.0, 0.0], k=2).mean_outcome_r == pytest.approx(0.5)
+
+
+def test_log_lines_missing_from_sidecar_are_caught_up(tmp_path):
+    import json
+    from dataclasses import asdict
+
+    path = tmp_path / "p.jsonl"
+    VectorMemory(path=path).add(_rec("a", [1.0, 0.0, 0.0], 2.0))
+    with path.open("a", encoding="utf-8") as f:  # a writer that never touched the sidecar
+        f.write(json.dumps(asdict(_rec("b", [0.0, 0.0, 1.0], 1.0))) + "\n")
+        f.write("{torn json\n")
+    m = VectorMemory(path=path)
+    assert len(m) == 2
+    assert m.query([0.0, 0.0, 1.0], k=1)[0][1].record_id == "b"
+
+    (tmp_path / "p.vecidx" / "meta.json").unlink()  # lost sidecar → rebuilt from the log
+    assert [r.record_id for _, r in VectorMemory(path=path).query([1.0, 0.0, 0.0], k=2)] == ["a", "b"]
+
+
+def test_add_rejects_wrong_dimension(mem):
+    mem.add(_rec("a", [1.0, 0.0, 0.0], 2.0))
+    with pytest.raises(ValueError):
+        mem.add(_rec("b", [1.0, 0.0], 2.0))
+    assert len(VectorMemory(path=mem.path)) == 1
+
+
+def test_ivf_index_recall_and_persistence(tmp_path, monkeypatch):
+    import helios.memory.vector_store as vs
+
+    monkeypatch.setattr(vs, "ANN_MIN_RECORDS", 1000)
+    rng = np.random.default_rng(7)
+    centers = rng.normal(size=(20, 8))
+    vecs = centers[rng.integers(0, 20, 3000)] + 0.3 * rng.normal(size=(3000, 8))
+    path = tmp_path / "p.jsonl"
+    m = VectorMemory(path=path, ann=True, nprobe=8)
+    for i, v in enumerate(vecs):
+        m.add(PatternRecord(
+            record_id=str(i), strategy="A2", feature_vector=tuple(v), feature_names=(),
+            outcome_r=0.0, outcome_label="breakeven", timestamp_unix=i,
+        ))
+    queries = rng.normal(size=(20, 8))
+    exact = [{r.record_id for _, r in m.query(q, k=10, exact=True)} for q in queries]
+    approx = [{r.record_id for _, r in m.query(q, k=10)} for q in queries]
+    recall = np.mean([len(a & e) / 10 for a, e in zip(approx, exact, strict=True)])
+    assert recall >= 0.9
+
+    m.add(_rec_dim8("late", vecs[0]))  # indexed incrementally, list id appended to the sidecar
+    reloaded = VectorMemory(path=path, ann=True, nprobe=8)
+    assert [r.record_id for _, r in reloaded.query(queries[0], k=10)] == \
+        [r.record_id for _, r in m.query(queries[0], k=10)]
+    assert (tmp_path / "p.vecidx" / "ivf_lists.i32").stat().st_size == 4 * len(reloaded)
+
+
+def _rec_dim8(rid: str, vec) -> PatternRecord:
+    return PatternRecord(
+        record_id=rid, strategy="A2", feature_vector=tuple(vec), feature_names=(),
+        outcome_r=0.0, outcome_label="breakeven", timestamp_unix=0,
+    )
+
+
+def test_query_batch_matches_per_target_stats(tmp_path):
+    from statistics import mean, median
+
+    rng = np.random.default_rng(3)
+    m = VectorMemory(path=tmp_path / "p.jsonl")
+    vecs = rng.normal(size=(300, 3))
+    outcomes = np.round(rng.normal(size=300), 3)
+    for i, (v, r) in enumerate(zip(vecs, outcomes, strict=True)):
+        m.add(_rec(f"r{i}", list(v), float(r)))
+    targets = rng.normal(size=(7, 3))
+    batch = m.query_batch(targets, k=25)
+    for target, got in zip(targets, batch, strict=True):
+        near = [r.outcome_r for _, r in m.query(target, k=25)]
+        assert got.n_neighbors == 25
+        assert got.mean_outcome_r == pytest.approx(mean(near))
+        assert got.median_outcome_r == pytest.approx(median(near))
+        assert got.win_rate == pytest.approx(sum(r > 0 for r in near) / 25)
+        assert [e.record_id for e in got.examples] == [r.record_id for _, r in m.query(target, k=5)]
+
+
+def test_filters_restrict_the_candidate_rows(tmp_path):
+    from dataclasses import replace
+
+    from helios.memory import PatternFilter
+
+    path = tmp_path / "p.jsonl"
+    m = VectorMemory(path=path)
+    m.add(replace(_rec("a2-old", [1.0, 0.0, 0.0], 1.0), timestamp_unix=100, metadata={"regime": "trend"}))
+    m.add(replace(_rec("a2-new", [0.9, 0.1, 0.0], -1.0), timestamp_unix=200, metadata={"regime": "chop"}))
+    m.add(replace(_rec("a5", [1.0, 0.0, 0.0], 3.0), strategy="A5", timestamp_unix=200))
+
+    def ids(where, mem=m):
+        return [r.record_id for _, r in mem.query([1.0, 0.0, 0.0], k=10, where=where)]
+
+    assert ids(PatternFilter(strategy="A2")) == ["a2-old", "a2-new"]
+    assert ids(PatternFilter(strategy=["A5", "A9"])) == ["a5"]
+    assert ids(PatternFilter(since=150)) == ["a5", "a2-new"]
+    assert ids(PatternFilter(until=150)) == ["a2-old"]
+    assert ids(PatternFilter(metadata={"regime": "chop"})) == ["a2-new"]
+    assert ids(PatternFilter(strategy="nope")) == []
+    assert m.similar_outcomes([1.0, 0.0, 0.0], where=PatternFilter(strategy="nope")).n_neighbors == 0
+
+    # the metadata column is built from the log after a reload and kept current by add()
+    m2 = VectorMemory(path=path)
+    assert ids(PatternFilter(metadata={"regime": "trend"}), m2) == ["a2-old"]
+    m2.add(replace(_rec("a2-late", [1.0, 0.0, 0.0], 2.0), timestamp_unix=300, metadata={"regime": "trend"}))
+    assert ids(PatternFilter(strategy="A2", metadata={"regime": "trend"}), m2) == ["a2-old", "a2-late"]
+
+
+def test_ann_filter_still_returns_k_matches(tmp_path, monkeypatch):
+    import helios.memory.vector_store as vs
+    from helios.memory import PatternFilter
+
+    monkeypatch.setattr(vs, "ANN_MIN_RECORDS", 1000)
+    rng = np.random.default_rng(11)
+    vecs = rng.normal(size=(3000, 8))
+    m = VectorMemory(path=tmp_path / "p.jsonl", ann=True, nprobe=1)
+    for i, v in enumerate(vecs):
+        m.add(PatternRecord(
+            record_id=str(i), strategy="A2", feature_vector=tuple(v), feature_names=(),
+            outcome_r=0.0, outcome_label="breakeven", timestamp_unix=i,
+            metadata={"bucket": i % 25, "tags": ["x"] if i % 2 else []},
+        ))
+    q = rng.normal(size=8)
+    # 120 matching rows: more than one probed list holds, so lists are widened
+    got = m.query(q, k=50, where=PatternFilter(metadata={"bucket": 3}))
+    assert len(got) == 50
+    assert all(int(r.record_id) % 25 == 3 for _, r in got)
+    # 12 matching rows: below k, searched exactly
+    where = PatternFilter(since=2988)
+    assert [r.record_id for _, r in m.query(q, k=50, where=where)] == \
+        [r.record_id for _, r in m.query(q, k=50, where=where, exact=True)]
+    # unhashable metadata values compare by equality, as before
+    assert len(m.query(q, k=3000, where=PatternFilter(metadata={"tags": ["x"]}), exact=True)) == 1500
+    assert len(m.query(q, k=3000, where=PatternFilter(metadata={"bucket": 3.0}), exact=True)) == 120
+
+
+def test_stale_sidecar_tail_is_ignored_by_readers_and_trimmed_on_write(tmp_path):
+    path = tmp_path / "p.jsonl"
+    VectorMemory(path=path).add(_rec("a", [1.0, 0.0, 0.0], 2.0))
+    sidecar = tmp_path / "p.vecidx"
+    for name, junk in (("vectors.f32", b"\0" * 12), ("outcome_r.f64", b"\0" * 8)):
+        with (sidecar / name).open("ab") as f:  # a crash before meta.json counted the row
+            f.write(junk)
+    sizes = {p.name: p.stat().st_size for p in sidecar.iterdir()}
+
+    reader = VectorMemory(path=path)
+    assert [r.record_id for _, r in reader.query([1.0, 0.0, 0.0], k=5)] == ["a"]
+    assert {p.name: p.stat().st_size for p in sidecar.iterdir()} == sizes  # untouched
+
+    reader.add(_rec("b", [0.0, 1.0, 0.0], -1.0, label="loss"))
+    assert (sidecar / "outcome_r.f64").stat().st_size == 16
+    again = VectorMemory(path=path)
+    assert again.similar_outcomes([0.0, 1.0, 0.0], k=1).mean_outcome_r == -1.0
+    assert [r.record_id for _, r in again.query([0.0, 1.0, 0.0], k=2)] == ["b", "a"]
+
+
+def test_ann_is_opt_in(tmp_path, monkeypatch):
+    import helios.memory.vector_store as vs
+
+    monkeypatch.setattr(vs, "ANN_MIN_RECORDS", 10)
+    m = VectorMemory(path=tmp_path / "p.jsonl")
+    for i in range(20):
+        m.add(_rec(str(i), [1.0, float(i), 0.0], 0.0))
+    m.query([1.0, 0.0, 0.0], k=3)
+    assert m._ivf is None and not (tmp_path / "p.vecidx" / "ivf_centroids.f32").exists()
+
+
+def test_ann_waits_for_min_records_and_retrains_as_the_memory_grows(tmp_path, monkeypatch):
+    import helios.memory.vector_store as vs
+
+    monkeypatch.setattr(vs, "ANN_MIN_RECORDS", 100)
+    rng = np.random.default_rng(3)
+    path = tmp_path / "p.jsonl"
+    m = VectorMemory(path=path, ann=True)
+
+    def grow(to: int) -> None:
+        for i in range(len(m), to):
+            m.add(_rec_dim8(str(i), rng.normal(size=8)))
+        m.query(rng.normal(size=8), k=5)
+
+    grow(50)
+    assert m._ivf is None  # exact below ANN_MIN_RECORDS
+    grow(100)
+    first = m._ivf.n_lists
+    grow(399)
+    assert m._ivf.n_lists == first  # under ANN_RETRAIN_GROWTH x the training size
+    grow(400)
+    assert m._ivf.n_lists > first
+    # The training size is persisted, so a reload keeps the index as is
+    reloaded = VectorMemory(path=path, ann=True)
+    reloaded.query(rng.normal(size=8), k=5)
+    assert reloaded._ivf_trained_n == 400
+    assert reloaded._ivf.n_lists == m._ivf.n_lists